@@ -14,6 +14,7 @@ import logging
 import secrets
 from datetime import date, datetime, timedelta
 from decimal import Decimal
+from email.utils import format_datetime
 from typing import Annotated
 from uuid import UUID
 
@@ -32,6 +33,7 @@ from src.schemas.subscription import CalendarEvent, MonthlyPaymentsSummary, Paym
 from src.security.rate_limit import limiter, rate_limit_get, rate_limit_write
 from src.services.currency_service import CurrencyService
 from src.services.google_calendar_service import GoogleCalendarService
+from src.services.ical_cache import get_ical_feed_cache
 from src.services.ical_service import ICalService
 from src.services.payment_service import PaymentService
 
@@ -438,6 +440,7 @@ async def get_ical_feed_url(
 
 @router.get("/ical/feed/{user_id}/{token}/payments.ics")
 async def get_ical_feed(
+    request: Request,
     user_id: UUID,
     token: str,
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -451,7 +454,13 @@ async def get_ical_feed(
     The token is generated per-user and provides read-only access
     to the calendar feed.
 
+    Feeds are served from a per-user cache keyed by the user's
+    subscription data version, with a strong ETag and Last-Modified.
+    Conditional polls get 304 Not Modified; polls while nothing changed
+    do not query the database.
+
     Args:
+        request: Incoming request (for conditional headers).
         user_id: The user's UUID.
         token: The authentication token.
         include_inactive: Include inactive subscriptions.
@@ -459,7 +468,8 @@ async def get_ical_feed(
         payment_types: Comma-separated list of payment types to include.
 
     Returns:
-        Response: The iCal file content with appropriate headers.
+        Response: The iCal file content with appropriate headers, or
+            304 Not Modified.
 
     Raises:
         HTTPException: 403 if token is invalid.
@@ -472,24 +482,42 @@ async def get_ical_feed(
     # Parse payment types
     types_list = None
     if payment_types:
-        types_list = [t.strip() for t in payment_types.split(",")]
+        types_list = sorted({t.strip() for t in payment_types.split(",")})
 
-    # Generate feed
-    service = ICalService(db, user_id)
-    ical_content = await service.generate_feed(
-        include_inactive=include_inactive,
-        days_ahead=days_ahead,
-        payment_types=types_list,
-    )
+    feed_cache = get_ical_feed_cache()
+    params = {
+        "include_inactive": include_inactive,
+        "days_ahead": days_ahead,
+        "payment_types": types_list,
+    }
+    version = await feed_cache.get_version(str(user_id))
+    feed = await feed_cache.get(str(user_id), version, params)
+    if feed is None:
+        service = ICalService(db, user_id)
+        ical_content = await service.generate_feed(
+            include_inactive=include_inactive,
+            days_ahead=days_ahead,
+            payment_types=types_list,
+        )
+        feed = await feed_cache.put(str(user_id), version, params, ical_content)
+
+    headers = {
+        "ETag": feed.etag,
+        "Last-Modified": format_datetime(feed.last_modified, usegmt=True),
+        # Clients may keep the feed but must revalidate on every poll
+        "Cache-Control": "private, no-cache",
+    }
+    if feed.is_current(
+        request.headers.get("if-none-match"), request.headers.get("if-modified-since")
+    ):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
     return Response(
-        content=ical_content,
+        content=feed.body,
         media_type="text/calendar",
         headers={
             "Content-Disposition": "attachment; filename=moneyflow-payments.ics",
-            "Cache-Control": "no-cache, no-store, must-revalidate",
-            "Pragma": "no-cache",
-            "Expires": "0",
+            **headers,
         },
     )
 
@@ -589,6 +617,9 @@ class GoogleCalendarSyncResponse(BaseModel):
     """Response for sync operation."""
 
     created: int = Field(description="Number of events created")
+    updated: int = Field(default=0, description="Number of events updated")
+    deleted: int = Field(default=0, description="Number of events deleted")
+    unchanged: int = Field(default=0, description="Number of events already up to date")
     failed: int = Field(description="Number of events that failed")
     total: int = Field(description="Total subscriptions processed")
 
@@ -726,7 +757,9 @@ async def sync_to_google_calendar(
 ) -> GoogleCalendarSyncResponse:
     """Sync subscriptions to Google Calendar.
 
-    Creates calendar events for all active subscriptions.
+    Creates, updates and deletes calendar events so the calendar matches
+    the active subscriptions; events that are already up to date are
+    left alone.
 
     Args:
         calendar_id: Google Calendar ID to sync to (default: 'primary').
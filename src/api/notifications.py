@@ -35,6 +35,7 @@ from src.schemas.notification import (
     history_to_response,
     preferences_to_response,
 )
+from src.services.notification_schedule import user_timezone
 from src.services.push_service import PushService
 from src.services.telegram_service import get_telegram_service
 
@@ -59,7 +60,12 @@ async def get_or_create_preferences(db: AsyncSession, user_id: str) -> Notificat
     prefs = result.scalar_one_or_none()
 
     if not prefs:
-        prefs = NotificationPreferences(user_id=user_id)
+        # Notifications are scheduled by the user's timezone preference
+        user = await db.get(User, user_id)
+        prefs = NotificationPreferences(
+            user_id=user_id,
+            timezone=user_timezone(user.preferences if user else None),
+        )
         db.add(prefs)
         await db.commit()
         await db.refresh(prefs)
@@ -500,7 +506,7 @@ async def subscribe_to_push(
     # Send test notification
     sub_info = prefs.get_push_subscription_dict()
     if sub_info:
-        push_service.send_test_notification(sub_info)
+        await push_service.send_test_notification_async(sub_info)
 
     return PushSubscribeResponse(
         success=True,
@@ -593,7 +599,7 @@ async def send_push_test_notification(
             detail="No push subscription found. Please re-enable push notifications.",
         )
 
-    success = push_service.send_test_notification(sub_info)
+    success = await push_service.send_test_notification_async(sub_info)
 
     if not success:
         raise HTTPException(
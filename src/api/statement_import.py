@@ -11,7 +11,7 @@ from __future__ import annotations
 
 import logging
 import uuid
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
 from decimal import Decimal
 from io import BytesIO
 from pathlib import Path
@@ -49,14 +49,22 @@ from src.schemas.statement import (
     ImportPreviewSummary,
     StatementUploadResponse,
 )
+from src.schemas.subscription import SubscriptionCreate
 from src.services.bank_service import BankService
 from src.services.duplicate_detector import DuplicateDetector
-from src.services.parsers import CSVStatementParser, OFXStatementParser, PDFStatementParser
+from src.services.parsers import (
+    CSVStatementParser,
+    OFXStatementParser,
+    PDFStatementParser,
+    fingerprint_transactions,
+)
 from src.services.statement_ai_service import (
     FrequencyType,
     PaymentTypeClassification,
     StatementAIService,
 )
+from src.services.statement_dedup_service import StatementDedupService, hash_content
+from src.services.subscription_service import SubscriptionService
 
 logger = logging.getLogger(__name__)
 
@@ -83,6 +91,7 @@ def _get_file_type(filename: str) -> FileType | None:
 def _frequency_to_model(freq: FrequencyType) -> str:
     """Convert FrequencyType to Frequency model value."""
     mapping = {
+        FrequencyType.DAILY: "daily",
         FrequencyType.WEEKLY: "weekly",
         FrequencyType.BIWEEKLY: "biweekly",
         FrequencyType.MONTHLY: "monthly",
@@ -145,6 +154,7 @@ async def upload_statement(
     # Read file content
     content = await file.read()
     file_size = len(content)
+    content_hash = hash_content(content)
 
     # Create import job
     job = StatementImportJob(
@@ -153,6 +163,7 @@ async def upload_statement(
         filename=file.filename,
         file_type=file_type,
         file_size=file_size,
+        content_hash=content_hash,
         bank_id=uuid.UUID(bank_id) if bank_id else None,
         currency=currency,
         status=ImportJobStatus.PROCESSING,
@@ -162,26 +173,45 @@ async def upload_statement(
     await db.flush()
 
     try:
-        # Parse the statement based on file type
-        bank_service = BankService(db)
-
-        if file_type == FileType.PDF:
-            parser = PDFStatementParser(currency=currency)
-            statement = parser.parse(BytesIO(content))
-        elif file_type == FileType.CSV:
-            # Get bank profile if specified
-            bank_profile = None
-            if bank_id:
-                bank_profile = await bank_service.get_by_id(uuid.UUID(bank_id))
-            parser = CSVStatementParser(
-                bank_service=bank_service,
-                bank_profile=bank_profile,
-                currency=currency,
-            )
-            statement = await parser.parse_async(BytesIO(content))
-        else:
-            parser = OFXStatementParser(currency=currency)
-            statement = parser.parse(BytesIO(content))
+        # Reuse the parse result of an identical earlier upload if cached
+        dedup_service = StatementDedupService(db)
+        cache_key = dedup_service.parse_cache_key(content_hash, file_type, currency, bank_id)
+        statement = await dedup_service.get_cached_statement(cache_key)
+        parse_cache_hit = statement is not None
+
+        if statement is None:
+            # Parse the statement based on file type
+            bank_service = BankService(db)
+
+            if file_type == FileType.PDF:
+                parser = PDFStatementParser(currency=currency)
+                statement = parser.parse(BytesIO(content))
+            elif file_type == FileType.CSV:
+                # Get bank profile if specified
+                bank_profile = None
+                if bank_id:
+                    bank_profile = await bank_service.get_by_id(uuid.UUID(bank_id))
+                parser = CSVStatementParser(
+                    bank_service=bank_service,
+                    bank_profile=bank_profile,
+                    currency=currency,
+                )
+                statement = await parser.parse_async(BytesIO(content))
+            else:
+                parser = OFXStatementParser(currency=currency)
+                statement = parser.parse(BytesIO(content))
+
+            await dedup_service.cache_statement(cache_key, statement)
+
+        # Recognise transactions already analysed in earlier imports
+        fingerprints = fingerprint_transactions(statement.transactions)
+        known_fingerprints = await dedup_service.find_known_fingerprints(
+            current_user.id, fingerprints
+        )
+        job.raw_data = {
+            "parse_cache_hit": parse_cache_hit,
+            "known_transactions": sum(1 for fp in fingerprints if fp in known_fingerprints),
+        }
 
         # Update job with statement info
         job.total_transactions = len(statement.transactions)
@@ -197,6 +227,7 @@ async def upload_statement(
             statement,
             min_confidence=min_confidence,
             use_ai=use_ai,
+            known_fingerprints=known_fingerprints,
         )
 
         # Get existing subscriptions for duplicate detection
@@ -208,13 +239,14 @@ async def upload_statement(
         )
         existing_subs = list(existing_subs_result.scalars().all())
 
-        # Detect duplicates
+        # Detect duplicates (index built once, shared by all patterns)
         duplicate_detector = DuplicateDetector()
+        existing_index = duplicate_detector.build_index(existing_subs)
 
         # Create detected subscriptions
         for pattern in patterns:
             # Check for duplicates
-            best_match = duplicate_detector.find_best_match(pattern, existing_subs)
+            best_match = duplicate_detector.find_best_match(pattern, existing_index)
 
             detected = DetectedSubscription(
                 id=uuid.uuid4(),
@@ -246,16 +278,25 @@ async def upload_statement(
 
             db.add(detected)
 
+        await dedup_service.record_fingerprints(current_user.id, job.id, fingerprints)
+
         job.detected_count = len(patterns)
         job.status = ImportJobStatus.READY
         await db.commit()
 
+        message = f"Detected {len(patterns)} potential recurring payments"
+        if job.raw_data["known_transactions"]:
+            message += (
+                f" ({job.raw_data['known_transactions']} transactions"
+                " recognised from earlier imports)"
+            )
+
         return StatementUploadResponse(
             job_id=str(job.id),
             filename=job.filename,
             file_type=job.file_type.value,
             status=job.status.value,
-            message=f"Detected {len(patterns)} potential recurring payments",
+            message=message,
         )
 
     except Exception as e:
@@ -623,38 +664,49 @@ async def confirm_import(
             and d.status not in (DetectionStatus.DUPLICATE, DetectionStatus.SKIPPED)
         ]
 
-    created_ids: list[str] = []
     imported_count = 0
     skipped_count = 0
+    errors: list[str] = []
 
+    # Validate every row first, then insert the valid ones in one statement
+    valid: list[tuple[DetectedSubscription, SubscriptionCreate]] = []
     for detected in to_import:
         try:
-            # Create subscription
-            sub = Subscription(
-                id=str(uuid.uuid4()),
-                user_id=current_user.id,
+            start = detected.first_seen or detected.last_seen
+            create_data = SubscriptionCreate(
                 name=detected.name,
                 amount=detected.amount,
                 currency=detected.currency,
                 frequency=Frequency(detected.frequency),
+                start_date=start.date() if start else date.today(),
                 payment_type=PaymentType(detected.payment_type),
-                is_active=True,
                 card_id=request.card_id,
                 category_id=request.category_id,
             )
-            db.add(sub)
-
-            # Update detected subscription
-            detected.status = DetectionStatus.IMPORTED
-            detected.created_subscription_id = sub.id
-            created_ids.append(sub.id)
-            imported_count += 1
-
+            valid.append((detected, create_data))
         except Exception as e:
             logger.warning(f"Failed to import subscription {detected.name}: {e}")
             detected.status = DetectionStatus.SKIPPED
+            errors.append(f"{detected.name}: {e}")
             skipped_count += 1
 
+    service = SubscriptionService(db, user_id=str(current_user.id))
+    created = await service.create_many([create_data for _, create_data in valid])
+
+    for position, (detected, _) in enumerate(valid):
+        sub_id = created.ids[position]
+        if sub_id is None:
+            error = created.errors.get(position, "Insert failed")
+            logger.warning(f"Failed to import subscription {detected.name}: {error}")
+            detected.status = DetectionStatus.SKIPPED
+            errors.append(f"{detected.name}: {error}")
+            skipped_count += 1
+            continue
+
+        detected.status = DetectionStatus.IMPORTED
+        detected.created_subscription_id = sub_id
+        imported_count += 1
+
     # Update job
     job.imported_count = imported_count
     job.skipped_count = skipped_count
@@ -668,7 +720,8 @@ async def confirm_import(
         imported_count=imported_count,
         skipped_count=skipped_count,
         duplicate_count=job.duplicate_count,
-        created_subscription_ids=created_ids,
+        created_subscription_ids=created.created_ids,
+        errors=errors,
     )
 
 
@@ -14,7 +14,7 @@ from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile, status
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.dependencies import get_current_active_user
@@ -22,19 +22,26 @@ from src.core.config import settings
 from src.core.dependencies import get_db
 from src.models.subscription import Frequency, PaymentMode, PaymentType
 from src.models.user import User
+from src.models.webhook import WebhookEvent
 from src.schemas.report import ReportConfig
 from src.schemas.subscription import (
     ExportData,
     ImportResult,
     SubscriptionCreate,
-    SubscriptionExport,
     SubscriptionResponse,
     SubscriptionSummary,
     SubscriptionUpdate,
 )
 from src.security.rate_limit import limiter, rate_limit_get, rate_limit_write
 from src.services.currency_service import CurrencyService
+from src.services.subscription_export import (
+    ExportFormat,
+    encode_export,
+    gzip_stream,
+    iter_export_records,
+)
 from src.services.subscription_service import SubscriptionService
+from src.services.webhook_service import WebhookService
 
 logger = logging.getLogger(__name__)
 
@@ -231,7 +238,11 @@ async def create_subscription(
     """
     service = SubscriptionService(db, user_id=str(current_user.id))
     subscription = await service.create(data)
-    return SubscriptionResponse.model_validate(subscription)
+    response = SubscriptionResponse.model_validate(subscription)
+    await WebhookService(db, current_user.id).trigger_event(
+        WebhookEvent.SUBSCRIPTION_CREATED, response.model_dump(mode="json")
+    )
+    return response
 
 
 @router.put("/{subscription_id}", response_model=SubscriptionResponse)
@@ -275,7 +286,11 @@ async def update_subscription(
             detail=f"Subscription {subscription_id} not found",
         )
 
-    return SubscriptionResponse.model_validate(subscription)
+    response = SubscriptionResponse.model_validate(subscription)
+    await WebhookService(db, current_user.id).trigger_event(
+        WebhookEvent.SUBSCRIPTION_UPDATED, response.model_dump(mode="json")
+    )
+    return response
 
 
 @router.delete("/{subscription_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -309,92 +324,119 @@ async def delete_subscription(
             detail=f"Subscription {subscription_id} not found",
         )
 
+    await WebhookService(db, current_user.id).trigger_event(
+        WebhookEvent.SUBSCRIPTION_DELETED, {"id": subscription_id}
+    )
+
 
 # ============================================================================
 # Import/Export Endpoints
 # ============================================================================
 
 
+def _export_response(
+    service: SubscriptionService,
+    export_format: ExportFormat,
+    include_inactive: bool,
+    payment_type: PaymentType | None,
+    compress: bool,
+) -> StreamingResponse:
+    """Build a streaming download of a user's payments.
+
+    Args:
+        service: Subscription service of the user.
+        export_format: Output format.
+        include_inactive: Whether to include inactive payments.
+        payment_type: Optional filter for specific payment type.
+        compress: Whether to gzip the file on the fly.
+
+    Returns:
+        Streaming file download response.
+    """
+    is_active = None if include_inactive else True
+    records = iter_export_records(service, is_active=is_active, payment_type=payment_type)
+    chunks = encode_export(records, export_format)
+
+    filename = f"payments_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.{export_format.value}"
+    media_type = export_format.media_type
+    if compress:
+        chunks = gzip_stream(chunks)
+        filename += ".gz"
+        media_type = "application/gzip"
+
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+
 @router.get("/export/json", response_model=ExportData)
 @limiter.limit(rate_limit_get)
 async def export_subscriptions_json(
     request: Request,
     include_inactive: bool = Query(default=True, description="Include inactive payments"),
     payment_type: PaymentType | None = Query(default=None, description="Filter by payment type"),
+    compress: bool = Query(default=False, description="Gzip the exported file"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
-) -> ExportData:
+) -> StreamingResponse:
     """Export all subscriptions/payments as JSON.
 
     Exports payment data in a format suitable for backup or transfer.
     The export includes metadata (version 2.0, timestamp) and all payment fields
-    including Money Flow fields (payment_type, debt, savings).
+    including Money Flow fields (payment_type, debt, savings). The document
+    is streamed as it is read from the database.
 
     Args:
         include_inactive: Whether to include inactive payments.
         payment_type: Optional filter for specific payment type.
+        compress: Whether to gzip the exported file.
         db: Database session (injected by dependency).
 
     Returns:
-        ExportData with all payments.
+        Streaming ExportData JSON download.
 
     Example:
         GET /api/subscriptions/export/json
         GET /api/subscriptions/export/json?include_inactive=false
         GET /api/subscriptions/export/json?payment_type=debt
+        GET /api/subscriptions/export/json?compress=true
     """
     service = SubscriptionService(db, user_id=str(current_user.id))
-    is_active = None if include_inactive else True
-    subscriptions = await service.get_all(is_active=is_active, payment_type=payment_type)
-
-    # Helper to format Decimal for JSON - distinguishes null from zero
-    def format_decimal_json(value: Decimal | None) -> str | None:
-        """Format Decimal for JSON export, preserving null vs zero distinction."""
-        if value is None:
-            return None
-        return str(value)
-
-    export_subs = []
-    for sub in subscriptions:
-        export_subs.append(
-            SubscriptionExport(
-                name=sub.name,
-                amount=str(sub.amount),
-                currency=sub.currency,
-                frequency=sub.frequency.value,
-                frequency_interval=sub.frequency_interval,
-                start_date=sub.start_date.isoformat(),
-                next_payment_date=sub.next_payment_date.isoformat(),
-                payment_type=sub.payment_type.value,
-                payment_mode=sub.payment_mode.value if sub.payment_mode else "recurring",
-                category=sub.category,
-                notes=sub.notes,
-                is_active=sub.is_active,
-                payment_method=sub.payment_method,
-                reminder_days=sub.reminder_days,
-                icon_url=sub.icon_url,
-                color=sub.color,
-                auto_renew=sub.auto_renew,
-                is_installment=sub.is_installment,
-                total_installments=sub.total_installments,
-                completed_installments=sub.completed_installments,
-                # Debt-specific fields - use format_decimal_json to preserve 0 vs null
-                total_owed=format_decimal_json(sub.total_owed),
-                remaining_balance=format_decimal_json(sub.remaining_balance),
-                creditor=sub.creditor,
-                # Savings-specific fields - use format_decimal_json to preserve 0 vs null
-                target_amount=format_decimal_json(sub.target_amount),
-                current_saved=format_decimal_json(sub.current_saved),
-                recipient=sub.recipient,
-            )
-        )
+    return _export_response(service, ExportFormat.JSON, include_inactive, payment_type, compress)
 
-    return ExportData(
-        version="2.0",
-        exported_at=datetime.utcnow(),
-        subscription_count=len(export_subs),
-        subscriptions=export_subs,
-    )
+
+@router.get("/export/ndjson")
+@limiter.limit(rate_limit_get)
+async def export_subscriptions_ndjson(
+    request: Request,
+    include_inactive: bool = Query(default=True, description="Include inactive payments"),
+    payment_type: PaymentType | None = Query(default=None, description="Filter by payment type"),
+    compress: bool = Query(default=False, description="Gzip the exported file"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> StreamingResponse:
+    """Export all subscriptions/payments as newline-delimited JSON.
+
+    Each line is one payment with the same fields as the JSON export, so
+    large exports can be processed line by line.
+
+    Args:
+        include_inactive: Whether to include inactive payments.
+        payment_type: Optional filter for specific payment type.
+        compress: Whether to gzip the exported file.
+        db: Database session (injected by dependency).
+
+    Returns:
+        Streaming NDJSON download.
+
+    Example:
+        GET /api/subscriptions/export/ndjson
+        GET /api/subscriptions/export/ndjson?compress=true
+    """
+    service = SubscriptionService(db, user_id=str(current_user.id))
+    return _export_response(service, ExportFormat.NDJSON, include_inactive, payment_type, compress)
 
 
 @router.get("/export/csv")
@@ -403,117 +445,32 @@ async def export_subscriptions_csv(
     request: Request,
     include_inactive: bool = Query(default=True, description="Include inactive payments"),
     payment_type: PaymentType | None = Query(default=None, description="Filter by payment type"),
+    compress: bool = Query(default=False, description="Gzip the exported file"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
-) -> Response:
+) -> StreamingResponse:
     """Export all subscriptions/payments as CSV.
 
     Exports payment data in CSV format for spreadsheet applications.
     Headers are included in the first row. Includes Money Flow fields.
+    Rows are streamed as they are read from the database.
 
     Args:
         include_inactive: Whether to include inactive payments.
         payment_type: Optional filter for specific payment type.
+        compress: Whether to gzip the exported file.
         db: Database session (injected by dependency).
 
     Returns:
-        CSV file download response.
+        Streaming CSV download.
 
     Example:
         GET /api/subscriptions/export/csv
         GET /api/subscriptions/export/csv?payment_type=debt
+        GET /api/subscriptions/export/csv?compress=true
     """
     service = SubscriptionService(db, user_id=str(current_user.id))
-    is_active = None if include_inactive else True
-    subscriptions = await service.get_all(is_active=is_active, payment_type=payment_type)
-
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Write header (Money Flow v2.1 format with payment_mode)
-    writer.writerow(
-        [
-            "name",
-            "amount",
-            "currency",
-            "frequency",
-            "frequency_interval",
-            "start_date",
-            "next_payment_date",
-            "payment_type",
-            "payment_mode",
-            "category",
-            "notes",
-            "is_active",
-            "payment_method",
-            "reminder_days",
-            "icon_url",
-            "color",
-            "auto_renew",
-            "is_installment",
-            "total_installments",
-            "completed_installments",
-            # Debt-specific fields
-            "total_owed",
-            "remaining_balance",
-            "creditor",
-            # Savings-specific fields
-            "target_amount",
-            "current_saved",
-            "recipient",
-        ]
-    )
-
-    # Helper to format Decimal for CSV - distinguishes null from zero
-    def format_decimal(value: Decimal | None) -> str:
-        """Format Decimal for CSV export, preserving null vs zero distinction."""
-        if value is None:
-            return ""
-        return str(value)
-
-    # Write data rows
-    for sub in subscriptions:
-        writer.writerow(
-            [
-                sub.name,
-                str(sub.amount),
-                sub.currency,
-                sub.frequency.value,
-                sub.frequency_interval,
-                sub.start_date.isoformat(),
-                sub.next_payment_date.isoformat(),
-                sub.payment_type.value,
-                sub.payment_mode.value if sub.payment_mode else "recurring",
-                sub.category or "",
-                sub.notes or "",
-                str(sub.is_active).lower(),
-                sub.payment_method or "",
-                sub.reminder_days,
-                sub.icon_url or "",
-                sub.color,
-                str(sub.auto_renew).lower(),
-                str(sub.is_installment).lower(),
-                sub.total_installments if sub.total_installments is not None else "",
-                sub.completed_installments,
-                # Debt-specific fields - use format_decimal to preserve 0 vs null
-                format_decimal(sub.total_owed),
-                format_decimal(sub.remaining_balance),
-                sub.creditor or "",
-                # Savings-specific fields - use format_decimal to preserve 0 vs null
-                format_decimal(sub.target_amount),
-                format_decimal(sub.current_saved),
-                sub.recipient or "",
-            ]
-        )
-
-    csv_content = output.getvalue()
-    filename = f"payments_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.csv"
-
-    return Response(
-        content=csv_content,
-        media_type="text/csv",
-        headers={"Content-Disposition": f"attachment; filename={filename}"},
-    )
+    return _export_response(service, ExportFormat.CSV, include_inactive, payment_type, compress)
 
 
 @router.get("/export/pdf")
@@ -813,6 +770,7 @@ async def _import_subscriptions(
     """Import subscriptions/payments from parsed data.
 
     Supports both v1.0 (subscriptions only) and v2.0 (Money Flow) formats.
+    All rows are validated first, then the valid ones are inserted in bulk.
 
     Args:
         subscriptions: List of payment dictionaries.
@@ -835,6 +793,8 @@ async def _import_subscriptions(
         errors=[],
     )
 
+    # Validate every row before touching the database
+    pending: list[tuple[int, SubscriptionCreate]] = []
     for i, sub_data in enumerate(subscriptions):
         try:
             name = sub_data.get("name", "").strip()
@@ -946,13 +906,19 @@ async def _import_subscriptions(
                 recipient=sub_data.get("recipient") or None,
             )
 
-            await service.create(create_data)
+            pending.append((i, create_data))
             existing_names.add(name.lower())
-            result.imported += 1
 
         except Exception as e:
             result.failed += 1
             result.errors.append(f"Row {i + 1}: {e}")
             logger.exception(f"Failed to import payment row {i + 1}")
 
+    if pending:
+        created = await service.create_many([create_data for _, create_data in pending])
+        result.imported += len(created.created_ids)
+        for position, error in created.errors.items():
+            result.failed += 1
+            result.errors.append(f"Row {pending[position][0] + 1}: {error}")
+
     return result
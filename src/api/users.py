@@ -14,10 +14,12 @@ Security:
 import json
 
 from fastapi import APIRouter, Depends, Request
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.dependencies import get_current_active_user
 from src.core.dependencies import get_db
+from src.models.notification import NotificationPreferences
 from src.models.user import User
 from src.schemas.user import UserPreferencesResponse, UserPreferencesUpdate
 from src.security.rate_limit import limiter
@@ -156,6 +158,13 @@ async def update_preferences(
 
     # Save to database
     current_user.preferences = json.dumps(current_prefs)
+    if "timezone" in update_data:
+        # Keep the notification schedule in the user's timezone
+        await db.execute(
+            update(NotificationPreferences)
+            .where(NotificationPreferences.user_id == current_user.id)
+            .values(timezone=update_data["timezone"])
+        )
     await db.commit()
     await db.refresh(current_user)
 
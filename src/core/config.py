@@ -27,6 +27,8 @@ class Settings(BaseSettings):
         supported_currencies: List of supported currency codes.
         cache_ttl_exchange_rates: TTL for exchange rate cache in seconds.
         redis_url: Redis connection URL for caching.
+        statement_parse_cache_ttl: TTL for cached statement parse results in seconds.
+        merchant_classification_cache_ttl: TTL for cached AI merchant classifications.
         rag_enabled: Enable RAG (Retrieval-Augmented Generation) features.
         qdrant_host: Qdrant vector database host.
         qdrant_port: Qdrant HTTP API port.
@@ -99,6 +101,8 @@ class Settings(BaseSettings):
 
     # Redis (for caching)
     redis_url: str = "redis://localhost:6379/0"
+    statement_parse_cache_ttl: int = 86400  # 24 hours cache for parsed statements
+    merchant_classification_cache_ttl: int = 604800  # 7 days cache for merchant classes
 
     # RAG Configuration
     rag_enabled: bool = True
@@ -154,9 +158,50 @@ class Settings(BaseSettings):
     smtp_from_name: str = "Money Flow"  # Sender display name
     smtp_use_tls: bool = True  # Use TLS encryption
 
+    # Notification dispatch limits (per worker)
+    notification_telegram_rate: float = 25.0  # Messages/second (Telegram allows ~30)
+    notification_telegram_concurrency: int = 20  # Concurrent Telegram requests
+    notification_email_rate: float = 10.0  # Emails/second accepted by the SMTP relay
+    notification_email_concurrency: int = 4  # Concurrent sends = pooled SMTP connections
+    notification_push_rate: float = 50.0  # Push messages/second
+    notification_push_concurrency: int = 10  # Concurrent push sends (worker threads)
+    notification_shard_count: int = 8  # Shard jobs per notification cron run
+    fanout_result_ttl: int = 86400  # Seconds to keep per-shard results of a run
+    notification_ledger_retention_days: int = 90  # Days to keep send-ledger entries
+
     # Cloud Backup settings
     gcs_backup_bucket: str = ""  # GCS bucket name for backups
     backup_retention_days: int = 30  # Days to retain backups
+    backup_full_interval_days: int = 7  # Days between full snapshots (deltas in between)
+    backup_upload_concurrency: int = 4  # Concurrent backup uploads per worker
+
+    # PDF report rendering (worker processes)
+    report_render_workers: int = 2  # Processes rendering reports (= concurrent renders)
+    report_render_queue_size: int = 8  # Reports waiting for a worker before rejecting more
+    report_render_timeout: float = 60.0  # Seconds one report may take to render
+    report_cache_enabled: bool = True  # Serve identical report requests from cache
+    report_cache_dir: str = ""  # Cache directory (empty = <tmp>/money_flow_reports)
+    report_cache_max_bytes: int = 256 * 1024 * 1024  # Size bound of the cache (LRU eviction)
+
+    # iCal feed caching (Redis)
+    ical_feed_cache_ttl: int = 86400  # Seconds a serialized feed is kept (also rebuilt daily)
+    ical_version_ttl: int = 30 * 86400  # Seconds a user's subscription data version is kept
+
+    # Webhook delivery (outbox dispatcher in the worker)
+    webhook_endpoint_concurrency: int = 4  # Requests in flight per endpoint host
+    webhook_dispatch_batch_size: int = 100  # Pending deliveries claimed per batch
+    webhook_dispatch_max_batches: int = 10  # Batches sent per dispatch job
+
+    # REST hook event batching (hooks subscribed with batch=true)
+    rest_hook_batch_window: float = 2.0  # Seconds events for one hook are coalesced
+    rest_hook_batch_max_events: int = 100  # Events per batched request
+    rest_hook_batch_max_bytes: int = 256 * 1024  # Body size cap of a batched request
+
+    # Icon fetching (process-wide fetcher in front of the icon_cache table)
+    icon_fetch_concurrency: int = 8  # Icon source requests in flight per process
+    icon_memory_cache_size: int = 2048  # Icons kept in the in-process LRU
+    icon_memory_cache_ttl: int = 300  # Seconds an icon is served from the LRU
+    icon_negative_cache_ttl: int = 3600  # Seconds a name with no icon is not refetched
 
     # Web Push (VAPID) settings for PWA notifications
     vapid_private_key: str = ""  # VAPID private key (generate with py_vapid)
@@ -25,7 +25,8 @@ Exception Hierarchy:
     ├── ExternalServiceError (502/503)
     │   ├── ClaudeAPIError
     │   ├── DatabaseConnectionError
-    │   └── CacheConnectionError
+    │   ├── CacheConnectionError
+    │   └── ReportRenderError
     └── BusinessLogicError (400)
         └── OperationFailedError
 
@@ -523,6 +524,25 @@ class VectorStoreError(ExternalServiceError):
         )
 
 
+class ReportRenderError(ExternalServiceError):
+    """Raised when a PDF report cannot be rendered (queue full or too slow)."""
+
+    def __init__(
+        self,
+        message: str = "Report generation failed",
+        retry_after: int | None = None,
+    ) -> None:
+        details: dict[str, Any] = {}
+        if retry_after:
+            details["retry_after"] = retry_after
+        super().__init__(
+            message=message,
+            service_name="report_renderer",
+            details=details,
+        )
+        self.retry_after = retry_after
+
+
 # =============================================================================
 # Business Logic Errors (400)
 # =============================================================================
@@ -0,0 +1,183 @@
+"""Sharded fan-out for per-user cron tasks.
+
+A notification cron job used to process every user in one job, so extra
+ARQ workers sat idle during the morning spike. With fan-out the cron entry
+only enqueues one job per shard; any worker can pick up any shard, so
+throughput scales with the number of workers.
+
+- Partitioning: users are split by a hash of their ID (see
+  ``src.services.notification_query_service.shard_condition``).
+- Idempotency: each shard job gets a deterministic job ID built from the
+  task, run (the scheduling slot) and shard, so firing the cron twice (or
+  on two workers) enqueues each shard once.
+- Completion barrier: every shard records its result in a Redis hash; the
+  shard that completes the set aggregates the results.
+
+Usage:
+    cron(fan_out_job("send_daily_digest"), minute={0, 15, 30, 45})
+
+    # In the shard task
+    await record_shard_result(ctx.get("redis"), "send_daily_digest", slot, 3, 8, result)
+"""
+
+import json
+import logging
+from collections.abc import Callable, Coroutine
+from datetime import UTC, datetime
+from typing import Any
+
+from arq.connections import ArqRedis
+
+from src.core.config import settings
+from src.services.notification_schedule import slot_id
+
+logger = logging.getLogger(__name__)
+
+FANOUT_KEY_PREFIX = "fanout"
+
+
+def shard_job_id(task_name: str, run_id: str, shard_index: int, shard_count: int) -> str:
+    """Build the idempotency key (ARQ job ID) of one shard job.
+
+    Args:
+        task_name: Registered task name.
+        run_id: Run the shard belongs to (a scheduling slot ID).
+        shard_index: Shard number, 0-based.
+        shard_count: Total number of shards.
+
+    Returns:
+        Deterministic job ID.
+    """
+    return f"{task_name}:{run_id}:{shard_index}-of-{shard_count}"
+
+
+def _results_key(task_name: str, run_id: str, shard_count: int) -> str:
+    """Redis hash holding per-shard results of one run."""
+    return f"{FANOUT_KEY_PREFIX}:{task_name}:{run_id}:{shard_count}"
+
+
+def aggregate_results(results: list[dict[str, Any]]) -> dict[str, int]:
+    """Sum the numeric counters returned by shard jobs.
+
+    Args:
+        results: Result dictionaries of the individual shards.
+
+    Returns:
+        Dictionary with each counter summed over all shards.
+    """
+    totals: dict[str, int] = {}
+    for result in results:
+        for key, value in result.items():
+            if isinstance(value, int) and not isinstance(value, bool):
+                totals[key] = totals.get(key, 0) + value
+    return totals
+
+
+async def fan_out(
+    redis: ArqRedis,
+    task_name: str,
+    run_id: str,
+    shard_count: int,
+    **kwargs: Any,
+) -> list[str]:
+    """Enqueue one job per shard of a task.
+
+    Args:
+        redis: ARQ Redis connection.
+        task_name: Registered task accepting shard_index, shard_count and slot.
+        run_id: Scheduling slot ID the run belongs to; passed to the jobs as ``slot``.
+        shard_count: Number of shards to split users into.
+        **kwargs: Extra keyword arguments passed to every shard job.
+
+    Returns:
+        Job IDs of the shards enqueued by this call (already queued or
+        finished shards are skipped).
+    """
+    enqueued = []
+    for shard_index in range(shard_count):
+        job_id = shard_job_id(task_name, run_id, shard_index, shard_count)
+        job = await redis.enqueue_job(
+            task_name,
+            _job_id=job_id,
+            shard_index=shard_index,
+            shard_count=shard_count,
+            slot=run_id,
+            **kwargs,
+        )
+        if job is None:
+            logger.info(f"Shard job {job_id} already enqueued, skipping")
+            continue
+        enqueued.append(job_id)
+
+    logger.info(f"Fanned out {task_name} into {len(enqueued)}/{shard_count} shard jobs")
+    return enqueued
+
+
+def fan_out_job(
+    task_name: str,
+    shard_count: int | None = None,
+) -> Callable[[dict[str, Any]], Coroutine[Any, Any, dict[str, Any]]]:
+    """Create a cron coroutine that fans a task out for the current slot.
+
+    Args:
+        task_name: Registered task to fan out.
+        shard_count: Number of shards (defaults to settings.notification_shard_count).
+
+    Returns:
+        Coroutine function suitable for ``arq.cron``.
+    """
+
+    async def run(ctx: dict[str, Any]) -> dict[str, Any]:
+        count = shard_count or settings.notification_shard_count
+        run_id = slot_id(datetime.now(UTC))
+        job_ids = await fan_out(ctx["redis"], task_name, run_id, count)
+        return {"shards_enqueued": len(job_ids), "shard_count": count}
+
+    run.__name__ = run.__qualname__ = f"fan_out_{task_name}"
+    return run
+
+
+async def record_shard_result(
+    redis: ArqRedis | None,
+    task_name: str,
+    run_id: str,
+    shard_index: int,
+    shard_count: int,
+    result: dict[str, Any],
+) -> dict[str, int] | None:
+    """Record a shard's result and aggregate once all shards are done.
+
+    The result is written and the number of finished shards read in one
+    MULTI/EXEC transaction, so exactly one shard observes the complete set
+    and performs the aggregation. The totals are stored next to the
+    per-shard results under a ``:summary`` key.
+
+    Args:
+        redis: ARQ Redis connection (None outside a worker; nothing is recorded).
+        task_name: Registered task name.
+        run_id: Run the shard belongs to.
+        shard_index: Shard number, 0-based.
+        shard_count: Total number of shards.
+        result: This shard's result dictionary.
+
+    Returns:
+        Aggregated results if this shard completed the run, otherwise None.
+    """
+    if redis is None or shard_count <= 1:
+        return None
+
+    key = _results_key(task_name, run_id, shard_count)
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.hset(key, str(shard_index), json.dumps(result))
+        pipe.expire(key, settings.fanout_result_ttl)
+        pipe.hlen(key)
+        _, _, finished = await pipe.execute()
+
+    if finished < shard_count:
+        return None
+
+    raw_results = await redis.hgetall(key)
+    totals = aggregate_results([json.loads(value) for value in raw_results.values()])
+    await redis.set(f"{key}:summary", json.dumps(totals), ex=settings.fanout_result_ttl)
+    logger.info(f"{task_name} run {run_id} complete across {shard_count} shards: {totals}")
+    return totals
@@ -5,6 +5,7 @@ This module provides Prometheus metrics collection with:
 - Custom business metrics (subscriptions, payments, etc.)
 - Database query metrics
 - AI agent performance metrics
+- PDF report render pool metrics
 
 Usage:
     from src.core.metrics import setup_metrics
@@ -18,7 +19,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import TYPE_CHECKING
 
-from prometheus_client import Counter, Histogram
+from prometheus_client import Counter, Gauge, Histogram
 from prometheus_fastapi_instrumentator import Instrumentator
 from prometheus_fastapi_instrumentator.metrics import Info
 
@@ -82,6 +83,26 @@ cache_operations = Counter(
     ["operation", "hit"],
 )
 
+# PDF report rendering (process pool)
+report_renders = Counter(
+    "money_flow_report_renders_total",
+    "Total PDF report renders",
+    ["outcome"],
+)
+
+report_render_latency = Histogram(
+    "money_flow_report_render_seconds",
+    "PDF report render latency (including queue time)",
+    ["outcome"],
+    buckets=[0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0],
+)
+
+report_render_queue = Gauge(
+    "money_flow_report_render_queue",
+    "PDF reports in the render pool",
+    ["state"],
+)
+
 
 def _requests_by_endpoint() -> Callable[[Info], None]:
     """Create a metric for requests by endpoint.
@@ -284,11 +305,42 @@ def record_cache_operation(operation: str, hit: bool) -> None:
     ).inc()
 
 
+def record_report_render(outcome: str, latency: float) -> None:
+    """Record a PDF report render.
+
+    Args:
+        outcome: The render outcome (success, error, timeout, rejected).
+        latency: Time from submission to completion in seconds.
+
+    Example:
+        >>> record_report_render("success", 1.2)
+    """
+    report_renders.labels(outcome=outcome).inc()
+    if outcome != "rejected":
+        report_render_latency.labels(outcome=outcome).observe(latency)
+
+
+def set_report_render_queue(queued: int, running: int) -> None:
+    """Set the number of PDF reports waiting for and using render workers.
+
+    Args:
+        queued: Reports waiting for a free worker.
+        running: Reports being rendered.
+
+    Example:
+        >>> set_report_render_queue(queued=2, running=4)
+    """
+    report_render_queue.labels(state="queued").set(queued)
+    report_render_queue.labels(state="running").set(running)
+
+
 __all__ = [
     "record_agent_request",
     "record_cache_operation",
     "record_db_query",
     "record_rag_operation",
+    "record_report_render",
     "record_subscription_operation",
+    "set_report_render_queue",
     "setup_metrics",
 ]
@@ -177,7 +177,7 @@ class CircuitOpenError(ExternalServiceError):
         self.recovery_time = recovery_time
 
 
-def _check_circuit(circuit: CircuitBreakerState, name: str) -> None:
+def check_circuit(circuit: CircuitBreakerState, name: str) -> None:
     """Check if circuit allows the call.
 
     Args:
@@ -205,7 +205,7 @@ def _check_circuit(circuit: CircuitBreakerState, name: str) -> None:
         circuit.half_open_calls += 1
 
 
-def _record_success(circuit: CircuitBreakerState, name: str) -> None:
+def record_circuit_success(circuit: CircuitBreakerState, name: str) -> None:
     """Record a successful call.
 
     Args:
@@ -222,7 +222,7 @@ def _record_success(circuit: CircuitBreakerState, name: str) -> None:
         circuit.failure_count = 0
 
 
-def _record_failure(circuit: CircuitBreakerState, name: str, error: Exception) -> None:
+def record_circuit_failure(circuit: CircuitBreakerState, name: str, error: Exception) -> None:
     """Record a failed call.
 
     Args:
@@ -341,14 +341,14 @@ def circuit_breaker(
             circuit = get_circuit(name)
 
             # Check if call is allowed
-            _check_circuit(circuit, name)
+            check_circuit(circuit, name)
 
             try:
                 result = await func(*args, **kwargs)
-                _record_success(circuit, name)
+                record_circuit_success(circuit, name)
                 return result
             except Exception as e:
-                _record_failure(circuit, name, e)
+                record_circuit_failure(circuit, name, e)
                 raise
 
         return wrapper
@@ -476,7 +476,7 @@ async def resilient_call(
         # Apply circuit breaker check
         if circuit_name:
             circuit = get_circuit(circuit_name)
-            _check_circuit(circuit, circuit_name)
+            check_circuit(circuit, circuit_name)
 
         # Execute with retry and timeout
         last_exception: Exception | None = None
@@ -493,12 +493,12 @@ async def resilient_call(
                         timeout=timeout,
                     )
                     if circuit_name:
-                        _record_success(get_circuit(circuit_name), circuit_name)
+                        record_circuit_success(get_circuit(circuit_name), circuit_name)
                     return result
                 except Exception as e:
                     last_exception = e
                     if circuit_name:
-                        _record_failure(get_circuit(circuit_name), circuit_name, e)
+                        record_circuit_failure(get_circuit(circuit_name), circuit_name, e)
                     raise
 
         # Should not reach here
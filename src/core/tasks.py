@@ -25,20 +25,30 @@ Usage:
     arq src.core.tasks.WorkerSettings
 """
 
+import asyncio
 import logging
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Iterable
+from contextlib import AbstractAsyncContextManager, nullcontext
 from datetime import date, datetime, timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from arq import create_pool, cron
 from arq.connections import ArqRedis, RedisSettings
+from arq.cron import CronJob
 from arq.jobs import Job
 from pydantic import BaseModel
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
-from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.core.config import settings
+from src.core.fanout import fan_out_job, record_shard_result
+from src.services.notification_schedule import SLOT_MINUTES
+
+if TYPE_CHECKING:
+    from src.models.notification_history import NotificationChannel, NotificationType
+    from src.services.notification_dispatcher import NotificationDispatcher
+    from src.services.notification_ledger import LedgerKey
+    from src.services.notification_query_service import NotificationRecipient
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +87,38 @@ def get_redis_settings() -> RedisSettings:
     )
 
 
+# Shared worker HTTP client settings (see startup())
+WORKER_HTTP_TIMEOUT = 10.0
+WORKER_HTTP_MAX_CONNECTIONS = 50
+
+
+def _open_session(ctx: dict[str, Any]) -> AsyncSession:
+    """Open a database session for one task run.
+
+    Uses, in order: a session injected as ``ctx["db_session"]`` (tests),
+    the worker's pooled ``ctx["session_factory"]`` created in startup(),
+    or the application's module-level session factory when the task is
+    called outside a worker. No task creates its own engine.
+
+    Args:
+        ctx: ARQ context dictionary.
+
+    Returns:
+        AsyncSession; the task closes it when done.
+    """
+    db_session = ctx.get("db_session")
+    if db_session is not None:
+        return db_session
+
+    session_factory = ctx.get("session_factory")
+    if session_factory is None:
+        from src.db.database import async_session_maker
+
+        session_factory = async_session_maker
+
+    return session_factory()
+
+
 # =============================================================================
 # Task Registry
 # =============================================================================
@@ -346,681 +388,815 @@ async def cleanup_expired_sessions(ctx: dict[str, Any]) -> dict[str, int]:
     return {"cleaned_sessions": 0}
 
 
-@task(name="send_payment_reminders", max_tries=3, timeout=600)
-async def send_payment_reminders(ctx: dict[str, Any], days_ahead: int = 7) -> dict[str, int]:
-    """Send reminders for upcoming payments via Telegram.
+async def _complete_shard(
+    ctx: dict[str, Any],
+    task_name: str,
+    slot: str | None,
+    shard_index: int,
+    shard_count: int,
+    result: dict[str, int],
+) -> None:
+    """Record a shard's result with the fan-out completion barrier."""
+    if shard_count <= 1 or slot is None:
+        return
+    try:
+        await record_shard_result(
+            ctx.get("redis"), task_name, slot, shard_index, shard_count, result
+        )
+    except Exception as e:
+        # The sends already happened; a lost tally must not fail (and retry) the job
+        logger.error(f"Failed to record {task_name} shard {shard_index}/{shard_count}: {e}")
 
-    Runs daily and sends reminders to users who have Telegram notifications enabled.
-    Respects each user's reminder_days_before setting and quiet hours.
 
-    Args:
-        ctx: ARQ context dictionary.
-        days_ahead: Number of days to look ahead for payments.
+def _get_dispatcher(ctx: dict[str, Any]) -> "NotificationDispatcher":
+    """Return the worker's shared dispatcher, or a new one outside the worker."""
+    from src.services.notification_dispatcher import NotificationDispatcher
 
-    Returns:
-        Dictionary with count of reminders sent.
-    """
-    from src.models.notification import NotificationPreferences
-    from src.models.subscription import Subscription
-    from src.services.telegram_service import TelegramService
+    return ctx.get("dispatcher") or NotificationDispatcher()
 
-    logger.info(f"Running send_payment_reminders task for {days_ahead} days ahead")
 
-    # Create database session
-    db_session = ctx.get("db_session")
-    if not db_session:
-        engine = create_async_engine(settings.database_url)
-        async_session = async_sessionmaker(engine, expire_on_commit=False)
-        db_session = async_session()
+class _NotificationRun:
+    """Shared state of one run of a notification task.
 
-    telegram_service = TelegramService()
-    reminders_sent = 0
-    users_notified = 0
+    Holds the senders for the requested channels, the recipient query
+    service and the send ledger. Channels whose sender is not configured
+    are dropped, so a run only queries users reachable on a usable channel.
+    """
 
-    try:
-        # Get all users with Telegram enabled and verified
-        prefs_result = await db_session.execute(
-            select(NotificationPreferences)
-            .where(NotificationPreferences.telegram_enabled.is_(True))
-            .where(NotificationPreferences.telegram_verified.is_(True))
-            .where(NotificationPreferences.reminder_enabled.is_(True))
-            .options(selectinload(NotificationPreferences.user))
+    def __init__(
+        self,
+        ctx: dict[str, Any],
+        channels: "Iterable[NotificationChannel]",
+        shard_index: int,
+        shard_count: int,
+    ) -> None:
+        from src.models.notification_history import NotificationChannel
+        from src.services.email_service import EmailService
+        from src.services.notification_ledger import NotificationLedger
+        from src.services.notification_query_service import NotificationQueryService
+        from src.services.telegram_service import TelegramService
+
+        self.telegram_service = TelegramService(http_client=ctx.get("http_client"))
+        self.email_service = EmailService()
+        self.channels = list(channels)
+        if NotificationChannel.EMAIL in self.channels and not self.email_service.is_configured:
+            logger.warning("Email service not configured, skipping email notifications")
+            self.channels.remove(NotificationChannel.EMAIL)
+
+        self.dispatcher = _get_dispatcher(ctx)
+        self.db_session = _open_session(ctx)
+        self.queries = NotificationQueryService(
+            self.db_session, shard_index=shard_index, shard_count=shard_count
         )
-        notification_prefs = prefs_result.scalars().all()
+        # Claims are committed between batches, so they need their own session
+        self.ledger = NotificationLedger(_open_session(ctx))
 
-        today = date.today()
-        current_time = datetime.now().time()
+    def reachable(self, recipient: "NotificationRecipient") -> list["NotificationChannel"]:
+        """Channels of this run the recipient can be notified on."""
+        return [channel for channel in self.channels if recipient.can_receive(channel)]
 
-        for prefs in notification_prefs:
-            if not prefs.telegram_chat_id:
-                continue
+    def email_session(self) -> AbstractAsyncContextManager[Any]:
+        """Pooled SMTP connections for the run, if it sends email."""
+        from src.models.notification_history import NotificationChannel
 
-            # Check quiet hours
-            if prefs.is_in_quiet_hours(current_time):
-                logger.debug(f"Skipping user {prefs.user_id} - in quiet hours")
-                continue
+        if NotificationChannel.EMAIL not in self.channels:
+            return nullcontext()
+        return self.email_service.session(connections=settings.notification_email_concurrency)
 
-            # Calculate the target date based on user's reminder_days_before
-            target_date = today + timedelta(days=prefs.reminder_days_before)
-
-            # Get subscriptions due on the target date
-            subs_result = await db_session.execute(
-                select(Subscription)
-                .where(Subscription.user_id == prefs.user_id)
-                .where(Subscription.is_active.is_(True))
-                .where(Subscription.next_payment_date == target_date)
-            )
-            subscriptions = subs_result.scalars().all()
+    async def close(self) -> None:
+        """Close the run's database sessions and its own Telegram client.
 
-            for sub in subscriptions:
-                try:
-                    success = await telegram_service.send_reminder(
-                        chat_id=prefs.telegram_chat_id,
-                        subscription=sub,
-                        days_until=prefs.reminder_days_before,
-                    )
-                    if success:
-                        reminders_sent += 1
-                except Exception as e:
-                    logger.error(f"Failed to send reminder for subscription {sub.id}: {e}")
+        Without a worker client in ``ctx["http_client"]`` the Telegram
+        service creates one for the run; a shared client stays open.
+        """
+        try:
+            await self.ledger.db.close()
+            await self.db_session.close()
+        finally:
+            await self.telegram_service.aclose()
 
-            if subscriptions:
-                users_notified += 1
 
-    finally:
-        await db_session.close()
+def _sent_on(outcomes: "dict[LedgerKey, bool]", channel: "NotificationChannel") -> int:
+    """Number of successful sends on a channel."""
+    return sum(1 for key, ok in outcomes.items() if ok and key.channel == channel)
 
-    logger.info(f"Payment reminders sent: {reminders_sent} to {users_notified} users")
-    return {"reminders_sent": reminders_sent, "users_notified": users_notified}
 
+def _users_notified(outcomes: "dict[LedgerKey, bool]") -> int:
+    """Number of users with at least one successful send."""
+    return len({key.user_id for key, ok in outcomes.items() if ok})
 
-@task(name="send_daily_digest", max_tries=3, timeout=600)
-async def send_daily_digest(ctx: dict[str, Any]) -> dict[str, int]:
-    """Send daily payment digest to users who have it enabled.
 
-    Sends a summary of today's payments and upcoming payments for the week.
+async def _send_payment_reminders(
+    ctx: dict[str, Any],
+    task_name: str,
+    channels: "Iterable[NotificationChannel]",
+    shard_index: int,
+    shard_count: int,
+    slot: str | None,
+) -> dict[str, int]:
+    """Send payment reminders on several channels in one pass per user.
 
     Args:
         ctx: ARQ context dictionary.
+        task_name: Calling task, for the fan-out completion barrier.
+        channels: Channels to send reminders on.
+        shard_index: Shard of users to process (see src.core.fanout).
+        shard_count: Total number of shards (1 = all users).
+        slot: Scheduling-wheel slot to deliver; None notifies every user now.
 
     Returns:
-        Dictionary with count of digests sent.
+        Dictionary with Telegram reminders, emails sent and users notified.
     """
-    from src.models.notification import NotificationPreferences
-    from src.models.subscription import Subscription
-    from src.models.user import User
-    from src.services.telegram_service import TelegramService
-
-    logger.info("Running send_daily_digest task")
-
-    # Create database session
-    db_session = ctx.get("db_session")
-    if not db_session:
-        engine = create_async_engine(settings.database_url)
-        async_session = async_sessionmaker(engine, expire_on_commit=False)
-        db_session = async_session()
-
-    telegram_service = TelegramService()
-    digests_sent = 0
-
-    try:
-        # Get all users with daily digest enabled
-        prefs_result = await db_session.execute(
-            select(NotificationPreferences)
-            .where(NotificationPreferences.telegram_enabled.is_(True))
-            .where(NotificationPreferences.telegram_verified.is_(True))
-            .where(NotificationPreferences.daily_digest.is_(True))
-            .options(selectinload(NotificationPreferences.user))
-        )
-        notification_prefs = prefs_result.scalars().all()
-
-        today = date.today()
-        week_end = today + timedelta(days=7)
-        current_time = datetime.now().time()
-
-        for prefs in notification_prefs:
-            if not prefs.telegram_chat_id:
-                continue
-
-            # Check quiet hours
-            if prefs.is_in_quiet_hours(current_time):
-                continue
-
-            # Get subscriptions due within the next week
-            subs_result = await db_session.execute(
-                select(Subscription)
-                .where(Subscription.user_id == prefs.user_id)
-                .where(Subscription.is_active.is_(True))
-                .where(Subscription.next_payment_date >= today)
-                .where(Subscription.next_payment_date <= week_end)
-                .order_by(Subscription.next_payment_date)
-            )
-            subscriptions = list(subs_result.scalars().all())
-
-            if not subscriptions:
-                continue
-
-            # Get user's preferred currency
-            user_result = await db_session.execute(select(User).where(User.id == prefs.user_id))
-            user = user_result.scalar_one_or_none()
-            currency = (
-                user.preferences.get("currency", "GBP") if user and user.preferences else "GBP"
-            )
+    from src.models.notification_history import NotificationChannel, NotificationType
+    from src.services.notification_ledger import LedgerKey, PendingSend
+    from src.services.notification_query_service import (
+        NotificationRecipient,
+        window_conditions,
+    )
 
-            try:
-                success = await telegram_service.send_daily_digest(
-                    chat_id=prefs.telegram_chat_id,
-                    subscriptions=subscriptions,
-                    currency=currency,
+    result = {"reminders_sent": 0, "emails_sent": 0, "users_notified": 0}
+    run = _NotificationRun(ctx, channels, shard_index, shard_count)
+
+    def plan(recipient: NotificationRecipient) -> list[PendingSend]:
+        prefs = recipient.preferences
+        sends = []
+        for channel in run.reachable(recipient):
+            for sub in recipient.subscriptions:
+                key = LedgerKey(
+                    recipient.user_id,
+                    sub.id,
+                    sub.next_payment_date,
+                    channel,
+                    NotificationType.PAYMENT_REMINDER,
                 )
-                if success:
-                    digests_sent += 1
-            except Exception as e:
-                logger.error(f"Failed to send daily digest to user {prefs.user_id}: {e}")
+                if channel == NotificationChannel.TELEGRAM:
+                    send = lambda sub=sub: run.telegram_service.send_reminder(  # noqa: E731
+                        chat_id=prefs.telegram_chat_id,
+                        subscription=sub,
+                        days_until=prefs.reminder_days_before,
+                    )
+                else:
+                    send = lambda sub=sub: run.email_service.send_reminder(  # noqa: E731
+                        to_email=recipient.email,
+                        subscription=sub,
+                        days_until=prefs.reminder_days_before,
+                    )
+                sends.append(PendingSend(key, send))
+        return sends
 
+    try:
+        if run.channels:
+            async with run.email_session():
+                for window in await run.queries.delivery_windows(slot):
+                    # Users with a payment due exactly reminder_days_before from their local today
+                    async for recipients in run.queries.iter_reminder_recipients(
+                        run.channels, window.local_date, *window_conditions(window)
+                    ):
+                        # Check quiet hours
+                        sends = [
+                            send
+                            for recipient in recipients
+                            if not window.suppresses(recipient.preferences)
+                            for send in plan(recipient)
+                        ]
+                        outcomes = await run.ledger.deliver(run.dispatcher, sends)
+                        result["reminders_sent"] += _sent_on(outcomes, NotificationChannel.TELEGRAM)
+                        result["emails_sent"] += _sent_on(outcomes, NotificationChannel.EMAIL)
+                        result["users_notified"] += _users_notified(outcomes)
     finally:
-        await db_session.close()
-
-    logger.info(f"Daily digests sent: {digests_sent}")
-    return {"digests_sent": digests_sent}
+        await run.close()
 
+    logger.info(f"Payment reminders sent: {result}")
+    await _complete_shard(ctx, task_name, slot, shard_index, shard_count, result)
+    return result
 
-@task(name="send_weekly_digest", max_tries=3, timeout=600)
-async def send_weekly_digest(ctx: dict[str, Any]) -> dict[str, int]:
-    """Send weekly payment summary to users who have it enabled.
 
-    Sends a comprehensive summary of all payments for the upcoming week.
-    Only runs on each user's preferred day of the week.
+async def _send_digests(
+    ctx: dict[str, Any],
+    task_name: str,
+    notification_type: "NotificationType",
+    channels: "Iterable[NotificationChannel]",
+    shard_index: int,
+    shard_count: int,
+    slot: str | None,
+) -> dict[str, int]:
+    """Send daily or weekly digests on several channels in one pass per user.
 
     Args:
         ctx: ARQ context dictionary.
+        task_name: Calling task, for the fan-out completion barrier.
+        notification_type: DAILY_DIGEST or WEEKLY_DIGEST.
+        channels: Channels to send digests on.
+        shard_index: Shard of users to process (see src.core.fanout).
+        shard_count: Total number of shards (1 = all users).
+        slot: Scheduling-wheel slot to deliver; None notifies every user now.
 
     Returns:
         Dictionary with count of digests sent.
     """
     from src.models.notification import NotificationPreferences
-    from src.models.subscription import Subscription
-    from src.models.user import User
-    from src.services.telegram_service import TelegramService
-
-    logger.info("Running send_weekly_digest task")
-
-    # Create database session
-    db_session = ctx.get("db_session")
-    if not db_session:
-        engine = create_async_engine(settings.database_url)
-        async_session = async_sessionmaker(engine, expire_on_commit=False)
-        db_session = async_session()
-
-    telegram_service = TelegramService()
-    digests_sent = 0
+    from src.models.notification_history import NotificationChannel, NotificationType
+    from src.services.email_templates import (
+        DigestContent,
+        DigestPeriod,
+        RenderedEmail,
+        render_digests,
+    )
+    from src.services.notification_ledger import LedgerKey, PendingSend
+    from src.services.notification_query_service import (
+        NotificationRecipient,
+        window_conditions,
+    )
 
-    try:
-        today = date.today()
-        current_weekday = today.weekday()  # 0 = Monday
-        week_end = today + timedelta(days=7)
-        current_time = datetime.now().time()
-
-        # Get all users with weekly digest enabled on today's day
-        prefs_result = await db_session.execute(
-            select(NotificationPreferences)
-            .where(NotificationPreferences.telegram_enabled.is_(True))
-            .where(NotificationPreferences.telegram_verified.is_(True))
-            .where(NotificationPreferences.weekly_digest.is_(True))
-            .where(NotificationPreferences.weekly_digest_day == current_weekday)
-            .options(selectinload(NotificationPreferences.user))
+    weekly = notification_type == NotificationType.WEEKLY_DIGEST
+    period = DigestPeriod.WEEKLY if weekly else DigestPeriod.DAILY
+    result = {"digests_sent": 0}
+    run = _NotificationRun(ctx, channels, shard_index, shard_count)
+
+    def plan(
+        recipient: NotificationRecipient,
+        today: date,
+        emails: dict[str, RenderedEmail],
+    ) -> list[PendingSend]:
+        sends = []
+        for channel in run.reachable(recipient):
+            key = LedgerKey(recipient.user_id, None, today, channel, notification_type)
+            if channel == NotificationChannel.TELEGRAM:
+                send_digest = (
+                    run.telegram_service.send_weekly_digest
+                    if weekly
+                    else run.telegram_service.send_daily_digest
+                )
+                send = lambda send_digest=send_digest: send_digest(  # noqa: E731
+                    chat_id=recipient.preferences.telegram_chat_id,
+                    subscriptions=recipient.subscriptions,
+                    currency=recipient.currency,
+                )
+            elif recipient.user_id in emails:
+                send = lambda email=emails[recipient.user_id]: run.email_service.send_rendered(  # noqa: E731
+                    to_email=recipient.email, email=email
+                )
+            else:
+                continue  # No email digest without payments
+            sends.append(PendingSend(key, send))
+        return sends
+
+    def render_emails(
+        recipients: list[NotificationRecipient], today: date
+    ) -> dict[str, RenderedEmail]:
+        """Render the email digests of a whole batch in one call."""
+        if NotificationChannel.EMAIL not in run.channels:
+            return {}
+        batch = [
+            r for r in recipients if r.subscriptions and r.can_receive(NotificationChannel.EMAIL)
+        ]
+        rendered = render_digests(
+            [DigestContent(r.subscriptions, r.currency) for r in batch], period, today
         )
-        notification_prefs = prefs_result.scalars().all()
+        return {r.user_id: email for r, email in zip(batch, rendered, strict=True)}
 
-        for prefs in notification_prefs:
-            if not prefs.telegram_chat_id:
-                continue
-
-            # Check quiet hours
-            if prefs.is_in_quiet_hours(current_time):
-                continue
+    try:
+        if run.channels:
+            async with run.email_session():
+                for window in await run.queries.delivery_windows(slot):
+                    today = window.local_date
+                    if weekly:
+                        # Weekly digest on the user's day (0 = Monday), with or without
+                        # payments due in the next 7 days
+                        conditions = [
+                            NotificationPreferences.weekly_digest.is_(True),
+                            NotificationPreferences.weekly_digest_day == today.weekday(),
+                        ]
+                    else:
+                        conditions = [NotificationPreferences.daily_digest.is_(True)]
+
+                    async for recipients in run.queries.iter_upcoming_recipients(
+                        run.channels,
+                        today,
+                        today + timedelta(days=7),
+                        *conditions,
+                        *window_conditions(window),
+                        include_empty=weekly,
+                    ):
+                        # Check quiet hours
+                        recipients = [r for r in recipients if not window.suppresses(r.preferences)]
+                        emails = render_emails(recipients, today)
+                        sends = [
+                            send
+                            for recipient in recipients
+                            for send in plan(recipient, today, emails)
+                        ]
+                        outcomes = await run.ledger.deliver(run.dispatcher, sends)
+                        result["digests_sent"] += sum(outcomes.values())
+    finally:
+        await run.close()
 
-            # Get all subscriptions due in the next 7 days
-            subs_result = await db_session.execute(
-                select(Subscription)
-                .where(Subscription.user_id == prefs.user_id)
-                .where(Subscription.is_active.is_(True))
-                .where(Subscription.next_payment_date >= today)
-                .where(Subscription.next_payment_date <= week_end)
-                .order_by(Subscription.next_payment_date)
-            )
-            subscriptions = list(subs_result.scalars().all())
+    logger.info(f"{notification_type.value} sent: {result['digests_sent']}")
+    await _complete_shard(ctx, task_name, slot, shard_index, shard_count, result)
+    return result
 
-            # Get user's preferred currency
-            user_result = await db_session.execute(select(User).where(User.id == prefs.user_id))
-            user = user_result.scalar_one_or_none()
-            currency = (
-                user.preferences.get("currency", "GBP") if user and user.preferences else "GBP"
-            )
 
-            try:
-                success = await telegram_service.send_weekly_digest(
-                    chat_id=prefs.telegram_chat_id,
-                    subscriptions=subscriptions,
-                    currency=currency,
-                )
-                if success:
-                    digests_sent += 1
-            except Exception as e:
-                logger.error(f"Failed to send weekly digest to user {prefs.user_id}: {e}")
+@task(name="send_payment_reminders", max_tries=3, timeout=600)
+async def send_payment_reminders(
+    ctx: dict[str, Any],
+    days_ahead: int = 7,
+    shard_index: int = 0,
+    shard_count: int = 1,
+    slot: str | None = None,
+) -> dict[str, int]:
+    """Send reminders for upcoming payments via Telegram and email.
+
+    Sends reminders to users who have Telegram or email notifications
+    enabled, on every channel they have enabled, in a single pass.
+    Respects each user's reminder_days_before setting, local delivery
+    time and quiet hours. Each reminder is recorded in the send ledger,
+    so retries and repeated runs do not send it again.
 
-    finally:
-        await db_session.close()
+    Args:
+        ctx: ARQ context dictionary.
+        days_ahead: Unused; kept for compatibility with queued jobs.
+        shard_index: Shard of users to process (see src.core.fanout).
+        shard_count: Total number of shards (1 = all users).
+        slot: Scheduling-wheel slot to deliver; None notifies every user now.
 
-    logger.info(f"Weekly digests sent: {digests_sent}")
-    return {"digests_sent": digests_sent}
+    Returns:
+        Dictionary with count of reminders sent.
+    """
+    from src.models.notification_history import NotificationChannel
+
+    logger.info("Running send_payment_reminders task")
+    return await _send_payment_reminders(
+        ctx,
+        "send_payment_reminders",
+        [NotificationChannel.TELEGRAM, NotificationChannel.EMAIL],
+        shard_index,
+        shard_count,
+        slot,
+    )
 
 
-@task(name="scheduled_cloud_backup", max_tries=3, timeout=900)
-async def scheduled_cloud_backup(ctx: dict[str, Any]) -> dict[str, int]:
-    """Run scheduled backups for all users with backup enabled.
+@task(name="send_daily_digest", max_tries=3, timeout=600)
+async def send_daily_digest(
+    ctx: dict[str, Any],
+    shard_index: int = 0,
+    shard_count: int = 1,
+    slot: str | None = None,
+) -> dict[str, int]:
+    """Send daily payment digest to users who have it enabled.
 
-    Creates compressed JSON backups of user subscription data
-    and uploads to cloud storage (GCS) or local fallback.
+    Sends a summary of today's payments and upcoming payments for the week
+    via Telegram and email.
 
     Args:
         ctx: ARQ context dictionary.
+        shard_index: Shard of users to process (see src.core.fanout).
+        shard_count: Total number of shards (1 = all users).
+        slot: Scheduling-wheel slot to deliver; None notifies every user now.
 
     Returns:
-        Dictionary with count of successful and failed backups.
+        Dictionary with count of digests sent.
     """
-    from src.models.user import User
-    from src.services.backup_service import BackupService, run_scheduled_backup
+    from src.models.notification_history import NotificationChannel, NotificationType
 
-    logger.info("Running scheduled_cloud_backup task")
+    logger.info("Running send_daily_digest task")
+    return await _send_digests(
+        ctx,
+        "send_daily_digest",
+        NotificationType.DAILY_DIGEST,
+        [NotificationChannel.TELEGRAM, NotificationChannel.EMAIL],
+        shard_index,
+        shard_count,
+        slot,
+    )
 
-    # Create database session
-    db_session = ctx.get("db_session")
-    if not db_session:
-        engine = create_async_engine(settings.database_url)
-        async_session = async_sessionmaker(engine, expire_on_commit=False)
-        db_session = async_session()
 
-    backup_service = BackupService()
-    successful = 0
-    failed = 0
+@task(name="send_weekly_digest", max_tries=3, timeout=600)
+async def send_weekly_digest(
+    ctx: dict[str, Any],
+    shard_index: int = 0,
+    shard_count: int = 1,
+    slot: str | None = None,
+) -> dict[str, int]:
+    """Send weekly payment summary to users who have it enabled.
 
-    try:
-        # Get all active users
-        # In the future, filter by users who have backup enabled in preferences
-        users_result = await db_session.execute(select(User).where(User.is_active.is_(True)))
-        users = users_result.scalars().all()
+    Sends a comprehensive summary of all payments for the upcoming week
+    via Telegram and email. Only runs on each user's preferred (local) day
+    of the week.
 
-        for user in users:
-            try:
-                result = await run_scheduled_backup(
-                    db=db_session,
-                    user=user,
-                    backup_service=backup_service,
-                )
-                if result.success:
-                    successful += 1
-                    logger.info(
-                        f"Backup completed for user {user.id}: "
-                        f"{result.subscription_count} subscriptions, "
-                        f"{result.file_size} bytes"
-                    )
-                else:
-                    failed += 1
-                    logger.error(f"Backup failed for user {user.id}: {result.error}")
-            except Exception as e:
-                failed += 1
-                logger.error(f"Backup error for user {user.id}: {e}")
+    Args:
+        ctx: ARQ context dictionary.
+        shard_index: Shard of users to process (see src.core.fanout).
+        shard_count: Total number of shards (1 = all users).
+        slot: Scheduling-wheel slot to deliver; None notifies every user now.
 
-    finally:
-        await db_session.close()
+    Returns:
+        Dictionary with count of digests sent.
+    """
+    from src.models.notification_history import NotificationChannel, NotificationType
 
-    logger.info(f"Cloud backup complete: {successful} successful, {failed} failed")
-    return {"successful": successful, "failed": failed}
+    logger.info("Running send_weekly_digest task")
+    return await _send_digests(
+        ctx,
+        "send_weekly_digest",
+        NotificationType.WEEKLY_DIGEST,
+        [NotificationChannel.TELEGRAM, NotificationChannel.EMAIL],
+        shard_index,
+        shard_count,
+        slot,
+    )
 
 
 @task(name="send_email_reminders", max_tries=3, timeout=600)
-async def send_email_reminders(ctx: dict[str, Any], days_ahead: int = 7) -> dict[str, int]:
-    """Send payment reminders via email to users who have email notifications enabled.
+async def send_email_reminders(
+    ctx: dict[str, Any],
+    days_ahead: int = 7,
+    shard_index: int = 0,
+    shard_count: int = 1,
+    slot: str | None = None,
+) -> dict[str, int]:
+    """Send payment reminders via email only.
+
+    Scheduled runs send email from send_payment_reminders; this task is
+    kept for manual runs and already-queued jobs. Reminders already sent
+    are skipped via the send ledger.
 
     Args:
         ctx: ARQ context dictionary.
-        days_ahead: Number of days to look ahead for payments.
+        days_ahead: Unused; kept for compatibility with queued jobs.
+        shard_index: Shard of users to process (see src.core.fanout).
+        shard_count: Total number of shards (1 = all users).
+        slot: Scheduling-wheel slot to deliver; None notifies every user now.
 
     Returns:
         Dictionary with count of emails sent.
     """
-    from src.models.notification import NotificationPreferences
-    from src.models.subscription import Subscription
-    from src.models.user import User
-    from src.services.email_service import EmailService
-
-    logger.info(f"Running send_email_reminders task for {days_ahead} days ahead")
+    from src.models.notification_history import NotificationChannel
+
+    logger.info("Running send_email_reminders task")
+    return await _send_payment_reminders(
+        ctx,
+        "send_email_reminders",
+        [NotificationChannel.EMAIL],
+        shard_index,
+        shard_count,
+        slot,
+    )
 
-    # Create database session
-    db_session = ctx.get("db_session")
-    if not db_session:
-        engine = create_async_engine(settings.database_url)
-        async_session = async_sessionmaker(engine, expire_on_commit=False)
-        db_session = async_session()
 
-    email_service = EmailService()
+@task(name="send_email_daily_digest", max_tries=3, timeout=600)
+async def send_email_daily_digest(
+    ctx: dict[str, Any],
+    shard_index: int = 0,
+    shard_count: int = 1,
+    slot: str | None = None,
+) -> dict[str, int]:
+    """Send daily payment digest via email only.
 
-    if not email_service.is_configured:
-        logger.warning("Email service not configured, skipping email reminders")
-        return {"emails_sent": 0, "users_notified": 0}
+    Scheduled runs send email from send_daily_digest; this task is kept for
+    manual runs and already-queued jobs.
 
-    emails_sent = 0
-    users_notified = 0
+    Args:
+        ctx: ARQ context dictionary.
+        shard_index: Shard of users to process (see src.core.fanout).
+        shard_count: Total number of shards (1 = all users).
+        slot: Scheduling-wheel slot to deliver; None notifies every user now.
 
-    try:
-        # Get all users with email reminders enabled
-        prefs_result = await db_session.execute(
-            select(NotificationPreferences)
-            .where(NotificationPreferences.email_enabled.is_(True))
-            .where(NotificationPreferences.reminder_enabled.is_(True))
-            .options(selectinload(NotificationPreferences.user))
-        )
-        notification_prefs = prefs_result.scalars().all()
+    Returns:
+        Dictionary with count of digests sent.
+    """
+    from src.models.notification_history import NotificationChannel, NotificationType
 
-        today = date.today()
+    logger.info("Running send_email_daily_digest task")
+    return await _send_digests(
+        ctx,
+        "send_email_daily_digest",
+        NotificationType.DAILY_DIGEST,
+        [NotificationChannel.EMAIL],
+        shard_index,
+        shard_count,
+        slot,
+    )
 
-        for prefs in notification_prefs:
-            # Get user email
-            user_result = await db_session.execute(select(User).where(User.id == prefs.user_id))
-            user = user_result.scalar_one_or_none()
-            if not user or not user.email:
-                continue
 
-            # Calculate the target date based on user's reminder_days_before
-            target_date = today + timedelta(days=prefs.reminder_days_before)
+@task(name="send_email_weekly_digest", max_tries=3, timeout=600)
+async def send_email_weekly_digest(
+    ctx: dict[str, Any],
+    shard_index: int = 0,
+    shard_count: int = 1,
+    slot: str | None = None,
+) -> dict[str, int]:
+    """Send weekly payment summary via email only.
 
-            # Get subscriptions due on the target date
-            subs_result = await db_session.execute(
-                select(Subscription)
-                .where(Subscription.user_id == prefs.user_id)
-                .where(Subscription.is_active.is_(True))
-                .where(Subscription.next_payment_date == target_date)
-            )
-            subscriptions = subs_result.scalars().all()
+    Scheduled runs send email from send_weekly_digest; this task is kept
+    for manual runs and already-queued jobs.
 
-            for sub in subscriptions:
-                try:
-                    success = await email_service.send_reminder(
-                        to_email=user.email,
-                        subscription=sub,
-                        days_until=prefs.reminder_days_before,
-                    )
-                    if success:
-                        emails_sent += 1
-                except Exception as e:
-                    logger.error(f"Failed to send email reminder for subscription {sub.id}: {e}")
+    Args:
+        ctx: ARQ context dictionary.
+        shard_index: Shard of users to process (see src.core.fanout).
+        shard_count: Total number of shards (1 = all users).
+        slot: Scheduling-wheel slot to deliver; None notifies every user now.
 
-            if subscriptions:
-                users_notified += 1
+    Returns:
+        Dictionary with count of digests sent.
+    """
+    from src.models.notification_history import NotificationChannel, NotificationType
 
-    finally:
-        await db_session.close()
+    logger.info("Running send_email_weekly_digest task")
+    return await _send_digests(
+        ctx,
+        "send_email_weekly_digest",
+        NotificationType.WEEKLY_DIGEST,
+        [NotificationChannel.EMAIL],
+        shard_index,
+        shard_count,
+        slot,
+    )
 
-    logger.info(f"Email reminders sent: {emails_sent} to {users_notified} users")
-    return {"emails_sent": emails_sent, "users_notified": users_notified}
 
+@task(name="send_overdue_alerts", max_tries=3, timeout=600)
+async def send_overdue_alerts(
+    ctx: dict[str, Any],
+    shard_index: int = 0,
+    shard_count: int = 1,
+    slot: str | None = None,
+) -> dict[str, int]:
+    """Send alerts for overdue payments.
 
-@task(name="send_email_daily_digest", max_tries=3, timeout=600)
-async def send_email_daily_digest(ctx: dict[str, Any]) -> dict[str, int]:
-    """Send daily payment digest via email.
+    Notifies users about payments that were due but haven't been marked as
+    paid, at most once per subscription per (local) day.
 
     Args:
         ctx: ARQ context dictionary.
+        shard_index: Shard of users to process (see src.core.fanout).
+        shard_count: Total number of shards (1 = all users).
+        slot: Scheduling-wheel slot to deliver; None notifies every user now.
 
     Returns:
-        Dictionary with count of digests sent.
+        Dictionary with count of alerts sent.
     """
-    from src.models.notification import NotificationPreferences
-    from src.models.subscription import Subscription
-    from src.models.user import User
-    from src.services.email_service import EmailService
-
-    logger.info("Running send_email_daily_digest task")
-
-    # Create database session
-    db_session = ctx.get("db_session")
-    if not db_session:
-        engine = create_async_engine(settings.database_url)
-        async_session = async_sessionmaker(engine, expire_on_commit=False)
-        db_session = async_session()
-
-    email_service = EmailService()
+    from src.models.notification_history import NotificationChannel, NotificationType
+    from src.services.notification_ledger import LedgerKey, PendingSend
+    from src.services.notification_query_service import (
+        NotificationRecipient,
+        window_conditions,
+    )
 
-    if not email_service.is_configured:
-        logger.warning("Email service not configured, skipping email digests")
-        return {"digests_sent": 0}
+    logger.info("Running send_overdue_alerts task")
 
-    digests_sent = 0
+    result = {"alerts_sent": 0}
+    run = _NotificationRun(ctx, [NotificationChannel.TELEGRAM], shard_index, shard_count)
+
+    def plan(recipient: NotificationRecipient, today: date) -> list[PendingSend]:
+        prefs = recipient.preferences
+        sends = []
+        for sub in recipient.subscriptions:
+            days_overdue = (today - sub.next_payment_date).days
+            key = LedgerKey(
+                recipient.user_id,
+                sub.id,
+                today,
+                NotificationChannel.TELEGRAM,
+                NotificationType.OVERDUE_ALERT,
+            )
+            sends.append(
+                PendingSend(
+                    key,
+                    # Use negative days_until to indicate overdue
+                    lambda sub=sub, days_overdue=days_overdue: run.telegram_service.send_reminder(
+                        chat_id=prefs.telegram_chat_id,
+                        subscription=sub,
+                        days_until=-days_overdue,  # Negative = overdue
+                    ),
+                )
+            )
+        return sends
 
     try:
-        # Get all users with email daily digest enabled
-        prefs_result = await db_session.execute(
-            select(NotificationPreferences)
-            .where(NotificationPreferences.email_enabled.is_(True))
-            .where(NotificationPreferences.daily_digest.is_(True))
-            .options(selectinload(NotificationPreferences.user))
-        )
-        notification_prefs = prefs_result.scalars().all()
+        for window in await run.queries.delivery_windows(slot):
+            # Users with overdue alerts enabled and active subscriptions past due
+            async for recipients in run.queries.iter_overdue_recipients(
+                run.channels, window.local_date, *window_conditions(window)
+            ):
+                # Check quiet hours
+                sends = [
+                    send
+                    for recipient in recipients
+                    if not window.suppresses(recipient.preferences)
+                    for send in plan(recipient, window.local_date)
+                ]
+                outcomes = await run.ledger.deliver(run.dispatcher, sends)
+                result["alerts_sent"] += sum(outcomes.values())
 
-        today = date.today()
-        week_end = today + timedelta(days=7)
+    finally:
+        await run.close()
 
-        for prefs in notification_prefs:
-            # Get user email and preferences
-            user_result = await db_session.execute(select(User).where(User.id == prefs.user_id))
-            user = user_result.scalar_one_or_none()
-            if not user or not user.email:
-                continue
+    logger.info(f"Overdue alerts sent: {result['alerts_sent']}")
+    await _complete_shard(ctx, "send_overdue_alerts", slot, shard_index, shard_count, result)
+    return result
 
-            currency = (
-                user.preferences.get("currency", "GBP") if user and user.preferences else "GBP"
-            )
 
-            # Get subscriptions due within the next week
-            subs_result = await db_session.execute(
-                select(Subscription)
-                .where(Subscription.user_id == prefs.user_id)
-                .where(Subscription.is_active.is_(True))
-                .where(Subscription.next_payment_date >= today)
-                .where(Subscription.next_payment_date <= week_end)
-                .order_by(Subscription.next_payment_date)
-            )
-            subscriptions = list(subs_result.scalars().all())
+@task(name="prune_notification_ledger", max_tries=3, timeout=300)
+async def prune_notification_ledger(ctx: dict[str, Any]) -> dict[str, int]:
+    """Delete send-ledger entries older than the retention period.
 
-            if not subscriptions:
-                continue
+    Args:
+        ctx: ARQ context dictionary.
 
-            try:
-                success = await email_service.send_daily_digest(
-                    to_email=user.email,
-                    subscriptions=subscriptions,
-                    currency=currency,
-                )
-                if success:
-                    digests_sent += 1
-            except Exception as e:
-                logger.error(f"Failed to send email daily digest to user {prefs.user_id}: {e}")
+    Returns:
+        Dictionary with count of entries deleted.
+    """
+    from src.services.notification_ledger import NotificationLedger
 
+    logger.info("Running prune_notification_ledger task")
+
+    cutoff = datetime.utcnow() - timedelta(days=settings.notification_ledger_retention_days)
+    db_session = _open_session(ctx)
+    try:
+        deleted = await NotificationLedger(db_session).prune(cutoff)
     finally:
         await db_session.close()
 
-    logger.info(f"Email daily digests sent: {digests_sent}")
-    return {"digests_sent": digests_sent}
+    logger.info(f"Pruned {deleted} notification ledger entries")
+    return {"entries_deleted": deleted}
 
 
-@task(name="send_email_weekly_digest", max_tries=3, timeout=600)
-async def send_email_weekly_digest(ctx: dict[str, Any]) -> dict[str, int]:
-    """Send weekly payment summary via email.
+@task(name="scheduled_cloud_backup", max_tries=3, timeout=900)
+async def scheduled_cloud_backup(ctx: dict[str, Any]) -> dict[str, int]:
+    """Run scheduled backups for all users with backup enabled.
 
-    Only runs on each user's preferred day of the week.
+    Creates compressed JSON backups of user subscription data and uploads
+    them to cloud storage (GCS) or local fallback. Backups are incremental:
+    users whose data is unchanged since their last backup are skipped, and
+    between periodic full snapshots only deltas are written.
+
+    Users are serialized one at a time on the task's session while up to
+    ``backup_upload_concurrency`` uploads (and retention cleanups) run in
+    the background. Backup states are recorded once the uploads finish.
 
     Args:
         ctx: ARQ context dictionary.
 
     Returns:
-        Dictionary with count of digests sent.
+        Dictionary with count of successful, skipped and failed backups,
+        and of successful backups whose retention cleanup failed.
     """
-    from src.models.notification import NotificationPreferences
-    from src.models.subscription import Subscription
     from src.models.user import User
-    from src.services.email_service import EmailService
+    from src.services.backup_service import BackupService, PreparedBackup
 
-    logger.info("Running send_email_weekly_digest task")
+    logger.info("Running scheduled_cloud_backup task")
 
-    # Create database session
-    db_session = ctx.get("db_session")
-    if not db_session:
-        engine = create_async_engine(settings.database_url)
-        async_session = async_sessionmaker(engine, expire_on_commit=False)
-        db_session = async_session()
+    db_session = _open_session(ctx)
 
-    email_service = EmailService()
+    backup_service = ctx.get("backup_service") or BackupService()
+    semaphore = asyncio.Semaphore(settings.backup_upload_concurrency)
+    uploaded: list[PreparedBackup] = []
+    uploads: list[asyncio.Task] = []
+    successful = 0
+    skipped = 0
+    failed = 0
+    cleanup_failed = 0
 
-    if not email_service.is_configured:
-        logger.warning("Email service not configured, skipping email weekly digests")
-        return {"digests_sent": 0}
+    async def upload(prepared: PreparedBackup) -> None:
+        nonlocal successful, failed, cleanup_failed
+        try:
+            try:
+                result = await backup_service.upload_prepared(prepared)
+            except Exception as e:
+                failed += 1
+                logger.error(f"Backup error for user {prepared.user_id}: {e}")
+                return
+            if not result.success:
+                failed += 1
+                logger.error(f"Backup failed for user {prepared.user_id}: {result.error}")
+                return
+            successful += 1
+            uploaded.append(prepared)
 
-    digests_sent = 0
+            # The backup is stored; a failed cleanup is retried on the next run
+            try:
+                deleted = await backup_service.cleanup_old_backups(prepared.user_id)
+            except Exception as e:
+                cleanup_failed += 1
+                logger.error(f"Backup cleanup error for user {prepared.user_id}: {e}")
+                return
+            if deleted > 0:
+                logger.info(f"Cleaned up {deleted} old backups for user {prepared.user_id}")
+        finally:
+            semaphore.release()
 
     try:
-        today = date.today()
-        current_weekday = today.weekday()  # 0 = Monday
-        week_end = today + timedelta(days=7)
-
-        # Get all users with email weekly digest enabled on today's day
-        prefs_result = await db_session.execute(
-            select(NotificationPreferences)
-            .where(NotificationPreferences.email_enabled.is_(True))
-            .where(NotificationPreferences.weekly_digest.is_(True))
-            .where(NotificationPreferences.weekly_digest_day == current_weekday)
-            .options(selectinload(NotificationPreferences.user))
+        # Get all active users
+        # In the future, filter by users who have backup enabled in preferences
+        # Only the ID and email are backed up; loading User entities would
+        # pull in all of their relationships
+        users_result = await db_session.execute(
+            select(User.id, User.email).where(User.is_active.is_(True))
         )
-        notification_prefs = prefs_result.scalars().all()
+        users = users_result.all()
 
-        for prefs in notification_prefs:
-            # Get user email and preferences
-            user_result = await db_session.execute(select(User).where(User.id == prefs.user_id))
-            user = user_result.scalar_one_or_none()
-            if not user or not user.email:
+        for user in users:
+            try:
+                prepared = await backup_service.prepare_backup(db_session, user)
+            except Exception as e:
+                failed += 1
+                logger.error(f"Backup error for user {user.id}: {e}")
+                continue
+            if prepared is None:
+                skipped += 1
                 continue
 
-            currency = (
-                user.preferences.get("currency", "GBP") if user and user.preferences else "GBP"
-            )
-
-            # Get all subscriptions due in the next 7 days
-            subs_result = await db_session.execute(
-                select(Subscription)
-                .where(Subscription.user_id == prefs.user_id)
-                .where(Subscription.is_active.is_(True))
-                .where(Subscription.next_payment_date >= today)
-                .where(Subscription.next_payment_date <= week_end)
-                .order_by(Subscription.next_payment_date)
-            )
-            subscriptions = list(subs_result.scalars().all())
+            # Bounds in-flight uploads and the backups held in memory
+            await semaphore.acquire()
+            uploads.append(asyncio.create_task(upload(prepared)))
 
-            try:
-                success = await email_service.send_weekly_digest(
-                    to_email=user.email,
-                    subscriptions=subscriptions,
-                    currency=currency,
-                )
-                if success:
-                    digests_sent += 1
-            except Exception as e:
-                logger.error(f"Failed to send email weekly digest to user {prefs.user_id}: {e}")
+        await asyncio.gather(*uploads)
+        await backup_service.record_backups(db_session, uploaded)
 
     finally:
+        for pending in uploads:
+            pending.cancel()
         await db_session.close()
 
-    logger.info(f"Email weekly digests sent: {digests_sent}")
-    return {"digests_sent": digests_sent}
+    logger.info(
+        f"Cloud backup complete: {successful} successful, {skipped} unchanged, {failed} failed, "
+        f"{cleanup_failed} cleanups failed"
+    )
+    return {
+        "successful": successful,
+        "skipped": skipped,
+        "failed": failed,
+        "cleanup_failed": cleanup_failed,
+    }
 
 
-@task(name="send_overdue_alerts", max_tries=3, timeout=600)
-async def send_overdue_alerts(ctx: dict[str, Any]) -> dict[str, int]:
-    """Send alerts for overdue payments.
+@task(name="dispatch_webhook_deliveries", max_tries=1, timeout=300)
+async def dispatch_webhook_deliveries(ctx: dict[str, Any]) -> dict[str, int]:
+    """Send pending webhook deliveries from the outbox.
 
-    Notifies users about payments that were due but haven't been marked as paid.
+    Enqueued when a transaction that queued deliveries commits, and run
+    every minute by cron for anything left behind. Batches are claimed
+    with SKIP LOCKED, so several runs can work through the outbox at once.
 
     Args:
         ctx: ARQ context dictionary.
 
     Returns:
-        Dictionary with count of alerts sent.
+        Dictionary with count of deliveries dispatched.
     """
-    from src.models.notification import NotificationPreferences
-    from src.models.subscription import Subscription
-    from src.services.telegram_service import TelegramService
+    from src.services.webhook_dispatcher import get_webhook_dispatcher
 
-    logger.info("Running send_overdue_alerts task")
+    dispatcher = ctx.get("webhook_dispatcher") or get_webhook_dispatcher()
+    batch_size = settings.webhook_dispatch_batch_size
+    dispatched = 0
 
-    # Create database session
-    db_session = ctx.get("db_session")
-    if not db_session:
-        engine = create_async_engine(settings.database_url)
-        async_session = async_sessionmaker(engine, expire_on_commit=False)
-        db_session = async_session()
+    db_session = _open_session(ctx)
+    try:
+        for _ in range(settings.webhook_dispatch_max_batches):
+            claimed = await dispatcher.dispatch_pending(db_session, batch_size)
+            dispatched += claimed
+            if claimed < batch_size:
+                break
+    finally:
+        await db_session.close()
 
-    telegram_service = TelegramService()
-    alerts_sent = 0
+    if dispatched:
+        logger.info(f"Dispatched {dispatched} webhook deliveries")
+    return {"dispatched": dispatched}
 
-    try:
-        # Get all users with overdue alerts enabled
-        prefs_result = await db_session.execute(
-            select(NotificationPreferences)
-            .where(NotificationPreferences.telegram_enabled.is_(True))
-            .where(NotificationPreferences.telegram_verified.is_(True))
-            .where(NotificationPreferences.overdue_alerts.is_(True))
-            .options(selectinload(NotificationPreferences.user))
-        )
-        notification_prefs = prefs_result.scalars().all()
 
-        today = date.today()
-        current_time = datetime.now().time()
+@task(name="retry_webhook_deliveries", max_tries=1, timeout=300)
+async def retry_webhook_deliveries(ctx: dict[str, Any]) -> dict[str, int]:
+    """Resend failed webhook deliveries that are due for retry.
 
-        for prefs in notification_prefs:
-            if not prefs.telegram_chat_id:
-                continue
+    Scans deliveries of all users: due retries are claimed in batches with
+    SKIP LOCKED and resent concurrently, so running this on more workers
+    raises retry throughput.
 
-            # Check quiet hours
-            if prefs.is_in_quiet_hours(current_time):
-                continue
+    Args:
+        ctx: ARQ context dictionary.
 
-            # Get overdue subscriptions (past due date, still active)
-            subs_result = await db_session.execute(
-                select(Subscription)
-                .where(Subscription.user_id == prefs.user_id)
-                .where(Subscription.is_active.is_(True))
-                .where(Subscription.next_payment_date < today)
-            )
-            overdue_subscriptions = subs_result.scalars().all()
+    Returns:
+        Dictionary with count of deliveries retried.
+    """
+    from src.services.webhook_dispatcher import get_webhook_dispatcher
 
-            for sub in overdue_subscriptions:
-                days_overdue = (today - sub.next_payment_date).days
-                try:
-                    # Use negative days_until to indicate overdue
-                    success = await telegram_service.send_reminder(
-                        chat_id=prefs.telegram_chat_id,
-                        subscription=sub,
-                        days_until=-days_overdue,  # Negative = overdue
-                    )
-                    if success:
-                        alerts_sent += 1
-                except Exception as e:
-                    logger.error(f"Failed to send overdue alert for subscription {sub.id}: {e}")
+    dispatcher = ctx.get("webhook_dispatcher") or get_webhook_dispatcher()
+    batch_size = settings.webhook_dispatch_batch_size
+    retried = 0
 
+    db_session = _open_session(ctx)
+    try:
+        for _ in range(settings.webhook_dispatch_max_batches):
+            claimed = await dispatcher.retry_due(db_session, batch_size)
+            retried += claimed
+            if claimed < batch_size:
+                break
     finally:
         await db_session.close()
 
-    logger.info(f"Overdue alerts sent: {alerts_sent}")
-    return {"alerts_sent": alerts_sent}
+    if retried:
+        logger.info(f"Retried {retried} webhook deliveries")
+    return {"retried": retried}
 
 
 # =============================================================================
@@ -1031,26 +1207,88 @@ async def send_overdue_alerts(ctx: dict[str, Any]) -> dict[str, int]:
 async def startup(ctx: dict[str, Any]) -> None:
     """Worker startup hook.
 
-    Called when the worker starts. Use for initializing connections.
+    Creates the resources shared by every task run for the lifetime of the
+    worker process and stores them in ctx:
+
+    - ``engine`` / ``session_factory``: one pooled database engine
+    - ``http_client``: pooled HTTP client for Telegram and other APIs
+    - ``cache``: connected Redis cache service
+    - ``backup_service``: backup service with its lazily created GCS client
+    - ``dispatcher``: per-channel concurrency and rate limits for notifications
+    - ``webhook_dispatcher``: webhook sends on the shared HTTP client, with
+      per-endpoint limits and circuit breakers
+
+    ARQ itself provides the queue's Redis connection as ``ctx["redis"]``.
 
     Args:
         ctx: ARQ context dictionary.
     """
+    from src.db.database import create_database_engine
+    from src.services.backup_service import BackupService
+    from src.services.cache_service import get_cache_service
+    from src.services.ical_cache import track_subscription_changes
+    from src.services.notification_dispatcher import NotificationDispatcher
+    from src.services.telegram_service import create_http_client
+    from src.services.webhook_dispatcher import WebhookDispatcher
+
     logger.info("ARQ worker starting up")
-    # Initialize any connections needed by tasks
     ctx["startup_time"] = datetime.utcnow()
 
+    engine = create_database_engine()
+    ctx["engine"] = engine
+    ctx["session_factory"] = async_sessionmaker(engine, expire_on_commit=False)
+    ctx["http_client"] = create_http_client(
+        max_connections=WORKER_HTTP_MAX_CONNECTIONS, timeout=WORKER_HTTP_TIMEOUT
+    )
+    ctx["cache"] = await get_cache_service()
+    ctx["backup_service"] = BackupService()
+    ctx["dispatcher"] = NotificationDispatcher()
+    ctx["webhook_dispatcher"] = WebhookDispatcher(http_client=ctx["http_client"])
+    # Replace iCal data versions when tasks change subscriptions
+    track_subscription_changes()
+
 
 async def shutdown(ctx: dict[str, Any]) -> None:
     """Worker shutdown hook.
 
-    Called when the worker shuts down. Use for cleanup.
+    Closes the shared resources created by startup().
 
     Args:
         ctx: ARQ context dictionary.
     """
+    from src.services.cache_service import close_cache_service
+
     logger.info("ARQ worker shutting down")
-    # Clean up any connections
+
+    ctx.pop("webhook_dispatcher", None)
+    http_client = ctx.pop("http_client", None)
+    if http_client is not None:
+        await http_client.aclose()
+
+    if ctx.pop("cache", None) is not None:
+        await close_cache_service()
+
+    ctx.pop("session_factory", None)
+    engine = ctx.pop("engine", None)
+    if engine is not None:
+        await engine.dispose()
+
+
+def _fan_out_cron(task_name: str) -> CronJob:
+    """Cron entry that enqueues a sharded run of a notification task every slot.
+
+    The entry fires at the start of each scheduling-wheel slot; the shard
+    jobs then notify only the users whose local delivery time falls in that
+    slot (see src.services.notification_schedule).
+
+    Args:
+        task_name: Registered task accepting shard_index, shard_count and slot.
+
+    Returns:
+        CronJob for WorkerSettings.cron_jobs.
+    """
+    minutes = set(range(0, 60, SLOT_MINUTES))
+    return cron(fan_out_job(task_name), minute=minutes, timeout=60)
 
 
 class WorkerSettings:
@@ -1085,22 +1323,21 @@ class WorkerSettings:
     cron_jobs = [
         # Clean up expired sessions daily at 3 AM
         cron(cleanup_expired_sessions, hour=3, minute=0),
-        # Telegram notifications
-        # Send payment reminders daily at 9 AM
-        cron(send_payment_reminders, hour=9, minute=0),
-        # Send daily digest at 8 AM
-        cron(send_daily_digest, hour=8, minute=0),
-        # Send weekly digest at 8 AM (task filters by user's preferred day)
-        cron(send_weekly_digest, hour=8, minute=0),
-        # Check for overdue payments at 10 AM
-        cron(send_overdue_alerts, hour=10, minute=0),
-        # Email notifications
-        # Send email reminders daily at 9:30 AM (staggered from Telegram)
-        cron(send_email_reminders, hour=9, minute=30),
-        # Send email daily digest at 8:30 AM
-        cron(send_email_daily_digest, hour=8, minute=30),
-        # Send email weekly digest at 8:30 AM (task filters by user's preferred day)
-        cron(send_email_weekly_digest, hour=8, minute=30),
+        # Notification crons run every 15-minute slot and fan out into one job
+        # per user shard (see src.core.fanout); each user is notified in the
+        # slot containing their local reminder_time (or quiet_hours_end).
+        # Each task sends on Telegram and email in one pass per user.
+        _fan_out_cron("send_payment_reminders"),
+        _fan_out_cron("send_daily_digest"),
+        # Weekly digest tasks filter by the user's preferred (local) day
+        _fan_out_cron("send_weekly_digest"),
+        _fan_out_cron("send_overdue_alerts"),
+        # Prune the notification send ledger daily at 3:30 AM
+        cron(prune_notification_ledger, hour=3, minute=30),
         # Run cloud backups daily at 2 AM
         cron(scheduled_cloud_backup, hour=2, minute=0),
+        # Send webhook deliveries missed by the on-commit dispatch every minute
+        cron(dispatch_webhook_deliveries, timeout=300),
+        # Resend webhook deliveries due for retry every minute
+        cron(retry_webhook_deliveries, timeout=300),
     ]
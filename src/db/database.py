@@ -26,6 +26,7 @@ import logging
 
 from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
@@ -94,8 +95,21 @@ def _get_engine_kwargs() -> dict:
     return kwargs
 
 
+def create_database_engine() -> AsyncEngine:
+    """Create an async engine with the configured connection pool.
+
+    Long-lived processes other than the API (e.g. the ARQ worker) use this
+    to own a single pooled engine for their lifetime and dispose of it on
+    shutdown.
+
+    Returns:
+        AsyncEngine: New engine; the caller is responsible for disposing it.
+    """
+    return create_async_engine(settings.database_url, **_get_engine_kwargs())
+
+
 # Create async engine with optimized connection pool
-engine = create_async_engine(settings.database_url, **_get_engine_kwargs())
+engine = create_database_engine()
 
 
 # Pool event listeners for metrics and debugging
@@ -0,0 +1,49 @@
+"""add_google_calendar_event_syncs
+
+Revision ID: a4c8e1f93b62
+Revises: e7b3c9a15d20
+Create Date: 2026-01-14 09:42:18.305617
+
+Incremental Google Calendar sync:
+- google_calendar_event_syncs: calendar event and content hash each
+  subscription was last synced to, so syncs only push changes
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a4c8e1f93b62"
+down_revision: str | Sequence[str] | None = "e7b3c9a15d20"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create google_calendar_event_syncs table."""
+    op.create_table(
+        "google_calendar_event_syncs",
+        sa.Column("subscription_id", sa.String(length=36), nullable=False),
+        sa.Column("user_id", sa.String(length=36), nullable=False),
+        sa.Column("calendar_id", sa.String(length=255), nullable=False),
+        sa.Column("event_id", sa.String(length=1024), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("synced_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("subscription_id"),
+    )
+    op.create_index(
+        "ix_google_calendar_event_syncs_user_id",
+        "google_calendar_event_syncs",
+        ["user_id"],
+    )
+
+
+def downgrade() -> None:
+    """Drop google_calendar_event_syncs table."""
+    op.drop_index(
+        "ix_google_calendar_event_syncs_user_id", table_name="google_calendar_event_syncs"
+    )
+    op.drop_table("google_calendar_event_syncs")
@@ -0,0 +1,70 @@
+"""add_statement_dedup
+
+Revision ID: b7d4e2a19c30
+Revises: e631c2e23154
+Create Date: 2026-01-06 10:12:41.503118
+
+Statement re-upload deduplication:
+- statement_import_jobs.content_hash: SHA-256 of the uploaded file
+- statement_transaction_fingerprints: per-transaction hashes per job
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d4e2a19c30"
+down_revision: str | Sequence[str] | None = "e631c2e23154"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add content hash and transaction fingerprint table."""
+    op.add_column(
+        "statement_import_jobs",
+        sa.Column("content_hash", sa.String(length=64), nullable=True),
+    )
+    op.create_index(
+        "ix_import_jobs_user_content_hash",
+        "statement_import_jobs",
+        ["user_id", "content_hash"],
+        unique=False,
+    )
+
+    op.create_table(
+        "statement_transaction_fingerprints",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("user_id", sa.String(length=36), nullable=False),
+        sa.Column("job_id", sa.UUID(), nullable=False),
+        sa.Column("fingerprint", sa.String(length=64), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["job_id"], ["statement_import_jobs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("job_id", "fingerprint", name="uq_txn_fingerprints_job_fingerprint"),
+    )
+    op.create_index(
+        "ix_txn_fingerprints_user_fingerprint",
+        "statement_transaction_fingerprints",
+        ["user_id", "fingerprint"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop transaction fingerprint table and content hash."""
+    op.drop_index(
+        "ix_txn_fingerprints_user_fingerprint",
+        table_name="statement_transaction_fingerprints",
+    )
+    op.drop_table("statement_transaction_fingerprints")
+    op.drop_index("ix_import_jobs_user_content_hash", table_name="statement_import_jobs")
+    op.drop_column("statement_import_jobs", "content_hash")
@@ -0,0 +1,66 @@
+"""add_notification_timezone
+
+Revision ID: c3a9f1d6e482
+Revises: b7d4e2a19c30
+Create Date: 2026-01-08 09:41:17.220945
+
+Timezone-aware notification scheduling:
+- notification_preferences.timezone: IANA timezone mirrored from the
+  user's preferences, backfilled from users.preferences
+"""
+
+import json
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3a9f1d6e482"
+down_revision: str | Sequence[str] | None = "b7d4e2a19c30"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add timezone column, backfill it and index it with reminder_time."""
+    op.add_column(
+        "notification_preferences",
+        sa.Column("timezone", sa.String(length=64), server_default="UTC", nullable=False),
+    )
+
+    # users.preferences is a JSON string that may be malformed, so parse it
+    # in Python rather than casting in SQL
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text(
+            "SELECT np.id, u.preferences FROM notification_preferences np "
+            "JOIN users u ON u.id = np.user_id WHERE u.preferences IS NOT NULL"
+        )
+    ).fetchall()
+    for prefs_id, raw_preferences in rows:
+        try:
+            timezone = json.loads(raw_preferences).get("timezone")
+        except (ValueError, TypeError, AttributeError):
+            continue
+        if isinstance(timezone, str) and timezone and timezone != "UTC":
+            bind.execute(
+                sa.text("UPDATE notification_preferences SET timezone = :tz WHERE id = :id"),
+                {"tz": timezone[:64], "id": prefs_id},
+            )
+
+    op.create_index(
+        "ix_notification_preferences_timezone_reminder_time",
+        "notification_preferences",
+        ["timezone", "reminder_time"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop timezone column and index."""
+    op.drop_index(
+        "ix_notification_preferences_timezone_reminder_time",
+        table_name="notification_preferences",
+    )
+    op.drop_column("notification_preferences", "timezone")
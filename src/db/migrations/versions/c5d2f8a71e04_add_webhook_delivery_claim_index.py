@@ -0,0 +1,35 @@
+"""add_webhook_delivery_claim_index
+
+Revision ID: c5d2f8a71e04
+Revises: a4c8e1f93b62
+Create Date: 2026-01-16 11:08:52.417093
+
+Batched webhook retries:
+- ix_webhook_deliveries_status_next_retry_at: lets the dispatcher and the
+  retry scanner claim due PENDING/RETRYING deliveries without scanning
+  every delivery of that status
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5d2f8a71e04"
+down_revision: str | Sequence[str] | None = "a4c8e1f93b62"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the delivery claim index."""
+    op.create_index(
+        "ix_webhook_deliveries_status_next_retry_at",
+        "webhook_deliveries",
+        ["status", "next_retry_at"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the delivery claim index."""
+    op.drop_index("ix_webhook_deliveries_status_next_retry_at", table_name="webhook_deliveries")
@@ -0,0 +1,56 @@
+"""add_notification_sends
+
+Revision ID: d5e8a2c47b91
+Revises: c3a9f1d6e482
+Create Date: 2026-01-09 14:22:05.318417
+
+Notification send ledger:
+- notification_sends: one row per claimed notification, unique on
+  (user, subscription, occurrence date, channel, type)
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d5e8a2c47b91"
+down_revision: str | Sequence[str] | None = "c3a9f1d6e482"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create notification_sends table."""
+    op.create_table(
+        "notification_sends",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("user_id", sa.String(length=36), nullable=False),
+        sa.Column("subscription_key", sa.String(length=36), nullable=False),
+        sa.Column("occurrence_date", sa.Date(), nullable=False),
+        sa.Column("channel", sa.String(length=20), nullable=False),
+        sa.Column("notification_type", sa.String(length=50), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("claimed_at", sa.DateTime(), nullable=False),
+        sa.Column("sent_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "user_id",
+            "subscription_key",
+            "occurrence_date",
+            "channel",
+            "notification_type",
+            name="uq_notification_sends_key",
+        ),
+    )
+    op.create_index(
+        "ix_notification_sends_claimed_at", "notification_sends", ["claimed_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Drop notification_sends table."""
+    op.drop_index("ix_notification_sends_claimed_at", table_name="notification_sends")
+    op.drop_table("notification_sends")
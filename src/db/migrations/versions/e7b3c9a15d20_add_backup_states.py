@@ -0,0 +1,42 @@
+"""add_backup_states
+
+Revision ID: e7b3c9a15d20
+Revises: d5e8a2c47b91
+Create Date: 2026-01-10 11:04:37.582914
+
+Incremental cloud backups:
+- backup_states: last backup per user (content hash, hashes of the last
+  full snapshot) so unchanged users are skipped and deltas can be built
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7b3c9a15d20"
+down_revision: str | Sequence[str] | None = "d5e8a2c47b91"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create backup_states table."""
+    op.create_table(
+        "backup_states",
+        sa.Column("user_id", sa.String(length=36), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("snapshot_hashes", sa.JSON(), nullable=False),
+        sa.Column("last_backup_id", sa.String(length=100), nullable=False),
+        sa.Column("last_full_backup_id", sa.String(length=100), nullable=False),
+        sa.Column("last_backup_at", sa.DateTime(), nullable=False),
+        sa.Column("last_full_backup_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+
+
+def downgrade() -> None:
+    """Drop backup_states table."""
+    op.drop_table("backup_states")
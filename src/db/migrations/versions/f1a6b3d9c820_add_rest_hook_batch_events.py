@@ -0,0 +1,34 @@
+"""add_rest_hook_batch_events
+
+Revision ID: f1a6b3d9c820
+Revises: c5d2f8a71e04
+Create Date: 2026-01-19 15:26:07.884512
+
+REST hook event batching:
+- rest_hook_subscriptions.batch_events: hooks opting in receive events
+  coalesced into JSON array payloads instead of one request per event
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f1a6b3d9c820"
+down_revision: str | Sequence[str] | None = "c5d2f8a71e04"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add batch_events column."""
+    op.add_column(
+        "rest_hook_subscriptions",
+        sa.Column("batch_events", sa.Boolean(), nullable=False, server_default="false"),
+    )
+
+
+def downgrade() -> None:
+    """Drop batch_events column."""
+    op.drop_column("rest_hook_subscriptions", "batch_events")
@@ -52,9 +52,18 @@ from src.security.headers import SecurityHeadersMiddleware
 from src.security.rate_limit import limiter
 from src.security.secrets_validator import validate_secrets
 from src.services.cache_service import close_cache_service, get_cache_service
+from src.services.ical_cache import track_subscription_changes
+from src.services.icon_fetcher import close_icon_fetcher
 from src.services.rag_service import get_rag_service
+from src.services.report_render_pool import close_report_render_pool
+from src.services.rest_hook_batcher import close_rest_hook_batcher
 from src.services.telegram_handler import handle_telegram_update
-from src.services.telegram_service import TelegramPoller, get_telegram_service
+from src.services.telegram_service import (
+    TelegramPoller,
+    close_telegram_service,
+    get_telegram_service,
+)
+from src.services.webhook_dispatcher import close_webhook_dispatcher
 
 # Configure structured logging before anything else
 configure_logging()
@@ -95,6 +104,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         )
 
     await init_db()
+    track_subscription_changes()
     # Initialize cache service (Redis)
     cache = await get_cache_service()
 
@@ -118,7 +128,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown - cleanup connections
     if telegram_poller:
         await telegram_poller.stop()
+    await close_telegram_service()
     await close_cache_service()
+    await close_webhook_dispatcher()
+    await close_rest_hook_batcher()
+    await close_icon_fetcher()
+    close_report_render_pool()
     logger.info("Application shutdown complete")
 
 
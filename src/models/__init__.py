@@ -6,6 +6,7 @@ from src.models.ai_preferences import (
     IconGenerationStyle,
     SuggestionFrequency,
 )
+from src.models.backup_state import BackupState
 from src.models.bank_connection import (
     AccountType,
     BankAccount,
@@ -24,7 +25,11 @@ from src.models.export_history import (
     ExportStatus,
     ExportType,
 )
-from src.models.google_calendar import GoogleCalendarConnection, GoogleCalendarSyncStatus
+from src.models.google_calendar import (
+    GoogleCalendarConnection,
+    GoogleCalendarEventSync,
+    GoogleCalendarSyncStatus,
+)
 from src.models.icon_cache import IconCache, IconSource
 from src.models.integration import (
     APIKey,
@@ -39,6 +44,7 @@ from src.models.notification_history import (
     NotificationStatus,
     NotificationType,
 )
+from src.models.notification_send import NotificationSend
 from src.models.payment_card import CardType, PaymentCard
 from src.models.rag import Conversation, RAGAnalytics
 from src.models.statement_import import (
@@ -47,6 +53,7 @@ from src.models.statement_import import (
     FileType,
     ImportJobStatus,
     StatementImportJob,
+    StatementTransactionFingerprint,
 )
 from src.models.subscription import (
     Frequency,
@@ -69,6 +76,7 @@ __all__ = [
     "AIModel",
     "AIPreferences",
     "APIKey",
+    "BackupState",
     "BankAccount",
     "BankConnection",
     "BankProfile",
@@ -89,6 +97,7 @@ __all__ = [
     "FileType",
     "Frequency",
     "GoogleCalendarConnection",
+    "GoogleCalendarEventSync",
     "GoogleCalendarSyncStatus",
     "IconCache",
     "IconGenerationStyle",
@@ -99,6 +108,7 @@ __all__ = [
     "NotificationChannel",
     "NotificationHistory",
     "NotificationPreferences",
+    "NotificationSend",
     "NotificationStatus",
     "NotificationType",
     "PaymentCard",
@@ -108,6 +118,7 @@ __all__ = [
     "RAGAnalytics",
     "RestHookSubscription",
     "StatementImportJob",
+    "StatementTransactionFingerprint",
     "Subscription",
     "SuggestionFrequency",
     "TransactionCategory",
@@ -0,0 +1,64 @@
+"""Backup state ORM model.
+
+This module defines the per-user record of the last cloud backup, used to
+skip unchanged users and to build delta backups against the last full
+snapshot.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.database import Base
+
+
+class BackupState(Base):
+    """Last backup of one user.
+
+    Attributes:
+        user_id: Foreign key to users table (primary key).
+        content_hash: Hash of the user's data at the last backup; an
+            unchanged hash means the next backup can be skipped.
+        snapshot_hashes: Per-subscription hashes ({id: hash}) of the last
+            full snapshot, which delta backups are computed against.
+        last_backup_id: ID of the last backup (full or delta).
+        last_full_backup_id: ID of the last full snapshot.
+        last_backup_at: When the last backup was taken.
+        last_full_backup_at: When the last full snapshot was taken.
+
+    Example:
+        >>> state = BackupState(
+        ...     user_id="user-uuid",
+        ...     content_hash="9f86d08...",
+        ...     snapshot_hashes={"subscription-uuid": "2c26b46..."},
+        ...     last_backup_id="user-uuid_20260110_020000",
+        ...     last_full_backup_id="user-uuid_20260110_020000",
+        ... )
+    """
+
+    __tablename__ = "backup_states"
+
+    # Primary key
+    user_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    # Change detection
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    snapshot_hashes: Mapped[dict[str, str]] = mapped_column(JSON, nullable=False, default=dict)
+
+    # Backups
+    last_backup_id: Mapped[str] = mapped_column(String(100), nullable=False)
+    last_full_backup_id: Mapped[str] = mapped_column(String(100), nullable=False)
+
+    # Timestamps
+    last_backup_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    last_full_backup_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        """Return string representation of the backup state."""
+        return (
+            f"<BackupState(user_id='{self.user_id}', last_backup='{self.last_backup_id}', "
+            f"last_full='{self.last_full_backup_id}')>"
+        )
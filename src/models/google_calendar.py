@@ -1,7 +1,8 @@
-"""Google Calendar OAuth connection model.
+"""Google Calendar OAuth connection and sync state models.
 
-This module defines the SQLAlchemy ORM model for storing Google Calendar
-OAuth tokens and connection status for users.
+This module defines the SQLAlchemy ORM models for storing Google Calendar
+OAuth tokens and connection status for users, and the record of which
+calendar event each subscription was synced to.
 
 Sprint 5.6 - Calendar Integration
 """
@@ -10,7 +11,7 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, String, Text
+from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db.database import Base
@@ -126,3 +127,58 @@ class GoogleCalendarConnection(Base):
             True if token is expired and no refresh token is available.
         """
         return self.is_token_expired and not self.refresh_token
+
+
+class GoogleCalendarEventSync(Base):
+    """Calendar event a subscription was last synced to.
+
+    Sync compares the content hash of each subscription's event body with
+    the stored one and only creates, updates or deletes the events that
+    differ. Rows outlive their subscription (no foreign key) so the event
+    of a deleted subscription can still be removed from the calendar.
+
+    Attributes:
+        subscription_id: ID of the synced subscription (primary key).
+        user_id: Foreign key to the user who owns the subscription.
+        calendar_id: Google Calendar ID holding the event.
+        event_id: Google Calendar event ID.
+        content_hash: SHA-256 of the event body last sent to Google.
+        synced_at: When the event was last created or updated.
+
+    Example:
+        >>> state = GoogleCalendarEventSync(
+        ...     subscription_id="subscription-uuid",
+        ...     user_id="user-uuid",
+        ...     calendar_id="primary",
+        ...     event_id="a1b2c3d4e5",
+        ...     content_hash="9f86d08...",
+        ... )
+    """
+
+    __tablename__ = "google_calendar_event_syncs"
+    __table_args__ = (Index("ix_google_calendar_event_syncs_user_id", "user_id"),)
+
+    # Primary key
+    subscription_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+
+    # Foreign key to user
+    user_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+
+    # Synced event
+    calendar_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    event_id: Mapped[str] = mapped_column(String(1024), nullable=False)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+
+    # Timestamps
+    synced_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return (
+            f"<GoogleCalendarEventSync(subscription_id='{self.subscription_id}', "
+            f"event_id='{self.event_id}')>"
+        )
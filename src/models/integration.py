@@ -188,6 +188,7 @@ class RestHookSubscription(Base):
         target_url: URL to send webhook payloads to.
         event_type: Event type this subscription is for.
         status: Current subscription status.
+        batch_events: Whether events are coalesced into batched array payloads.
         delivery_count: Number of successful deliveries.
         failure_count: Number of failed deliveries.
         last_delivery_at: When the last delivery was made.
@@ -231,6 +232,9 @@ class RestHookSubscription(Base):
         Enum(IntegrationStatus), default=IntegrationStatus.ACTIVE, nullable=False
     )
 
+    # Coalesce events into batched array payloads (opt-in)
+    batch_events: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+
     # Statistics
     delivery_count: Mapped[int] = mapped_column(Integer, default=0)
     failure_count: Mapped[int] = mapped_column(Integer, default=0)
@@ -8,7 +8,7 @@ import secrets
 import uuid
 from datetime import datetime, time
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Time
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Time
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db.database import Base
@@ -43,8 +43,10 @@ class NotificationPreferences(Base):
         Reminder Settings:
             reminder_enabled: Whether payment reminders are enabled.
             reminder_days_before: Days before payment to send reminder (default: 3).
-            reminder_time: Time of day to send reminders (default: 09:00).
+            reminder_time: Local time of day to send reminders (default: 09:00).
             overdue_alerts: Whether to send alerts for overdue payments.
+            timezone: IANA timezone reminder_time and quiet hours are in,
+                mirrored from the user's preferences (default: UTC).
 
         Digest Settings:
             daily_digest: Whether to send daily payment digest.
@@ -70,6 +72,10 @@ class NotificationPreferences(Base):
     """
 
     __tablename__ = "notification_preferences"
+    __table_args__ = (
+        # Scheduling wheel lookups: users of a timezone by delivery time
+        Index("ix_notification_preferences_timezone_reminder_time", "timezone", "reminder_time"),
+    )
 
     # Primary key
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
@@ -102,6 +108,7 @@ class NotificationPreferences(Base):
     reminder_days_before: Mapped[int] = mapped_column(Integer, default=3)
     reminder_time: Mapped[time] = mapped_column(Time, default=time(9, 0))  # 09:00
     overdue_alerts: Mapped[bool] = mapped_column(Boolean, default=True)
+    timezone: Mapped[str] = mapped_column(String(64), default="UTC", server_default="UTC")
 
     # Digest settings
     daily_digest: Mapped[bool] = mapped_column(Boolean, default=False)
@@ -0,0 +1,87 @@
+"""Notification send ledger ORM model.
+
+This module defines the ledger used to deliver each scheduled notification
+at most once, however many times a job is retried or a cron fires.
+"""
+
+import uuid
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, ForeignKey, Index, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.database import Base
+from src.models.notification_history import NotificationStatus
+
+
+class NotificationSend(Base):
+    """One claimed notification send.
+
+    A row is inserted (claimed) before a notification is sent and updated
+    with the outcome afterwards. The unique key means a second claim of the
+    same notification fails, so it is only sent once; failed sends can be
+    claimed again.
+
+    Attributes:
+        id: UUID primary key (auto-generated).
+        user_id: Foreign key to users table.
+        subscription_key: Subscription the notification is about, or "" for
+            user-level notifications such as digests (NULLs would not
+            collide in the unique key).
+        occurrence_date: Date the notification is for: the payment date of
+            a reminder, or the user's local date for digests and alerts.
+        channel: Notification channel (telegram, email, push).
+        notification_type: Type of notification.
+        status: pending while claimed, then sent or failed.
+        claimed_at: When the send was claimed.
+        sent_at: When the send succeeded.
+
+    Example:
+        >>> send = NotificationSend(
+        ...     user_id="user-uuid",
+        ...     subscription_key="subscription-uuid",
+        ...     occurrence_date=date(2026, 1, 13),
+        ...     channel=NotificationChannel.TELEGRAM.value,
+        ...     notification_type=NotificationType.PAYMENT_REMINDER.value,
+        ... )
+    """
+
+    __tablename__ = "notification_sends"
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id",
+            "subscription_key",
+            "occurrence_date",
+            "channel",
+            "notification_type",
+            name="uq_notification_sends_key",
+        ),
+        # Retention pruning
+        Index("ix_notification_sends_claimed_at", "claimed_at"),
+    )
+
+    # Primary key
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+
+    # Ledger key
+    user_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    subscription_key: Mapped[str] = mapped_column(String(36), nullable=False, default="")
+    occurrence_date: Mapped[date] = mapped_column(Date, nullable=False)
+    channel: Mapped[str] = mapped_column(String(20), nullable=False)
+    notification_type: Mapped[str] = mapped_column(String(50), nullable=False)
+
+    # Outcome
+    status: Mapped[str] = mapped_column(String(20), default=NotificationStatus.PENDING.value)
+
+    # Timestamps
+    claimed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    sent_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    def __repr__(self) -> str:
+        """Return string representation of the ledger entry."""
+        return (
+            f"<NotificationSend(user_id='{self.user_id}', type='{self.notification_type}', "
+            f"channel='{self.channel}', date={self.occurrence_date}, status='{self.status}')>"
+        )
@@ -3,6 +3,7 @@
 This module provides SQLAlchemy models for:
 - StatementImportJob: Tracks the status of statement file processing
 - DetectedSubscription: Stores AI-detected recurring payments from statements
+- StatementTransactionFingerprint: Per-transaction hashes for overlap detection
 """
 
 from __future__ import annotations
@@ -22,6 +23,7 @@ from sqlalchemy import (
     Numeric,
     String,
     Text,
+    UniqueConstraint,
     func,
 )
 from sqlalchemy import (
@@ -99,6 +101,8 @@ class StatementImportJob(Base):
         nullable=False,
     )
     file_size: Mapped[int] = mapped_column(nullable=True)  # Size in bytes
+    # SHA-256 of the uploaded bytes, used to reuse cached parse results
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
     # Bank information (optional)
     bank_id: Mapped[uuid.UUID | None] = mapped_column(
@@ -158,6 +162,7 @@ class StatementImportJob(Base):
     __table_args__ = (
         Index("ix_import_jobs_user_status", "user_id", "status"),
         Index("ix_import_jobs_user_created", "user_id", "created_at"),
+        Index("ix_import_jobs_user_content_hash", "user_id", "content_hash"),
     )
 
     def __repr__(self) -> str:
@@ -300,3 +305,52 @@ class DetectedSubscription(Base):
     def is_duplicate(self) -> bool:
         """Check if this is a duplicate of an existing subscription."""
         return self.duplicate_of_id is not None
+
+
+class StatementTransactionFingerprint(Base):
+    """Fingerprint of a transaction seen in an imported statement.
+
+    One row per transaction per job. Lets a new upload recognise the
+    transactions it shares with earlier statements (re-uploads and
+    overlapping months) so only new activity is analysed.
+    """
+
+    __tablename__ = "statement_transaction_fingerprints"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+
+    # NOTE: User model uses String(36) for id, not UUID
+    user_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    job_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("statement_import_jobs.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    # SHA-256 of the transaction's fingerprint key (see Transaction.fingerprint_key)
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        Index("ix_txn_fingerprints_user_fingerprint", "user_id", "fingerprint"),
+        UniqueConstraint("job_id", "fingerprint", name="uq_txn_fingerprints_job_fingerprint"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<StatementTransactionFingerprint(job_id={self.job_id}, "
+            f"fingerprint={self.fingerprint[:12]})>"
+        )
@@ -11,7 +11,7 @@ import secrets
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -273,6 +273,10 @@ class WebhookDelivery(Base):
     """
 
     __tablename__ = "webhook_deliveries"
+    # Claiming due deliveries (outbox dispatch and the retry scanner)
+    __table_args__ = (
+        Index("ix_webhook_deliveries_status_next_retry_at", "status", "next_retry_at"),
+    )
 
     # Primary key
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
@@ -367,6 +371,17 @@ class WebhookDelivery(Base):
         self.next_retry_at = retry_at
         self.attempt_number += 1
 
+    def defer(self, until: datetime) -> None:
+        """Postpone a delivery that was not attempted.
+
+        Used when the endpoint's circuit breaker is open; the attempt
+        number is not increased.
+
+        Args:
+            until: Earliest time to attempt the delivery.
+        """
+        self.next_retry_at = until
+
     @property
     def can_retry(self) -> bool:
         """Check if delivery can be retried.
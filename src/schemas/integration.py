@@ -130,10 +130,14 @@ class RestHookSubscribe(BaseModel):
     Attributes:
         target_url: URL to send webhook payloads to.
         event_type: Event type to subscribe to.
+        batch: Coalesce events into array payloads sent every few seconds.
     """
 
     target_url: HttpUrl
     event_type: str = Field(..., min_length=1, max_length=50)
+    batch: bool = Field(
+        False, description="Receive events in batches (JSON arrays) instead of one request each"
+    )
 
     @field_validator("event_type")
     @classmethod
@@ -165,6 +169,7 @@ class RestHookResponse(BaseModel):
         event_type: Event type subscribed to.
         integration_type: Type of integration.
         status: Current status.
+        batch_events: Whether events are delivered in batches.
         delivery_count: Number of successful deliveries.
         failure_count: Number of failed deliveries.
         last_delivery_at: When last delivery was made.
@@ -178,6 +183,7 @@ class RestHookResponse(BaseModel):
     event_type: str
     integration_type: IntegrationTypeEnum
     status: IntegrationStatusEnum
+    batch_events: bool = False
     delivery_count: int
     failure_count: int
     last_delivery_at: datetime | None
@@ -186,6 +186,7 @@ class ConfirmImportResponse(BaseModel):
     skipped_count: int
     duplicate_count: int
     created_subscription_ids: list[str]
+    errors: list[str] = Field(default_factory=list)
 
 
 # ============================================================================
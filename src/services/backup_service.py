@@ -6,31 +6,81 @@ Supports Google Cloud Storage as the primary backup destination.
 Features:
 - JSON export backup (all user data)
 - Compressed backup files
+- Incremental backups: unchanged users are skipped, and between periodic
+  full snapshots only the subscriptions changed since the last snapshot
+  are written (a delta)
 - Retention policy (configurable days)
 - Backup verification
 - Restore functionality
+
+A user's data is hashed per subscription; the hashes of the last full
+snapshot and the hash of the last backup are kept in ``backup_states``
+(see BackupState). Restoring a user means reading the last full snapshot
+and applying the latest delta on top of it.
+
+Backups are streamed in both directions so memory stays flat for large
+accounts. Files are gzipped JSON Lines: a header line, one line per
+subscription and a trailer line::
+
+    {"header": {"version": "3.0", "backup_id": ..., "backup_type": "full", ...}}
+    {"subscription": {"id": ..., "name": ..., ...}}
+    {"trailer": {"subscription_count": 1}}
+
+Subscriptions are read from a server-side cursor and written row by row
+into the compressor, which spools to a temporary file that is uploaded as
+a stream. Restores read the file line by line and upsert in batches.
+Version 2.0 backups (a single JSON document, ``.json.gz``) can still be
+restored.
 """
 
+import asyncio
 import gzip
+import hashlib
 import json
 import logging
-from datetime import datetime, timedelta
+import os
+import shutil
+import tempfile
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any
+from enum import Enum
+from itertools import islice
+from typing import IO, TYPE_CHECKING, Any
 
 from pydantic import BaseModel
 from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from src.core.config import settings
+from src.models.backup_state import BackupState
 from src.models.subscription import Subscription
+from src.services.ical_cache import mark_subscriptions_changed
 
 if TYPE_CHECKING:
     from src.models.user import User
 
 logger = logging.getLogger(__name__)
 
+# Backup IDs of delta backups end with this suffix
+DELTA_SUFFIX = "_delta"
+
+BACKUP_VERSION = "3.0"
+BACKUP_SUFFIX = ".jsonl.gz"
+LEGACY_BACKUP_SUFFIX = ".json.gz"  # Version 2.0: one JSON document
+
+# Compressed backups up to this size stay in memory, larger ones spill to disk
+SPOOL_MAX_SIZE = 1024 * 1024
+
+
+class BackupType(str, Enum):
+    """Kind of backup file."""
+
+    FULL = "full"
+    DELTA = "delta"
+
 
 class BackupMetadata(BaseModel):
     """Metadata about a backup file."""
@@ -42,6 +92,7 @@ class BackupMetadata(BaseModel):
     file_size: int
     version: str = "2.0"
     storage_provider: str = "gcs"
+    backup_type: BackupType = BackupType.FULL
 
 
 class BackupResult(BaseModel):
@@ -53,6 +104,96 @@ class BackupResult(BaseModel):
     file_size: int = 0
     subscription_count: int = 0
     error: str | None = None
+    backup_type: BackupType | None = None
+    skipped: bool = False  # Data unchanged since the last backup
+
+
+class RestoreResult(BaseModel):
+    """Result of a restore operation."""
+
+    success: bool
+    backup_id: str
+    restored_count: int = 0
+    error: str | None = None
+
+
+@dataclass
+class PreparedBackup:
+    """A serialized backup ready to upload.
+
+    Attributes:
+        backup_id: Unique backup identifier.
+        user_id: User the backup belongs to.
+        backup_type: Full snapshot or delta.
+        file: Compressed backup file, positioned at the start.
+        file_size: Size of the compressed file in bytes.
+        subscription_count: Subscriptions written to the file.
+        content_hash: Hash of the user's data.
+        subscription_hashes: Hash of every current subscription by ID.
+    """
+
+    backup_id: str
+    user_id: str
+    backup_type: BackupType
+    file: IO[bytes]
+    file_size: int
+    subscription_count: int
+    content_hash: str
+    subscription_hashes: dict[str, str]
+
+    def close(self) -> None:
+        """Release the backup file."""
+        self.file.close()
+
+
+class _BackupWriter:
+    """Writes JSON Lines through gzip into a spooled temporary file."""
+
+    def __init__(self) -> None:
+        self._file = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)  # noqa: SIM115
+        self._gzip = gzip.GzipFile(fileobj=self._file, mode="wb")
+
+    def write(self, kind: str, value: dict[str, Any]) -> None:
+        line = json.dumps({kind: value}, separators=(",", ":"), default=str)
+        self._gzip.write(line.encode("utf-8") + b"\n")
+
+    def finish(self) -> tuple[IO[bytes], int]:
+        """Flush the compressor; return the file (rewound) and its size."""
+        self._gzip.close()
+        size = self._file.tell()
+        self._file.seek(0)
+        return self._file, size
+
+    def discard(self) -> None:
+        self._gzip.close()
+        self._file.close()
+
+
+def _hash_record(record: dict[str, Any]) -> str:
+    """Stable hash of a serialized record."""
+    canonical = json.dumps(record, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _content_hash(user_email: str, subscription_hashes: dict[str, str]) -> str:
+    """Hash of a user's whole backup from the per-subscription hashes."""
+    digest = hashlib.sha256(user_email.encode("utf-8"))
+    for sub_id in sorted(subscription_hashes):
+        digest.update(f"\n{sub_id}:{subscription_hashes[sub_id]}".encode())
+    return digest.hexdigest()
+
+
+def _backup_type_of(backup_id: str) -> BackupType:
+    """Kind of a backup from its ID."""
+    return BackupType.DELTA if backup_id.endswith(DELTA_SUFFIX) else BackupType.FULL
+
+
+def _backup_id_of(filename: str) -> str | None:
+    """Backup ID of a backup file name, or None for other files."""
+    for suffix in (BACKUP_SUFFIX, LEGACY_BACKUP_SUFFIX):
+        if filename.endswith(suffix):
+            return filename[: -len(suffix)]
+    return None
 
 
 class BackupService:
@@ -63,19 +204,26 @@ class BackupService:
     - Local file storage (fallback/dev)
     """
 
+    # Rows fetched per cursor round trip and upserted per restore statement
+    STREAM_BATCH_SIZE = 500
+
     def __init__(
         self,
         bucket_name: str | None = None,
         retention_days: int = 30,
+        full_interval_days: int | None = None,
     ):
         """Initialize backup service.
 
         Args:
             bucket_name: GCS bucket name. If None, uses config or local storage.
             retention_days: Number of days to retain backups.
+            full_interval_days: Days between full snapshots; backups in
+                between are deltas (defaults to config).
         """
         self.bucket_name = bucket_name or getattr(settings, "gcs_backup_bucket", None)
         self.retention_days = retention_days
+        self.full_interval_days = full_interval_days or settings.backup_full_interval_days
         self._gcs_client = None
 
     def _get_gcs_client(self) -> Any:
@@ -102,7 +250,7 @@ class BackupService:
         """Serialize a subscription to a dictionary.
 
         Args:
-            sub: Subscription model instance.
+            sub: Subscription model instance (or a row of its columns).
 
         Returns:
             Dictionary representation of the subscription.
@@ -154,95 +302,234 @@ class BackupService:
             "card_id": str(sub.card_id) if sub.card_id else None,
         }
 
-    async def create_backup(
+    async def prepare_backup(
         self,
         db: AsyncSession,
         user: "User",
-    ) -> BackupResult:
-        """Create a backup of all user subscriptions.
+        force_full: bool = False,
+    ) -> PreparedBackup | None:
+        """Serialize a user's backup, or decide none is needed.
+
+        A full snapshot is written when the user has none yet, when the last
+        one is older than full_interval_days, or when forced. Otherwise only
+        the subscriptions added or changed since the last snapshot (and the
+        IDs of removed ones) are written, unless nothing changed since the
+        last backup at all.
 
         Args:
             db: Database session.
-            user: User whose data to backup.
+            user: User whose data to backup (only ``id`` and ``email`` are
+                read, so a row of those columns also works).
+            force_full: Write a full snapshot regardless of the schedule.
 
         Returns:
-            BackupResult with backup details.
+            The prepared backup, or None if the data is unchanged.
         """
-        backup_id = f"{user.id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
-        logger.info(f"Creating backup {backup_id} for user {user.id}")
+        user_id = str(user.id)
+        now = datetime.utcnow()
+
+        state = await db.get(BackupState, user_id)
+        full = (
+            force_full
+            or state is None
+            or now - state.last_full_backup_at >= timedelta(days=self.full_interval_days)
+        )
+        snapshot = {} if full else state.snapshot_hashes
+
+        backup_type = BackupType.FULL if full else BackupType.DELTA
+        backup_id = f"{user_id}_{now.strftime('%Y%m%d_%H%M%S')}"
+        if not full:
+            backup_id += DELTA_SUFFIX
+        header: dict[str, Any] = {
+            "version": BACKUP_VERSION,
+            "backup_id": backup_id,
+            "backup_type": backup_type.value,
+            "created_at": now.isoformat(),
+            "user_id": user_id,
+            "user_email": user.email,
+        }
+        if not full:
+            header["base_backup_id"] = state.last_full_backup_id
+
+        writer = _BackupWriter()
+        writer.write("header", header)
+        hashes: dict[str, str] = {}
+        count = 0
 
         try:
-            # Fetch all subscriptions for the user
-            result = await db.execute(
-                select(Subscription)
-                .where(Subscription.user_id == str(user.id))
-                .options(selectinload(Subscription.category_rel))
-            )
-            subscriptions = list(result.scalars().all())
-
-            # Create backup data
-            backup_data = {
-                "version": "2.0",
-                "backup_id": backup_id,
-                "created_at": datetime.utcnow().isoformat(),
-                "user_id": str(user.id),
-                "user_email": user.email,
-                "subscription_count": len(subscriptions),
-                "subscriptions": [self._serialize_subscription(sub) for sub in subscriptions],
-            }
-
-            # Serialize to JSON
-            json_data = json.dumps(backup_data, indent=2, default=str)
-
-            # Compress
-            compressed = gzip.compress(json_data.encode("utf-8"))
-            file_size = len(compressed)
-
-            # Upload to storage
-            file_path = await self._upload_backup(
-                backup_id=backup_id,
-                data=compressed,
-                user_id=str(user.id),
+            # Plain column rows from a server-side cursor: backups need no
+            # relationships, and no more than one batch is held at a time
+            rows = await db.stream(
+                select(*Subscription.__table__.columns)
+                .where(Subscription.user_id == user_id)
+                .execution_options(yield_per=self.STREAM_BATCH_SIZE)
             )
+            async for row in rows:
+                record = self._serialize_subscription(row)
+                hashes[record["id"]] = record_hash = _hash_record(record)
+                if full or snapshot.get(record["id"]) != record_hash:
+                    writer.write("subscription", record)
+                    count += 1
+        except BaseException:
+            writer.discard()
+            raise
+
+        content_hash = _content_hash(user.email, hashes)
+        if not full and state.content_hash == content_hash:
+            writer.discard()
+            return None
+
+        trailer: dict[str, Any] = {"subscription_count": count}
+        if not full:
+            trailer["removed_subscription_ids"] = sorted(snapshot.keys() - hashes.keys())
+        writer.write("trailer", trailer)
+        file, file_size = writer.finish()
+
+        return PreparedBackup(
+            backup_id=backup_id,
+            user_id=user_id,
+            backup_type=backup_type,
+            file=file,
+            file_size=file_size,
+            subscription_count=count,
+            content_hash=content_hash,
+            subscription_hashes=hashes,
+        )
+
+    async def upload_prepared(self, prepared: PreparedBackup) -> BackupResult:
+        """Upload a prepared backup and release its file.
 
-            logger.info(
-                f"Backup {backup_id} created successfully: "
-                f"{len(subscriptions)} subscriptions, {file_size} bytes"
-            )
+        Args:
+            prepared: Backup returned by prepare_backup().
 
-            return BackupResult(
-                success=True,
-                backup_id=backup_id,
-                file_path=file_path,
-                file_size=file_size,
-                subscription_count=len(subscriptions),
+        Returns:
+            BackupResult with backup details.
+        """
+        try:
+            file_path = await self._upload_backup(
+                backup_id=prepared.backup_id,
+                file=prepared.file,
+                file_size=prepared.file_size,
+                user_id=prepared.user_id,
             )
-
         except Exception as e:
-            logger.error(f"Backup failed for user {user.id}: {e}")
+            logger.error(f"Backup upload failed for user {prepared.user_id}: {e}")
             return BackupResult(
                 success=False,
-                backup_id=backup_id,
+                backup_id=prepared.backup_id,
+                backup_type=prepared.backup_type,
                 error=str(e),
             )
+        finally:
+            prepared.close()
+
+        logger.info(
+            f"Backup {prepared.backup_id} ({prepared.backup_type.value}) created successfully: "
+            f"{prepared.subscription_count} subscriptions, {prepared.file_size} bytes"
+        )
+        return BackupResult(
+            success=True,
+            backup_id=prepared.backup_id,
+            file_path=file_path,
+            file_size=prepared.file_size,
+            subscription_count=prepared.subscription_count,
+            backup_type=prepared.backup_type,
+        )
+
+    async def record_backups(self, db: AsyncSession, backups: list[PreparedBackup]) -> None:
+        """Store the state of uploaded backups for the next incremental run.
+
+        Args:
+            db: Database session.
+            backups: Successfully uploaded backups.
+        """
+        if not backups:
+            return
+
+        now = datetime.utcnow()
+        result = await db.execute(
+            select(BackupState).where(BackupState.user_id.in_([b.user_id for b in backups]))
+        )
+        states = {state.user_id: state for state in result.scalars()}
+
+        for backup in backups:
+            state = states.get(backup.user_id)
+            if state is None:
+                state = BackupState(user_id=backup.user_id)
+                db.add(state)
+            state.content_hash = backup.content_hash
+            state.last_backup_id = backup.backup_id
+            state.last_backup_at = now
+            if backup.backup_type == BackupType.FULL:
+                state.snapshot_hashes = backup.subscription_hashes
+                state.last_full_backup_id = backup.backup_id
+                state.last_full_backup_at = now
+
+        await db.commit()
+
+    async def create_backup(
+        self,
+        db: AsyncSession,
+        user: "User",
+        force_full: bool = False,
+    ) -> BackupResult:
+        """Create a backup of all user subscriptions.
+
+        Writes a full snapshot or a delta (see prepare_backup()) and records
+        it for the next run; nothing is written if the data is unchanged.
+
+        Args:
+            db: Database session.
+            user: User whose data to backup.
+            force_full: Write a full snapshot regardless of the schedule.
+
+        Returns:
+            BackupResult with backup details.
+        """
+        logger.info(f"Creating backup for user {user.id}")
+
+        try:
+            prepared = await self.prepare_backup(db, user, force_full=force_full)
+        except Exception as e:
+            logger.error(f"Backup failed for user {user.id}: {e}")
+            return BackupResult(success=False, error=str(e))
+
+        if prepared is None:
+            logger.info(f"Backup skipped for user {user.id}: no changes since last backup")
+            return BackupResult(success=True, skipped=True)
+
+        result = await self.upload_prepared(prepared)
+        if result.success:
+            await self.record_backups(db, [prepared])
+        return result
 
     async def _upload_backup(
         self,
         backup_id: str,
-        data: bytes,
+        file: IO[bytes],
+        file_size: int,
         user_id: str,
     ) -> str:
         """Upload backup to cloud storage or local file.
 
+        The file is streamed to storage. The storage clients are blocking,
+        so the upload runs in a thread and several uploads can proceed
+        concurrently.
+
         Args:
             backup_id: Unique backup identifier.
-            data: Compressed backup data.
+            file: Compressed backup file, positioned at the start.
+            file_size: Size of the file in bytes.
             user_id: User ID for path organization.
 
         Returns:
             Path or URL to the uploaded file.
         """
-        filename = f"{backup_id}.json.gz"
+        return await asyncio.to_thread(self._write_backup, backup_id, file, file_size, user_id)
+
+    def _write_backup(self, backup_id: str, file: IO[bytes], file_size: int, user_id: str) -> str:
+        """Stream a backup file to cloud storage or a local file (blocking)."""
+        filename = f"{backup_id}{BACKUP_SUFFIX}"
         blob_path = f"backups/{user_id}/{filename}"
 
         gcs_client = self._get_gcs_client()
@@ -250,25 +537,198 @@ class BackupService:
             try:
                 bucket = gcs_client.bucket(self.bucket_name)
                 blob = bucket.blob(blob_path)
-                blob.upload_from_string(data, content_type="application/gzip")
+                blob.upload_from_file(file, size=file_size, content_type="application/gzip")
                 logger.info(f"Uploaded backup to gs://{self.bucket_name}/{blob_path}")
                 return f"gs://{self.bucket_name}/{blob_path}"
             except Exception as e:
                 logger.warning(f"GCS upload failed, falling back to local: {e}")
+                file.seek(0)
 
         # Fallback to local storage
-        import os
-
         local_dir = f"backups/{user_id}"
         os.makedirs(local_dir, exist_ok=True)
         local_path = f"{local_dir}/{filename}"
 
         with open(local_path, "wb") as f:
-            f.write(data)
+            shutil.copyfileobj(file, f)
 
         logger.info(f"Saved backup locally to {local_path}")
         return local_path
 
+    def _open_backup(self, user_id: str, backup_id: str) -> tuple[IO[bytes], bool]:
+        """Open a backup file for streaming reads (blocking).
+
+        Args:
+            user_id: User the backup belongs to.
+            backup_id: Backup identifier.
+
+        Returns:
+            The open file and whether it is in the legacy (2.0) format.
+
+        Raises:
+            FileNotFoundError: If no such backup exists.
+        """
+        gcs_client = self._get_gcs_client()
+        for suffix in (BACKUP_SUFFIX, LEGACY_BACKUP_SUFFIX):
+            path = f"backups/{user_id}/{backup_id}{suffix}"
+            legacy = suffix == LEGACY_BACKUP_SUFFIX
+            if gcs_client and self.bucket_name:
+                blob = gcs_client.bucket(self.bucket_name).blob(path)
+                if blob.exists():
+                    return blob.open("rb"), legacy
+            elif os.path.exists(path):
+                return open(path, "rb"), legacy  # noqa: SIM115
+        raise FileNotFoundError(f"Backup {backup_id} not found for user {user_id}")
+
+    def iter_backup(self, user_id: str, backup_id: str) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Read a backup line by line (blocking).
+
+        Args:
+            user_id: User the backup belongs to.
+            backup_id: Backup identifier.
+
+        Yields:
+            ``("header", ...)``, then ``("subscription", ...)`` for every
+            subscription, then ``("trailer", ...)``.
+        """
+        raw, legacy = self._open_backup(user_id, backup_id)
+        with raw, gzip.open(raw, "rt", encoding="utf-8") as lines:
+            if legacy:
+                # One JSON document: cannot be streamed, but is still readable
+                data = json.load(lines)
+                subscriptions = data.pop("subscriptions", [])
+                yield "header", data
+                for record in subscriptions:
+                    yield "subscription", record
+                yield "trailer", {"subscription_count": len(subscriptions)}
+                return
+
+            for line in lines:
+                if line.strip():
+                    ((kind, value),) = json.loads(line).items()
+                    yield kind, value
+
+    def _deserialize_subscription(self, record: dict[str, Any], user_id: str) -> dict[str, Any]:
+        """Convert a backed-up subscription into column values.
+
+        Args:
+            record: Subscription as written by _serialize_subscription().
+            user_id: Owner of the restored subscription.
+
+        Returns:
+            Column values for an INSERT into subscriptions.
+        """
+        columns = Subscription.__table__.columns
+        values: dict[str, Any] = {"user_id": user_id}
+        for key, value in record.items():
+            column = columns.get(key)
+            if column is None or key == "user_id":
+                continue
+            if value is None and not column.nullable and column.default is not None:
+                # Older backups may lack values for columns that are now required
+                value = column.default.arg if column.default.is_scalar else None
+            elif value is not None:
+                python_type = column.type.python_type
+                if python_type is Decimal:
+                    value = Decimal(value)
+                elif python_type is date:
+                    value = date.fromisoformat(value)
+                elif issubclass(python_type, Enum):
+                    value = python_type(value)
+            values[key] = value
+        return values
+
+    async def _upsert_subscriptions(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        records: list[dict[str, Any]],
+    ) -> None:
+        """Insert or update a batch of backed-up subscriptions of one user."""
+        if not records:
+            return
+
+        rows = [self._deserialize_subscription(record, user_id) for record in records]
+        dialect = db.get_bind().dialect.name
+        module = postgresql if dialect == "postgresql" else sqlite
+        stmt = module.insert(Subscription).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["id"],
+            set_={
+                **{key: stmt.excluded[key] for key in rows[0] if key not in ("id", "user_id")},
+                "updated_at": datetime.utcnow(),
+            },
+            # Never take over another user's subscription
+            where=Subscription.user_id == user_id,
+        )
+        await db.execute(stmt)
+        mark_subscriptions_changed(db, user_id)
+
+    async def restore_backup(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        backup_id: str,
+    ) -> RestoreResult:
+        """Restore a user's subscriptions from a backup.
+
+        Subscriptions in the backup are inserted, or updated if they still
+        exist; subscriptions created since the backup are kept. For a delta
+        the base snapshot is restored with the delta applied on top
+        (subscriptions removed by the delta are not restored). The file is
+        read line by line and written in batches, in one transaction.
+
+        Args:
+            db: Database session.
+            user_id: User to restore.
+            backup_id: Backup to restore (full snapshot or delta).
+
+        Returns:
+            RestoreResult with the number of subscriptions restored.
+        """
+        logger.info(f"Restoring backup {backup_id} for user {user_id}")
+
+        async def restore_from(
+            records: Iterator[tuple[str, dict[str, Any]]], skip: set[str]
+        ) -> int:
+            restored = 0
+            while batch := await asyncio.to_thread(
+                lambda: list(islice(records, self.STREAM_BATCH_SIZE))
+            ):
+                subscriptions = [
+                    value
+                    for kind, value in batch
+                    if kind == "subscription" and value["id"] not in skip
+                ]
+                await self._upsert_subscriptions(db, user_id, subscriptions)
+                restored += len(subscriptions)
+            return restored
+
+        try:
+            restored = 0
+            if _backup_type_of(backup_id) == BackupType.DELTA:
+                # Deltas are small: read it whole, then stream the snapshot
+                delta = await asyncio.to_thread(lambda: list(self.iter_backup(user_id, backup_id)))
+                sections = dict(delta)
+                changed = [value for kind, value in delta if kind == "subscription"]
+                skip = {record["id"] for record in changed}
+                skip.update(sections["trailer"].get("removed_subscription_ids", []))
+                base = self.iter_backup(user_id, sections["header"]["base_backup_id"])
+                restored += await restore_from(base, skip)
+                await self._upsert_subscriptions(db, user_id, changed)
+                restored += len(changed)
+            else:
+                restored += await restore_from(self.iter_backup(user_id, backup_id), set())
+
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"Restore of backup {backup_id} failed for user {user_id}: {e}")
+            return RestoreResult(success=False, backup_id=backup_id, error=str(e))
+
+        logger.info(f"Restored {restored} subscriptions from backup {backup_id}")
+        return RestoreResult(success=True, backup_id=backup_id, restored_count=restored)
+
     async def list_backups(
         self,
         user_id: str,
@@ -293,8 +753,8 @@ class BackupService:
                 blobs = bucket.list_blobs(prefix=prefix, max_results=limit)
 
                 for blob in blobs:
-                    if blob.name.endswith(".json.gz"):
-                        backup_id = blob.name.split("/")[-1].replace(".json.gz", "")
+                    backup_id = _backup_id_of(blob.name.split("/")[-1])
+                    if backup_id is not None:
                         backups.append(
                             BackupMetadata(
                                 backup_id=backup_id,
@@ -302,6 +762,7 @@ class BackupService:
                                 created_at=blob.time_created,
                                 subscription_count=0,  # Would need to parse file
                                 file_size=blob.size or 0,
+                                backup_type=_backup_type_of(backup_id),
                             )
                         )
                 return backups
@@ -309,14 +770,12 @@ class BackupService:
                 logger.warning(f"Failed to list GCS backups: {e}")
 
         # Fallback to local storage
-        import os
-
         local_dir = f"backups/{user_id}"
         if os.path.exists(local_dir):
             files = sorted(os.listdir(local_dir), reverse=True)[:limit]
             for f in files:
-                if f.endswith(".json.gz"):
-                    backup_id = f.replace(".json.gz", "")
+                backup_id = _backup_id_of(f)
+                if backup_id is not None:
                     file_path = os.path.join(local_dir, f)
                     stat = os.stat(file_path)
                     backups.append(
@@ -327,6 +786,7 @@ class BackupService:
                             subscription_count=0,
                             file_size=stat.st_size,
                             storage_provider="local",
+                            backup_type=_backup_type_of(backup_id),
                         )
                     )
 
@@ -338,6 +798,9 @@ class BackupService:
     ) -> int:
         """Delete backups older than retention period.
 
+        Full snapshots are kept for one extra full interval, since deltas
+        within the retention period may be based on them.
+
         Args:
             user_id: User ID to clean up backups for.
 
@@ -345,9 +808,15 @@ class BackupService:
             Number of backups deleted.
         """
         deleted = 0
-        cutoff = datetime.utcnow() - timedelta(days=self.retention_days)
+        delta_cutoff = datetime.utcnow() - timedelta(days=self.retention_days)
+        full_cutoff = delta_cutoff - timedelta(days=self.full_interval_days)
         prefix = f"backups/{user_id}/"
 
+        def expired(backup_id: str, created_at: datetime) -> bool:
+            if _backup_type_of(backup_id) == BackupType.DELTA:
+                return created_at < delta_cutoff
+            return created_at < full_cutoff
+
         gcs_client = self._get_gcs_client()
         if gcs_client and self.bucket_name:
             try:
@@ -355,7 +824,12 @@ class BackupService:
                 blobs = bucket.list_blobs(prefix=prefix)
 
                 for blob in blobs:
-                    if blob.time_created and blob.time_created.replace(tzinfo=None) < cutoff:
+                    backup_id = _backup_id_of(blob.name.split("/")[-1])
+                    if (
+                        backup_id is not None
+                        and blob.time_created
+                        and expired(backup_id, blob.time_created.replace(tzinfo=None))
+                    ):
                         blob.delete()
                         deleted += 1
                         logger.info(f"Deleted old backup: {blob.name}")
@@ -365,15 +839,14 @@ class BackupService:
                 logger.warning(f"Failed to cleanup GCS backups: {e}")
 
         # Fallback to local storage
-        import os
-
         local_dir = f"backups/{user_id}"
         if os.path.exists(local_dir):
             for f in os.listdir(local_dir):
-                if f.endswith(".json.gz"):
+                backup_id = _backup_id_of(f)
+                if backup_id is not None:
                     file_path = os.path.join(local_dir, f)
                     stat = os.stat(file_path)
-                    if datetime.fromtimestamp(stat.st_mtime) < cutoff:
+                    if expired(backup_id, datetime.fromtimestamp(stat.st_mtime)):
                         os.remove(file_path)
                         deleted += 1
                         logger.info(f"Deleted old local backup: {file_path}")
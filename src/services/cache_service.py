@@ -33,6 +33,9 @@ class CacheService:
         - ctx:{user_id}:{session_id} - Conversation context (TTL: 30 min)
         - search:{type}:{hash} - Search results (TTL: 5 min)
         - analytics:{date} - Daily analytics (TTL: 24 hours)
+        - merchant:cls:{normalized_name} - AI merchant classification (TTL: 7 days)
+        - ical:version:{user_id} - Subscription data version of a user (TTL: 30 days)
+        - ical:feed:{user_id}:{hash} - Serialized iCal feed (TTL: 24 hours)
 
     Attributes:
         redis: Async Redis client instance.
@@ -172,6 +175,83 @@ class CacheService:
             logger.warning(f"Cache set failed for key {key}: {e}")
             return False
 
+    async def add(self, key: str, value: Any, ttl: int | None = None) -> bool:
+        """Set value in cache only if the key does not exist yet.
+
+        Args:
+            key: Cache key.
+            value: Value to cache (must be JSON serializable).
+            ttl: Time-to-live in seconds (default: from settings).
+
+        Returns:
+            True if the value was stored, False if the key already existed
+            or the cache is unavailable.
+
+        Example:
+            >>> await cache.add("ical:version:user-123", {"token": "abc"}, ttl=3600)
+        """
+        if self._redis is None:
+            return False
+
+        try:
+            if ttl is None:
+                ttl = settings.rag_cache_ttl
+
+            return bool(await self._redis.set(key, json.dumps(value), ex=ttl, nx=True))
+        except Exception as e:
+            logger.warning(f"Cache add failed for key {key}: {e}")
+            return False
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get several values from cache in one round trip.
+
+        Args:
+            keys: Cache keys.
+
+        Returns:
+            Dict of key to deserialized value for the keys that were found.
+
+        Example:
+            >>> values = await cache.get_many(["merchant:cls:netflix", "merchant:cls:spotify"])
+        """
+        if self._redis is None or not keys:
+            return {}
+
+        try:
+            values = await self._redis.mget(keys)
+            return {
+                key: json.loads(value) for key, value in zip(keys, values, strict=True) if value
+            }
+        except Exception as e:
+            logger.warning(f"Cache get_many failed for {len(keys)} keys: {e}")
+            return {}
+
+    async def set_many(self, items: dict[str, Any], ttl: int | None = None) -> bool:
+        """Set several values in cache in one pipelined round trip.
+
+        Args:
+            items: Mapping of cache key to value (must be JSON serializable).
+            ttl: Time-to-live in seconds (default: from settings).
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        if self._redis is None or not items:
+            return False
+
+        try:
+            if ttl is None:
+                ttl = settings.rag_cache_ttl
+
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.setex(key, ttl, json.dumps(value))
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning(f"Cache set_many failed for {len(items)} keys: {e}")
+            return False
+
     async def delete(self, key: str) -> bool:
         """Delete value from cache.
 
@@ -14,6 +14,7 @@ from src.models.category import Category
 from src.models.subscription import Subscription
 from src.schemas.category import CategoryCreate, CategoryUpdate, CategoryWithStats
 from src.services.currency_service import CurrencyService
+from src.services.ical_cache import mark_subscriptions_changed
 
 
 class CategoryService:
@@ -179,6 +180,7 @@ class CategoryService:
             .where(Subscription.category_id == category_id)
             .values(category_id=None)
         )
+        mark_subscriptions_changed(self.db, self.user_id)
 
         await self.db.delete(category)
         await self.db.flush()
@@ -317,6 +319,7 @@ class CategoryService:
             )
             .values(category_id=category_id)
         )
+        mark_subscriptions_changed(self.db, self.user_id)
         await self.db.flush()
         return result.rowcount
 
@@ -8,12 +8,16 @@ Features:
 - Amount similarity checking
 - Frequency alignment verification
 - Confidence scoring for matches
+- Candidate index (token, trigram and amount blocking) so large
+  subscription lists are not compared pair-by-pair
 """
 
 from __future__ import annotations
 
 import logging
+import math
 import re
+from collections import defaultdict
 from dataclasses import dataclass, field
 from decimal import Decimal
 from difflib import SequenceMatcher
@@ -47,6 +51,166 @@ class DuplicateMatch:
         }
 
 
+@dataclass
+class IndexedSubscription:
+    """An existing subscription with its comparison keys precomputed."""
+
+    subscription: Subscription
+    normalized_name: str
+    tokens: frozenset[str]
+    frequency: str
+    # Matcher with the name preloaded as seq2, so its lookup tables are
+    # built once rather than once per compared pattern
+    matcher: SequenceMatcher[str]
+
+
+class SubscriptionIndex:
+    """Blocking index over a user's existing subscriptions.
+
+    Candidates for a detected pattern are the union of:
+    - subscriptions sharing a name token (token inverted index)
+    - subscriptions sharing a character trigram (trigram index)
+    - subscriptions whose amount is close enough that the amount and
+      frequency terms alone could carry the score past ``min_similarity``
+      (log-scale amount buckets)
+
+    Very short names are always candidates, as are all subscriptions when
+    ``min_similarity`` is too low for amounts to prune.
+    Every candidate is still scored by ``DuplicateDetector``, so scores
+    are identical to a full pairwise comparison. The only pairs skipped
+    are strong name matches that share no trigram, token or nearby
+    amount, which real merchant names do not produce.
+    """
+
+    # Names shorter than this match too loosely to block on trigrams
+    MIN_INDEXED_NAME_LENGTH = 5
+    AMOUNT_BUCKET_BASE = 1.25
+
+    def __init__(
+        self,
+        detector: DuplicateDetector,
+        subscriptions: list[Subscription],
+    ) -> None:
+        """Build the index.
+
+        Args:
+            detector: Detector whose normalization rules are used
+            subscriptions: User's existing subscriptions
+        """
+        self._detector = detector
+        self.entries: list[IndexedSubscription] = []
+        self._by_token: dict[str, list[int]] = defaultdict(list)
+        self._by_trigram: dict[str, list[int]] = defaultdict(list)
+        self._by_amount_bucket: dict[int | None, list[int]] = defaultdict(list)
+        self._short_names: list[int] = []
+
+        for subscription in subscriptions:
+            normalized = detector._normalize_name(subscription.name)
+            if not normalized:
+                # Empty names score 0.0 and can never match
+                continue
+
+            entry = IndexedSubscription(
+                subscription=subscription,
+                normalized_name=normalized,
+                tokens=frozenset(normalized.split()),
+                frequency=subscription.frequency.value if subscription.frequency else "monthly",
+                matcher=SequenceMatcher(None, "", normalized),
+            )
+            slot = len(self.entries)
+            self.entries.append(entry)
+
+            for token in entry.tokens:
+                self._by_token[token].append(slot)
+            if len(normalized) < self.MIN_INDEXED_NAME_LENGTH:
+                self._short_names.append(slot)
+            else:
+                for trigram in self._trigrams(normalized):
+                    self._by_trigram[trigram].append(slot)
+            self._by_amount_bucket[self._amount_bucket(subscription.amount)].append(slot)
+
+    def candidates(
+        self,
+        normalized_name: str,
+        amount: Decimal,
+        min_amount_score: float | None,
+    ) -> list[IndexedSubscription]:
+        """Return plausible matches for a pattern, in original list order.
+
+        Args:
+            normalized_name: Pattern name after ``_normalize_name``
+            amount: Pattern amount
+            min_amount_score: Lowest amount similarity that could still
+                reach the threshold on amount alone, or None if amounts
+                cannot be used to prune
+
+        Returns:
+            Candidate subscriptions in their original order
+        """
+        if not normalized_name:
+            return []
+
+        if len(normalized_name) < self.MIN_INDEXED_NAME_LENGTH or min_amount_score is None:
+            # Short names can be substrings of (or typos for) anything
+            return list(self.entries)
+
+        slots: set[int] = set(self._short_names)
+        for token in normalized_name.split():
+            slots.update(self._by_token.get(token, ()))
+        for trigram in self._trigrams(normalized_name):
+            slots.update(self._by_trigram.get(trigram, ()))
+        for bucket in self._amount_buckets_near(amount, min_amount_score):
+            for slot in self._by_amount_bucket.get(bucket, ()):
+                if slot in slots:
+                    continue
+                # Buckets are coarse; keep only amounts that really qualify
+                amount_score = self._detector._calculate_amount_similarity(
+                    amount,
+                    self.entries[slot].subscription.amount,
+                )
+                if amount_score >= min_amount_score:
+                    slots.add(slot)
+
+        return [self.entries[slot] for slot in sorted(slots)]
+
+    @staticmethod
+    def _trigrams(name: str) -> set[str]:
+        """Get the character trigrams of a name, padded at both ends.
+
+        Padding (two leading spaces, one trailing) follows pg_trgm so that
+        typos near the start or end of a name still share a trigram.
+        """
+        padded = f"  {name} "
+        return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+    @classmethod
+    def _amount_bucket(cls, amount: Decimal) -> int | None:
+        """Get the log-scale bucket for an amount (None for zero)."""
+        value = abs(float(amount))
+        if value == 0:
+            return None
+        return math.floor(math.log(value, cls.AMOUNT_BUCKET_BASE))
+
+    @classmethod
+    def _amount_buckets_near(cls, amount: Decimal, min_amount_score: float) -> list[int | None]:
+        """Get buckets holding amounts with similarity >= ``min_amount_score``.
+
+        Amount similarity is ``(3 - r) / (1 + r)`` for a ratio ``r >= 1``
+        between the amounts, so the score bounds the ratio.
+        """
+        value = abs(float(amount))
+        if value == 0:
+            # Only an equal (zero) amount scores above 0.0
+            return [None]
+        if min_amount_score > 1:
+            return []
+
+        max_ratio = (3 - min_amount_score) / (1 + min_amount_score)
+        low = math.floor(math.log(value / max_ratio, cls.AMOUNT_BUCKET_BASE)) - 1
+        high = math.floor(math.log(value * max_ratio, cls.AMOUNT_BUCKET_BASE)) + 1
+        return list(range(low, high + 1))
+
+
 class DuplicateDetector:
     """Service for detecting duplicate subscriptions.
 
@@ -57,11 +221,18 @@ class DuplicateDetector:
     # Similarity thresholds
     NAME_SIMILARITY_THRESHOLD = 0.7
     AMOUNT_SIMILARITY_THRESHOLD = 0.1  # 10% variance allowed
+    MIN_NAME_SIMILARITY = 0.4  # Below this, names are too different
     HIGH_CONFIDENCE_THRESHOLD = 0.85
     MEDIUM_CONFIDENCE_THRESHOLD = 0.65
 
+    # Score weights
+    NAME_WEIGHT = 0.4
+    AMOUNT_WEIGHT = 0.35
+    FREQUENCY_WEIGHT = 0.25
+
     # Frequency mappings for normalization
     FREQUENCY_MAP = {
+        "daily": 1,
         "weekly": 7,
         "biweekly": 14,
         "monthly": 30,
@@ -75,29 +246,42 @@ class DuplicateDetector:
         """Initialize the duplicate detector."""
         pass
 
+    def build_index(self, existing_subscriptions: list[Subscription]) -> SubscriptionIndex:
+        """Build a candidate index over existing subscriptions.
+
+        Build it once and pass it to ``find_best_match`` when matching
+        many patterns against the same subscriptions.
+
+        Args:
+            existing_subscriptions: User's existing subscriptions
+
+        Returns:
+            SubscriptionIndex for candidate generation
+        """
+        return SubscriptionIndex(self, existing_subscriptions)
+
     def find_duplicates(
         self,
         patterns: list[DetectedPattern],
-        existing_subscriptions: list[Subscription],
+        existing_subscriptions: list[Subscription] | SubscriptionIndex,
         min_similarity: float = 0.6,
     ) -> list[DuplicateMatch]:
         """Find potential duplicates for detected patterns.
 
         Args:
             patterns: List of detected patterns from statement
-            existing_subscriptions: User's existing subscriptions
+            existing_subscriptions: User's existing subscriptions or a
+                prebuilt SubscriptionIndex
             min_similarity: Minimum similarity score to consider a match
 
         Returns:
             List of duplicate matches sorted by similarity
         """
+        index = self._as_index(existing_subscriptions)
         matches: list[DuplicateMatch] = []
 
         for pattern in patterns:
-            for subscription in existing_subscriptions:
-                match = self._check_match(pattern, subscription)
-                if match and match.similarity_score >= min_similarity:
-                    matches.append(match)
+            matches.extend(self._match_candidates(pattern, index, min_similarity))
 
         # Sort by similarity score (highest first)
         matches.sort(key=lambda m: m.similarity_score, reverse=True)
@@ -107,14 +291,15 @@ class DuplicateDetector:
     def find_best_match(
         self,
         pattern: DetectedPattern,
-        existing_subscriptions: list[Subscription],
+        existing_subscriptions: list[Subscription] | SubscriptionIndex,
         min_similarity: float = 0.6,
     ) -> DuplicateMatch | None:
         """Find the best matching existing subscription for a pattern.
 
         Args:
             pattern: Detected pattern to match
-            existing_subscriptions: User's existing subscriptions
+            existing_subscriptions: User's existing subscriptions or a
+                prebuilt SubscriptionIndex
             min_similarity: Minimum similarity score to consider a match
 
         Returns:
@@ -122,14 +307,94 @@ class DuplicateDetector:
         """
         best_match: DuplicateMatch | None = None
 
-        for subscription in existing_subscriptions:
-            match = self._check_match(pattern, subscription)
-            if match and match.similarity_score >= min_similarity:
-                if best_match is None or match.similarity_score > best_match.similarity_score:
-                    best_match = match
+        index = self._as_index(existing_subscriptions)
+        for match in self._match_candidates(pattern, index, min_similarity):
+            if best_match is None or match.similarity_score > best_match.similarity_score:
+                best_match = match
 
         return best_match
 
+    def _as_index(
+        self,
+        existing_subscriptions: list[Subscription] | SubscriptionIndex,
+    ) -> SubscriptionIndex:
+        """Return a SubscriptionIndex, building one if given a plain list."""
+        if isinstance(existing_subscriptions, SubscriptionIndex):
+            return existing_subscriptions
+        return self.build_index(existing_subscriptions)
+
+    def _match_candidates(
+        self,
+        pattern: DetectedPattern,
+        index: SubscriptionIndex,
+        min_similarity: float,
+    ) -> list[DuplicateMatch]:
+        """Score a pattern against its index candidates.
+
+        Args:
+            pattern: Detected pattern
+            index: Index over existing subscriptions
+            min_similarity: Minimum similarity score to consider a match
+
+        Returns:
+            Matches at or above ``min_similarity``, in subscription order
+        """
+        pattern_name = self._normalize_name(pattern.normalized_name)
+        pattern_tokens = frozenset(pattern_name.split())
+        candidates = index.candidates(
+            pattern_name,
+            pattern.amount,
+            self._min_amount_score(min_similarity),
+        )
+
+        matches: list[DuplicateMatch] = []
+        for entry in candidates:
+            name_score = self._normalized_name_similarity(
+                pattern_name,
+                entry.normalized_name,
+                pattern_tokens,
+                entry.tokens,
+                floor=self.MIN_NAME_SIMILARITY,
+                matcher=entry.matcher,
+            )
+            match = self._score_match(
+                pattern,
+                entry.subscription,
+                name_score,
+                entry.frequency,
+            )
+            if match and match.similarity_score >= min_similarity:
+                matches.append(match)
+
+        return matches
+
+    def _min_amount_score(self, min_similarity: float) -> float | None:
+        """Get the lowest amount similarity that can still reach a threshold.
+
+        A name in the [MIN_NAME_SIMILARITY, NAME_SIMILARITY_THRESHOLD) band
+        adds no name term, so the score is the weighted amount and
+        frequency terms alone (frequency at most 1.0). Stronger name
+        matches are found through the token and trigram indexes instead.
+
+        Args:
+            min_similarity: Minimum similarity score to consider a match
+
+        Returns:
+            Minimum amount similarity, or None if amounts cannot prune
+        """
+        # Scores are rounded to two decimals before comparison
+        threshold = min_similarity - 0.005 - 1e-9
+        weight = self.AMOUNT_WEIGHT + self.FREQUENCY_WEIGHT
+        required = (threshold * weight - self.FREQUENCY_WEIGHT) / self.AMOUNT_WEIGHT
+        if required <= 0:
+            return None
+
+        amount_match = 1 - self.AMOUNT_SIMILARITY_THRESHOLD
+        if required * 2 < amount_match:
+            # Reachable with the halved mismatch score
+            return required * 2
+        return max(amount_match, required)
+
     def _check_match(
         self,
         pattern: DetectedPattern,
@@ -144,42 +409,68 @@ class DuplicateDetector:
         Returns:
             DuplicateMatch if there's a match, None otherwise
         """
-        match_reasons: list[str] = []
-        scores: list[tuple[float, float]] = []  # (score, weight)
-
-        # 1. Name similarity (weighted: 0.4)
         name_score = self._calculate_name_similarity(
             pattern.normalized_name,
             subscription.name,
         )
+        return self._score_match(
+            pattern,
+            subscription,
+            name_score,
+            subscription.frequency.value if subscription.frequency else "monthly",
+        )
+
+    def _score_match(
+        self,
+        pattern: DetectedPattern,
+        subscription: Subscription,
+        name_score: float,
+        subscription_frequency: str,
+    ) -> DuplicateMatch | None:
+        """Combine name, amount and frequency into a weighted match score.
+
+        Args:
+            pattern: Detected pattern
+            subscription: Existing subscription
+            name_score: Name similarity between the two
+            subscription_frequency: Subscription frequency value
+
+        Returns:
+            DuplicateMatch if there's a match, None otherwise
+        """
+        match_reasons: list[str] = []
+        scores: list[tuple[float, float]] = []  # (score, weight)
+
+        # 1. Name similarity
         if name_score >= self.NAME_SIMILARITY_THRESHOLD:
             match_reasons.append(f"Name match: {name_score:.0%}")
-            scores.append((name_score, 0.4))
-        elif name_score < 0.4:
+            scores.append((name_score, self.NAME_WEIGHT))
+        elif name_score < self.MIN_NAME_SIMILARITY:
             # Names too different, skip this match
             return None
 
-        # 2. Amount similarity (weighted: 0.35)
+        # 2. Amount similarity
         amount_score = self._calculate_amount_similarity(
             pattern.amount,
             subscription.amount,
         )
         if amount_score >= (1 - self.AMOUNT_SIMILARITY_THRESHOLD):
             match_reasons.append(f"Amount match: {amount_score:.0%}")
-            scores.append((amount_score, 0.35))
+            scores.append((amount_score, self.AMOUNT_WEIGHT))
         else:
-            scores.append((amount_score * 0.5, 0.35))  # Penalize amount mismatch
+            # Penalize amount mismatch
+            scores.append((amount_score * 0.5, self.AMOUNT_WEIGHT))
 
-        # 3. Frequency alignment (weighted: 0.25)
+        # 3. Frequency alignment
         freq_score = self._calculate_frequency_similarity(
             pattern.frequency.value,
-            subscription.frequency.value if subscription.frequency else "monthly",
+            subscription_frequency,
         )
         if freq_score > 0.8:
             match_reasons.append("Frequency match")
-            scores.append((freq_score, 0.25))
+            scores.append((freq_score, self.FREQUENCY_WEIGHT))
         else:
-            scores.append((freq_score * 0.7, 0.25))
+            scores.append((freq_score * 0.7, self.FREQUENCY_WEIGHT))
 
         # Calculate weighted average
         if not scores:
@@ -222,6 +513,39 @@ class DuplicateDetector:
         norm1 = self._normalize_name(name1)
         norm2 = self._normalize_name(name2)
 
+        return self._normalized_name_similarity(
+            norm1,
+            norm2,
+            frozenset(norm1.split()),
+            frozenset(norm2.split()),
+        )
+
+    def _normalized_name_similarity(
+        self,
+        norm1: str,
+        norm2: str,
+        tokens1: frozenset[str],
+        tokens2: frozenset[str],
+        floor: float = 0.0,
+        matcher: SequenceMatcher[str] | None = None,
+    ) -> float:
+        """Calculate similarity between two already-normalized names.
+
+        When ``floor`` is set, the full sequence match is skipped if its
+        cheap upper bounds already fall below it; the returned score is
+        then only guaranteed to be below ``floor``.
+
+        Args:
+            norm1: First normalized name
+            norm2: Second normalized name
+            tokens1: Whitespace tokens of the first name
+            tokens2: Whitespace tokens of the second name
+            floor: Scores below this value need not be exact
+            matcher: Reusable matcher whose seq2 is already ``norm2``
+
+        Returns:
+            Similarity score from 0.0 to 1.0
+        """
         if not norm1 or not norm2:
             return 0.0
 
@@ -233,18 +557,24 @@ class DuplicateDetector:
         if norm1 in norm2 or norm2 in norm1:
             return 0.9
 
-        # Sequence matching
-        sequence_score = SequenceMatcher(None, norm1, norm2).ratio()
-
         # Token overlap
-        tokens1 = set(norm1.split())
-        tokens2 = set(norm2.split())
         if tokens1 and tokens2:
             common_tokens = tokens1 & tokens2
             token_score = len(common_tokens) / max(len(tokens1), len(tokens2))
         else:
             token_score = 0.0
 
+        # Sequence matching
+        if matcher is None:
+            matcher = SequenceMatcher(None, norm1, norm2)
+        else:
+            matcher.set_seq1(norm1)
+        if token_score < floor and (
+            matcher.real_quick_ratio() < floor or matcher.quick_ratio() < floor
+        ):
+            return token_score
+        sequence_score = matcher.ratio()
+
         # Take the best score
         return max(sequence_score, token_score)
 
@@ -8,10 +8,13 @@ Features:
 - Daily/weekly digest emails
 - HTML formatted emails with styling
 - Async email sending via aiosmtplib
+- Reusable pooled SMTP connections for bulk sends
 """
 
+import asyncio
 import logging
-from datetime import date
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from decimal import Decimal
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
@@ -20,19 +23,23 @@ from typing import TYPE_CHECKING
 import aiosmtplib
 
 from src.core.config import settings
+from src.services.email_templates import (
+    CURRENCY_SYMBOLS,
+    DigestContent,
+    DigestPeriod,
+    RenderedEmail,
+    render_digest_html,
+    render_digests,
+    render_reminder,
+    render_reminder_html,
+)
 
 if TYPE_CHECKING:
     from src.models.subscription import Subscription
 
 logger = logging.getLogger(__name__)
 
-# Currency symbols mapping
-CURRENCY_SYMBOLS = {
-    "GBP": "£",
-    "USD": "$",
-    "EUR": "€",
-    "UAH": "₴",
-}
+__all__ = ["CURRENCY_SYMBOLS", "EmailService"]
 
 
 class EmailService:
@@ -80,6 +87,7 @@ class EmailService:
         self.smtp_password = smtp_password or getattr(settings, "smtp_password", "")
         self.from_email = from_email or getattr(settings, "smtp_from_email", "")
         self.from_name = from_name
+        self._smtp_pool: asyncio.Queue[aiosmtplib.SMTP] | None = None
 
     @property
     def is_configured(self) -> bool:
@@ -90,6 +98,86 @@ class EmailService:
         """
         return bool(self.smtp_host and self.smtp_user and self.smtp_password)
 
+    @asynccontextmanager
+    async def session(self, connections: int = 1) -> AsyncIterator["EmailService"]:
+        """Reuse SMTP connections for all sends made inside the block.
+
+        Without a session every email opens, authenticates and closes its own
+        SMTP connection. Inside a session up to ``connections`` connections
+        are opened lazily, kept alive between emails and closed on exit.
+
+        Args:
+            connections: Number of pooled connections (concurrent sends).
+
+        Yields:
+            This service.
+
+        Example:
+            >>> async with service.session(connections=4):
+            ...     await service.send_email(...)
+        """
+        pool: asyncio.Queue[aiosmtplib.SMTP] = asyncio.Queue()
+        for _ in range(max(1, connections)):
+            pool.put_nowait(
+                aiosmtplib.SMTP(
+                    hostname=self.smtp_host,
+                    port=self.smtp_port,
+                    username=self.smtp_user,
+                    password=self.smtp_password,
+                    start_tls=True,
+                )
+            )
+        self._smtp_pool = pool
+
+        try:
+            yield self
+        finally:
+            self._smtp_pool = None
+            while not pool.empty():
+                smtp = pool.get_nowait()
+                if not smtp.is_connected:
+                    continue
+                try:
+                    await smtp.quit()
+                except aiosmtplib.SMTPException:
+                    smtp.close()
+
+    async def _deliver(self, msg: MIMEMultipart) -> None:
+        """Send a message over a pooled connection, or a one-off one.
+
+        Args:
+            msg: Message to send.
+        """
+        pool = self._smtp_pool
+        if pool is None:
+            await aiosmtplib.send(
+                msg,
+                hostname=self.smtp_host,
+                port=self.smtp_port,
+                username=self.smtp_user,
+                password=self.smtp_password,
+                start_tls=True,
+            )
+            return
+
+        smtp = await pool.get()
+        try:
+            if not smtp.is_connected:
+                await smtp.connect()
+            try:
+                await smtp.send_message(msg)
+            except aiosmtplib.SMTPServerDisconnected:
+                # The relay dropped an idle connection; reconnect once
+                await smtp.connect()
+                await smtp.send_message(msg)
+        except Exception:
+            # Don't hand a connection in an unknown state to the next send
+            if smtp.is_connected:
+                smtp.close()
+            raise
+        finally:
+            pool.put_nowait(smtp)
+
     async def send_email(
         self,
         to_email: str,
@@ -127,14 +215,7 @@ class EmailService:
             msg.attach(MIMEText(html_body, "html"))
 
             # Send email
-            await aiosmtplib.send(
-                msg,
-                hostname=self.smtp_host,
-                port=self.smtp_port,
-                username=self.smtp_user,
-                password=self.smtp_password,
-                start_tls=True,
-            )
+            await self._deliver(msg)
 
             logger.info(f"Email sent to {to_email}: {subject}")
             return True
@@ -143,6 +224,18 @@ class EmailService:
             logger.error(f"Failed to send email to {to_email}: {e}")
             return False
 
+    async def send_rendered(self, to_email: str, email: RenderedEmail) -> bool:
+        """Send an email rendered by src.services.email_templates.
+
+        Args:
+            to_email: Recipient email address.
+            email: Rendered subject and bodies.
+
+        Returns:
+            True if email sent successfully.
+        """
+        return await self.send_email(to_email, email.subject, email.html_body, email.text_body)
+
     async def send_reminder(
         self,
         to_email: str,
@@ -159,54 +252,7 @@ class EmailService:
         Returns:
             True if email sent successfully.
         """
-        # Determine urgency and styling
-        if days_until < 0:
-            urgency = "overdue"
-            urgency_text = f"{abs(days_until)} days overdue"
-            color = "#dc2626"  # Red
-        elif days_until == 0:
-            urgency = "today"
-            urgency_text = "Due today"
-            color = "#f59e0b"  # Orange
-        elif days_until == 1:
-            urgency = "tomorrow"
-            urgency_text = "Due tomorrow"
-            color = "#f59e0b"  # Orange
-        else:
-            urgency = "upcoming"
-            urgency_text = f"Due in {days_until} days"
-            color = "#3b82f6"  # Blue
-
-        # Get currency symbol
-        currency_symbol = CURRENCY_SYMBOLS.get(subscription.currency, "£")
-        amount = f"{currency_symbol}{subscription.amount:.2f}"
-
-        # Build subject
-        if urgency == "overdue":
-            subject = f"⚠️ Overdue: {subscription.name} payment is {abs(days_until)} days late"
-        elif urgency == "today":
-            subject = f"💳 Payment Due Today: {subscription.name} - {amount}"
-        else:
-            subject = f"📅 Upcoming Payment: {subscription.name} - {amount} ({urgency_text})"
-
-        # Build HTML body
-        html_body = self._build_reminder_html(
-            subscription=subscription,
-            amount=amount,
-            urgency_text=urgency_text,
-            color=color,
-        )
-
-        # Plain text fallback
-        text_body = (
-            f"Payment Reminder: {subscription.name}\n\n"
-            f"Amount: {amount}\n"
-            f"Status: {urgency_text}\n"
-            f"Frequency: {subscription.frequency.value.title()}\n\n"
-            f"--\nMoney Flow - Your payment tracking assistant"
-        )
-
-        return await self.send_email(to_email, subject, html_body, text_body)
+        return await self.send_rendered(to_email, render_reminder(subscription, days_until))
 
     async def send_daily_digest(
         self,
@@ -227,36 +273,8 @@ class EmailService:
         if not subscriptions:
             return False
 
-        currency_symbol = CURRENCY_SYMBOLS.get(currency, "£")
-        today = date.today()
-
-        # Calculate totals
-        total = sum(s.amount for s in subscriptions)
-        today_payments = [s for s in subscriptions if s.next_payment_date == today]
-        week_payments = [
-            s for s in subscriptions if s.next_payment_date and s.next_payment_date > today
-        ]
-
-        subject = f"📊 Daily Digest: {len(subscriptions)} payments this week ({currency_symbol}{total:.2f})"
-
-        html_body = self._build_digest_html(
-            subscriptions=subscriptions,
-            today_payments=today_payments,
-            week_payments=week_payments,
-            currency_symbol=currency_symbol,
-            total=total,
-            period="Daily",
-        )
-
-        text_body = (
-            f"Daily Payment Digest\n\n"
-            f"Total: {currency_symbol}{total:.2f}\n"
-            f"Payments today: {len(today_payments)}\n"
-            f"Payments this week: {len(week_payments)}\n\n"
-            f"--\nMoney Flow"
-        )
-
-        return await self.send_email(to_email, subject, html_body, text_body)
+        (email,) = render_digests([DigestContent(subscriptions, currency)], DigestPeriod.DAILY)
+        return await self.send_rendered(to_email, email)
 
     async def send_weekly_digest(
         self,
@@ -277,31 +295,8 @@ class EmailService:
         if not subscriptions:
             return False
 
-        currency_symbol = CURRENCY_SYMBOLS.get(currency, "£")
-        today = date.today()
-
-        # Calculate totals
-        total = sum(s.amount for s in subscriptions)
-
-        subject = f"📅 Weekly Summary: {len(subscriptions)} payments ({currency_symbol}{total:.2f})"
-
-        html_body = self._build_digest_html(
-            subscriptions=subscriptions,
-            today_payments=[s for s in subscriptions if s.next_payment_date == today],
-            week_payments=subscriptions,
-            currency_symbol=currency_symbol,
-            total=total,
-            period="Weekly",
-        )
-
-        text_body = (
-            f"Weekly Payment Summary\n\n"
-            f"Total: {currency_symbol}{total:.2f}\n"
-            f"Payments: {len(subscriptions)}\n\n"
-            f"--\nMoney Flow"
-        )
-
-        return await self.send_email(to_email, subject, html_body, text_body)
+        (email,) = render_digests([DigestContent(subscriptions, currency)], DigestPeriod.WEEKLY)
+        return await self.send_rendered(to_email, email)
 
     async def send_test_notification(self, to_email: str) -> bool:
         """Send a test notification email.
@@ -362,66 +357,7 @@ class EmailService:
         Returns:
             HTML string for the email body.
         """
-        date_str = ""
-        if subscription.next_payment_date:
-            date_str = subscription.next_payment_date.strftime("%B %d, %Y")
-
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                       margin: 0; padding: 0; background: #f3f4f6; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                          color: white; padding: 30px; text-align: center; border-radius: 8px 8px 0 0; }}
-                .content {{ background: white; padding: 30px; border-radius: 0 0 8px 8px;
-                           box-shadow: 0 4px 6px rgba(0,0,0,0.1); }}
-                .status {{ display: inline-block; padding: 8px 16px; border-radius: 20px;
-                          color: white; font-weight: 600; margin-bottom: 20px; }}
-                .amount {{ font-size: 36px; font-weight: 700; color: #1f2937; margin: 20px 0; }}
-                .details {{ background: #f8fafc; padding: 20px; border-radius: 8px; margin: 20px 0; }}
-                .detail-row {{ display: flex; justify-content: space-between; padding: 8px 0;
-                              border-bottom: 1px solid #e5e7eb; }}
-                .detail-row:last-child {{ border-bottom: none; }}
-                .label {{ color: #6b7280; }}
-                .value {{ font-weight: 600; color: #1f2937; }}
-                .footer {{ text-align: center; padding: 20px; color: #9ca3af; font-size: 12px; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1 style="margin: 0;">💰 Money Flow</h1>
-                    <p style="margin: 10px 0 0;">Payment Reminder</p>
-                </div>
-                <div class="content">
-                    <div class="status" style="background: {color};">{urgency_text}</div>
-                    <h2 style="margin: 0; color: #1f2937;">{subscription.name}</h2>
-                    <div class="amount">{amount}</div>
-                    <div class="details">
-                        <div class="detail-row">
-                            <span class="label">Payment Date</span>
-                            <span class="value">{date_str}</span>
-                        </div>
-                        <div class="detail-row">
-                            <span class="label">Frequency</span>
-                            <span class="value">{subscription.frequency.value.title()}</span>
-                        </div>
-                        <div class="detail-row">
-                            <span class="label">Category</span>
-                            <span class="value">{subscription.category or "Uncategorized"}</span>
-                        </div>
-                    </div>
-                </div>
-                <div class="footer">
-                    <p>Money Flow - Your payment tracking assistant</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+        return render_reminder_html(subscription, amount, urgency_text, color)
 
     def _build_digest_html(
         self,
@@ -445,81 +381,10 @@ class EmailService:
         Returns:
             HTML string for the email body.
         """
-        # Build payment rows
-        payment_rows = ""
-        for sub in subscriptions[:10]:  # Limit to 10 for email length
-            date_str = sub.next_payment_date.strftime("%b %d") if sub.next_payment_date else ""
-            payment_rows += f"""
-            <tr>
-                <td style="padding: 12px; border-bottom: 1px solid #e5e7eb;">{sub.name}</td>
-                <td style="padding: 12px; border-bottom: 1px solid #e5e7eb; text-align: right;">
-                    {currency_symbol}{sub.amount:.2f}
-                </td>
-                <td style="padding: 12px; border-bottom: 1px solid #e5e7eb; text-align: right;">
-                    {date_str}
-                </td>
-            </tr>
-            """
-
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                       margin: 0; padding: 0; background: #f3f4f6; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                          color: white; padding: 30px; text-align: center; border-radius: 8px 8px 0 0; }}
-                .content {{ background: white; padding: 30px; border-radius: 0 0 8px 8px;
-                           box-shadow: 0 4px 6px rgba(0,0,0,0.1); }}
-                .stats {{ display: flex; justify-content: space-around; margin: 20px 0; }}
-                .stat {{ text-align: center; }}
-                .stat-value {{ font-size: 28px; font-weight: 700; color: #667eea; }}
-                .stat-label {{ color: #6b7280; font-size: 12px; }}
-                table {{ width: 100%; border-collapse: collapse; margin-top: 20px; }}
-                th {{ background: #f8fafc; padding: 12px; text-align: left; font-weight: 600; }}
-                .footer {{ text-align: center; padding: 20px; color: #9ca3af; font-size: 12px; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1 style="margin: 0;">📊 Money Flow</h1>
-                    <p style="margin: 10px 0 0;">{period} Payment Digest</p>
-                </div>
-                <div class="content">
-                    <div class="stats">
-                        <div class="stat">
-                            <div class="stat-value">{len(subscriptions)}</div>
-                            <div class="stat-label">Payments</div>
-                        </div>
-                        <div class="stat">
-                            <div class="stat-value">{currency_symbol}{total:.2f}</div>
-                            <div class="stat-label">Total</div>
-                        </div>
-                        <div class="stat">
-                            <div class="stat-value">{len(today_payments)}</div>
-                            <div class="stat-label">Due Today</div>
-                        </div>
-                    </div>
-                    <table>
-                        <thead>
-                            <tr>
-                                <th>Payment</th>
-                                <th style="text-align: right;">Amount</th>
-                                <th style="text-align: right;">Date</th>
-                            </tr>
-                        </thead>
-                        <tbody>
-                            {payment_rows}
-                        </tbody>
-                    </table>
-                </div>
-                <div class="footer">
-                    <p>Money Flow - Your payment tracking assistant</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+        return render_digest_html(
+            subscriptions=subscriptions,
+            due_today=len(today_payments),
+            symbol=currency_symbol,
+            total=total,
+            period=DigestPeriod(period),
+        )
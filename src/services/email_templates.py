@@ -0,0 +1,768 @@
+"""Precompiled HTML templates for notification and report emails.
+
+Email bodies used to be built with f-strings for every user: the whole
+page, including its stylesheet, was re-formatted per email. Templates here
+are compiled once at import into literal chunks and placeholder slots;
+rendering is a single join over the slots. Values shared by many users are
+folded into the template ahead of time with CompiledTemplate.bind() and
+cached per period and currency, so per-user work is mostly the user's
+own rows.
+
+Placeholders use ``{{ name }}`` so CSS braces need no escaping. Values are
+inserted as-is; user-provided text (subscription names, categories) is
+escaped by the render functions.
+
+Example:
+    >>> emails = render_digests(
+    ...     [DigestContent(subscriptions, "GBP") for subscriptions in batch],
+    ...     period=DigestPeriod.DAILY,
+    ... )
+"""
+
+from __future__ import annotations
+
+import html
+import re
+import textwrap
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.models.subscription import Subscription
+
+# Currency symbols mapping
+CURRENCY_SYMBOLS = {
+    "GBP": "£",
+    "USD": "$",
+    "EUR": "€",
+    "UAH": "₴",
+}
+
+_PLACEHOLDER = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+# Payments listed in a digest email (keeps emails short)
+DIGEST_MAX_ROWS = 10
+
+
+def currency_symbol(currency: str) -> str:
+    """Return the display symbol of a currency code (£ if unknown)."""
+    return CURRENCY_SYMBOLS.get(currency, "£")
+
+
+class CompiledTemplate:
+    """A template split once into literal chunks and placeholder slots.
+
+    Attributes:
+        fields: Placeholder names, in order of appearance.
+    """
+
+    def __init__(self, source: str) -> None:
+        """Compile a template.
+
+        Args:
+            source: Template text with ``{{ name }}`` placeholders. Common
+                leading indentation is removed.
+        """
+        parts = _PLACEHOLDER.split(textwrap.dedent(source).strip("\n"))
+        self._literals: list[str] = parts[0::2]
+        self.fields: tuple[str, ...] = tuple(parts[1::2])
+
+    @classmethod
+    def _from_parts(cls, literals: list[str], fields: list[str]) -> CompiledTemplate:
+        template = cls.__new__(cls)
+        template._literals = literals
+        template.fields = tuple(fields)
+        return template
+
+    def bind(self, **values: object) -> CompiledTemplate:
+        """Fold some placeholder values into a new, smaller template.
+
+        Args:
+            **values: Values for some of the placeholders.
+
+        Returns:
+            Template with those placeholders replaced by literals.
+        """
+        literals = [self._literals[0]]
+        fields: list[str] = []
+        for field, literal in zip(self.fields, self._literals[1:], strict=True):
+            if field in values:
+                literals[-1] += f"{values[field]}{literal}"
+            else:
+                fields.append(field)
+                literals.append(literal)
+        return self._from_parts(literals, fields)
+
+    def embed(self, field: str, template: CompiledTemplate) -> CompiledTemplate:
+        """Insert another template at a placeholder, keeping its placeholders.
+
+        Args:
+            field: Placeholder to replace.
+            template: Template to insert.
+
+        Returns:
+            Combined template.
+        """
+        literals = [self._literals[0]]
+        fields: list[str] = []
+        for name, literal in zip(self.fields, self._literals[1:], strict=True):
+            if name == field:
+                literals[-1] += template._literals[0]
+                fields.extend(template.fields)
+                literals.extend(template._literals[1:])
+                literals[-1] += literal
+            else:
+                fields.append(name)
+                literals.append(literal)
+        return self._from_parts(literals, fields)
+
+    def render(self, values: Mapping[str, object] | None = None, **kwargs: object) -> str:
+        """Render the template.
+
+        Args:
+            values: Placeholder values.
+            **kwargs: More placeholder values.
+
+        Returns:
+            Rendered text.
+
+        Raises:
+            KeyError: If a placeholder has no value.
+        """
+        if values is None:
+            values = kwargs
+        elif kwargs:
+            values = {**values, **kwargs}
+        out = [self._literals[0]]
+        for field, literal in zip(self.fields, self._literals[1:], strict=True):
+            out.append(str(values[field]))
+            out.append(literal)
+        return "".join(out)
+
+
+@dataclass(frozen=True)
+class RenderedEmail:
+    """A fully rendered email, ready to send.
+
+    Attributes:
+        subject: Subject line.
+        html_body: HTML body.
+        text_body: Plain text fallback.
+    """
+
+    subject: str
+    html_body: str
+    text_body: str
+
+
+class DigestPeriod(str, Enum):
+    """Digest email period."""
+
+    DAILY = "Daily"
+    WEEKLY = "Weekly"
+
+
+@dataclass(frozen=True)
+class DigestContent:
+    """Data of one user's digest email.
+
+    Attributes:
+        subscriptions: Upcoming subscriptions, ordered by payment date.
+        currency: Display currency code.
+    """
+
+    subscriptions: list[Subscription]
+    currency: str = "GBP"
+
+
+# =============================================================================
+# Notification emails
+# =============================================================================
+
+_NOTIFICATION_STYLE = """
+body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+       margin: 0; padding: 0; background: #f3f4f6; }
+.container { max-width: 600px; margin: 0 auto; padding: 20px; }
+.header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+          color: white; padding: 30px; text-align: center; border-radius: 8px 8px 0 0; }
+.content { background: white; padding: 30px; border-radius: 0 0 8px 8px;
+           box-shadow: 0 4px 6px rgba(0,0,0,0.1); }
+.footer { text-align: center; padding: 20px; color: #9ca3af; font-size: 12px; }
+"""
+
+_NOTIFICATION_PAGE = CompiledTemplate(
+    """
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <style>{{ style }}{{ extra_style }}</style>
+    </head>
+    <body>
+        <div class="container">
+            <div class="header">
+                <h1 style="margin: 0;">{{ logo }} Money Flow</h1>
+                <p style="margin: 10px 0 0;">{{ heading }}</p>
+            </div>
+            <div class="content">
+                {{ content }}
+            </div>
+            <div class="footer">
+                <p>Money Flow - Your payment tracking assistant</p>
+            </div>
+        </div>
+    </body>
+    </html>
+    """
+).bind(style=_NOTIFICATION_STYLE)
+
+_REMINDER_PAGE = _NOTIFICATION_PAGE.bind(
+    logo="💰",
+    heading="Payment Reminder",
+    extra_style="""
+.status { display: inline-block; padding: 8px 16px; border-radius: 20px;
+          color: white; font-weight: 600; margin-bottom: 20px; }
+.amount { font-size: 36px; font-weight: 700; color: #1f2937; margin: 20px 0; }
+.details { background: #f8fafc; padding: 20px; border-radius: 8px; margin: 20px 0; }
+.detail-row { display: flex; justify-content: space-between; padding: 8px 0;
+              border-bottom: 1px solid #e5e7eb; }
+.detail-row:last-child { border-bottom: none; }
+.label { color: #6b7280; }
+.value { font-weight: 600; color: #1f2937; }
+""",
+)
+
+_REMINDER_CONTENT = CompiledTemplate(
+    """
+    <div class="status" style="background: {{ color }};">{{ urgency_text }}</div>
+    <h2 style="margin: 0; color: #1f2937;">{{ name }}</h2>
+    <div class="amount">{{ amount }}</div>
+    <div class="details">
+        <div class="detail-row">
+            <span class="label">Payment Date</span>
+            <span class="value">{{ date }}</span>
+        </div>
+        <div class="detail-row">
+            <span class="label">Frequency</span>
+            <span class="value">{{ frequency }}</span>
+        </div>
+        <div class="detail-row">
+            <span class="label">Category</span>
+            <span class="value">{{ category }}</span>
+        </div>
+    </div>
+    """
+)
+
+_DIGEST_STYLE = """
+.stats { display: flex; justify-content: space-around; margin: 20px 0; }
+.stat { text-align: center; }
+.stat-value { font-size: 28px; font-weight: 700; color: #667eea; }
+.stat-label { color: #6b7280; font-size: 12px; }
+table { width: 100%; border-collapse: collapse; margin-top: 20px; }
+th { background: #f8fafc; padding: 12px; text-align: left; font-weight: 600; }
+"""
+
+_DIGEST_CONTENT = CompiledTemplate(
+    """
+    <div class="stats">
+        <div class="stat">
+            <div class="stat-value">{{ payment_count }}</div>
+            <div class="stat-label">Payments</div>
+        </div>
+        <div class="stat">
+            <div class="stat-value">{{ symbol }}{{ total }}</div>
+            <div class="stat-label">Total</div>
+        </div>
+        <div class="stat">
+            <div class="stat-value">{{ due_today }}</div>
+            <div class="stat-label">Due Today</div>
+        </div>
+    </div>
+    <table>
+        <thead>
+            <tr>
+                <th>Payment</th>
+                <th style="text-align: right;">Amount</th>
+                <th style="text-align: right;">Date</th>
+            </tr>
+        </thead>
+        <tbody>
+            {{ rows }}
+        </tbody>
+    </table>
+    """
+)
+
+_DIGEST_ROW = CompiledTemplate(
+    """
+    <tr>
+        <td style="padding: 12px; border-bottom: 1px solid #e5e7eb;">{{ name }}</td>
+        <td style="padding: 12px; border-bottom: 1px solid #e5e7eb; text-align: right;">{{ symbol }}{{ amount }}</td>
+        <td style="padding: 12px; border-bottom: 1px solid #e5e7eb; text-align: right;">{{ date }}</td>
+    </tr>
+    """
+)
+
+
+@lru_cache(maxsize=64)
+def _digest_template(period: DigestPeriod, symbol: str) -> CompiledTemplate:
+    """Digest page with the period and currency folded in (shared by all users)."""
+    page = _NOTIFICATION_PAGE.bind(
+        logo="📊", heading=f"{period.value} Payment Digest", extra_style=_DIGEST_STYLE
+    )
+    return page.embed("content", _DIGEST_CONTENT.bind(symbol=symbol))
+
+
+@lru_cache(maxsize=64)
+def _digest_row(symbol: str) -> CompiledTemplate:
+    """Digest payment row with the currency folded in."""
+    return _DIGEST_ROW.bind(symbol=symbol)
+
+
+def render_reminder_html(
+    subscription: Subscription,
+    amount: str,
+    urgency_text: str,
+    color: str,
+) -> str:
+    """Render the HTML body of a payment reminder email.
+
+    Args:
+        subscription: Subscription the reminder is about.
+        amount: Formatted amount string.
+        urgency_text: Status text (e.g., "Due tomorrow").
+        color: Status color hex code.
+
+    Returns:
+        HTML string for the email body.
+    """
+    date_str = ""
+    if subscription.next_payment_date:
+        date_str = subscription.next_payment_date.strftime("%B %d, %Y")
+
+    content = _REMINDER_CONTENT.render(
+        color=color,
+        urgency_text=urgency_text,
+        name=html.escape(subscription.name),
+        amount=amount,
+        date=date_str,
+        frequency=subscription.frequency.value.title(),
+        category=html.escape(subscription.category or "Uncategorized"),
+    )
+    return _REMINDER_PAGE.render(content=content)
+
+
+def render_reminder(subscription: Subscription, days_until: int) -> RenderedEmail:
+    """Render a payment reminder email.
+
+    Args:
+        subscription: Subscription the reminder is about.
+        days_until: Days until the payment is due (negative = overdue).
+
+    Returns:
+        Rendered email.
+    """
+    # Determine urgency and styling
+    if days_until < 0:
+        urgency_text = f"{abs(days_until)} days overdue"
+        color = "#dc2626"  # Red
+    elif days_until == 0:
+        urgency_text = "Due today"
+        color = "#f59e0b"  # Orange
+    elif days_until == 1:
+        urgency_text = "Due tomorrow"
+        color = "#f59e0b"  # Orange
+    else:
+        urgency_text = f"Due in {days_until} days"
+        color = "#3b82f6"  # Blue
+
+    amount = f"{currency_symbol(subscription.currency)}{subscription.amount:.2f}"
+
+    if days_until < 0:
+        subject = f"⚠️ Overdue: {subscription.name} payment is {abs(days_until)} days late"
+    elif days_until == 0:
+        subject = f"💳 Payment Due Today: {subscription.name} - {amount}"
+    else:
+        subject = f"📅 Upcoming Payment: {subscription.name} - {amount} ({urgency_text})"
+
+    text_body = (
+        f"Payment Reminder: {subscription.name}\n\n"
+        f"Amount: {amount}\n"
+        f"Status: {urgency_text}\n"
+        f"Frequency: {subscription.frequency.value.title()}\n\n"
+        f"--\nMoney Flow - Your payment tracking assistant"
+    )
+
+    return RenderedEmail(
+        subject=subject,
+        html_body=render_reminder_html(subscription, amount, urgency_text, color),
+        text_body=text_body,
+    )
+
+
+def render_digest_html(
+    subscriptions: list[Subscription],
+    due_today: int,
+    symbol: str,
+    total: Decimal,
+    period: DigestPeriod,
+) -> str:
+    """Render the HTML body of a digest email.
+
+    Args:
+        subscriptions: All subscriptions in the digest.
+        due_today: Number of payments due today.
+        symbol: Currency symbol for display.
+        total: Total amount.
+        period: Digest period.
+
+    Returns:
+        HTML string for the email body.
+    """
+    row = _digest_row(symbol)
+    rows = "".join(
+        row.render(
+            name=html.escape(sub.name),
+            amount=f"{sub.amount:.2f}",
+            date=sub.next_payment_date.strftime("%b %d") if sub.next_payment_date else "",
+        )
+        for sub in subscriptions[:DIGEST_MAX_ROWS]
+    )
+    return _digest_template(period, symbol).render(
+        payment_count=len(subscriptions),
+        total=f"{total:.2f}",
+        due_today=due_today,
+        rows=rows,
+    )
+
+
+def render_digests(
+    digests: Iterable[DigestContent],
+    period: DigestPeriod,
+    today: date | None = None,
+) -> list[RenderedEmail]:
+    """Render a batch of digest emails in one call.
+
+    Args:
+        digests: One entry per user; each must have at least one subscription.
+        period: Digest period.
+        today: Reference date for "due today" (defaults to date.today()).
+
+    Returns:
+        Rendered emails, in the order of ``digests``.
+    """
+    today = today or date.today()
+    rendered = []
+
+    for digest in digests:
+        subscriptions = digest.subscriptions
+        symbol = currency_symbol(digest.currency)
+        total = sum((s.amount for s in subscriptions), Decimal(0))
+        due_today = sum(1 for s in subscriptions if s.next_payment_date == today)
+
+        if period == DigestPeriod.DAILY:
+            later = sum(
+                1 for s in subscriptions if s.next_payment_date and s.next_payment_date > today
+            )
+            subject = (
+                f"📊 Daily Digest: {len(subscriptions)} payments this week ({symbol}{total:.2f})"
+            )
+            text_body = (
+                f"Daily Payment Digest\n\n"
+                f"Total: {symbol}{total:.2f}\n"
+                f"Payments today: {due_today}\n"
+                f"Payments this week: {later}\n\n"
+                f"--\nMoney Flow"
+            )
+        else:
+            subject = f"📅 Weekly Summary: {len(subscriptions)} payments ({symbol}{total:.2f})"
+            text_body = (
+                f"Weekly Payment Summary\n\n"
+                f"Total: {symbol}{total:.2f}\n"
+                f"Payments: {len(subscriptions)}\n\n"
+                f"--\nMoney Flow"
+            )
+
+        rendered.append(
+            RenderedEmail(
+                subject=subject,
+                html_body=render_digest_html(subscriptions, due_today, symbol, total, period),
+                text_body=text_body,
+            )
+        )
+
+    return rendered
+
+
+# =============================================================================
+# Scheduled report emails
+# =============================================================================
+
+_REPORT_PAGE = CompiledTemplate(
+    """
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <meta charset="utf-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    </head>
+    <body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Helvetica, Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px; color: #374151;">
+        <h1 style="color: #1f2937;">{{ title }}</h1>
+        <p style="color: #6b7280;">{{ subtitle }}</p>
+
+        {{ content }}
+
+        <hr style="border: none; border-top: 1px solid #e5e7eb; margin: 24px 0;">
+        <p style="color: #9ca3af; font-size: 14px;">
+            {{ attachment_note }}<br>
+            <em>Money Flow - Your Personal Finance Tracker</em>
+        </p>
+    </body>
+    </html>
+    """
+)
+
+_DAILY_REPORT_PAGE = _REPORT_PAGE.bind(
+    title="📊 Daily Payment Report",
+    attachment_note="See the attached PDF for your full subscription overview.",
+)
+_WEEKLY_REPORT_PAGE = _REPORT_PAGE.bind(
+    title="📅 Weekly Report",
+    attachment_note="See the attached PDF for detailed charts and breakdowns.",
+)
+_MONTHLY_REPORT_PAGE = _REPORT_PAGE.bind(
+    title="📊 Monthly Report",
+    attachment_note="See the attached PDF for the full report with charts.",
+)
+
+_TH = "padding: 8px; border-bottom: 2px solid #e5e7eb;"
+_TD = "padding: 8px; border-bottom: 1px solid #e5e7eb;"
+
+_REPORT_SECTION = CompiledTemplate(
+    """
+    <h3 style="color: #1f2937; margin-top: 24px;">{{ emoji }} {{ title }}</h3>
+    <table style="width: 100%; border-collapse: collapse; margin-bottom: 16px;">
+        <thead>
+            <tr style="background-color: #f3f4f6;">
+                <th style="{{ th }} text-align: left;">Name</th>
+                <th style="{{ th }} text-align: right;">Amount</th>
+            </tr>
+        </thead>
+        <tbody>
+            {{ rows }}
+        </tbody>
+        <tfoot>
+            <tr style="background-color: #f9fafb; font-weight: bold;">
+                <td style="padding: 8px;">Total</td>
+                <td style="padding: 8px; text-align: right;">{{ symbol }}{{ total }}</td>
+            </tr>
+        </tfoot>
+    </table>
+    """
+).bind(th=_TH)
+
+_REPORT_SECTION_ROW = CompiledTemplate(
+    """
+    <tr>
+        <td style="{{ td }}">{{ name }}</td>
+        <td style="{{ td }} text-align: right;">{{ symbol }}{{ amount }}</td>
+    </tr>
+    """
+).bind(td=_TD)
+
+_REPORT_NONE = CompiledTemplate('<p style="color: #6b7280;">{{ text }}</p>')
+
+_WEEKLY_REPORT_CONTENT = CompiledTemplate(
+    """
+    <div style="background-color: #f3f4f6; padding: 16px; border-radius: 8px; margin: 16px 0;">
+        <h2 style="margin: 0; color: #1f2937;">{{ symbol }}{{ total }}</h2>
+        <p style="margin: 4px 0 0 0; color: #6b7280;">Total this {{ period }} ({{ count }} payment(s))</p>
+    </div>
+
+    <h3 style="color: #1f2937;">{{ table_title }}</h3>
+    <table style="width: 100%; border-collapse: collapse;">
+        <thead>
+            <tr style="background-color: #f3f4f6;">
+                {{ header }}
+            </tr>
+        </thead>
+        <tbody>
+            {{ rows }}
+        </tbody>
+    </table>
+    """
+)
+
+_WEEKLY_REPORT_HEADER = (
+    f'<th style="{_TH} text-align: left;">Day</th>'
+    f'<th style="{_TH} text-align: left;">Payments</th>'
+    f'<th style="{_TH} text-align: right;">Amount</th>'
+)
+_MONTHLY_REPORT_HEADER = (
+    f'<th style="{_TH} text-align: left;">Category</th>'
+    f'<th style="{_TH} text-align: right;">Amount</th>'
+    f'<th style="{_TH} text-align: right;">%</th>'
+)
+
+_THREE_COLUMN_ROW = CompiledTemplate(
+    """
+    <tr>
+        <td style="{{ td }}">{{ first }}</td>
+        <td style="{{ td }}{{ second_align }}">{{ second }}</td>
+        <td style="{{ td }} text-align: right;">{{ third }}</td>
+    </tr>
+    """
+).bind(td=_TD)
+_WEEKLY_REPORT_ROW = _THREE_COLUMN_ROW.bind(second_align="")
+_MONTHLY_REPORT_ROW = _THREE_COLUMN_ROW.bind(second_align=" text-align: right;")
+
+_WEEKLY_REPORT_EMPTY = (
+    '<tr><td colspan="3" style="padding: 16px; text-align: center; color: #6b7280;">'
+    "No payments scheduled this week</td></tr>"
+)
+
+
+def _report_section(payments: list[Subscription], title: str, emoji: str, symbol: str) -> str:
+    """Render a titled payment table with a total row (empty if no payments)."""
+    if not payments:
+        return ""
+    total = sum(float(p.amount) for p in payments)
+    rows = "".join(
+        _REPORT_SECTION_ROW.render(
+            name=html.escape(p.name), symbol=symbol, amount=f"{float(p.amount):.2f}"
+        )
+        for p in payments
+    )
+    return _REPORT_SECTION.render(
+        emoji=emoji, title=title, rows=rows, symbol=symbol, total=f"{total:.2f}"
+    )
+
+
+def render_daily_report_html(
+    today_payments: list[Subscription],
+    tomorrow_payments: list[Subscription],
+    currency: str,
+    today: date | None = None,
+) -> str:
+    """Render the HTML body of a daily report email.
+
+    Args:
+        today_payments: Payments due today.
+        tomorrow_payments: Payments due tomorrow.
+        currency: Currency code.
+        today: Report date (defaults to date.today()).
+
+    Returns:
+        HTML email body.
+    """
+    symbol = currency_symbol(currency)
+    today = today or date.today()
+
+    today_section = _report_section(today_payments, "Due Today", "💳", symbol)
+    tomorrow_section = _report_section(tomorrow_payments, "Due Tomorrow", "📅", symbol)
+
+    content = "\n".join(
+        [
+            today_section or _REPORT_NONE.render(text="No payments due today."),
+            tomorrow_section or _REPORT_NONE.render(text="No payments due tomorrow."),
+        ]
+    )
+    return _DAILY_REPORT_PAGE.render(subtitle=today.strftime("%A, %d %B %Y"), content=content)
+
+
+def render_weekly_report_html(
+    week_payments: list[Subscription],
+    total: float,
+    week_start: date,
+    week_end: date,
+    currency: str,
+) -> str:
+    """Render the HTML body of a weekly report email.
+
+    Args:
+        week_payments: Payments due this week.
+        total: Total amount due.
+        week_start: Start of the week.
+        week_end: End of the week.
+        currency: Currency code.
+
+    Returns:
+        HTML email body.
+    """
+    symbol = currency_symbol(currency)
+
+    # Group by day
+    day_groups: dict[date, list[Subscription]] = {}
+    for p in week_payments:
+        if p.next_payment_date:
+            day_groups.setdefault(p.next_payment_date, []).append(p)
+
+    rows = "".join(
+        _WEEKLY_REPORT_ROW.render(
+            first=day.strftime("%A, %d %b"),
+            second=html.escape(", ".join(p.name for p in day_groups[day])),
+            third=f"{symbol}{sum(float(p.amount) for p in day_groups[day]):.2f}",
+        )
+        for day in sorted(day_groups)
+    )
+
+    content = _WEEKLY_REPORT_CONTENT.render(
+        symbol=symbol,
+        total=f"{total:.2f}",
+        period="week",
+        count=len(week_payments),
+        table_title="Payment Schedule",
+        header=_WEEKLY_REPORT_HEADER,
+        rows=rows or _WEEKLY_REPORT_EMPTY,
+    )
+    return _WEEKLY_REPORT_PAGE.render(
+        subtitle=f"{week_start.strftime('%d %B')} - {week_end.strftime('%d %B %Y')}",
+        content=content,
+    )
+
+
+def render_monthly_report_html(
+    month_payments: list[Subscription],
+    category_totals: dict[str, float],
+    total: float,
+    month_name: str,
+    currency: str,
+) -> str:
+    """Render the HTML body of a monthly report email.
+
+    Args:
+        month_payments: Payments due this month.
+        category_totals: Total by category.
+        total: Total amount due.
+        month_name: Name of the month.
+        currency: Currency code.
+
+    Returns:
+        HTML email body.
+    """
+    symbol = currency_symbol(currency)
+
+    rows = "".join(
+        _MONTHLY_REPORT_ROW.render(
+            first=html.escape(category),
+            second=f"{symbol}{cat_total:.2f}",
+            third=f"{(cat_total / total * 100) if total > 0 else 0:.1f}%",
+        )
+        for category, cat_total in category_totals.items()
+    )
+
+    content = _WEEKLY_REPORT_CONTENT.render(
+        symbol=symbol,
+        total=f"{total:.2f}",
+        period="month",
+        count=len(month_payments),
+        table_title="Spending by Category",
+        header=_MONTHLY_REPORT_HEADER,
+        rows=rows,
+    )
+    return _MONTHLY_REPORT_PAGE.render(subtitle=month_name, content=content)
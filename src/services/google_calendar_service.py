@@ -10,20 +10,32 @@ References:
 - https://googleapis.github.io/google-api-python-client/docs/oauth.html
 """
 
+import asyncio
+import enum
+import hashlib
+import json
 import logging
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any
 from uuid import UUID
 
+import httplib2
+from google.auth.exceptions import GoogleAuthError
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from src.core.config import settings
-from src.models.google_calendar import GoogleCalendarConnection, GoogleCalendarSyncStatus
+from src.models.google_calendar import (
+    GoogleCalendarConnection,
+    GoogleCalendarEventSync,
+    GoogleCalendarSyncStatus,
+)
 from src.models.subscription import Subscription
 
 logger = logging.getLogger(__name__)
@@ -37,6 +49,69 @@ SCOPES = [
 # Money Flow event prefix for identification
 EVENT_PREFIX = "[Money Flow]"
 
+# Requests per Google batch HTTP request (the Calendar API allows 50)
+SYNC_BATCH_SIZE = 50
+
+# HTTP statuses meaning the event no longer exists in the calendar
+EVENT_GONE_STATUSES = {404, 410}
+
+# Errors of a whole batch request: rejected by Google (401, 5xx),
+# credentials refresh or transport failures
+BATCH_ERRORS = (HttpError, GoogleAuthError, httplib2.HttpLib2Error, OSError)
+
+
+class SyncAction(str, enum.Enum):
+    """Change applied to a calendar event during sync.
+
+    Attributes:
+        CREATE: Insert a new event.
+        UPDATE: Replace the body of a synced event.
+        DELETE: Remove a synced event.
+    """
+
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+@dataclass
+class SyncOperation:
+    """One event change planned by a sync.
+
+    Attributes:
+        action: Change to apply.
+        subscription_id: ID of the subscription the event belongs to.
+        calendar_id: Google Calendar ID the request goes to.
+        event_id: Google event ID (update and delete).
+        body: Event body (create and update).
+        content_hash: Hash of the body (create and update).
+        state: Sync state row the result is recorded in. A delete with
+            a state also removes the row; a create without one adds a row.
+        then: Operation applied only once this one succeeded (the create
+            of an event moved to another calendar).
+    """
+
+    action: SyncAction
+    subscription_id: str
+    calendar_id: str
+    event_id: str | None = None
+    body: dict | None = None
+    content_hash: str | None = None
+    state: GoogleCalendarEventSync | None = None
+    then: "SyncOperation | None" = None
+
+
+def event_content_hash(body: dict) -> str:
+    """Hash an event body to detect changes since the last sync.
+
+    Args:
+        body: Google Calendar event body.
+
+    Returns:
+        SHA-256 hex digest of the canonical JSON of the body.
+    """
+    return hashlib.sha256(json.dumps(body, sort_keys=True, default=str).encode()).hexdigest()
+
 
 class GoogleCalendarService:
     """Service for Google Calendar OAuth and event synchronization.
@@ -235,7 +310,7 @@ class GoogleCalendarService:
             try:
                 from google.auth.transport.requests import Request
 
-                credentials.refresh(Request())
+                await asyncio.to_thread(credentials.refresh, Request())
 
                 # Update stored tokens
                 connection.access_token = credentials.token
@@ -275,8 +350,8 @@ class GoogleCalendarService:
             return []
 
         try:
-            service = self._get_calendar_service(credentials)
-            calendar_list = service.calendarList().list().execute()
+            service = await asyncio.to_thread(self._get_calendar_service, credentials)
+            calendar_list = await asyncio.to_thread(service.calendarList().list().execute)
             return [
                 {
                     "id": cal["id"],
@@ -310,14 +385,14 @@ class GoogleCalendarService:
         event = self._build_event_body(subscription)
 
         try:
-            service = self._get_calendar_service(credentials)
-            created_event = (
+            service = await asyncio.to_thread(self._get_calendar_service, credentials)
+            created_event = await asyncio.to_thread(
                 service.events()
                 .insert(
                     calendarId=calendar_id,
                     body=event,
                 )
-                .execute()
+                .execute
             )
 
             logger.info(f"Created Google Calendar event: {created_event.get('id')}")
@@ -354,7 +429,7 @@ class GoogleCalendarService:
             freq_str = subscription.frequency.value
 
         description_parts = [
-            f"Payment: {subscription.service_name}",
+            f"Payment: {subscription.name}",
             f"Amount: {amount_str}",
             f"Frequency: {freq_str.replace('_', ' ').title()}",
         ]
@@ -374,7 +449,7 @@ class GoogleCalendarService:
         payment_date = subscription.next_payment_date
 
         event = {
-            "summary": f"{EVENT_PREFIX} {subscription.service_name} - {amount_str}",
+            "summary": f"{EVENT_PREFIX} {subscription.name} - {amount_str}",
             "description": "\n".join(description_parts),
             "start": {
                 "date": payment_date.isoformat(),
@@ -426,52 +501,287 @@ class GoogleCalendarService:
 
         return rules.get(freq_lower)
 
+    def _plan_sync(
+        self,
+        subscriptions: list[Subscription],
+        states: dict[str, GoogleCalendarEventSync],
+        calendar_id: str,
+    ) -> tuple[list[SyncOperation], int]:
+        """Diff subscriptions against the last synced state.
+
+        Args:
+            subscriptions: Subscriptions that should have an event.
+            states: Sync state rows of the user by subscription ID.
+            calendar_id: Calendar the events should be in.
+
+        Returns:
+            Tuple of (operations, number of unchanged events).
+        """
+        operations: list[SyncOperation] = []
+        unchanged = 0
+        wanted: set[str] = set()
+
+        for sub in subscriptions:
+            sub_id = str(sub.id)
+            wanted.add(sub_id)
+            body = self._build_event_body(sub)
+            content_hash = event_content_hash(body)
+            state = states.get(sub_id)
+
+            if state is None:
+                operations.append(
+                    SyncOperation(
+                        SyncAction.CREATE, sub_id, calendar_id, body=body, content_hash=content_hash
+                    )
+                )
+            elif state.calendar_id != calendar_id:
+                # Moved to another calendar: remove the old event, then create
+                # the new one in the same row. If the delete fails the row keeps
+                # pointing at the old event, so the next sync retries the move.
+                operations.append(
+                    SyncOperation(
+                        SyncAction.DELETE,
+                        sub_id,
+                        state.calendar_id,
+                        event_id=state.event_id,
+                        then=SyncOperation(
+                            SyncAction.CREATE,
+                            sub_id,
+                            calendar_id,
+                            body=body,
+                            content_hash=content_hash,
+                            state=state,
+                        ),
+                    )
+                )
+            elif state.content_hash != content_hash:
+                operations.append(
+                    SyncOperation(
+                        SyncAction.UPDATE,
+                        sub_id,
+                        calendar_id,
+                        event_id=state.event_id,
+                        body=body,
+                        content_hash=content_hash,
+                        state=state,
+                    )
+                )
+            else:
+                unchanged += 1
+
+        # Events of deleted, inactive or unscheduled subscriptions
+        for sub_id, state in states.items():
+            if sub_id not in wanted:
+                operations.append(
+                    SyncOperation(
+                        SyncAction.DELETE,
+                        sub_id,
+                        state.calendar_id,
+                        event_id=state.event_id,
+                        state=state,
+                    )
+                )
+
+        return operations, unchanged
+
+    def _build_request(self, service: Any, operation: SyncOperation) -> Any:
+        """Build the Calendar API request for a sync operation."""
+        events = service.events()
+        if operation.action == SyncAction.CREATE:
+            return events.insert(calendarId=operation.calendar_id, body=operation.body)
+        if operation.action == SyncAction.UPDATE:
+            return events.update(
+                calendarId=operation.calendar_id,
+                eventId=operation.event_id,
+                body=operation.body,
+            )
+        return events.delete(calendarId=operation.calendar_id, eventId=operation.event_id)
+
+    async def _execute_batch(
+        self,
+        service: Any,
+        operations: list[SyncOperation],
+    ) -> list[tuple[dict | None, HttpError | None]]:
+        """Send operations as one batch HTTP request.
+
+        Args:
+            service: Google Calendar API service.
+            operations: At most SYNC_BATCH_SIZE operations.
+
+        Returns:
+            (response, error) per operation, in order.
+        """
+        results: list[tuple[dict | None, HttpError | None]] = [(None, None)] * len(operations)
+
+        def on_response(request_id: str, response: dict | None, exception: Exception) -> None:
+            results[int(request_id)] = (response, exception)
+
+        batch = service.new_batch_http_request(callback=on_response)
+        for i, operation in enumerate(operations):
+            batch.add(self._build_request(service, operation), request_id=str(i))
+        # The client is synchronous: keep the event loop free while it waits
+        await asyncio.to_thread(batch.execute)
+        return results
+
+    async def _record_result(self, operation: SyncOperation, response: dict | None) -> None:
+        """Record a successful operation in the sync state."""
+        now = datetime.utcnow()
+        if operation.action == SyncAction.DELETE:
+            if operation.state is not None:
+                await self.db.delete(operation.state)
+            return
+
+        state = operation.state
+        if state is None:
+            self.db.add(
+                GoogleCalendarEventSync(
+                    subscription_id=operation.subscription_id,
+                    user_id=str(self.user_id),
+                    calendar_id=operation.calendar_id,
+                    event_id=response["id"],
+                    content_hash=operation.content_hash,
+                    synced_at=now,
+                )
+            )
+            return
+
+        state.calendar_id = operation.calendar_id
+        if operation.action == SyncAction.CREATE:
+            state.event_id = response["id"]
+        state.content_hash = operation.content_hash
+        state.synced_at = now
+
+    async def _apply_operations(
+        self,
+        service: Any,
+        operations: list[SyncOperation],
+        connection: GoogleCalendarConnection,
+    ) -> dict[str, int]:
+        """Apply planned operations in batches and record the results.
+
+        Each batch is committed as soon as Google answered, so the sync
+        state never lags behind the calendar. Updates and deletes of
+        events removed from the calendar by the user are handled as
+        creates and completed deletes respectively. Follow-up operations
+        (``then``) are sent in a later batch, only after their operation
+        succeeded. If a whole batch request fails, it and the operations
+        not yet sent are counted as failed and the error is recorded on
+        the connection; the sync state keeps them for the next sync.
+
+        Args:
+            service: Google Calendar API service.
+            operations: Planned operations.
+            connection: The user's connection, for recording errors.
+
+        Returns:
+            Counts of created, updated, deleted and failed events.
+        """
+        counts = {"created": 0, "updated": 0, "deleted": 0, "failed": 0}
+        counters = {
+            SyncAction.CREATE: "created",
+            SyncAction.UPDATE: "updated",
+            SyncAction.DELETE: "deleted",
+        }
+
+        pending = list(operations)
+        while pending:
+            batch, pending = pending[:SYNC_BATCH_SIZE], pending[SYNC_BATCH_SIZE:]
+            try:
+                results = await self._execute_batch(service, batch)
+            except BATCH_ERRORS as e:
+                logger.error(f"Google Calendar batch request failed for user {self.user_id}: {e}")
+                connection.last_error = str(e)
+                counts["failed"] += len(batch) + len(pending)
+                break
+
+            for operation, (response, error) in zip(batch, results, strict=True):
+                gone = (
+                    isinstance(error, HttpError)
+                    and error.resp is not None
+                    and error.resp.status in EVENT_GONE_STATUSES
+                )
+                if error is None or (gone and operation.action == SyncAction.DELETE):
+                    await self._record_result(operation, response)
+                    counts[counters[operation.action]] += 1
+                    if operation.then is not None:
+                        pending.append(operation.then)
+                elif gone and operation.action == SyncAction.UPDATE:
+                    # Deleted in the calendar: create it again
+                    operation.action = SyncAction.CREATE
+                    pending.append(operation)
+                else:
+                    logger.error(
+                        f"Failed to {operation.action.value} event for subscription "
+                        f"{operation.subscription_id}: {error}"
+                    )
+                    counts["failed"] += 1
+
+            await self.db.commit()
+
+        return counts
+
     async def sync_subscriptions_to_calendar(
         self,
         calendar_id: str = "primary",
     ) -> dict:
         """Sync all active subscriptions to Google Calendar.
 
-        Creates or updates calendar events for all active subscriptions.
+        Sync is incremental: event bodies are compared with the content
+        hashes recorded at the last sync, and only new, changed and
+        removed subscriptions produce requests. These are sent as Google
+        batch HTTP requests, with the blocking client calls run in a
+        worker thread.
 
         Args:
             calendar_id: Google Calendar ID to sync to.
 
         Returns:
-            dict: Sync result with counts of created/updated/failed events.
+            dict: Sync result with counts of created/updated/deleted/
+                unchanged/failed events.
         """
         connection = await self.get_connection()
         if not connection or connection.sync_status != GoogleCalendarSyncStatus.CONNECTED:
             return {"error": "Not connected to Google Calendar"}
 
+        credentials = await self._get_credentials()
+        if not credentials:
+            return {"error": "Google Calendar authorization expired"}
+
         # Get active subscriptions
         result = await self.db.execute(
             select(Subscription)
+            .options(raiseload("*"))
             .where(Subscription.user_id == str(self.user_id))
             .where(Subscription.is_active == True)  # noqa: E712
             .where(Subscription.next_payment_date != None)  # noqa: E711
         )
-        subscriptions = result.scalars().all()
+        subscriptions = list(result.scalars().all())
 
-        created = 0
-        failed = 0
+        states_result = await self.db.execute(
+            select(GoogleCalendarEventSync).where(
+                GoogleCalendarEventSync.user_id == str(self.user_id)
+            )
+        )
+        states = {state.subscription_id: state for state in states_result.scalars().all()}
 
-        for sub in subscriptions:
-            event = await self.create_event(sub, calendar_id)
-            if event:
-                created += 1
-            else:
-                failed += 1
+        operations, unchanged = self._plan_sync(subscriptions, states, calendar_id)
+        counts = {"created": 0, "updated": 0, "deleted": 0, "failed": 0}
+        if operations:
+            service = await asyncio.to_thread(self._get_calendar_service, credentials)
+            counts = await self._apply_operations(service, operations, connection)
 
         # Update last sync time
         connection.last_sync_at = datetime.utcnow()
         await self.db.commit()
 
-        logger.info(f"Synced {created} events to Google Calendar for user {self.user_id}")
+        logger.info(
+            f"Synced Google Calendar for user {self.user_id}: {counts['created']} created, "
+            f"{counts['updated']} updated, {counts['deleted']} deleted, {unchanged} unchanged"
+        )
 
         return {
-            "created": created,
-            "failed": failed,
+            **counts,
+            "unchanged": unchanged,
             "total": len(subscriptions),
         }
 
@@ -0,0 +1,414 @@
+"""Per-user cache of serialized iCal feeds.
+
+Calendar apps poll feed URLs every few minutes, while a user's payments
+change rarely. Serialized feeds are therefore cached in Redis and served
+with a strong ETag and Last-Modified, so polls that find nothing new
+cost one or two Redis reads, or end with 304 Not Modified, without
+touching the database.
+
+Invalidation uses a per-user subscription data version: a random token
+stored under ``ical:version:{user_id}`` that is replaced whenever a
+transaction that changed the user's subscriptions commits. Feeds are
+cached under the token, the feed date and the feed parameters, so a
+new version (or a new day, which moves the days-ahead window) simply
+misses and old entries expire on their own.
+
+Change tracking:
+    - ORM inserts, updates and deletes of Subscription rows are collected
+      at flush time by session event listeners (see
+      track_subscription_changes()).
+    - Code writing subscriptions with Core statements calls
+      mark_subscriptions_changed() on its session.
+    - The versions are replaced once the transaction commits; rolled
+      back changes leave them untouched.
+
+Example:
+    >>> feed_cache = get_ical_feed_cache()
+    >>> version = await feed_cache.get_version(user_id)
+    >>> feed = await feed_cache.get(user_id, version, params)
+    >>> if feed is None:
+    ...     feed = await feed_cache.put(user_id, version, params, await service.generate_feed())
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import secrets
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time
+from email.utils import parsedate_to_datetime
+from itertools import chain
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+from src.core.config import settings
+from src.core.metrics import record_cache_operation
+from src.models.subscription import Subscription
+from src.services.cache_service import CacheService, get_cache_service
+
+logger = logging.getLogger(__name__)
+
+# Session.info key collecting the users whose subscriptions changed
+CHANGED_USERS_INFO_KEY = "ical_changed_users"
+
+# Bump when the feed layout changes so cached feeds are not served
+FEED_FORMAT_VERSION = 1
+
+# Version bumps scheduled from commit hooks (kept referenced until done)
+_pending_bumps: set[asyncio.Task[None]] = set()
+
+
+@dataclass(frozen=True)
+class FeedVersion:
+    """Subscription data version of a user.
+
+    Attributes:
+        token: Random token replaced on every change.
+        modified: When the user's subscriptions last changed (UTC), or
+            when the version was first created.
+    """
+
+    token: str
+    modified: datetime
+
+    @classmethod
+    def new(cls) -> "FeedVersion":
+        """Create a version for data changed now."""
+        return cls(token=secrets.token_hex(8), modified=datetime.now(UTC).replace(microsecond=0))
+
+    def to_dict(self) -> dict[str, str]:
+        """Serialize for the cache."""
+        return {"token": self.token, "modified": self.modified.isoformat()}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, str]) -> "FeedVersion":
+        """Deserialize from the cache."""
+        return cls(token=data["token"], modified=datetime.fromisoformat(data["modified"]))
+
+
+@dataclass(frozen=True)
+class CachedFeed:
+    """A serialized feed with its validators.
+
+    Attributes:
+        body: iCal file content.
+        etag: Strong entity tag (quoted digest of the body).
+        last_modified: Last-Modified time of the feed (UTC, whole seconds).
+    """
+
+    body: bytes
+    etag: str
+    last_modified: datetime
+
+    @classmethod
+    def build(cls, body: bytes, version: FeedVersion, today: date) -> "CachedFeed":
+        """Build a feed with validators from its content.
+
+        Args:
+            body: iCal file content.
+            version: Data version the feed was generated from.
+            today: Feed date; the feed also changes when the date does.
+
+        Returns:
+            CachedFeed whose Last-Modified is the later of the data change
+            and the start of the feed date.
+        """
+        day_start = datetime.combine(today, time.min, tzinfo=UTC)
+        return cls(
+            body=body,
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            last_modified=max(version.modified, day_start),
+        )
+
+    def is_current(self, if_none_match: str | None, if_modified_since: str | None) -> bool:
+        """Evaluate the conditional headers of a poll against this feed.
+
+        If-None-Match takes precedence over If-Modified-Since (RFC 9110).
+
+        Args:
+            if_none_match: If-None-Match request header.
+            if_modified_since: If-Modified-Since request header.
+
+        Returns:
+            True if the client's copy is current (304 Not Modified).
+        """
+        if if_none_match is not None:
+            if if_none_match.strip() == "*":
+                return True
+            # Weak comparison: W/ prefixes are ignored
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            return self.etag in tags
+
+        if not if_modified_since:
+            return False
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=UTC)
+        return self.last_modified <= since
+
+    def to_dict(self) -> dict[str, str]:
+        """Serialize for the cache (iCal content is UTF-8 text)."""
+        return {
+            "body": self.body.decode(),
+            "etag": self.etag,
+            "last_modified": self.last_modified.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, str]) -> "CachedFeed":
+        """Deserialize from the cache."""
+        return cls(
+            body=data["body"].encode(),
+            etag=data["etag"],
+            last_modified=datetime.fromisoformat(data["last_modified"]),
+        )
+
+
+def _version_key(user_id: str) -> str:
+    """Cache key of a user's subscription data version."""
+    return f"ical:version:{user_id}"
+
+
+def _feed_key(user_id: str, version: FeedVersion, params: dict[str, Any], today: date) -> str:
+    """Cache key of a feed for a data version, parameters and date."""
+    payload = {
+        "format": FEED_FORMAT_VERSION,
+        "version": version.token,
+        "date": today.isoformat(),
+        "params": params,
+    }
+    digest = hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode())
+    return f"ical:feed:{user_id}:{digest.hexdigest()[:32]}"
+
+
+class ICalFeedCache:
+    """Redis cache of serialized iCal feeds keyed by data version.
+
+    Degrades to no caching when Redis is unavailable: every poll gets a
+    fresh version and rebuilds the feed.
+
+    Attributes:
+        feed_ttl: Seconds a serialized feed is kept.
+        version_ttl: Seconds a data version is kept.
+    """
+
+    def __init__(
+        self,
+        cache: CacheService | None = None,
+        feed_ttl: int | None = None,
+        version_ttl: int | None = None,
+    ) -> None:
+        """Initialize the feed cache.
+
+        Args:
+            cache: Cache service (default: shared connected instance).
+            feed_ttl: Feed TTL in seconds (default from settings).
+            version_ttl: Version TTL in seconds (default from settings).
+        """
+        self._cache = cache
+        self.feed_ttl = feed_ttl or settings.ical_feed_cache_ttl
+        self.version_ttl = version_ttl or settings.ical_version_ttl
+
+    async def _get_cache(self) -> CacheService:
+        """Get the cache service, connecting on first use."""
+        if self._cache is None:
+            self._cache = await get_cache_service()
+        return self._cache
+
+    async def get_version(self, user_id: str) -> FeedVersion:
+        """Get a user's subscription data version, creating it if missing.
+
+        A missing version (never set or expired) is replaced by a new
+        token, so feeds cached under an older one are never served.
+
+        Args:
+            user_id: User ID.
+
+        Returns:
+            Current data version of the user.
+        """
+        cache = await self._get_cache()
+        key = _version_key(str(user_id))
+        data = await cache.get(key)
+        if data is not None:
+            return FeedVersion.from_dict(data)
+
+        version = FeedVersion.new()
+        if not await cache.add(key, version.to_dict(), ttl=self.version_ttl):
+            # Another request created it first (or the cache is unavailable)
+            data = await cache.get(key)
+            if data is not None:
+                return FeedVersion.from_dict(data)
+        return version
+
+    async def bump(self, user_ids: set[str]) -> None:
+        """Replace the data versions of users whose subscriptions changed.
+
+        Args:
+            user_ids: IDs of the users.
+        """
+        if not user_ids:
+            return
+        cache = await self._get_cache()
+        version = FeedVersion.new()
+        await cache.set_many(
+            {_version_key(user_id): version.to_dict() for user_id in user_ids},
+            ttl=self.version_ttl,
+        )
+        logger.debug(f"Bumped subscription data version of {len(user_ids)} users")
+
+    async def get(
+        self,
+        user_id: str,
+        version: FeedVersion,
+        params: dict[str, Any],
+        today: date | None = None,
+    ) -> CachedFeed | None:
+        """Get a cached feed.
+
+        Args:
+            user_id: User ID.
+            version: Current data version of the user.
+            params: Feed parameters (filters, days ahead).
+            today: Feed date (default: today).
+
+        Returns:
+            Cached feed, or None on a miss.
+        """
+        cache = await self._get_cache()
+        key = _feed_key(str(user_id), version, params, today or date.today())
+        data = await cache.get(key)
+        record_cache_operation("ical_feed_get", data is not None)
+        if data is None:
+            return None
+
+        try:
+            return CachedFeed.from_dict(data)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Discarding unreadable cached feed {key}: {e}")
+            await cache.delete(key)
+            return None
+
+    async def put(
+        self,
+        user_id: str,
+        version: FeedVersion,
+        params: dict[str, Any],
+        body: bytes,
+        today: date | None = None,
+    ) -> CachedFeed:
+        """Cache a generated feed.
+
+        Args:
+            user_id: User ID.
+            version: Data version read before the feed was generated.
+            params: Feed parameters (filters, days ahead).
+            body: iCal file content.
+            today: Feed date (default: today).
+
+        Returns:
+            The feed with its validators (also when caching is unavailable).
+        """
+        today = today or date.today()
+        feed = CachedFeed.build(body, version, today)
+        cache = await self._get_cache()
+        stored = await cache.set(
+            _feed_key(str(user_id), version, params, today), feed.to_dict(), ttl=self.feed_ttl
+        )
+        record_cache_operation("ical_feed_set", stored)
+        return feed
+
+
+# Singleton instance
+_ical_feed_cache: ICalFeedCache | None = None
+
+
+def get_ical_feed_cache() -> ICalFeedCache:
+    """Get the shared iCal feed cache.
+
+    Returns:
+        ICalFeedCache instance.
+    """
+    global _ical_feed_cache
+    if _ical_feed_cache is None:
+        _ical_feed_cache = ICalFeedCache()
+    return _ical_feed_cache
+
+
+def mark_subscriptions_changed(session: AsyncSession | Session, *user_ids: str | None) -> None:
+    """Record that a session changed subscriptions of some users.
+
+    Needed only for Core statements (bulk inserts, updates); ORM changes
+    are collected automatically. The users' data versions are replaced
+    when the session commits.
+
+    Args:
+        session: Session the changes were made in.
+        *user_ids: IDs of the users whose subscriptions changed.
+    """
+    changed = session.info.setdefault(CHANGED_USERS_INFO_KEY, set())
+    changed.update(str(user_id) for user_id in user_ids if user_id)
+
+
+def _collect_subscription_changes(session: Session, flush_context: Any) -> None:
+    """Collect the owners of flushed Subscription rows (after_flush hook)."""
+    user_ids = [
+        obj.user_id
+        for obj in chain(session.new, session.dirty, session.deleted)
+        if isinstance(obj, Subscription)
+    ]
+    if user_ids:
+        mark_subscriptions_changed(session, *user_ids)
+
+
+def _publish_subscription_changes(session: Session) -> None:
+    """Replace the data versions of the changed users (after_commit hook)."""
+    user_ids = session.info.pop(CHANGED_USERS_INFO_KEY, None)
+    if not user_ids:
+        return
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # Synchronous session outside the event loop (e.g. migrations)
+        logger.debug("No event loop to publish subscription changes")
+        return
+
+    task = loop.create_task(get_ical_feed_cache().bump(user_ids))
+    _pending_bumps.add(task)
+    task.add_done_callback(_pending_bumps.discard)
+
+
+def _discard_subscription_changes(session: Session, transaction: SessionTransaction) -> None:
+    """Forget unpublished changes when the outermost transaction ends.
+
+    After a commit they were already published; after a rollback they
+    never happened. Savepoints ending do not discard anything.
+    """
+    if transaction.parent is None:
+        session.info.pop(CHANGED_USERS_INFO_KEY, None)
+
+
+def track_subscription_changes() -> None:
+    """Register the session hooks bumping data versions on commit.
+
+    Called once at startup by each process writing subscriptions (API
+    and worker). Safe to call more than once.
+    """
+    if not event.contains(Session, "after_flush", _collect_subscription_changes):
+        event.listen(Session, "after_flush", _collect_subscription_changes)
+        event.listen(Session, "after_commit", _publish_subscription_changes)
+        event.listen(Session, "after_transaction_end", _discard_subscription_changes)
+
+
+async def wait_for_pending_bumps() -> None:
+    """Wait for version bumps scheduled by commits to finish."""
+    if _pending_bumps:
+        await asyncio.gather(*_pending_bumps, return_exceptions=True)
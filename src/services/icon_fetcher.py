@@ -0,0 +1,273 @@
+"""Process-wide icon fetching state shared by IconService instances.
+
+IconService is created per request, so on its own every request opened
+its own HTTP client, went to the database for every icon and probed the
+external sources again for names that were being fetched by another
+request at the same moment. The IconFetcher holds what those requests
+share:
+
+- Pooled client: one HTTP client for all source probes, with a semaphore
+  bounding the requests in flight (``icon_fetch_concurrency``).
+- Memory cache: an LRU of resolved icons in front of the ``icon_cache``
+  table, kept for ``icon_memory_cache_ttl`` seconds and never past the
+  icon's own expiry.
+- Single-flight: concurrent fetches of the same normalized name share
+  one fetch.
+- Negative cache: names no source had an icon for are not fetched again
+  for ``icon_negative_cache_ttl`` seconds.
+
+The caches are per process; the TTLs bound how stale other workers can
+be after an icon changes.
+
+Example:
+    >>> fetcher = get_icon_fetcher()
+    >>> icon = fetcher.get("netflix")
+    >>> if icon is None:
+    ...     icon = await fetcher.single_flight(("netflix", ()), fetch)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.schemas.icon import IconResponse
+
+logger = logging.getLogger(__name__)
+
+# Single-flight key: normalized service name first, then anything else
+# that changes the result (such as the sources tried)
+FetchKey = tuple[str, ...]
+
+# Request timeout for icon source probes (seconds)
+ICON_FETCH_TIMEOUT = 10.0
+
+
+class IconFetcher:
+    """Pooled, deduplicating icon fetcher with an in-process cache.
+
+    Attributes:
+        cache_size: Maximum icons (and negative results) kept in memory.
+        cache_ttl: Seconds a resolved icon is served from memory.
+        negative_ttl: Seconds a name without an icon is not refetched.
+    """
+
+    def __init__(
+        self,
+        concurrency: int | None = None,
+        cache_size: int | None = None,
+        cache_ttl: float | None = None,
+        negative_ttl: float | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        session_factory: Callable[[], AsyncSession] | None = None,
+    ) -> None:
+        """Initialize the fetcher.
+
+        Args:
+            concurrency: Source requests in flight (defaults to settings).
+            cache_size: LRU capacity (defaults to settings).
+            cache_ttl: LRU entry lifetime in seconds (defaults to settings).
+            negative_ttl: Negative entry lifetime in seconds (defaults to
+                settings).
+            http_client: Optional shared HTTP client; the caller closes it.
+            session_factory: Session factory for storing fetched icons
+                (defaults to the application's).
+        """
+        self.cache_size = cache_size or settings.icon_memory_cache_size
+        self.cache_ttl = cache_ttl if cache_ttl is not None else settings.icon_memory_cache_ttl
+        self.negative_ttl = (
+            negative_ttl if negative_ttl is not None else settings.icon_negative_cache_ttl
+        )
+        self._semaphore = asyncio.Semaphore(concurrency or settings.icon_fetch_concurrency)
+        self._http_client = http_client
+        self._owns_client = http_client is None
+        self._session_factory = session_factory
+        self._icons: OrderedDict[tuple[str, str | None], tuple[float, IconResponse]] = OrderedDict()
+        self._missing: OrderedDict[FetchKey, float] = OrderedDict()
+        self._in_flight: dict[FetchKey, asyncio.Task[IconResponse | None]] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client, created on first use."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=ICON_FETCH_TIMEOUT,
+                follow_redirects=True,
+                headers={"User-Agent": "MoneyFlow/1.0"},
+            )
+        return self._http_client
+
+    @property
+    def session_factory(self) -> Callable[[], AsyncSession]:
+        """Session factory for storing fetched icons."""
+        if self._session_factory is None:
+            from src.db.database import async_session_maker
+
+            self._session_factory = async_session_maker
+        return self._session_factory
+
+    async def head(self, url: str) -> httpx.Response:
+        """Send a HEAD request within the concurrency limit.
+
+        Args:
+            url: URL to probe.
+
+        Returns:
+            The response.
+        """
+        async with self._semaphore:
+            return await self.client.head(url)
+
+    def get(self, service_name: str, user_id: str | None = None) -> IconResponse | None:
+        """Get a resolved icon from memory.
+
+        Args:
+            service_name: Normalized service name.
+            user_id: User the icon was resolved for (None for global).
+
+        Returns:
+            The icon, or None if not cached or stale.
+        """
+        key = (service_name, user_id)
+        entry = self._icons.get(key)
+        if entry is None:
+            return None
+
+        stored_until, icon = entry
+        if time.monotonic() > stored_until or (
+            icon.expires_at is not None and datetime.now(UTC) > icon.expires_at
+        ):
+            del self._icons[key]
+            return None
+
+        self._icons.move_to_end(key)
+        return icon
+
+    def put(self, service_name: str, user_id: str | None, icon: IconResponse) -> None:
+        """Keep a resolved icon in memory.
+
+        Args:
+            service_name: Normalized service name.
+            user_id: User the icon was resolved for (None for global).
+            icon: Resolved icon.
+        """
+        key = (service_name, user_id)
+        self._icons[key] = (time.monotonic() + self.cache_ttl, icon)
+        self._icons.move_to_end(key)
+        while len(self._icons) > self.cache_size:
+            self._icons.popitem(last=False)
+
+    def invalidate(self, service_name: str) -> None:
+        """Drop everything cached for a name after its icon changed.
+
+        Args:
+            service_name: Normalized service name.
+        """
+        for key in [key for key in self._icons if key[0] == service_name]:
+            del self._icons[key]
+        for key in [key for key in self._missing if key[0] == service_name]:
+            del self._missing[key]
+
+    def is_missing(self, key: FetchKey) -> bool:
+        """Whether a fetch recently found no icon.
+
+        Args:
+            key: Fetch key (see single_flight()).
+
+        Returns:
+            True while the negative result is fresh.
+        """
+        until = self._missing.get(key)
+        if until is None:
+            return False
+        if time.monotonic() > until:
+            del self._missing[key]
+            return False
+        return True
+
+    async def single_flight(
+        self,
+        key: FetchKey,
+        fetch: Callable[[], Awaitable[IconResponse | None]],
+        use_negative_cache: bool = True,
+    ) -> IconResponse | None:
+        """Run a fetch, sharing it with concurrent callers of the same key.
+
+        The fetch runs in its own task, so a caller giving up does not
+        cancel it for the others. A fetch that finds no icon is cached
+        as missing.
+
+        Args:
+            key: Fetch key.
+            fetch: Coroutine function fetching and storing the icon.
+            use_negative_cache: Return None for keys recently found
+                missing without fetching.
+
+        Returns:
+            The fetched icon, or None if there is none.
+        """
+        if use_negative_cache and self.is_missing(key):
+            return None
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._run(key, fetch))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _run(
+        self,
+        key: FetchKey,
+        fetch: Callable[[], Awaitable[IconResponse | None]],
+    ) -> IconResponse | None:
+        """Run a fetch and record a missing result."""
+        icon = await fetch()
+        if icon is None:
+            self._missing[key] = time.monotonic() + self.negative_ttl
+            self._missing.move_to_end(key)
+            while len(self._missing) > self.cache_size:
+                self._missing.popitem(last=False)
+        else:
+            self._missing.pop(key, None)
+        return icon
+
+    async def close(self) -> None:
+        """Wait for fetches in flight and close the HTTP client if owned."""
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight.values(), return_exceptions=True)
+        if self._owns_client and self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+
+# Singleton instance
+_icon_fetcher: IconFetcher | None = None
+
+
+def get_icon_fetcher() -> IconFetcher:
+    """Get the process-wide icon fetcher.
+
+    Returns:
+        IconFetcher instance.
+    """
+    global _icon_fetcher
+    if _icon_fetcher is None:
+        _icon_fetcher = IconFetcher()
+    return _icon_fetcher
+
+
+async def close_icon_fetcher() -> None:
+    """Close the process-wide icon fetcher."""
+    global _icon_fetcher
+    if _icon_fetcher is not None:
+        await _icon_fetcher.close()
+        _icon_fetcher = None
@@ -2,7 +2,8 @@
 
 This module provides the IconService for:
 - Fetching icons from SimpleIcons, Clearbit, Logo.dev, Brandfetch
-- Caching icons in database with TTL
+- Caching icons in database with TTL, with an in-process LRU in front
+- Fetching bulk requests concurrently, single-flighted per service
 - AI icon generation using Claude for SVG icons
 - Icon search and retrieval
 
@@ -12,6 +13,7 @@ Example:
     >>> icon = await service.get_icon("netflix")
 """
 
+import asyncio
 import base64
 import logging
 import re
@@ -31,6 +33,7 @@ from src.schemas.icon import (
     IconSourceEnum,
     IconStatsResponse,
 )
+from src.services.icon_fetcher import get_icon_fetcher
 
 if TYPE_CHECKING:
     pass
@@ -44,6 +47,9 @@ CLEARBIT_LOGO_URL = "https://logo.clearbit.com"
 LOGO_DEV_URL = "https://img.logo.dev"
 BRANDFETCH_URL = "https://cdn.brandfetch.io"
 
+# Sources tried when none are given, in order of preference
+DEFAULT_SOURCES = [IconSourceEnum.SIMPLE_ICONS, IconSourceEnum.CLEARBIT]
+
 # Popular service slugs for SimpleIcons
 # Maps common names to SimpleIcons slugs
 SERVICE_SLUG_MAP = {
@@ -140,9 +146,11 @@ class IconService:
     - Bulk fetch icons for multiple services
     - Generate cache statistics
 
+    External requests, the in-memory cache and in-flight fetches are
+    shared across instances through the process-wide IconFetcher.
+
     Attributes:
         db: Async database session.
-        http_client: HTTP client for external requests.
 
     Example:
         >>> service = IconService(db_session)
@@ -157,23 +165,13 @@ class IconService:
             db: Async database session.
         """
         self.db = db
-        self._http_client: httpx.AsyncClient | None = None
-
-    async def _get_http_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._http_client is None:
-            self._http_client = httpx.AsyncClient(
-                timeout=10.0,
-                follow_redirects=True,
-                headers={"User-Agent": "MoneyFlow/1.0"},
-            )
-        return self._http_client
 
     async def close(self) -> None:
-        """Close HTTP client."""
-        if self._http_client:
-            await self._http_client.aclose()
-            self._http_client = None
+        """Release per-service resources.
+
+        The HTTP client is pooled by the IconFetcher and closed on
+        application shutdown, so there is nothing left to release.
+        """
 
     def _normalize_service_name(self, name: str) -> str:
         """Normalize service name for lookup.
@@ -230,19 +228,26 @@ class IconService:
             IconResponse or None if not found.
         """
         normalized = self._normalize_service_name(service_name)
+        fetcher = get_icon_fetcher()
 
-        # Check cache first (unless force refresh)
+        # Check memory, then database cache (unless force refresh)
         if not force_refresh:
+            icon = fetcher.get(normalized, user_id)
+            if icon:
+                return icon
+
             cached = await self._get_from_cache(normalized, user_id)
             if cached and not cached.is_expired:
                 cached.record_fetch()
                 await self.db.commit()
-                return self._to_response(cached)
+                icon = self._to_response(cached)
+                fetcher.put(normalized, user_id, icon)
+                return icon
 
         # Try to fetch from external sources
-        icon = await self._fetch_from_sources(service_name)
+        icon = await self._fetch_shared(service_name, force_refresh=force_refresh)
         if icon:
-            return self._to_response(icon)
+            return icon
 
         # Return cached even if expired
         if not force_refresh:
@@ -285,6 +290,22 @@ class IconService:
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
+    async def _get_many_from_cache(self, service_names: list[str]) -> list[IconCache]:
+        """Get global cache entries for several services in one query.
+
+        Args:
+            service_names: Normalized service names.
+
+        Returns:
+            Cached icons found (in no particular order).
+        """
+        query = select(IconCache).where(
+            IconCache.service_name.in_(service_names),
+            IconCache.user_id.is_(None),
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
     async def _fetch_from_sources(
         self,
         service_name: str,
@@ -292,7 +313,8 @@ class IconService:
     ) -> IconCache | None:
         """Fetch icon from external sources.
 
-        Tries sources in order until one succeeds.
+        Probes all sources concurrently and keeps the first one, in order
+        of preference, that has the icon.
 
         Args:
             service_name: Service name.
@@ -302,14 +324,16 @@ class IconService:
             Cached icon or None.
         """
         if sources is None:
-            sources = [IconSourceEnum.SIMPLE_ICONS, IconSourceEnum.CLEARBIT]
+            sources = DEFAULT_SOURCES
 
         normalized = self._normalize_service_name(service_name)
         slug = self._get_simple_icons_slug(service_name)
         brand_color = BRAND_COLORS.get(slug)
 
-        for source in sources:
-            icon_url = await self._try_fetch_source(service_name, source)
+        icon_urls = await asyncio.gather(
+            *(self._try_fetch_source(service_name, source) for source in sources)
+        )
+        for source, icon_url in zip(sources, icon_urls, strict=True):
             if icon_url:
                 # Create or update cache entry
                 icon = await self._create_cache_entry(
@@ -323,6 +347,64 @@ class IconService:
 
         return None
 
+    async def _fetch_shared(
+        self,
+        service_name: str,
+        sources: list[IconSourceEnum] | None = None,
+        force_refresh: bool = False,
+    ) -> IconResponse | None:
+        """Fetch an icon, sharing the fetch with concurrent requests.
+
+        Concurrent fetches of the same service (in this process) run once,
+        and services without an icon are not fetched again until their
+        negative cache entry expires, unless force_refresh is set.
+
+        Args:
+            service_name: Service name.
+            sources: Sources to try (default: SimpleIcons, Clearbit).
+            force_refresh: Ignore a cached negative result.
+
+        Returns:
+            Fetched icon or None.
+        """
+        sources = sources or DEFAULT_SOURCES
+        key = (
+            self._normalize_service_name(service_name),
+            tuple(source.value for source in sources),
+        )
+        return await get_icon_fetcher().single_flight(
+            key,
+            lambda: self._fetch_and_store(service_name, sources),
+            use_negative_cache=not force_refresh,
+        )
+
+    async def _fetch_and_store(
+        self,
+        service_name: str,
+        sources: list[IconSourceEnum],
+    ) -> IconResponse | None:
+        """Fetch an icon and store it using a session of its own.
+
+        Shared fetches outlive the request that started them and run
+        concurrently with each other, so they cannot use self.db.
+
+        Args:
+            service_name: Service name.
+            sources: Sources to try.
+
+        Returns:
+            Fetched icon or None.
+        """
+        fetcher = get_icon_fetcher()
+        async with fetcher.session_factory() as session:
+            icon = await IconService(session)._fetch_from_sources(service_name, sources)
+            if icon is None:
+                return None
+            response = self._to_response(icon)
+
+        fetcher.put(response.service_name, None, response)
+        return response
+
     async def _try_fetch_source(
         self,
         service_name: str,
@@ -338,14 +420,14 @@ class IconService:
             Icon URL or None.
         """
         try:
-            client = await self._get_http_client()
+            fetcher = get_icon_fetcher()
             slug = self._get_simple_icons_slug(service_name)
             color = BRAND_COLORS.get(slug, "000000").lstrip("#")
 
             if source == IconSourceEnum.SIMPLE_ICONS:
                 # Try SimpleIcons CDN
                 url = f"{SIMPLE_ICONS_CDN}/{slug}/{color}"
-                response = await client.head(url)
+                response = await fetcher.head(url)
                 if response.status_code == 200:
                     return url
 
@@ -354,7 +436,7 @@ class IconService:
                 domain = self._guess_domain(service_name)
                 if domain:
                     url = f"{CLEARBIT_LOGO_URL}/{domain}"
-                    response = await client.head(url)
+                    response = await fetcher.head(url)
                     if response.status_code == 200:
                         return url
 
@@ -363,7 +445,7 @@ class IconService:
                 domain = self._guess_domain(service_name)
                 if domain:
                     url = f"{LOGO_DEV_URL}/{domain}?token=pk_placeholder"
-                    response = await client.head(url)
+                    response = await fetcher.head(url)
                     if response.status_code == 200:
                         return url
 
@@ -457,6 +539,7 @@ class IconService:
             existing.set_expiry_from_source()
             existing.updated_at = datetime.now(UTC)
             await self.db.commit()
+            get_icon_fetcher().invalidate(service_name)
             return existing
 
         # Create new entry
@@ -473,6 +556,7 @@ class IconService:
         self.db.add(icon)
         await self.db.commit()
         await self.db.refresh(icon)
+        get_icon_fetcher().invalidate(service_name)
         return icon
 
     async def search_icons(
@@ -524,6 +608,11 @@ class IconService:
     ) -> IconBulkResponse:
         """Fetch icons for multiple services.
 
+        Icons are served from memory where possible, the rest of the
+        cached icons are loaded with one query, and the remaining services
+        are fetched concurrently. Names normalizing to the same service
+        are resolved once.
+
         Args:
             service_names: List of service names.
             sources: Sources to try.
@@ -531,11 +620,50 @@ class IconService:
         Returns:
             Bulk fetch response.
         """
+        fetcher = get_icon_fetcher()
+        resolved: dict[str, IconResponse | None] = {}
+        pending: dict[str, str] = {}  # Normalized name -> first requested name
+
+        for name in service_names:
+            normalized = self._normalize_service_name(name)
+            if normalized in resolved or normalized in pending:
+                continue
+            icon = fetcher.get(normalized)
+            if icon:
+                resolved[normalized] = icon
+            else:
+                pending[normalized] = name
+
+        if pending:
+            stale: dict[str, IconCache] = {}
+            recorded = False
+            for cached in await self._get_many_from_cache(list(pending)):
+                if cached.is_expired:
+                    stale[cached.service_name] = cached
+                    continue
+                cached.record_fetch()
+                recorded = True
+                icon = self._to_response(cached)
+                fetcher.put(cached.service_name, None, icon)
+                resolved[cached.service_name] = icon
+                del pending[cached.service_name]
+            if recorded:
+                await self.db.commit()
+
+            fetched = await asyncio.gather(
+                *(self._fetch_shared(name, sources) for name in pending.values())
+            )
+            for normalized, icon in zip(pending, fetched, strict=True):
+                if icon is None and normalized in stale:
+                    # Return cached even if expired
+                    icon = self._to_response(stale[normalized])
+                resolved[normalized] = icon
+
         icons: dict[str, IconResponse | None] = {}
         missing: list[str] = []
 
         for name in service_names:
-            icon = await self.get_icon(name)
+            icon = resolved[self._normalize_service_name(name)]
             if icon:
                 icons[name] = icon
             else:
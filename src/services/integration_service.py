@@ -8,6 +8,7 @@ Sprint 5.6 - IFTTT/Zapier Integration
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
 from datetime import datetime, timedelta
@@ -31,6 +32,11 @@ from src.schemas.integration import (
     RestHookSubscribe,
     SubscriptionEventData,
 )
+from src.services.rest_hook_batcher import (
+    REST_HOOK_TIMEOUT,
+    get_rest_hook_batcher,
+    rest_hook_headers,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -209,6 +215,7 @@ class IntegrationService:
             integration_type=integration_type,
             target_url=str(data.target_url),
             event_type=data.event_type,
+            batch_events=data.batch,
         )
 
         self.db.add(subscription)
@@ -306,13 +313,18 @@ class IntegrationService:
     ) -> int:
         """Trigger an event to all subscribed REST Hooks.
 
+        Hooks subscribed with batching get the event added to their open
+        batch (see src.services.rest_hook_batcher); all other hooks are
+        posted to concurrently.
+
         Args:
             event_type: Type of event to trigger.
             data: Event data payload.
             user_id: Optional specific user (defaults to service user_id).
 
         Returns:
-            Number of successful deliveries.
+            Number of successful deliveries, counting events queued for
+            batching hooks.
         """
         target_user_id = user_id or self.user_id
 
@@ -337,49 +349,70 @@ class IntegrationService:
             data=data,
         )
 
-        # Deliver to each subscription
-        successful = 0
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            for subscription in subscriptions:
-                try:
-                    response = await client.post(
-                        subscription.target_url,
-                        json=payload.model_dump(mode="json"),
-                        headers={
-                            "Content-Type": "application/json",
-                            "X-MoneyFlow-Event": event_type,
-                            "X-MoneyFlow-Event-ID": event_id,
-                        },
-                    )
-
-                    if 200 <= response.status_code < 300:
-                        subscription.record_success()
-                        successful += 1
-                        logger.info(
-                            f"Delivered event {event_type} to {subscription.target_url}"
-                        )
-                    elif response.status_code == 410:
-                        # 410 Gone - Zapier wants us to unsubscribe
-                        subscription.revoke()
-                        logger.info(
-                            f"Subscription {subscription.id} returned 410, revoking"
-                        )
-                    else:
-                        subscription.record_failure(f"HTTP {response.status_code}")
-                        logger.warning(
-                            f"Failed to deliver to {subscription.target_url}: "
-                            f"HTTP {response.status_code}"
-                        )
-
-                except httpx.RequestError as e:
-                    subscription.record_failure(str(e))
-                    logger.error(
-                        f"Request error delivering to {subscription.target_url}: {e}"
-                    )
+        batched = [subscription for subscription in subscriptions if subscription.batch_events]
+        immediate = [
+            subscription for subscription in subscriptions if not subscription.batch_events
+        ]
+
+        if batched:
+            batcher = get_rest_hook_batcher()
+            for subscription in batched:
+                batcher.add(subscription, payload)
+
+        successful = len(batched)
+        if immediate:
+            async with httpx.AsyncClient(timeout=REST_HOOK_TIMEOUT) as client:
+                results = await asyncio.gather(
+                    *(self._deliver(client, subscription, payload) for subscription in immediate)
+                )
+            successful += sum(results)
 
         await self.db.commit()
         return successful
 
+    async def _deliver(
+        self,
+        client: httpx.AsyncClient,
+        subscription: RestHookSubscription,
+        payload: EventPayload,
+    ) -> bool:
+        """Post one event to a REST Hook and record the outcome.
+
+        Args:
+            client: HTTP client to post with.
+            subscription: Target REST Hook.
+            payload: Event to deliver.
+
+        Returns:
+            True if the hook accepted the event.
+        """
+        try:
+            response = await client.post(
+                subscription.target_url,
+                json=payload.model_dump(mode="json"),
+                headers=rest_hook_headers(payload.event_type, payload.id),
+            )
+        except httpx.RequestError as e:
+            subscription.record_failure(str(e))
+            logger.error(f"Request error delivering to {subscription.target_url}: {e}")
+            return False
+
+        if 200 <= response.status_code < 300:
+            subscription.record_success()
+            logger.info(f"Delivered event {payload.event_type} to {subscription.target_url}")
+            return True
+
+        if response.status_code == 410:
+            # 410 Gone - Zapier wants us to unsubscribe
+            subscription.revoke()
+            logger.info(f"Subscription {subscription.id} returned 410, revoking")
+        else:
+            subscription.record_failure(f"HTTP {response.status_code}")
+            logger.warning(
+                f"Failed to deliver to {subscription.target_url}: HTTP {response.status_code}"
+            )
+        return False
+
     # ========================================================================
     # Sample Data (for Zapier field mapping)
     # ========================================================================
@@ -0,0 +1,183 @@
+"""Concurrent, rate-limited notification dispatcher.
+
+Reminder and digest runs used to send one awaited message at a time. The
+dispatcher lets a task send many notifications concurrently while staying
+inside each channel's limits:
+
+- Bounded concurrency: a semaphore per channel caps in-flight sends (and,
+  for email, matches the number of pooled SMTP connections).
+- Rate limits: a token bucket per channel keeps the send rate under the
+  provider's limit (Telegram allows about 30 messages per second per bot;
+  SMTP relays typically allow a handful per second).
+
+Example:
+    >>> dispatcher = NotificationDispatcher()
+    >>> sent = await dispatcher.send(
+    ...     NotificationChannel.TELEGRAM,
+    ...     lambda: telegram_service.send_message(chat_id, "Hello"),
+    ... )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import TypeVar
+
+from src.core.config import settings
+from src.models.notification_history import NotificationChannel
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class TokenBucket:
+    """Async token bucket rate limiter.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Each acquire() takes one token, waiting until one is available. Waiters
+    are served in arrival order.
+
+    Attributes:
+        rate: Tokens added per second.
+        capacity: Maximum number of stored tokens (burst size).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the bucket, initially full.
+
+        Args:
+            rate: Tokens added per second. Must be positive.
+            capacity: Burst size (defaults to one second's worth of tokens).
+            clock: Monotonic clock, injectable for tests.
+
+        Raises:
+            ValueError: If rate is not positive.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update."""
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+@dataclass(frozen=True)
+class ChannelLimits:
+    """Send limits for one notification channel.
+
+    Attributes:
+        rate: Maximum sends per second.
+        concurrency: Maximum sends in flight at once.
+    """
+
+    rate: float
+    concurrency: int
+
+
+def default_channel_limits() -> dict[NotificationChannel, ChannelLimits]:
+    """Build per-channel limits from settings.
+
+    Returns:
+        Limits for Telegram, email and push.
+    """
+    return {
+        NotificationChannel.TELEGRAM: ChannelLimits(
+            rate=settings.notification_telegram_rate,
+            concurrency=settings.notification_telegram_concurrency,
+        ),
+        NotificationChannel.EMAIL: ChannelLimits(
+            rate=settings.notification_email_rate,
+            concurrency=settings.notification_email_concurrency,
+        ),
+        NotificationChannel.PUSH: ChannelLimits(
+            rate=settings.notification_push_rate,
+            concurrency=settings.notification_push_concurrency,
+        ),
+    }
+
+
+class NotificationDispatcher:
+    """Runs notification sends concurrently within per-channel limits.
+
+    One dispatcher is shared by all tasks of a worker (see
+    ``src.core.tasks.startup``) so concurrent runs share the same limits.
+
+    Attributes:
+        limits: Limits per channel.
+    """
+
+    def __init__(self, limits: dict[NotificationChannel, ChannelLimits] | None = None) -> None:
+        """Initialize the dispatcher.
+
+        Args:
+            limits: Limits per channel (defaults to default_channel_limits()).
+        """
+        self.limits = limits or default_channel_limits()
+        self._semaphores = {
+            channel: asyncio.Semaphore(limit.concurrency) for channel, limit in self.limits.items()
+        }
+        self._buckets = {channel: TokenBucket(limit.rate) for channel, limit in self.limits.items()}
+
+    async def send(self, channel: NotificationChannel, send: Callable[[], Awaitable[T]]) -> T:
+        """Run one send once a concurrency slot and a rate token are available.
+
+        Args:
+            channel: Channel the send goes out on.
+            send: Zero-argument callable returning the send coroutine.
+
+        Returns:
+            Whatever the send returns.
+        """
+        async with self._semaphores[channel]:
+            await self._buckets[channel].acquire()
+            return await send()
+
+    async def gather(self, jobs: Iterable[Awaitable[int]]) -> int:
+        """Run per-recipient jobs concurrently and total their send counts.
+
+        Jobs should route each individual send through send(), which is
+        where the limits are applied; a failing job is logged and counts as
+        zero so one bad recipient cannot abort the batch.
+
+        Args:
+            jobs: Coroutines returning the number of notifications sent.
+
+        Returns:
+            Total number of notifications sent.
+        """
+        results = await asyncio.gather(*jobs, return_exceptions=True)
+        total = 0
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error(f"Notification job failed: {result}")
+                continue
+            total += result
+        return total
@@ -0,0 +1,237 @@
+"""Claim-before-send ledger for scheduled notifications.
+
+Notification jobs are retried (``max_tries``) and may run more than once
+for the same slot, so every send is first claimed in the
+``notification_sends`` table (see NotificationSend). A claim is one
+``INSERT ... ON CONFLICT`` per batch: rows that insert (or replace a failed
+attempt) are returned and sent; rows that conflict were already sent or
+are being sent by another job and are skipped. Outcomes are written back
+in one UPDATE per status.
+
+Claims are committed before anything is sent, so a job that crashes
+mid-send does not re-send on retry: delivery is at most once per key,
+except that failed sends may be claimed again.
+
+Example:
+    >>> ledger = NotificationLedger(db)
+    >>> sent = await ledger.deliver(dispatcher, [
+    ...     PendingSend(key, lambda: telegram_service.send_reminder(...)),
+    ... ])
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import date, datetime
+
+from sqlalchemy import delete, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.notification_history import (
+    NotificationChannel,
+    NotificationStatus,
+    NotificationType,
+)
+from src.models.notification_send import NotificationSend
+from src.services.notification_dispatcher import NotificationDispatcher
+
+logger = logging.getLogger(__name__)
+
+_KEY_COLUMNS = ["user_id", "subscription_key", "occurrence_date", "channel", "notification_type"]
+
+
+@dataclass(frozen=True)
+class LedgerKey:
+    """Identity of one notification send.
+
+    Attributes:
+        user_id: User being notified.
+        subscription_id: Subscription the notification is about, or None
+            for user-level notifications such as digests.
+        occurrence_date: Payment date for reminders, otherwise the user's
+            local date of the notification.
+        channel: Channel the notification goes out on.
+        notification_type: Type of notification.
+    """
+
+    user_id: str
+    subscription_id: str | None
+    occurrence_date: date
+    channel: NotificationChannel
+    notification_type: NotificationType
+
+    def as_row(self) -> dict[str, object]:
+        """Column values of the ledger row for this key."""
+        return {
+            "user_id": self.user_id,
+            "subscription_key": self.subscription_id or "",
+            "occurrence_date": self.occurrence_date,
+            "channel": self.channel.value,
+            "notification_type": self.notification_type.value,
+        }
+
+
+@dataclass(frozen=True)
+class PendingSend:
+    """A notification to send once it has been claimed.
+
+    Attributes:
+        key: Ledger key of the notification.
+        send: Zero-argument callable returning the send coroutine, which
+            resolves to True on success.
+    """
+
+    key: LedgerKey
+    send: Callable[[], Awaitable[bool]]
+
+
+class NotificationLedger:
+    """Claims, records and prunes notification sends.
+
+    The session should not be the one streaming recipients: claims and
+    outcomes are committed between batches, which would end the
+    streaming query's transaction.
+
+    Attributes:
+        db: Async database session used for ledger writes.
+        chunk_size: Rows per INSERT statement (bounded by driver parameter limits).
+    """
+
+    DEFAULT_CHUNK_SIZE = 500
+
+    def __init__(self, db: AsyncSession, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """Initialize the ledger.
+
+        Args:
+            db: Async database session used for ledger writes.
+            chunk_size: Rows per INSERT statement.
+        """
+        self.db = db
+        self.chunk_size = chunk_size
+
+    def _insert(self):
+        """Dialect-specific INSERT supporting ON CONFLICT."""
+        dialect = self.db.get_bind().dialect.name
+        module = postgresql if dialect == "postgresql" else sqlite
+        return module.insert(NotificationSend)
+
+    async def claim(self, keys: Iterable[LedgerKey]) -> dict[LedgerKey, str]:
+        """Atomically claim sends, skipping those already sent or in flight.
+
+        Args:
+            keys: Ledger keys to claim (duplicates are claimed once).
+
+        Returns:
+            Ledger row ID of every key claimed by this call.
+        """
+        by_row = {tuple(key.as_row()[column] for column in _KEY_COLUMNS): key for key in keys}
+        rows = list(by_row)
+        claimed: dict[LedgerKey, str] = {}
+        now = datetime.utcnow()
+
+        for start in range(0, len(rows), self.chunk_size):
+            values = [
+                {
+                    "id": str(uuid.uuid4()),
+                    **dict(zip(_KEY_COLUMNS, row, strict=True)),
+                    "status": NotificationStatus.PENDING.value,
+                    "claimed_at": now,
+                }
+                for row in rows[start : start + self.chunk_size]
+            ]
+            stmt = self._insert().values(values)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=_KEY_COLUMNS,
+                set_={
+                    "status": NotificationStatus.PENDING.value,
+                    "claimed_at": stmt.excluded.claimed_at,
+                },
+                # Only failed attempts may be claimed again
+                where=NotificationSend.status == NotificationStatus.FAILED.value,
+            ).returning(NotificationSend.id, *(getattr(NotificationSend, c) for c in _KEY_COLUMNS))
+            result = await self.db.execute(stmt)
+            for ledger_id, *row in result.all():
+                claimed[by_row[tuple(row)]] = ledger_id
+
+        await self.db.commit()
+        return claimed
+
+    async def record(self, outcomes: dict[str, bool]) -> None:
+        """Store the outcome of claimed sends.
+
+        Args:
+            outcomes: Success flag per ledger row ID.
+        """
+        sent = [ledger_id for ledger_id, ok in outcomes.items() if ok]
+        failed = [ledger_id for ledger_id, ok in outcomes.items() if not ok]
+
+        for start in range(0, len(sent), self.chunk_size):
+            await self.db.execute(
+                update(NotificationSend)
+                .where(NotificationSend.id.in_(sent[start : start + self.chunk_size]))
+                .values(status=NotificationStatus.SENT.value, sent_at=datetime.utcnow())
+            )
+        for start in range(0, len(failed), self.chunk_size):
+            await self.db.execute(
+                update(NotificationSend)
+                .where(NotificationSend.id.in_(failed[start : start + self.chunk_size]))
+                .values(status=NotificationStatus.FAILED.value)
+            )
+        await self.db.commit()
+
+    async def deliver(
+        self,
+        dispatcher: NotificationDispatcher,
+        sends: Iterable[PendingSend],
+    ) -> dict[LedgerKey, bool]:
+        """Claim a batch of sends, send the claimed ones and record the outcomes.
+
+        Args:
+            dispatcher: Dispatcher applying the per-channel limits.
+            sends: Notifications to send.
+
+        Returns:
+            Outcome of every send claimed by this call; unclaimed sends are
+            absent.
+        """
+        unique = {send.key: send for send in sends}
+        claimed = await self.claim(unique)
+        if len(claimed) < len(unique):
+            logger.info(f"Skipping {len(unique) - len(claimed)} notifications already sent")
+
+        outcomes: dict[LedgerKey, bool] = {}
+
+        async def deliver_one(send: PendingSend) -> int:
+            try:
+                ok = bool(await dispatcher.send(send.key.channel, send.send))
+            except Exception as e:
+                logger.error(
+                    f"Failed to send {send.key.notification_type.value} to user "
+                    f"{send.key.user_id} via {send.key.channel.value}: {e}"
+                )
+                ok = False
+            outcomes[send.key] = ok
+            return int(ok)
+
+        await dispatcher.gather(deliver_one(send) for key, send in unique.items() if key in claimed)
+        await self.record({claimed[key]: ok for key, ok in outcomes.items()})
+        return outcomes
+
+    async def prune(self, before: datetime) -> int:
+        """Delete ledger rows claimed before a cut-off.
+
+        Args:
+            before: Rows claimed earlier than this are deleted.
+
+        Returns:
+            Number of rows deleted.
+        """
+        result = await self.db.execute(
+            delete(NotificationSend).where(NotificationSend.claimed_at < before)
+        )
+        await self.db.commit()
+        return result.rowcount or 0
@@ -0,0 +1,485 @@
+"""Set-based recipient queries for notification fan-out.
+
+The reminder and digest tasks used to load every NotificationPreferences
+row and then query subscriptions (and often the user) once per user. This
+module replaces that N+1 pattern with one joined query per run:
+preferences are joined to users and to the subscriptions relevant for the
+notification, ordered by user, streamed from the database in chunks and
+grouped into one NotificationRecipient per user.
+
+Example:
+    >>> queries = NotificationQueryService(db)
+    >>> async for recipients in queries.iter_reminder_recipients(
+    ...     NotificationChannel.TELEGRAM, date.today()
+    ... ):
+    ...     for recipient in recipients:
+    ...         print(recipient.user_id, len(recipient.subscriptions))
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import AsyncIterator, Collection
+from dataclasses import dataclass, field
+from datetime import date, time, timedelta
+
+from sqlalchemy import ColumnElement, and_, case, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
+
+from src.models.notification import NotificationPreferences
+from src.models.notification_history import NotificationChannel
+from src.models.subscription import Subscription
+from src.models.user import User
+from src.services.notification_schedule import (
+    DeliveryWindow,
+    build_delivery_windows,
+    parse_slot,
+    unscheduled_window,
+)
+
+logger = logging.getLogger(__name__)
+
+# User IDs are UUID strings; their last two hex digits are uniformly
+# distributed and give 256 hash buckets to spread across shards.
+_SHARD_SUFFIX_LENGTH = 2
+_HEX_DIGITS = "0123456789abcdef"
+_HEX_SUFFIXES = [a + b for a in _HEX_DIGITS for b in _HEX_DIGITS]
+
+
+@dataclass
+class NotificationRecipient:
+    """A user to notify together with the subscriptions to notify about.
+
+    Attributes:
+        preferences: The user's notification preferences.
+        email: The user's email address.
+        currency: Preferred display currency from the user's preferences.
+        subscriptions: Matching subscriptions, ordered by next payment date.
+    """
+
+    preferences: NotificationPreferences
+    email: str | None
+    currency: str
+    subscriptions: list[Subscription] = field(default_factory=list)
+
+    @property
+    def user_id(self) -> str:
+        """ID of the user to notify."""
+        return self.preferences.user_id
+
+    def can_receive(self, channel: NotificationChannel) -> bool:
+        """Whether the user is reachable on a channel (mirrors channel_conditions())."""
+        prefs = self.preferences
+        if channel == NotificationChannel.TELEGRAM:
+            return bool(
+                prefs.telegram_enabled and prefs.telegram_verified and prefs.telegram_chat_id
+            )
+        if channel == NotificationChannel.EMAIL:
+            return bool(prefs.email_enabled and self.email)
+        return bool(prefs.push_enabled and prefs.push_verified and prefs.push_subscription)
+
+
+def _preferred_currency(raw_preferences: str | None) -> str:
+    """Read the display currency from a user's JSON preferences string."""
+    if not raw_preferences:
+        return "GBP"
+    try:
+        preferences = json.loads(raw_preferences)
+    except (json.JSONDecodeError, TypeError):
+        return "GBP"
+    if not isinstance(preferences, dict):
+        return "GBP"
+    return preferences.get("currency") or "GBP"
+
+
+def channel_conditions(channel: NotificationChannel) -> list[ColumnElement[bool]]:
+    """Conditions for a user being reachable on a channel.
+
+    Args:
+        channel: Notification channel.
+
+    Returns:
+        SQL conditions over NotificationPreferences and User.
+    """
+    if channel == NotificationChannel.TELEGRAM:
+        return [
+            NotificationPreferences.telegram_enabled.is_(True),
+            NotificationPreferences.telegram_verified.is_(True),
+            NotificationPreferences.telegram_chat_id.is_not(None),
+        ]
+    if channel == NotificationChannel.EMAIL:
+        return [
+            NotificationPreferences.email_enabled.is_(True),
+            User.email.is_not(None),
+        ]
+    return [
+        NotificationPreferences.push_enabled.is_(True),
+        NotificationPreferences.push_verified.is_(True),
+        NotificationPreferences.push_subscription.is_not(None),
+    ]
+
+
+def _as_channels(
+    channels: NotificationChannel | Collection[NotificationChannel],
+) -> list[NotificationChannel]:
+    """Normalise a channel or collection of channels to a list."""
+    if isinstance(channels, NotificationChannel):
+        return [channels]
+    return list(channels)
+
+
+def shard_of(user_id: str, shard_count: int) -> int:
+    """Return the shard a user belongs to.
+
+    Mirrors shard_condition(): the last two characters of the ID are read
+    as hex; IDs that do not end in hex digits fall into shard 0.
+
+    Args:
+        user_id: User ID.
+        shard_count: Total number of shards.
+
+    Returns:
+        Shard index, 0-based.
+    """
+    try:
+        return int(user_id[-_SHARD_SUFFIX_LENGTH:].lower(), 16) % shard_count
+    except ValueError:
+        return 0
+
+
+def shard_condition(
+    user_id_column: ColumnElement[str],
+    shard_index: int,
+    shard_count: int,
+) -> ColumnElement[bool]:
+    """SQL condition selecting the users of one hash shard.
+
+    Uses only substr/length/lower so the same partitioning works on
+    PostgreSQL and SQLite.
+
+    Args:
+        user_id_column: Column holding the user ID.
+        shard_index: Shard number, 0-based.
+        shard_count: Total number of shards.
+
+    Returns:
+        Condition true for users with shard_of(user_id) == shard_index.
+    """
+    suffix = func.lower(
+        func.substr(
+            user_id_column,
+            func.length(user_id_column) - (_SHARD_SUFFIX_LENGTH - 1),
+            _SHARD_SUFFIX_LENGTH,
+        )
+    )
+    mine = [s for s in _HEX_SUFFIXES if int(s, 16) % shard_count == shard_index]
+    if shard_index == 0:
+        return or_(suffix.in_(mine), suffix.not_in(_HEX_SUFFIXES))
+    return suffix.in_(mine)
+
+
+def delivery_time() -> ColumnElement[time]:
+    """Local time a user's notifications are delivered at.
+
+    reminder_time, or the end of quiet hours when reminder_time falls
+    inside them. Mirrors NotificationPreferences.is_in_quiet_hours(),
+    including overnight ranges and the inclusive end.
+
+    Returns:
+        SQL expression over NotificationPreferences.
+    """
+    prefs = NotificationPreferences
+    t = prefs.reminder_time
+    in_quiet_hours = and_(
+        prefs.quiet_hours_enabled.is_(True),
+        prefs.quiet_hours_start.is_not(None),
+        prefs.quiet_hours_end.is_not(None),
+        or_(
+            and_(
+                prefs.quiet_hours_start > prefs.quiet_hours_end,
+                or_(t >= prefs.quiet_hours_start, t <= prefs.quiet_hours_end),
+            ),
+            and_(
+                prefs.quiet_hours_start <= prefs.quiet_hours_end,
+                t >= prefs.quiet_hours_start,
+                t <= prefs.quiet_hours_end,
+            ),
+        ),
+    )
+    return case((in_quiet_hours, prefs.quiet_hours_end), else_=t)
+
+
+def window_conditions(window: DeliveryWindow) -> list[ColumnElement[bool]]:
+    """Conditions selecting the users to notify in a delivery window.
+
+    Args:
+        window: Window from NotificationQueryService.delivery_windows().
+
+    Returns:
+        Timezone and delivery-time conditions; none for unscheduled windows.
+    """
+    if window.timezones is None:
+        return []
+
+    delivery = delivery_time()
+    conditions = [
+        NotificationPreferences.timezone.in_(window.timezones),
+        delivery >= window.start,
+    ]
+    if window.end is not None:
+        conditions.append(delivery < window.end)
+    return conditions
+
+
+class NotificationQueryService:
+    """Streams notification recipients with their subscriptions.
+
+    Each iterator runs a single joined query (plus, for reminders, one
+    small query for the distinct reminder offsets) and yields recipients
+    in lists of up to ``chunk_size`` users, so memory use is bounded by the
+    chunk size rather than the user base.
+
+    With ``shard_count > 1`` only the users of one hash shard are returned,
+    so a fanned-out run (see ``src.core.fanout``) splits users across jobs.
+
+    Attributes:
+        db: Async database session.
+        chunk_size: Rows fetched per round trip and users per yielded list.
+        shard_index: Shard to return, 0-based.
+        shard_count: Total number of shards (1 = all users).
+    """
+
+    DEFAULT_CHUNK_SIZE = 1000
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        shard_index: int = 0,
+        shard_count: int = 1,
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            db: Async database session.
+            chunk_size: Rows fetched per round trip and users per yielded list.
+            shard_index: Shard to return, 0-based.
+            shard_count: Total number of shards (1 = all users).
+        """
+        self.db = db
+        self.chunk_size = chunk_size
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+
+    def _recipient_conditions(
+        self,
+        channels: NotificationChannel | Collection[NotificationChannel],
+        *extra_conditions: ColumnElement[bool],
+    ) -> list[ColumnElement[bool]]:
+        """Channel, shard and caller conditions on preferences/user.
+
+        A user matches if reachable on any of the channels, so one pass
+        serves every channel of a notification.
+        """
+        reachable = or_(*(and_(*channel_conditions(c)) for c in _as_channels(channels)))
+        conditions = [reachable, *extra_conditions]
+        if self.shard_count > 1:
+            conditions.append(
+                shard_condition(NotificationPreferences.user_id, self.shard_index, self.shard_count)
+            )
+        return conditions
+
+    async def delivery_windows(self, slot: str | None = None) -> list[DeliveryWindow]:
+        """Return the delivery windows to process for a scheduling slot.
+
+        Args:
+            slot: Slot ID from the scheduling wheel, or None to notify
+                every user at the server's current time.
+
+        Returns:
+            Windows for the timezones present in this service's shard.
+        """
+        if slot is None:
+            return [unscheduled_window()]
+
+        stmt = select(NotificationPreferences.timezone).distinct()
+        if self.shard_count > 1:
+            stmt = stmt.where(
+                shard_condition(NotificationPreferences.user_id, self.shard_index, self.shard_count)
+            )
+        result = await self.db.execute(stmt)
+        return build_delivery_windows(parse_slot(slot), result.scalars().all())
+
+    async def iter_reminder_recipients(
+        self,
+        channels: NotificationChannel | Collection[NotificationChannel],
+        today: date,
+        *extra_conditions: ColumnElement[bool],
+    ) -> AsyncIterator[list[NotificationRecipient]]:
+        """Yield users with a payment due exactly reminder_days_before from today.
+
+        Subscriptions are joined to preferences on
+        ``next_payment_date = today + reminder_days_before``. The offsets are
+        read first so the per-user target date is a CASE over literal dates,
+        which works the same on PostgreSQL and SQLite.
+
+        Args:
+            channels: Channel(s) the reminders are sent on.
+            today: Reference date.
+            *extra_conditions: Further conditions on the preferences
+                (e.g. window_conditions()).
+
+        Yields:
+            Lists of recipients, each with at least one subscription.
+        """
+        conditions = self._recipient_conditions(
+            channels, NotificationPreferences.reminder_enabled.is_(True), *extra_conditions
+        )
+
+        offsets_result = await self.db.execute(
+            select(NotificationPreferences.reminder_days_before)
+            .join(User, User.id == NotificationPreferences.user_id)
+            .where(*conditions)
+            .distinct()
+        )
+        offsets = [offset for offset in offsets_result.scalars().all() if offset is not None]
+        if not offsets:
+            return
+
+        target_date = case(
+            {offset: today + timedelta(days=offset) for offset in offsets},
+            value=NotificationPreferences.reminder_days_before,
+        )
+        async for recipients in self._iter_recipients(
+            conditions,
+            Subscription.next_payment_date == target_date,
+        ):
+            yield recipients
+
+    async def iter_upcoming_recipients(
+        self,
+        channels: NotificationChannel | Collection[NotificationChannel],
+        start: date,
+        end: date,
+        *extra_conditions: ColumnElement[bool],
+        include_empty: bool = False,
+    ) -> AsyncIterator[list[NotificationRecipient]]:
+        """Yield users with payments due between start and end (inclusive).
+
+        Args:
+            channels: Channel(s) the digests are sent on.
+            start: First payment date to include.
+            end: Last payment date to include.
+            *extra_conditions: Further conditions on the preferences
+                (e.g. ``NotificationPreferences.daily_digest.is_(True)``).
+            include_empty: Also yield users with no payments in the window
+                (outer join), as the weekly digest does.
+
+        Yields:
+            Lists of recipients.
+        """
+        async for recipients in self._iter_recipients(
+            self._recipient_conditions(channels, *extra_conditions),
+            and_(
+                Subscription.next_payment_date >= start,
+                Subscription.next_payment_date <= end,
+            ),
+            include_empty=include_empty,
+        ):
+            yield recipients
+
+    async def iter_overdue_recipients(
+        self,
+        channels: NotificationChannel | Collection[NotificationChannel],
+        today: date,
+        *extra_conditions: ColumnElement[bool],
+    ) -> AsyncIterator[list[NotificationRecipient]]:
+        """Yield users with active subscriptions whose payment date has passed.
+
+        Args:
+            channels: Channel(s) the alerts are sent on.
+            today: Reference date.
+            *extra_conditions: Further conditions on the preferences.
+
+        Yields:
+            Lists of recipients, each with at least one overdue subscription.
+        """
+        async for recipients in self._iter_recipients(
+            self._recipient_conditions(
+                channels, NotificationPreferences.overdue_alerts.is_(True), *extra_conditions
+            ),
+            Subscription.next_payment_date < today,
+        ):
+            yield recipients
+
+    async def _iter_recipients(
+        self,
+        conditions: list[ColumnElement[bool]],
+        subscription_condition: ColumnElement[bool],
+        include_empty: bool = False,
+    ) -> AsyncIterator[list[NotificationRecipient]]:
+        """Run the joined recipient query and group rows per user.
+
+        Rows are ordered by user, so a user's subscriptions are contiguous
+        and a recipient is complete as soon as the next user's row arrives,
+        even across chunk boundaries.
+
+        Args:
+            conditions: Conditions on preferences/user.
+            subscription_condition: Join condition selecting subscriptions.
+            include_empty: Outer join to keep users without subscriptions.
+
+        Yields:
+            Lists of up to chunk_size recipients.
+        """
+        stmt = (
+            select(NotificationPreferences, User.email, User.preferences, Subscription)
+            .join(User, User.id == NotificationPreferences.user_id)
+            .join(
+                Subscription,
+                and_(
+                    Subscription.user_id == NotificationPreferences.user_id,
+                    Subscription.is_active.is_(True),
+                    subscription_condition,
+                ),
+                isouter=include_empty,
+            )
+            .where(*conditions)
+            .order_by(
+                NotificationPreferences.user_id,
+                Subscription.next_payment_date,
+                Subscription.id,
+            )
+            # Subscription.user is selectin-loaded by default and would pull
+            # every user's collections; the recipient already carries the user.
+            .options(lazyload(Subscription.user))
+            .execution_options(yield_per=self.chunk_size)
+        )
+
+        result = await self.db.stream(stmt)
+        batch: list[NotificationRecipient] = []
+        current: NotificationRecipient | None = None
+
+        async for partition in result.partitions():
+            for row in partition:
+                prefs, email, raw_preferences, subscription = row
+                if current is None or current.user_id != prefs.user_id:
+                    if current is not None:
+                        batch.append(current)
+                        if len(batch) >= self.chunk_size:
+                            yield batch
+                            batch = []
+                    current = NotificationRecipient(
+                        preferences=prefs,
+                        email=email,
+                        currency=_preferred_currency(raw_preferences),
+                    )
+                if subscription is not None:
+                    current.subscriptions.append(subscription)
+
+        if current is not None:
+            batch.append(current)
+        if batch:
+            yield batch
@@ -0,0 +1,199 @@
+"""Timezone-aware notification scheduling wheel.
+
+Notifications are delivered at each user's local reminder_time. The day is
+divided into 15-minute UTC slots; a cron entry fires once per slot and, for
+every timezone present, works out which local time window the slot covers.
+Users whose delivery time falls in that window are notified in that slot,
+so load spreads across the day instead of one global spike.
+
+Timezones with the same UTC offset share a window, so a slot needs one
+query per distinct offset rather than per timezone name.
+
+Daylight saving: the slot spanning a spring-forward transition covers
+the skipped local times too (for Europe/London, 00:45-02:00 local), so
+users with a delivery time that does not exist that day are notified at
+the transition. At a fall-back transition the slot spanning it would end
+before it starts in local time; its window is instead cut at the
+transition, so repeated local times are delivered in both occurrences
+(the send ledger drops the repeat).
+
+Example:
+    >>> slot = slot_start(datetime.now(UTC))
+    >>> windows = build_delivery_windows(slot, ["UTC", "Europe/London", "Asia/Tokyo"])
+    >>> [(w.local_date, w.start, w.timezones) for w in windows]
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, timedelta
+from typing import TYPE_CHECKING
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+if TYPE_CHECKING:
+    from src.models.notification import NotificationPreferences
+
+logger = logging.getLogger(__name__)
+
+SLOT_MINUTES = 15
+DEFAULT_TIMEZONE = "UTC"
+
+
+@dataclass(frozen=True)
+class DeliveryWindow:
+    """Local time window one slot covers for a group of timezones.
+
+    An unscheduled window (``timezones is None``) covers every user at the
+    server's current date and time, which is how tasks behave when run
+    outside the wheel.
+
+    Attributes:
+        local_date: Local date in the window's timezones.
+        start: Local window start (inclusive).
+        end: Local window end (exclusive); None when the window runs to midnight.
+        timezones: Timezone names sharing this window, or None for all users.
+    """
+
+    local_date: date
+    start: time
+    end: time | None = None
+    timezones: tuple[str, ...] | None = None
+
+    @property
+    def is_scheduled(self) -> bool:
+        """Whether the window selects users by timezone and delivery time."""
+        return self.timezones is not None
+
+    def suppresses(self, preferences: NotificationPreferences) -> bool:
+        """Whether quiet hours block delivery to a user in this window.
+
+        Scheduled windows already move delivery out of quiet hours in SQL
+        (see notification_query_service.delivery_time), so only
+        unscheduled runs check the server's current time.
+
+        Args:
+            preferences: The user's notification preferences.
+
+        Returns:
+            True if the user must be skipped.
+        """
+        if self.is_scheduled:
+            return False
+        return preferences.is_in_quiet_hours(self.start)
+
+
+def slot_start(moment: datetime) -> datetime:
+    """Floor a moment to the start of its UTC slot.
+
+    Args:
+        moment: Any datetime; naive values are taken as UTC.
+
+    Returns:
+        Aware UTC datetime at a multiple of SLOT_MINUTES.
+    """
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    moment = moment.astimezone(UTC)
+    return moment.replace(
+        minute=moment.minute - moment.minute % SLOT_MINUTES, second=0, microsecond=0
+    )
+
+
+def parse_slot(slot: str) -> datetime:
+    """Parse a slot ID produced by slot_id().
+
+    Args:
+        slot: ISO 8601 slot start.
+
+    Returns:
+        Aware UTC slot start.
+    """
+    return slot_start(datetime.fromisoformat(slot))
+
+
+def slot_id(slot: datetime) -> str:
+    """Return the ISO 8601 ID of a slot, used in job IDs and task arguments."""
+    return slot_start(slot).isoformat(timespec="minutes")
+
+
+def resolve_timezone(name: str | None) -> ZoneInfo:
+    """Return the zone for a timezone name, falling back to UTC if unknown."""
+    try:
+        return ZoneInfo(name or DEFAULT_TIMEZONE)
+    except (ZoneInfoNotFoundError, ValueError):
+        logger.warning(f"Unknown timezone {name!r}, scheduling as UTC")
+        return ZoneInfo(DEFAULT_TIMEZONE)
+
+
+def user_timezone(raw_preferences: str | None) -> str:
+    """Read the timezone from a user's JSON preferences string.
+
+    Args:
+        raw_preferences: User.preferences JSON, possibly None or malformed.
+
+    Returns:
+        Timezone name, DEFAULT_TIMEZONE if missing.
+    """
+    if not raw_preferences:
+        return DEFAULT_TIMEZONE
+    try:
+        preferences = json.loads(raw_preferences)
+    except (json.JSONDecodeError, TypeError):
+        return DEFAULT_TIMEZONE
+    if not isinstance(preferences, dict):
+        return DEFAULT_TIMEZONE
+    return preferences.get("timezone") or DEFAULT_TIMEZONE
+
+
+def build_delivery_windows(slot: datetime, timezones: Iterable[str]) -> list[DeliveryWindow]:
+    """Compute the local windows a UTC slot covers.
+
+    Args:
+        slot: UTC slot start.
+        timezones: Timezone names present among the users.
+
+    Returns:
+        One window per distinct local (date, start) pair, with the
+        timezones that share it. Windows never end before they start
+        (see the module docstring on daylight saving).
+    """
+    slot = slot_start(slot)
+    groups: dict[tuple[date, time, time | None], list[str]] = {}
+
+    for name in sorted(set(timezones)):
+        zone = resolve_timezone(name)
+        local_start = slot.astimezone(zone)
+        local_end = (slot + timedelta(minutes=SLOT_MINUTES)).astimezone(zone)
+
+        start = local_start.time().replace(tzinfo=None)
+        if local_end.replace(tzinfo=None) < local_start.replace(tzinfo=None):
+            # Clocks went back during the slot: cover the wall-clock slot up
+            # to the transition; the repeated times come round again
+            local_end = local_start + timedelta(minutes=SLOT_MINUTES)
+
+        end: time | None = local_end.time().replace(tzinfo=None)
+        if local_end.date() != local_start.date():
+            end = None  # window runs to local midnight
+
+        groups.setdefault((local_start.date(), start, end), []).append(name)
+
+    return [
+        DeliveryWindow(local_date=local_date, start=start, end=end, timezones=tuple(names))
+        for (local_date, start, end), names in groups.items()
+    ]
+
+
+def unscheduled_window(now: datetime | None = None) -> DeliveryWindow:
+    """Window covering every user at the server's current date and time.
+
+    Args:
+        now: Server-local time (defaults to datetime.now()).
+
+    Returns:
+        Unscheduled delivery window.
+    """
+    now = now or datetime.now()
+    return DeliveryWindow(local_date=now.date(), start=now.time())
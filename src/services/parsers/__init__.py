@@ -16,6 +16,7 @@ from src.services.parsers.base import (
     Transaction,
     TransactionType,
     UnsupportedFormatError,
+    fingerprint_transactions,
 )
 from src.services.parsers.csv_parser import CSVStatementParser
 from src.services.parsers.ofx_parser import OFXStatementParser
@@ -34,4 +35,5 @@ __all__ = [
     "Transaction",
     "TransactionType",
     "UnsupportedFormatError",
+    "fingerprint_transactions",
 ]
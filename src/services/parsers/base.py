@@ -8,8 +8,12 @@ This module provides the foundation for all statement parsers:
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import re
 from abc import ABC, abstractmethod
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from decimal import Decimal
@@ -19,6 +23,8 @@ from typing import BinaryIO
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 class TransactionType(str, Enum):
     """Type of transaction."""
@@ -121,6 +127,45 @@ class Transaction:
         """Check if transaction is a credit."""
         return self.transaction_type == TransactionType.CREDIT or self.amount > 0
 
+    @property
+    def fingerprint_key(self) -> str:
+        """Format-independent identity of the transaction.
+
+        Built from the date, the amount to the penny and the description
+        with case and whitespace normalized, so the same transaction
+        exported as PDF, CSV or OFX produces the same key.
+        """
+        amount = self.amount.quantize(Decimal("0.01"))
+        description = _WHITESPACE_RE.sub(" ", self.description).lower()
+        return f"{self.date.isoformat()}|{amount}|{description}"
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dict (inverse of from_dict)."""
+        return {
+            "date": self.date.isoformat(),
+            "amount": str(self.amount),
+            "description": self.description,
+            "transaction_type": self.transaction_type.value,
+            "balance": str(self.balance) if self.balance is not None else None,
+            "reference": self.reference,
+            "category": self.category,
+            "raw_data": json.loads(json.dumps(self.raw_data, default=str)),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Transaction:
+        """Rebuild a transaction serialized with to_dict."""
+        return cls(
+            date=date.fromisoformat(data["date"]),
+            amount=Decimal(data["amount"]),
+            description=data["description"],
+            transaction_type=TransactionType(data["transaction_type"]),
+            balance=Decimal(data["balance"]) if data.get("balance") is not None else None,
+            reference=data.get("reference"),
+            category=data.get("category"),
+            raw_data=data.get("raw_data") or {},
+        )
+
 
 @dataclass
 class StatementData:
@@ -211,6 +256,81 @@ class StatementData:
         keyword_lower = keyword.lower()
         return [t for t in self.transactions if keyword_lower in t.description.lower()]
 
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dict for caching.
+
+        ``raw_text`` is omitted: it is only kept for debugging and can be
+        far larger than the parsed transactions.
+        """
+
+        def _optional(value: date | Decimal | None) -> str | None:
+            if value is None:
+                return None
+            return value.isoformat() if isinstance(value, date) else str(value)
+
+        return {
+            "transactions": [t.to_dict() for t in self.transactions],
+            "bank_name": self.bank_name,
+            "account_number": self.account_number,
+            "currency": self.currency,
+            "statement_date": _optional(self.statement_date),
+            "period_start": _optional(self.period_start),
+            "period_end": _optional(self.period_end),
+            "opening_balance": _optional(self.opening_balance),
+            "closing_balance": _optional(self.closing_balance),
+            "format": self.format.value,
+            "filename": self.filename,
+            "metadata": json.loads(json.dumps(self.metadata, default=str)),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> StatementData:
+        """Rebuild statement data serialized with to_dict."""
+
+        def _date(value: str | None) -> date | None:
+            return date.fromisoformat(value) if value else None
+
+        def _decimal(value: str | None) -> Decimal | None:
+            return Decimal(value) if value is not None else None
+
+        return cls(
+            transactions=[Transaction.from_dict(t) for t in data.get("transactions", [])],
+            bank_name=data.get("bank_name"),
+            account_number=data.get("account_number"),
+            currency=data.get("currency", "GBP"),
+            statement_date=_date(data.get("statement_date")),
+            period_start=_date(data.get("period_start")),
+            period_end=_date(data.get("period_end")),
+            opening_balance=_decimal(data.get("opening_balance")),
+            closing_balance=_decimal(data.get("closing_balance")),
+            format=StatementFormat(data.get("format", StatementFormat.UNKNOWN.value)),
+            filename=data.get("filename"),
+            metadata=data.get("metadata") or {},
+        )
+
+
+def fingerprint_transactions(transactions: list[Transaction]) -> list[str]:
+    """Compute a stable fingerprint for each transaction.
+
+    Identical transactions within one statement (two equal coffees on the
+    same day) are told apart by their occurrence number, so overlapping
+    statements that both contain them yield the same fingerprints.
+
+    Args:
+        transactions: Transactions in statement order
+
+    Returns:
+        SHA-256 hex digests, one per transaction, in the same order
+    """
+    occurrences: Counter[str] = Counter()
+    fingerprints = []
+    for txn in transactions:
+        key = txn.fingerprint_key
+        occurrence = occurrences[key]
+        occurrences[key] += 1
+        fingerprints.append(hashlib.sha256(f"{key}|{occurrence}".encode()).hexdigest())
+    return fingerprints
+
 
 class StatementParser(ABC):
     """Abstract base class for bank statement parsers.
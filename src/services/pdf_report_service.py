@@ -6,11 +6,14 @@ using ReportLab. Reports include summaries, payment lists, and visual charts.
 Supports multi-currency handling with automatic conversion to report currency.
 """
 
+import copy
 import logging
-from datetime import datetime, timedelta
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
 from decimal import Decimal
+from functools import lru_cache
 from io import BytesIO
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from reportlab.graphics.charts.piecharts import Pie
 from reportlab.graphics.shapes import Drawing, Line, Rect, String
@@ -31,6 +34,8 @@ if TYPE_CHECKING:
     from src.models.subscription import Subscription
     from src.schemas.report import ReportConfig
     from src.services.currency_service import CurrencyService
+    from src.services.report_cache import ReportCache
+    from src.services.report_render_pool import ReportRenderPool
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +67,376 @@ CHART_COLORS = [
     colors.HexColor("#6366f1"),  # Indigo
 ]
 
+# Chart drawings kept per process; charts only change when their data does,
+# so repeated reports (and unchanged sections of changed reports) reuse them
+CHART_CACHE_SIZE = 128
+
+
+def _fresh(drawing: Drawing | None) -> Drawing | None:
+    """Shallow copy of a cached drawing for use in one document.
+
+    Platypus stores layout state on the flowable (e.g. ``_postponed``), so
+    each document gets its own Drawing; the chart shapes are shared.
+    """
+    return copy.copy(drawing) if drawing is not None else None
+
+
+@lru_cache(maxsize=CHART_CACHE_SIZE)
+def _pie_chart_drawing(category_data: tuple[tuple[str, Decimal], ...]) -> Drawing | None:
+    """Build the category pie chart for the given data (cached).
+
+    See PDFReportService._build_category_pie_chart().
+    """
+    if not category_data:
+        return None
+
+    # Calculate total for percentages
+    total = sum(amount for _, amount in category_data)
+    if total <= 0:
+        return None
+
+    # Limit to top 8 categories, group rest into "Other"
+    max_slices = 8
+    if len(category_data) > max_slices:
+        top_categories = category_data[: max_slices - 1]
+        other_total = sum(amount for _, amount in category_data[max_slices - 1 :])
+        chart_data = top_categories + (("Other", other_total),)
+    else:
+        chart_data = category_data
+
+    # Create drawing
+    drawing = Drawing(400, 200)
+
+    # Create pie chart
+    pie = Pie()
+    pie.x = 100
+    pie.y = 25
+    pie.width = 150
+    pie.height = 150
+
+    # Set data and labels
+    pie.data = [float(amount) for _, amount in chart_data]
+    pie.labels = [
+        f"{name[:12]} ({float(amount) / float(total) * 100:.0f}%)" for name, amount in chart_data
+    ]
+
+    # Set slice colors
+    for i, _ in enumerate(chart_data):
+        pie.slices[i].fillColor = CHART_COLORS[i % len(CHART_COLORS)]
+        pie.slices[i].strokeColor = colors.white
+        pie.slices[i].strokeWidth = 1
+
+    # Configure label positioning
+    pie.sideLabels = True
+    pie.slices.labelRadius = 1.2
+    pie.slices.fontName = "Helvetica"
+    pie.slices.fontSize = 8
+
+    # Add pie to drawing
+    drawing.add(pie)
+
+    # Add title
+    title = String(200, 185, "Monthly Spending Distribution", fontSize=10, textAnchor="middle")
+    title.fontName = "Helvetica-Bold"
+    drawing.add(title)
+
+    return drawing
+
+
+@lru_cache(maxsize=CHART_CACHE_SIZE)
+def _bar_chart_drawing(
+    data: tuple[tuple[str, Decimal], ...], title: str, currency_symbol: str
+) -> Drawing | None:
+    """Build a horizontal category bar chart for the given data (cached).
+
+    See PDFReportService._build_horizontal_bar_chart().
+    """
+    if not data:
+        return None
+
+    # Calculate dimensions based on number of categories
+    num_categories = len(data)
+    bar_height = 20
+    chart_height = num_categories * (bar_height + 8) + 40
+    drawing_height = chart_height + 50
+    drawing_width = 500
+
+    drawing = Drawing(drawing_width, drawing_height)
+
+    # Add title
+    title_text = String(
+        drawing_width / 2,
+        drawing_height - 15,
+        title,
+        fontSize=11,
+        textAnchor="middle",
+    )
+    title_text.fontName = "Helvetica-Bold"
+    drawing.add(title_text)
+
+    # Find max value for scaling
+    max_value = float(max(amount for _, amount in data))
+    if max_value <= 0:
+        return None
+
+    # Chart area dimensions
+    left_margin = 120  # Space for category labels
+    right_margin = 80  # Space for amount labels
+    chart_width = drawing_width - left_margin - right_margin
+    chart_top = drawing_height - 40
+
+    # Draw bars
+    for i, (category, amount) in enumerate(data):
+        y = chart_top - (i + 1) * (bar_height + 8)
+        bar_width = (float(amount) / max_value) * chart_width
+
+        # Draw bar with gradient effect (main bar + highlight)
+        color = CHART_COLORS[i % len(CHART_COLORS)]
+
+        # Main bar
+        bar = Rect(left_margin, y, bar_width, bar_height)
+        bar.fillColor = color
+        bar.strokeColor = None
+        drawing.add(bar)
+
+        # Highlight effect (lighter bar at top)
+        if bar_width > 4:
+            highlight = Rect(left_margin, y + bar_height - 4, bar_width, 4)
+            highlight.fillColor = colors.Color(
+                min(color.red + 0.15, 1),
+                min(color.green + 0.15, 1),
+                min(color.blue + 0.15, 1),
+            )
+            highlight.strokeColor = None
+            drawing.add(highlight)
+
+        # Category label (left side)
+        cat_label = category[:15] + "..." if len(category) > 15 else category
+        label = String(
+            left_margin - 5,
+            y + bar_height / 2 - 3,
+            cat_label,
+            fontSize=9,
+            textAnchor="end",
+        )
+        label.fontName = "Helvetica"
+        drawing.add(label)
+
+        # Amount label (right side)
+        amount_str = f"{currency_symbol}{float(amount):,.2f}"
+        amount_label = String(
+            left_margin + bar_width + 5,
+            y + bar_height / 2 - 3,
+            amount_str,
+            fontSize=9,
+            textAnchor="start",
+        )
+        amount_label.fontName = "Helvetica-Bold"
+        drawing.add(amount_label)
+
+    # Draw baseline
+    baseline = Line(
+        left_margin,
+        chart_top - num_categories * (bar_height + 8) - 5,
+        left_margin,
+        chart_top + 5,
+    )
+    baseline.strokeColor = colors.HexColor("#cccccc")
+    baseline.strokeWidth = 1
+    drawing.add(baseline)
+
+    return drawing
+
+
+@dataclass(frozen=True)
+class ReportCategory:
+    """Category fields read by the report.
+
+    Attributes:
+        name: Category name.
+        budget_amount: Monthly budget of the category, if set.
+    """
+
+    name: str
+    budget_amount: Decimal | None = None
+
+
+@dataclass(frozen=True)
+class ReportCard:
+    """Payment card fields read by the report.
+
+    Attributes:
+        name: Card display name.
+    """
+
+    name: str
+
+
+@dataclass(frozen=True)
+class ReportPayment:
+    """Payment history fields read by the report.
+
+    Attributes:
+        payment_date: Date of the payment.
+        amount: Amount paid.
+        currency: Currency of the payment.
+        status: Payment status (PaymentStatus or its string value).
+    """
+
+    payment_date: date
+    amount: Decimal
+    currency: str
+    status: Any
+
+
+@dataclass(frozen=True)
+class ReportSubscription:
+    """Detached, picklable copy of the subscription fields read by the report.
+
+    ORM objects are bound to a session and drag their relationship graph
+    along, so reports rendered in a worker process are given these
+    snapshots instead. The attribute names match Subscription, so every
+    report section accepts either.
+    """
+
+    name: str
+    amount: Decimal
+    currency: str
+    frequency: Any
+    is_active: bool
+    next_payment_date: date | None
+    payment_type: Any
+    payment_mode: Any
+    category: str | None
+    category_rel: ReportCategory | None
+    payment_card: ReportCard | None
+    card_id: str | None
+    payment_history: tuple[ReportPayment, ...]
+    total_owed: Decimal | None
+    remaining_balance: Decimal | None
+    creditor: str | None
+    debt_paid_percentage: float | None
+    target_amount: Decimal | None
+    current_saved: Decimal | None
+    recipient: str | None
+    savings_progress_percentage: float | None
+
+    @classmethod
+    def from_subscription(cls, sub: "Subscription") -> "ReportSubscription":
+        """Snapshot a subscription (relationships must already be loaded).
+
+        Args:
+            sub: Subscription to copy.
+
+        Returns:
+            Detached snapshot of the subscription.
+        """
+        category_rel = getattr(sub, "category_rel", None)
+        payment_card = getattr(sub, "payment_card", None)
+        return cls(
+            name=sub.name,
+            amount=sub.amount,
+            currency=sub.currency,
+            frequency=sub.frequency,
+            is_active=sub.is_active,
+            next_payment_date=sub.next_payment_date,
+            payment_type=getattr(sub, "payment_type", None),
+            payment_mode=getattr(sub, "payment_mode", None),
+            category=sub.category,
+            category_rel=(
+                ReportCategory(category_rel.name, category_rel.budget_amount)
+                if category_rel
+                else None
+            ),
+            payment_card=ReportCard(payment_card.name) if payment_card else None,
+            card_id=str(sub.card_id) if getattr(sub, "card_id", None) else None,
+            payment_history=tuple(
+                ReportPayment(p.payment_date, p.amount, p.currency, p.status)
+                for p in getattr(sub, "payment_history", None) or ()
+            ),
+            total_owed=getattr(sub, "total_owed", None),
+            remaining_balance=getattr(sub, "remaining_balance", None),
+            creditor=getattr(sub, "creditor", None),
+            debt_paid_percentage=getattr(sub, "debt_paid_percentage", None),
+            target_amount=getattr(sub, "target_amount", None),
+            current_saved=getattr(sub, "current_saved", None),
+            recipient=getattr(sub, "recipient", None),
+            savings_progress_percentage=getattr(sub, "savings_progress_percentage", None),
+        )
+
+
+UNCATEGORIZED = "Uncategorized"
+
+
+@dataclass
+class ReportLine:
+    """One subscription with its figures in the report currency.
+
+    Attributes:
+        sub: The subscription (ORM object or ReportSubscription).
+        category: Name from the category relationship or the legacy
+            category field, None if uncategorized.
+        converted: Amount converted to the report currency.
+        monthly: Monthly equivalent of the converted amount (0 for one-time).
+    """
+
+    sub: Any
+    category: str | None
+    converted: Decimal
+    monthly: Decimal
+
+    @property
+    def category_name(self) -> str:
+        """Category name for display, "Uncategorized" if none."""
+        return self.category or UNCATEGORIZED
+
+
+@dataclass
+class ReportData:
+    """Report figures aggregated in one pass over the subscriptions.
+
+    Each subscription is converted and reduced to a monthly equivalent
+    once; every section renders from these figures.
+
+    Attributes:
+        today: Report date (UTC) that days until payment are counted from.
+        lines: Every subscription in the report, in input order.
+        active_count: Number of active subscriptions.
+        monthly_total: Monthly spend of active subscriptions.
+        currencies_used: Currencies of active subscriptions.
+        category_monthly: Monthly spend of active subscriptions per category.
+        category_budgets: Budget per category (first one seen).
+        card_monthly: Monthly spend of active subscriptions per card key.
+        card_names: Display name per card key.
+        one_time: One-time payments per category.
+        scheduled: Active subscriptions with a next payment date, paired
+            with the days until it (negative when overdue).
+        payments: Payment history as (subscription name, payment), most
+            recent first.
+        debts: Debt payments with an amount owed.
+        savings: Savings payments with a target amount.
+    """
+
+    today: date
+    lines: list[ReportLine] = field(default_factory=list)
+    active_count: int = 0
+    monthly_total: Decimal = Decimal("0")
+    currencies_used: set[str] = field(default_factory=set)
+    category_monthly: dict[str, Decimal] = field(default_factory=dict)
+    category_budgets: dict[str, Decimal] = field(default_factory=dict)
+    card_monthly: dict[str, Decimal] = field(default_factory=dict)
+    card_names: dict[str, str] = field(default_factory=dict)
+    one_time: dict[str, list[ReportLine]] = field(default_factory=dict)
+    scheduled: list[tuple[ReportLine, int]] = field(default_factory=list)
+    payments: list[tuple[str, Any]] = field(default_factory=list)
+    debts: list[Any] = field(default_factory=list)
+    savings: list[Any] = field(default_factory=list)
+
+    @property
+    def inactive_count(self) -> int:
+        """Number of inactive subscriptions."""
+        return len(self.lines) - self.active_count
+
 
 class PDFReportService:
     """Service for generating PDF reports of subscription/payment data.
@@ -84,6 +459,7 @@ class PDFReportService:
         currency: str = "GBP",
         currency_service: "CurrencyService | None" = None,
         config: "ReportConfig | None" = None,
+        rates: dict[str, Decimal] | None = None,
     ):
         """Initialize PDF report service.
 
@@ -95,6 +471,9 @@ class PDFReportService:
                 amounts are displayed in original currency without conversion.
             config: Optional ReportConfig for advanced customization. If provided,
                 overrides page_size, include_inactive, and currency parameters.
+            rates: Optional exchange rate table ({currency: rate}) to convert
+                with instead of the currency_service cache, as taken by
+                snapshot_rates().
         """
         # If config provided, use its values
         if config:
@@ -116,6 +495,7 @@ class PDFReportService:
 
         self.currency_symbol = CURRENCY_SYMBOLS.get(self.currency, "£")
         self.currency_service = currency_service
+        self.rates = rates
         self._conversion_cache: dict[str, Decimal] = {}  # Cache converted amounts
         self._failed_conversions: set[str] = set()  # Track failed currency conversions
         self.styles = getSampleStyleSheet()
@@ -143,20 +523,18 @@ class PDFReportService:
             rate = self._conversion_cache[cache_key]
             return (amount * rate).quantize(Decimal("0.01"))
 
-        # No currency service = return original
-        if not self.currency_service:
+        # No rates and no currency service = return original
+        if self.rates is None and not self.currency_service:
             return amount
 
         # If we already failed for this currency, don't retry
         if from_currency in self._failed_conversions:
             return amount
 
-        # Try to get rate from service cache (synchronously)
+        # Try to get rate from the given table or the service cache (synchronously)
         try:
-            # The currency service caches rates - we can access them synchronously
-            # if they were pre-fetched during async initialization
-            if self.currency_service._cache and not self.currency_service._cache.is_expired():
-                rates = self.currency_service._cache.rates
+            rates = self.rates if self.rates is not None else self._cached_rates()
+            if rates is not None:
                 from_rate = rates.get(from_currency)
                 to_rate = rates.get(self.currency)
 
@@ -185,11 +563,28 @@ class PDFReportService:
             currency: Original currency code.
             show_original: Whether to show original amount if different from report currency.
 
+        Returns:
+            Formatted amount string.
+        """
+        return self._format_amount(
+            amount, currency, self._convert_amount(amount, currency), show_original
+        )
+
+    def _format_amount(
+        self, amount: Decimal, currency: str, converted: Decimal, show_original: bool = True
+    ) -> str:
+        """Format an already converted amount, see _get_amount_display().
+
+        Args:
+            amount: Original amount.
+            currency: Original currency code.
+            converted: Amount in report currency.
+            show_original: Whether to show original amount if different from report currency.
+
         Returns:
             Formatted amount string.
         """
         original_symbol = CURRENCY_SYMBOLS.get(currency.upper(), currency)
-        converted = self._convert_amount(amount, currency)
 
         # Same currency or no conversion
         if currency.upper() == self.currency or converted == amount:
@@ -201,6 +596,30 @@ class PDFReportService:
 
         return f"{self.currency_symbol}{converted:.2f}"
 
+    def _cached_rates(self) -> dict[str, Decimal] | None:
+        """Rates from the currency service cache, if pre-fetched and fresh."""
+        # The currency service caches rates - we can access them synchronously
+        # if they were pre-fetched during async initialization
+        cache = self.currency_service._cache if self.currency_service else None
+        if cache and not cache.is_expired():
+            return cache.rates
+        return None
+
+    def snapshot_rates(self) -> dict[str, Decimal] | None:
+        """Copy the rate table used for conversions, for rendering elsewhere.
+
+        Returns:
+            Rates to pass as ``rates`` to another PDFReportService: None when
+            there is nothing to convert with, or an empty table when the
+            currency service has no fresh rates (so conversions are reported
+            as unavailable).
+        """
+        if self.rates is not None:
+            return dict(self.rates)
+        if not self.currency_service:
+            return None
+        return dict(self._cached_rates() or {})
+
     async def _prefetch_rates(self) -> None:
         """Pre-fetch exchange rates to populate cache for synchronous access."""
         if self.currency_service:
@@ -272,22 +691,57 @@ class PDFReportService:
         subscriptions: list["Subscription"],
         user_email: str | None = None,
         report_title: str = "Money Flow Report",
+        pool: "ReportRenderPool | None" = None,
+        cache: "ReportCache | None" = None,
     ) -> bytes:
         """Generate a PDF report asynchronously (with currency conversion).
 
+        Rates are pre-fetched on the event loop; layout and drawing run in
+        the report render pool so a large report does not block the loop.
+        Rendered reports are cached, so an identical request (same data,
+        options and rates on the same day) is served without re-rendering.
+
         Args:
             subscriptions: List of Subscription objects to include in report.
             user_email: Optional user email for personalization.
             report_title: Title for the report.
+            pool: Render pool to use (defaults to the shared pool).
+            cache: Report cache to use (defaults to the shared cache, if
+                report caching is enabled).
 
         Returns:
             PDF file as bytes.
+
+        Raises:
+            ReportRenderError: If the render queue is full or the report
+                exceeds its time budget.
         """
+        from src.services.report_cache import get_report_cache
+        from src.services.report_render_pool import RenderJob, get_report_render_pool
+
         # Pre-fetch exchange rates for currency conversion
         await self._prefetch_rates()
 
-        # Delegate to synchronous method
-        return self.generate_report(subscriptions, user_email, report_title)
+        job = RenderJob(
+            subscriptions=tuple(ReportSubscription.from_subscription(s) for s in subscriptions),
+            user_email=user_email,
+            report_title=report_title,
+            page_size=self.page_size,
+            include_inactive=self.include_inactive,
+            currency=self.currency,
+            config=self.config,
+            rates=self.snapshot_rates(),
+        )
+
+        cache = cache or get_report_cache()
+        key = job.cache_key() if cache else ""
+        if cache and (cached := await cache.get(key)) is not None:
+            return cached
+
+        pdf_bytes = await (pool or get_report_render_pool()).render(job)
+        if cache:
+            await cache.put(key, pdf_bytes)
+        return pdf_bytes
 
     def generate_report(
         self,
@@ -323,6 +777,9 @@ class PDFReportService:
         if not self.include_inactive:
             subscriptions = [s for s in subscriptions if s.is_active]
 
+        # Compute all section figures in one pass
+        data = self._aggregate(subscriptions)
+
         # Build document elements
         elements = []
 
@@ -361,47 +818,47 @@ class PDFReportService:
 
         # Summary section
         if include_summary:
-            elements.extend(self._build_summary(subscriptions))
+            elements.extend(self._build_summary(data))
 
         # Payment breakdown by category (with optional pie chart)
         if include_category:
-            elements.extend(self._build_category_breakdown(subscriptions, include_charts))
+            elements.extend(self._build_category_breakdown(data, include_charts))
 
         # One-time payments section (separate from recurring)
         if include_one_time:
-            elements.extend(self._build_one_time_payments_section(subscriptions))
+            elements.extend(self._build_one_time_payments_section(data))
 
         # Spending bar charts (current month and year-to-date)
         if include_charts:
-            elements.extend(self._build_spending_bar_charts(subscriptions))
+            elements.extend(self._build_spending_bar_charts(data))
 
         # Payment breakdown by card
         if include_card:
-            elements.extend(self._build_card_breakdown(subscriptions))
+            elements.extend(self._build_card_breakdown(data))
 
         # Upcoming payments
         if include_upcoming:
-            elements.extend(self._build_upcoming_payments(subscriptions))
+            elements.extend(self._build_upcoming_payments(data))
 
         # Payment history (recent transactions)
         if include_history:
-            elements.extend(self._build_payment_history(subscriptions, self.history_days))
+            elements.extend(self._build_payment_history(data, self.history_days))
 
         # Debt progress section
         if include_debt:
-            elements.extend(self._build_debt_progress(subscriptions))
+            elements.extend(self._build_debt_progress(data))
 
         # Savings goals section
         if include_savings:
-            elements.extend(self._build_savings_progress(subscriptions))
+            elements.extend(self._build_savings_progress(data))
 
         # Budget status section
         if include_budget:
-            elements.extend(self._build_budget_status(subscriptions))
+            elements.extend(self._build_budget_status(data))
 
         # All payments table
         if include_all_payments:
-            elements.extend(self._build_payments_table(subscriptions))
+            elements.extend(self._build_payments_table(data))
 
         # Footer with currency note
         elements.extend(self._build_footer())
@@ -411,6 +868,69 @@ class PDFReportService:
         buffer.seek(0)
         return buffer.getvalue()
 
+    def _aggregate(self, subscriptions: list["Subscription"]) -> ReportData:
+        """Compute the figures of all report sections in one pass.
+
+        Args:
+            subscriptions: Subscriptions in the report.
+
+        Returns:
+            Aggregated report data.
+        """
+        from src.models.subscription import PaymentMode, PaymentType
+
+        data = ReportData(today=datetime.utcnow().date())
+
+        for sub in subscriptions:
+            category_rel = getattr(sub, "category_rel", None)
+            category = category_rel.name if category_rel else sub.category or None
+            payment_mode = getattr(sub, "payment_mode", None)
+
+            converted = self._convert_amount(sub.amount, sub.currency)
+            monthly = self._to_monthly(
+                converted, sub.frequency.value, payment_mode.value if payment_mode else None
+            )
+            line = ReportLine(sub, category, converted, monthly)
+            data.lines.append(line)
+
+            if payment_mode == PaymentMode.ONE_TIME:
+                data.one_time.setdefault(line.category_name, []).append(line)
+            payment_type = getattr(sub, "payment_type", None)
+            if payment_mode == PaymentMode.DEBT or payment_type == PaymentType.DEBT:
+                if sub.total_owed and sub.total_owed > 0:
+                    data.debts.append(sub)
+            if payment_mode == PaymentMode.SAVINGS or payment_type == PaymentType.SAVINGS:
+                if sub.target_amount and sub.target_amount > 0:
+                    data.savings.append(sub)
+            for payment in getattr(sub, "payment_history", None) or ():
+                data.payments.append((sub.name, payment))
+
+            if not sub.is_active:
+                continue
+
+            data.active_count += 1
+            data.monthly_total += monthly
+            data.currencies_used.add(sub.currency.upper())
+
+            name = line.category_name
+            data.category_monthly[name] = data.category_monthly.get(name, Decimal("0")) + monthly
+            if category_rel and category_rel.budget_amount:
+                data.category_budgets.setdefault(name, category_rel.budget_amount)
+
+            if getattr(sub, "payment_card", None):
+                card_key = str(sub.card_id)
+                data.card_names[card_key] = sub.payment_card.name
+            else:
+                card_key = "unassigned"
+                data.card_names[card_key] = "Unassigned"
+            data.card_monthly[card_key] = data.card_monthly.get(card_key, Decimal("0")) + monthly
+
+            if sub.next_payment_date:
+                data.scheduled.append((line, (sub.next_payment_date - data.today).days))
+
+        data.payments.sort(key=lambda x: x[1].payment_date, reverse=True)
+        return data
+
     def _build_header(self, title: str, user_email: str | None) -> list[Paragraph | Spacer]:
         """Build report header section.
 
@@ -436,15 +956,13 @@ class PDFReportService:
 
         return elements
 
-    def _build_summary(
-        self, subscriptions: list["Subscription"]
-    ) -> list[Paragraph | Spacer | Table]:
+    def _build_summary(self, data: ReportData) -> list[Paragraph | Spacer | Table]:
         """Build summary statistics section.
 
         All amounts are converted to the report currency for accurate totals.
 
         Args:
-            subscriptions: List of subscriptions.
+            data: Aggregated report data.
 
         Returns:
             List of flowable elements.
@@ -452,40 +970,16 @@ class PDFReportService:
         elements: list[Paragraph | Spacer | Table] = []
         elements.append(Paragraph("Summary", self.styles["SectionHeader"]))
 
-        # Calculate totals - convert each amount to report currency first
-        active_count = sum(1 for s in subscriptions if s.is_active)
-        inactive_count = len(subscriptions) - active_count
-
-        monthly_total = Decimal("0")
-        yearly_total = Decimal("0")
-        currencies_used: set[str] = set()
-
-        for sub in subscriptions:
-            if not sub.is_active:
-                continue
-            # Convert amount to report currency before calculating monthly
-            converted_amount = self._convert_amount(sub.amount, sub.currency)
-            # Pass payment_mode to properly handle one-time payments
-            payment_mode = (
-                sub.payment_mode.value
-                if hasattr(sub, "payment_mode") and sub.payment_mode
-                else None
-            )
-            monthly = self._to_monthly(converted_amount, sub.frequency.value, payment_mode)
-            monthly_total += monthly
-            yearly_total += monthly * 12
-            currencies_used.add(sub.currency.upper())
-
-        # Summary table
+        # Summary table (amounts already converted to report currency)
         summary_data = [
-            ["Active Payments", str(active_count)],
-            ["Inactive Payments", str(inactive_count)],
-            ["Monthly Total", f"{self.currency_symbol}{monthly_total:.2f}"],
-            ["Yearly Total", f"{self.currency_symbol}{yearly_total:.2f}"],
+            ["Active Payments", str(data.active_count)],
+            ["Inactive Payments", str(data.inactive_count)],
+            ["Monthly Total", f"{self.currency_symbol}{data.monthly_total:.2f}"],
+            ["Yearly Total", f"{self.currency_symbol}{data.monthly_total * 12:.2f}"],
         ]
 
         # Add note if multiple currencies were converted
-        other_currencies = currencies_used - {self.currency}
+        other_currencies = data.currencies_used - {self.currency}
         if other_currencies:
             summary_data.append(["Currencies Converted", ", ".join(sorted(other_currencies))])
 
@@ -514,14 +1008,14 @@ class PDFReportService:
         return elements
 
     def _build_category_breakdown(
-        self, subscriptions: list["Subscription"], include_chart: bool = False
+        self, data: ReportData, include_chart: bool = False
     ) -> list[Paragraph | Spacer | Table | Drawing]:
         """Build spending breakdown by category with optional pie chart.
 
         All amounts are converted to report currency before summing.
 
         Args:
-            subscriptions: List of subscriptions.
+            data: Aggregated report data.
             include_chart: Whether to include a pie chart visualization.
 
         Returns:
@@ -530,30 +1024,8 @@ class PDFReportService:
         elements: list[Paragraph | Spacer | Table | Drawing] = []
         elements.append(Paragraph("Spending by Category", self.styles["SectionHeader"]))
 
-        # Group by category - convert amounts to report currency
-        category_totals: dict[str, Decimal] = {}
-        for sub in subscriptions:
-            if not sub.is_active:
-                continue
-            # Use category name from relationship, or string category, or "Uncategorized"
-            cat_name = "Uncategorized"
-            if hasattr(sub, "category_rel") and sub.category_rel:
-                cat_name = sub.category_rel.name
-            elif sub.category:
-                cat_name = sub.category
-            # Convert to report currency before calculating monthly
-            converted_amount = self._convert_amount(sub.amount, sub.currency)
-            # Pass payment_mode to properly handle one-time payments
-            payment_mode = (
-                sub.payment_mode.value
-                if hasattr(sub, "payment_mode") and sub.payment_mode
-                else None
-            )
-            monthly = self._to_monthly(converted_amount, sub.frequency.value, payment_mode)
-            category_totals[cat_name] = category_totals.get(cat_name, Decimal("0")) + monthly
-
         # Filter out categories with zero monthly spend (only one-time payments)
-        category_totals = {k: v for k, v in category_totals.items() if v > 0}
+        category_totals = {k: v for k, v in data.category_monthly.items() if v > 0}
 
         if not category_totals:
             elements.append(Paragraph("No active payments.", self.styles["ReportBody"]))
@@ -622,7 +1094,7 @@ class PDFReportService:
         return elements
 
     def _build_one_time_payments_section(
-        self, subscriptions: list["Subscription"]
+        self, data: ReportData
     ) -> list[Paragraph | Spacer | Table]:
         """Build a section showing one-time payments.
 
@@ -630,23 +1102,14 @@ class PDFReportService:
         significant expenses that should be visible in the report.
 
         Args:
-            subscriptions: List of subscriptions.
+            data: Aggregated report data.
 
         Returns:
             List of flowable elements.
         """
-        from src.models.subscription import PaymentMode
-
         elements: list[Paragraph | Spacer | Table] = []
 
-        # Filter for one-time payments only
-        one_time_payments = [
-            s
-            for s in subscriptions
-            if hasattr(s, "payment_mode") and s.payment_mode == PaymentMode.ONE_TIME
-        ]
-
-        if not one_time_payments:
+        if not data.one_time:
             return elements  # No one-time payments, skip section
 
         elements.append(Paragraph("One-Time Payments", self.styles["SectionHeader"]))
@@ -658,28 +1121,22 @@ class PDFReportService:
         )
         elements.append(Spacer(1, 10))
 
-        # Group by category
-        category_totals: dict[str, list[tuple[str, Decimal, str, bool]]] = {}
-        grand_total = Decimal("0")
-
-        for sub in one_time_payments:
-            cat_name = "Uncategorized"
-            if hasattr(sub, "category_rel") and sub.category_rel:
-                cat_name = sub.category_rel.name
-            elif sub.category:
-                cat_name = sub.category
-
-            converted_amount = self._convert_amount(sub.amount, sub.currency)
-            grand_total += converted_amount
-
-            if cat_name not in category_totals:
-                category_totals[cat_name] = []
-
-            # Store: (name, amount, status_label, is_paid)
-            status = "Paid" if not sub.is_active else "Pending"
-            category_totals[cat_name].append(
-                (sub.name, converted_amount, status, not sub.is_active)
-            )
+        # Group by category: (name, amount, status_label, is_paid)
+        category_totals: dict[str, list[tuple[str, Decimal, str, bool]]] = {
+            cat_name: [
+                (
+                    line.sub.name,
+                    line.converted,
+                    "Paid" if not line.sub.is_active else "Pending",
+                    not line.sub.is_active,
+                )
+                for line in lines
+            ]
+            for cat_name, lines in data.one_time.items()
+        }
+        grand_total = sum(
+            (line.converted for lines in data.one_time.values() for line in lines), Decimal("0")
+        )
 
         # Build table
         table_data = [["Payment", "Amount", "Status"]]
@@ -759,65 +1216,9 @@ class PDFReportService:
         Returns:
             Drawing containing the pie chart, or None if no data.
         """
-        if not category_data:
-            return None
-
-        # Calculate total for percentages
-        total = sum(amount for _, amount in category_data)
-        if total <= 0:
-            return None
-
-        # Limit to top 8 categories, group rest into "Other"
-        max_slices = 8
-        if len(category_data) > max_slices:
-            top_categories = category_data[: max_slices - 1]
-            other_total = sum(amount for _, amount in category_data[max_slices - 1 :])
-            chart_data = top_categories + [("Other", other_total)]
-        else:
-            chart_data = category_data
-
-        # Create drawing
-        drawing = Drawing(400, 200)
-
-        # Create pie chart
-        pie = Pie()
-        pie.x = 100
-        pie.y = 25
-        pie.width = 150
-        pie.height = 150
-
-        # Set data and labels
-        pie.data = [float(amount) for _, amount in chart_data]
-        pie.labels = [
-            f"{name[:12]} ({float(amount) / float(total) * 100:.0f}%)"
-            for name, amount in chart_data
-        ]
-
-        # Set slice colors
-        for i, _ in enumerate(chart_data):
-            pie.slices[i].fillColor = CHART_COLORS[i % len(CHART_COLORS)]
-            pie.slices[i].strokeColor = colors.white
-            pie.slices[i].strokeWidth = 1
-
-        # Configure label positioning
-        pie.sideLabels = True
-        pie.slices.labelRadius = 1.2
-        pie.slices.fontName = "Helvetica"
-        pie.slices.fontSize = 8
-
-        # Add pie to drawing
-        drawing.add(pie)
-
-        # Add title
-        title = String(200, 185, "Monthly Spending Distribution", fontSize=10, textAnchor="middle")
-        title.fontName = "Helvetica-Bold"
-        drawing.add(title)
-
-        return drawing
+        return _fresh(_pie_chart_drawing(tuple(category_data)))
 
-    def _build_spending_bar_charts(
-        self, subscriptions: list["Subscription"]
-    ) -> list[Paragraph | Spacer | Drawing]:
+    def _build_spending_bar_charts(self, data: ReportData) -> list[Paragraph | Spacer | Drawing]:
         """Build bar charts showing spending by category for current month and YTD.
 
         Creates two horizontal bar charts:
@@ -825,7 +1226,7 @@ class PDFReportService:
         2. Year-to-date spending by category
 
         Args:
-            subscriptions: List of subscriptions.
+            data: Aggregated report data.
 
         Returns:
             List of flowable elements including the bar charts.
@@ -833,30 +1234,8 @@ class PDFReportService:
         elements: list[Paragraph | Spacer | Drawing] = []
         elements.append(Paragraph("Spending Analysis", self.styles["SectionHeader"]))
 
-        # Calculate spending by category
-        category_monthly: dict[str, Decimal] = {}
-        for sub in subscriptions:
-            if not sub.is_active:
-                continue
-            # Get category name
-            cat_name = "Uncategorized"
-            if hasattr(sub, "category_rel") and sub.category_rel:
-                cat_name = sub.category_rel.name
-            elif sub.category:
-                cat_name = sub.category
-
-            # Convert to report currency
-            converted_amount = self._convert_amount(sub.amount, sub.currency)
-            payment_mode = (
-                sub.payment_mode.value
-                if hasattr(sub, "payment_mode") and sub.payment_mode
-                else None
-            )
-            monthly = self._to_monthly(converted_amount, sub.frequency.value, payment_mode)
-            category_monthly[cat_name] = category_monthly.get(cat_name, Decimal("0")) + monthly
-
         # Filter out zero values
-        category_monthly = {k: v for k, v in category_monthly.items() if v > 0}
+        category_monthly = {k: v for k, v in data.category_monthly.items() if v > 0}
 
         if not category_monthly:
             elements.append(
@@ -914,112 +1293,16 @@ class PDFReportService:
         Returns:
             Drawing containing the bar chart, or None if no data.
         """
-        if not data:
-            return None
-
-        # Calculate dimensions based on number of categories
-        num_categories = len(data)
-        bar_height = 20
-        chart_height = num_categories * (bar_height + 8) + 40
-        drawing_height = chart_height + 50
-        drawing_width = 500
-
-        drawing = Drawing(drawing_width, drawing_height)
-
-        # Add title
-        title_text = String(
-            drawing_width / 2,
-            drawing_height - 15,
-            title,
-            fontSize=11,
-            textAnchor="middle",
-        )
-        title_text.fontName = "Helvetica-Bold"
-        drawing.add(title_text)
+        return _fresh(_bar_chart_drawing(tuple(data), title, currency_symbol))
 
-        # Find max value for scaling
-        max_value = float(max(amount for _, amount in data))
-        if max_value <= 0:
-            return None
-
-        # Chart area dimensions
-        left_margin = 120  # Space for category labels
-        right_margin = 80  # Space for amount labels
-        chart_width = drawing_width - left_margin - right_margin
-        chart_top = drawing_height - 40
-
-        # Draw bars
-        for i, (category, amount) in enumerate(data):
-            y = chart_top - (i + 1) * (bar_height + 8)
-            bar_width = (float(amount) / max_value) * chart_width
-
-            # Draw bar with gradient effect (main bar + highlight)
-            color = CHART_COLORS[i % len(CHART_COLORS)]
-
-            # Main bar
-            bar = Rect(left_margin, y, bar_width, bar_height)
-            bar.fillColor = color
-            bar.strokeColor = None
-            drawing.add(bar)
-
-            # Highlight effect (lighter bar at top)
-            if bar_width > 4:
-                highlight = Rect(left_margin, y + bar_height - 4, bar_width, 4)
-                highlight.fillColor = colors.Color(
-                    min(color.red + 0.15, 1),
-                    min(color.green + 0.15, 1),
-                    min(color.blue + 0.15, 1),
-                )
-                highlight.strokeColor = None
-                drawing.add(highlight)
-
-            # Category label (left side)
-            cat_label = category[:15] + "..." if len(category) > 15 else category
-            label = String(
-                left_margin - 5,
-                y + bar_height / 2 - 3,
-                cat_label,
-                fontSize=9,
-                textAnchor="end",
-            )
-            label.fontName = "Helvetica"
-            drawing.add(label)
-
-            # Amount label (right side)
-            amount_str = f"{currency_symbol}{float(amount):,.2f}"
-            amount_label = String(
-                left_margin + bar_width + 5,
-                y + bar_height / 2 - 3,
-                amount_str,
-                fontSize=9,
-                textAnchor="start",
-            )
-            amount_label.fontName = "Helvetica-Bold"
-            drawing.add(amount_label)
-
-        # Draw baseline
-        baseline = Line(
-            left_margin,
-            chart_top - num_categories * (bar_height + 8) - 5,
-            left_margin,
-            chart_top + 5,
-        )
-        baseline.strokeColor = colors.HexColor("#cccccc")
-        baseline.strokeWidth = 1
-        drawing.add(baseline)
-
-        return drawing
-
-    def _build_card_breakdown(
-        self, subscriptions: list["Subscription"]
-    ) -> list[Paragraph | Spacer | Table]:
+    def _build_card_breakdown(self, data: ReportData) -> list[Paragraph | Spacer | Table]:
         """Build spending breakdown by payment card.
 
         Groups payments by their assigned payment card and shows
         monthly and yearly totals for each card.
 
         Args:
-            subscriptions: List of subscriptions.
+            data: Aggregated report data.
 
         Returns:
             List of flowable elements.
@@ -1027,32 +1310,8 @@ class PDFReportService:
         elements: list[Paragraph | Spacer | Table] = []
         elements.append(Paragraph("Spending by Payment Card", self.styles["SectionHeader"]))
 
-        # Group by card - convert amounts to report currency
-        card_totals: dict[str, Decimal] = {}
-        card_names: dict[str, str] = {}  # Map card_id to display name
-
-        for sub in subscriptions:
-            if not sub.is_active:
-                continue
-
-            # Get card name or use "Unassigned"
-            if hasattr(sub, "payment_card") and sub.payment_card:
-                card_key = str(sub.card_id)
-                card_names[card_key] = sub.payment_card.name
-            else:
-                card_key = "unassigned"
-                card_names[card_key] = "Unassigned"
-
-            # Convert to report currency before calculating monthly
-            converted_amount = self._convert_amount(sub.amount, sub.currency)
-            # Pass payment_mode to properly handle one-time payments
-            payment_mode = (
-                sub.payment_mode.value
-                if hasattr(sub, "payment_mode") and sub.payment_mode
-                else None
-            )
-            monthly = self._to_monthly(converted_amount, sub.frequency.value, payment_mode)
-            card_totals[card_key] = card_totals.get(card_key, Decimal("0")) + monthly
+        card_totals = data.card_monthly
+        card_names = data.card_names
 
         if not card_totals:
             elements.append(Paragraph("No active payments.", self.styles["ReportBody"]))
@@ -1113,16 +1372,14 @@ class PDFReportService:
 
         return elements
 
-    def _build_upcoming_payments(
-        self, subscriptions: list["Subscription"]
-    ) -> list[Paragraph | Spacer | Table]:
+    def _build_upcoming_payments(self, data: ReportData) -> list[Paragraph | Spacer | Table]:
         """Build upcoming payments section with overdue detection.
 
         Shows amounts converted to report currency with original amount in parentheses
         when currencies differ. Overdue payments are highlighted in red.
 
         Args:
-            subscriptions: List of subscriptions.
+            data: Aggregated report data.
 
         Returns:
             List of flowable elements.
@@ -1136,21 +1393,9 @@ class PDFReportService:
             )
         )
 
-        # Filter to active with payment dates
-        today = datetime.utcnow().date()
-        upcoming = []
-        overdue = []
-
-        for sub in subscriptions:
-            if not sub.is_active or not sub.next_payment_date:
-                continue
-            days_until = (sub.next_payment_date - today).days
-            if days_until < 0:
-                # Overdue payment
-                overdue.append((sub, days_until))
-            elif days_until <= date_range:
-                # Upcoming payment within date range
-                upcoming.append((sub, days_until))
+        # Split active payments with dates into overdue and upcoming in range
+        overdue = [(line, days) for line, days in data.scheduled if days < 0]
+        upcoming = [(line, days) for line, days in data.scheduled if 0 <= days <= date_range]
 
         if not upcoming and not overdue:
             elements.append(
@@ -1173,10 +1418,10 @@ class PDFReportService:
         table_data = [["Payment", "Date", "Amount", "Status"]]
         row_styles = []
 
-        for i, (sub, days) in enumerate(all_payments[:15]):  # Limit to 15 for space
+        for i, (line, days) in enumerate(all_payments[:15]):  # Limit to 15 for space
+            sub = line.sub
             date_str = sub.next_payment_date.strftime("%b %d, %Y") if sub.next_payment_date else ""
-            # Use _get_amount_display for proper formatting with conversion
-            amount_str = self._get_amount_display(sub.amount, sub.currency)
+            amount_str = self._format_amount(sub.amount, sub.currency, line.converted)
 
             # Determine status with color-coded urgency levels
             if days < 0:
@@ -1270,7 +1515,7 @@ class PDFReportService:
         return elements
 
     def _build_payment_history(
-        self, subscriptions: list["Subscription"], history_days: int = 30
+        self, data: ReportData, history_days: int = 30
     ) -> list[Paragraph | Spacer | Table]:
         """Build recent payment history section.
 
@@ -1278,7 +1523,7 @@ class PDFReportService:
         sorted by most recent first.
 
         Args:
-            subscriptions: List of subscriptions with payment_history loaded.
+            data: Aggregated report data (payment_history must be loaded).
             history_days: Number of days of history to show (default 30).
 
         Returns:
@@ -1289,19 +1534,9 @@ class PDFReportService:
             Paragraph(f"Recent Payments (Last {history_days} Days)", self.styles["SectionHeader"])
         )
 
-        # Collect all payment history from subscriptions
-        today = datetime.utcnow().date()
-        cutoff_date = today - timedelta(days=history_days)
-        all_payments = []
-
-        for sub in subscriptions:
-            # Check if subscription has payment_history loaded
-            if not hasattr(sub, "payment_history") or not sub.payment_history:
-                continue
-
-            for payment in sub.payment_history:
-                if payment.payment_date >= cutoff_date:
-                    all_payments.append((sub.name, payment))
+        # Payment history within the window, most recent first
+        cutoff_date = data.today - timedelta(days=history_days)
+        all_payments = [(name, p) for name, p in data.payments if p.payment_date >= cutoff_date]
 
         if not all_payments:
             elements.append(
@@ -1313,9 +1548,6 @@ class PDFReportService:
             elements.append(Spacer(1, 10))
             return elements
 
-        # Sort by payment date, most recent first
-        all_payments.sort(key=lambda x: x[1].payment_date, reverse=True)
-
         # Build table
         table_data = [["Date", "Payment", "Amount", "Status"]]
 
@@ -1420,31 +1652,22 @@ class PDFReportService:
 
         return elements
 
-    def _build_debt_progress(
-        self, subscriptions: list["Subscription"]
-    ) -> list[Paragraph | Spacer | Table]:
+    def _build_debt_progress(self, data: ReportData) -> list[Paragraph | Spacer | Table]:
         """Build debt progress tracking section.
 
         Shows all debt-type payments with total owed, remaining balance,
         paid amount, and progress percentage with visual progress bar.
 
         Args:
-            subscriptions: List of subscriptions.
+            data: Aggregated report data.
 
         Returns:
             List of flowable elements.
         """
-        from src.models.subscription import PaymentMode, PaymentType
-
         elements: list[Paragraph | Spacer | Table] = []
         elements.append(Paragraph("Debt Tracker", self.styles["SectionHeader"]))
 
-        # Filter to debt payments only
-        debts = []
-        for sub in subscriptions:
-            is_debt = sub.payment_mode == PaymentMode.DEBT or sub.payment_type == PaymentType.DEBT
-            if is_debt and sub.total_owed and sub.total_owed > 0:
-                debts.append(sub)
+        debts = data.debts
 
         if not debts:
             elements.append(Paragraph("No debt payments found.", self.styles["ReportBody"]))
@@ -1532,33 +1755,22 @@ class PDFReportService:
 
         return elements
 
-    def _build_savings_progress(
-        self, subscriptions: list["Subscription"]
-    ) -> list[Paragraph | Spacer | Table]:
+    def _build_savings_progress(self, data: ReportData) -> list[Paragraph | Spacer | Table]:
         """Build savings goals progress section.
 
         Shows all savings-type payments with target amount, current saved,
         remaining to save, and progress percentage with visual progress bar.
 
         Args:
-            subscriptions: List of subscriptions.
+            data: Aggregated report data.
 
         Returns:
             List of flowable elements.
         """
-        from src.models.subscription import PaymentMode, PaymentType
-
         elements: list[Paragraph | Spacer | Table] = []
         elements.append(Paragraph("Savings Goals", self.styles["SectionHeader"]))
 
-        # Filter to savings payments only
-        savings = []
-        for sub in subscriptions:
-            is_savings = (
-                sub.payment_mode == PaymentMode.SAVINGS or sub.payment_type == PaymentType.SAVINGS
-            )
-            if is_savings and sub.target_amount and sub.target_amount > 0:
-                savings.append(sub)
+        savings = data.savings
 
         if not savings:
             elements.append(Paragraph("No savings goals found.", self.styles["ReportBody"]))
@@ -1646,16 +1858,14 @@ class PDFReportService:
 
         return elements
 
-    def _build_budget_status(
-        self, subscriptions: list["Subscription"]
-    ) -> list[Paragraph | Spacer | Table]:
+    def _build_budget_status(self, data: ReportData) -> list[Paragraph | Spacer | Table]:
         """Build budget status section by category.
 
         Shows spending vs budget for each category that has a budget set,
         with visual indicators for on-track/over-budget status.
 
         Args:
-            subscriptions: List of subscriptions.
+            data: Aggregated report data.
 
         Returns:
             List of flowable elements.
@@ -1663,39 +1873,8 @@ class PDFReportService:
         elements: list[Paragraph | Spacer | Table] = []
         elements.append(Paragraph("Budget Status", self.styles["SectionHeader"]))
 
-        # Group spending by category and check budgets
-        category_spending: dict[str, Decimal] = {}
-        category_budgets: dict[str, Decimal] = {}
-
-        for sub in subscriptions:
-            if not sub.is_active:
-                continue
-
-            # Get category info
-            cat_name = "Uncategorized"
-            cat_budget = None
-
-            if hasattr(sub, "category_rel") and sub.category_rel:
-                cat_name = sub.category_rel.name
-                if sub.category_rel.budget_amount:
-                    cat_budget = sub.category_rel.budget_amount
-            elif sub.category:
-                cat_name = sub.category
-
-            # Convert and sum spending
-            converted = self._convert_amount(sub.amount, sub.currency)
-            # Pass payment_mode to properly handle one-time payments
-            payment_mode = (
-                sub.payment_mode.value
-                if hasattr(sub, "payment_mode") and sub.payment_mode
-                else None
-            )
-            monthly = self._to_monthly(converted, sub.frequency.value, payment_mode)
-            category_spending[cat_name] = category_spending.get(cat_name, Decimal("0")) + monthly
-
-            # Store budget if available
-            if cat_budget and cat_name not in category_budgets:
-                category_budgets[cat_name] = cat_budget
+        category_spending = data.category_monthly
+        category_budgets = data.category_budgets
 
         # Filter to categories with budgets
         budgeted_categories = {k: v for k, v in category_spending.items() if k in category_budgets}
@@ -1775,7 +1954,9 @@ class PDFReportService:
 
         # Summary
         over_count = sum(
-            1 for s, b in zip(category_spending.values(), category_budgets.values()) if s > b
+            1
+            for cat_name, spent in budgeted_categories.items()
+            if spent > category_budgets[cat_name]
         )
         if over_count > 0:
             elements.append(Spacer(1, 6))
@@ -1791,7 +1972,7 @@ class PDFReportService:
         return elements
 
     def _build_payments_table(
-        self, subscriptions: list["Subscription"]
+        self, data: ReportData
     ) -> list[Paragraph | Spacer | Table | PageBreak]:
         """Build full payments table with currency column.
 
@@ -1799,7 +1980,7 @@ class PDFReportService:
         when different from the report currency.
 
         Args:
-            subscriptions: List of subscriptions.
+            data: Aggregated report data.
 
         Returns:
             List of flowable elements.
@@ -1808,29 +1989,23 @@ class PDFReportService:
         elements.append(PageBreak())
         elements.append(Paragraph("All Payments", self.styles["SectionHeader"]))
 
-        if not subscriptions:
+        if not data.lines:
             elements.append(Paragraph("No payments found.", self.styles["ReportBody"]))
             return elements
 
-        # Sort by category then name
-        def get_category_name(s: "Subscription") -> str:
-            if hasattr(s, "category_rel") and s.category_rel:
-                return s.category_rel.name
-            elif s.category:
-                return s.category
-            return "ZZZ"
-
-        sorted_subs = sorted(
-            subscriptions,
-            key=lambda s: (get_category_name(s), s.name.lower()),
+        # Sort by category (uncategorized last) then name
+        sorted_lines = sorted(
+            data.lines,
+            key=lambda line: (line.category or "ZZZ", line.sub.name.lower()),
         )
 
         # Build table with Currency column
         table_data = [["Name", "Amount", "Currency", "Frequency", "Category", "Status"]]
         status_styles = []  # For status column color coding
 
-        for idx, sub in enumerate(sorted_subs):
-            cat_name = get_category_name(sub) if get_category_name(sub) != "ZZZ" else "-"
+        for idx, line in enumerate(sorted_lines):
+            sub = line.sub
+            cat_name = line.category or "-"
             # Status with symbol
             if sub.is_active:
                 status = "✓ Active"
@@ -1843,7 +2018,9 @@ class PDFReportService:
                     ("TEXTCOLOR", (5, idx + 1), (5, idx + 1), colors.HexColor("#9ca3af"))
                 )
             # Show converted amount with original if different
-            amount_str = self._get_amount_display(sub.amount, sub.currency, show_original=False)
+            amount_str = self._format_amount(
+                sub.amount, sub.currency, line.converted, show_original=False
+            )
             # Show original currency
             currency_display = sub.currency.upper()
             if sub.currency.upper() != self.currency:
@@ -1879,8 +2056,8 @@ class PDFReportService:
                     # Inactive rows have lighter text (except status column)
                     *[
                         ("TEXTCOLOR", (0, i + 1), (4, i + 1), colors.HexColor("#9ca3af"))
-                        for i, sub in enumerate(sorted_subs)
-                        if not sub.is_active
+                        for i, line in enumerate(sorted_lines)
+                        if not line.sub.is_active
                     ],
                     # Status column colors
                     *status_styles,
@@ -1925,7 +2102,7 @@ class PDFReportService:
                 "Amounts shown in original currency.</i>"
             )
             elements.append(Paragraph(failed_note, self.styles["Footer"]))
-        elif self.currency_service:
+        elif self.currency_service or self.rates is not None:
             currency_note = (
                 f"<br/><i>All amounts converted to {self.currency} using live exchange rates.</i>"
             )
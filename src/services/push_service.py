@@ -8,12 +8,15 @@ Features:
 - Push subscription storage
 - Payment reminder push notifications
 - Daily/weekly digest notifications
+- Async sends that run the blocking Web Push request in a worker thread
 """
 
+import asyncio
 import json
 import logging
 from typing import TYPE_CHECKING, Any
 
+import requests  # installed with pywebpush, which sends through it
 from pywebpush import WebPushException, webpush
 
 from src.core.config import settings
@@ -71,6 +74,20 @@ class PushService:
         self.vapid_email = vapid_email or getattr(settings, "vapid_email", "")
 
         self.vapid_claims = {"sub": f"mailto:{self.vapid_email}"} if self.vapid_email else {}
+        self._requests_session: requests.Session | None = None
+
+    @property
+    def requests_session(self) -> requests.Session:
+        """HTTP session reused across sends so push endpoints keep connections alive."""
+        if self._requests_session is None:
+            self._requests_session = requests.Session()
+        return self._requests_session
+
+    def close(self) -> None:
+        """Close the pooled HTTP session, if one was opened."""
+        if self._requests_session is not None:
+            self._requests_session.close()
+            self._requests_session = None
 
     @property
     def is_configured(self) -> bool:
@@ -131,6 +148,7 @@ class PushService:
                 data=json.dumps(payload),
                 vapid_private_key=self.vapid_private_key,
                 vapid_claims=self.vapid_claims,
+                requests_session=self.requests_session,
             )
 
             logger.info(f"Push notification sent: {title}")
@@ -147,6 +165,18 @@ class PushService:
             logger.error(f"Push notification error: {e}")
             return False
 
+    async def send_notification_async(self, *args: Any, **kwargs: Any) -> bool:
+        """Send a push notification without blocking the event loop.
+
+        pywebpush is synchronous (encryption plus a blocking HTTP request),
+        so the send runs in a worker thread. Takes the same arguments as
+        send_notification().
+
+        Returns:
+            True if notification sent successfully, False otherwise.
+        """
+        return await asyncio.to_thread(self.send_notification, *args, **kwargs)
+
     def send_reminder(
         self,
         subscription_info: dict[str, Any],
@@ -293,6 +323,37 @@ class PushService:
             ],
         )
 
+    async def send_reminder_async(
+        self,
+        subscription_info: dict[str, Any],
+        subscription: "Subscription",
+        days_until: int,
+    ) -> bool:
+        """Send a payment reminder push notification from a worker thread.
+
+        Args:
+            subscription_info: Push subscription object from browser.
+            subscription: Subscription object for the reminder.
+            days_until: Number of days until payment is due.
+
+        Returns:
+            True if notification sent successfully.
+        """
+        return await asyncio.to_thread(
+            self.send_reminder, subscription_info, subscription, days_until
+        )
+
+    async def send_test_notification_async(self, subscription_info: dict[str, Any]) -> bool:
+        """Send a test push notification from a worker thread.
+
+        Args:
+            subscription_info: Push subscription object from browser.
+
+        Returns:
+            True if notification sent successfully.
+        """
+        return await asyncio.to_thread(self.send_test_notification, subscription_info)
+
     def send_test_notification(self, subscription_info: dict[str, Any]) -> bool:
         """Send a test push notification.
 
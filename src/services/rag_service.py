@@ -492,6 +492,47 @@ class RAGService:
         except Exception as e:
             logger.warning(f"Failed to index note: {e}")
 
+    async def index_notes(
+        self,
+        user_id: str,
+        notes: dict[str, str],
+    ) -> None:
+        """Index many subscription notes with one embedding batch and upsert.
+
+        Args:
+            user_id: The user's ID.
+            notes: Mapping of subscription ID to note content.
+        """
+        notes = {sub_id: note for sub_id, note in notes.items() if note}
+        if not settings.rag_enabled or not notes:
+            return
+
+        try:
+            subscription_ids = list(notes)
+            embeddings = await self.embedding_service.embed_batch(
+                [notes[sub_id] for sub_id in subscription_ids], use_cache=True
+            )
+            now = time.time()
+
+            await self.vector_store.upsert_batch(
+                collection_name=VectorStore.NOTES_COLLECTION,
+                ids=[f"note:{sub_id}" for sub_id in subscription_ids],
+                vectors=embeddings,
+                payloads=[
+                    {
+                        "user_id": user_id,
+                        "subscription_id": sub_id,
+                        "note": notes[sub_id],
+                        "timestamp": now,
+                    }
+                    for sub_id in subscription_ids
+                ],
+            )
+            logger.debug(f"Indexed {len(subscription_ids)} notes for user {user_id}")
+
+        except Exception as e:
+            logger.warning(f"Failed to index notes: {e}")
+
     async def clear_session(self, user_id: str, session_id: str) -> None:
         """Clear session data from Redis and memory.
 
@@ -0,0 +1,175 @@
+"""On-disk cache of rendered PDF reports.
+
+Identical report requests (same data, filters, currency, page size and
+exchange rates) produce identical PDFs, so rendered reports are kept on
+the local filesystem and served again without re-rendering. Entries are
+keyed by RenderJob.cache_key(), which covers:
+
+- the user's data version: a digest of the subscription snapshots the
+  report is built from, so any change to the user's payments, cards,
+  categories or payment history yields a new key without explicit
+  invalidation;
+- the report options (ReportConfig, page size, currency, title);
+- the exchange rate snapshot the amounts were converted with;
+- the report date, as upcoming/overdue sections depend on it.
+
+The cache is bounded by total size and evicts least recently used
+entries; a hit refreshes the entry's modification time. Writes are
+atomic (temp file + rename), so several API processes on one host can
+share the directory.
+
+Example:
+    >>> cache = get_report_cache()
+    >>> pdf_bytes = await cache.get(key)
+    >>> if pdf_bytes is None:
+    ...     pdf_bytes = await pool.render(job)
+    ...     await cache.put(key, pdf_bytes)
+"""
+
+import asyncio
+import logging
+import os
+import tempfile
+
+from src.core.config import settings
+from src.core.metrics import record_cache_operation
+
+logger = logging.getLogger(__name__)
+
+CACHE_SUFFIX = ".pdf"
+
+
+class ReportCache:
+    """Size-bounded LRU cache of rendered reports on the local filesystem.
+
+    Attributes:
+        directory: Directory holding the cached reports.
+        max_bytes: Total size above which the least recently used reports
+            are evicted.
+    """
+
+    def __init__(self, directory: str | None = None, max_bytes: int | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Cache directory (default from settings, or a directory
+                under the system temp dir).
+            max_bytes: Size bound in bytes (default from settings).
+        """
+        self.directory = (
+            directory
+            or settings.report_cache_dir
+            or os.path.join(tempfile.gettempdir(), "money_flow_reports")
+        )
+        self.max_bytes = max_bytes or settings.report_cache_max_bytes
+
+    def _path(self, key: str) -> str:
+        """Path of the cached report for a key."""
+        return os.path.join(self.directory, f"{key}{CACHE_SUFFIX}")
+
+    def _read(self, key: str) -> bytes | None:
+        """Read a cached report and mark it recently used (blocking)."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return data
+
+    def _write(self, key: str, data: bytes) -> None:
+        """Store a report atomically, then evict down to the bound (blocking)."""
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._evict()
+
+    def _evict(self) -> int:
+        """Delete least recently used reports until under the size bound.
+
+        Returns:
+            Number of reports deleted.
+        """
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(CACHE_SUFFIX):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+        evicted = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            evicted += 1
+        if evicted:
+            logger.debug(f"Evicted {evicted} cached reports")
+        return evicted
+
+    async def get(self, key: str) -> bytes | None:
+        """Get a cached report.
+
+        Args:
+            key: Cache key of the report.
+
+        Returns:
+            PDF bytes, or None if not cached or unreadable.
+        """
+        try:
+            data = await asyncio.to_thread(self._read, key)
+        except OSError as e:
+            logger.warning(f"Failed to read cached report {key}: {e}")
+            data = None
+        record_cache_operation("report_get", data is not None)
+        return data
+
+    async def put(self, key: str, data: bytes) -> None:
+        """Cache a rendered report (failures are logged, not raised).
+
+        Args:
+            key: Cache key of the report.
+            data: PDF bytes.
+        """
+        if len(data) > self.max_bytes:
+            return
+        try:
+            await asyncio.to_thread(self._write, key, data)
+            record_cache_operation("report_set", True)
+        except OSError as e:
+            logger.warning(f"Failed to cache report {key}: {e}")
+
+
+# Singleton instance
+_report_cache: ReportCache | None = None
+
+
+def get_report_cache() -> ReportCache | None:
+    """Get the shared report cache.
+
+    Returns:
+        ReportCache instance, or None if report caching is disabled.
+    """
+    global _report_cache
+    if not settings.report_cache_enabled:
+        return None
+    if _report_cache is None:
+        _report_cache = ReportCache()
+    return _report_cache
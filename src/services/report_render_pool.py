@@ -0,0 +1,320 @@
+"""Process pool for rendering PDF reports off the event loop.
+
+ReportLab layout, chart drawing and table building are pure CPU work; run
+on the event loop they stall every other request while a large report
+builds. Reports are therefore rendered in a small pool of worker
+processes:
+
+- Concurrency is bounded by the number of workers; at most ``max_queue``
+  further reports wait for a free worker, beyond that new requests are
+  rejected straight away instead of piling up.
+- Every report has a hard time budget, enforced inside the worker with a
+  timer signal (which also frees the worker) and by the caller as a
+  backstop.
+- Queue depth, running renders, durations and outcomes are exported as
+  Prometheus metrics.
+
+Workers receive a RenderJob holding detached ReportSubscription snapshots
+and a copy of the exchange rates, so nothing bound to a database session
+or the event loop crosses the process boundary.
+
+Example:
+    >>> pool = get_report_render_pool()
+    >>> pdf_bytes = await pool.render(job)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import logging
+import multiprocessing
+import signal
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from src.core.config import settings
+from src.core.exceptions import ReportRenderError
+from src.core.metrics import record_report_render, set_report_render_queue
+
+if TYPE_CHECKING:
+    from src.schemas.report import ReportConfig
+    from src.services.pdf_report_service import ReportSubscription
+
+logger = logging.getLogger(__name__)
+
+# Bump when report layout changes so cached reports are not served
+CACHE_KEY_VERSION = 1
+
+# Extra time the caller waits beyond the budget before giving up on a worker
+TIMEOUT_GRACE_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class RenderJob:
+    """Everything a worker process needs to render one report.
+
+    Attributes:
+        subscriptions: Detached subscription snapshots.
+        user_email: Optional user email for personalization.
+        report_title: Title for the report.
+        page_size: Page size as (width, height) points.
+        include_inactive: Whether inactive subscriptions are included.
+        currency: Report currency.
+        config: Optional ReportConfig of the report.
+        rates: Exchange rate table, see PDFReportService.snapshot_rates().
+    """
+
+    subscriptions: tuple[ReportSubscription, ...]
+    user_email: str | None
+    report_title: str
+    page_size: tuple[float, float]
+    include_inactive: bool
+    currency: str
+    config: ReportConfig | None
+    rates: dict[str, Decimal] | None
+
+    def data_version(self) -> str:
+        """Digest of the subscription data the report is built from.
+
+        Returns:
+            Hex digest that changes whenever any reported field changes.
+        """
+        rows = [dataclasses.asdict(sub) for sub in self.subscriptions]
+        encoded = json.dumps(rows, default=str, sort_keys=True).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def cache_key(self, today: date | None = None) -> str:
+        """Key identifying the rendered output of this job.
+
+        Args:
+            today: Report date (defaults to the current UTC date), as
+                upcoming and overdue sections depend on it.
+
+        Returns:
+            Hex digest of the data version, report options, rate snapshot
+            and report date.
+        """
+        payload = {
+            "version": CACHE_KEY_VERSION,
+            "date": (today or datetime.utcnow().date()).isoformat(),
+            "data": self.data_version(),
+            "config": self.config.model_dump(mode="json") if self.config else None,
+            "page_size": self.page_size,
+            "include_inactive": self.include_inactive,
+            "currency": self.currency,
+            "rates": self.rates,
+            "user_email": self.user_email,
+            "report_title": self.report_title,
+        }
+        encoded = json.dumps(payload, default=str, sort_keys=True).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+
+def _on_budget_exceeded(signum: int, frame: object) -> None:
+    """Abort the running render when its time budget runs out."""
+    raise TimeoutError("Report render exceeded its time budget")
+
+
+def render_report(job: RenderJob, timeout: float | None = None) -> bytes:
+    """Render a report synchronously (runs in the worker process).
+
+    Args:
+        job: Report to render.
+        timeout: Time budget in seconds, enforced with a timer signal where
+            the platform supports it.
+
+    Returns:
+        PDF file as bytes.
+
+    Raises:
+        TimeoutError: If rendering takes longer than the budget.
+    """
+    from src.services.pdf_report_service import PDFReportService
+
+    use_timer = bool(timeout) and hasattr(signal, "setitimer")
+    if use_timer:
+        signal.signal(signal.SIGALRM, _on_budget_exceeded)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        service = PDFReportService(
+            include_inactive=job.include_inactive,
+            currency=job.currency,
+            config=job.config,
+            rates=job.rates,
+        )
+        if job.config is None:
+            service.page_size = job.page_size
+        return service.generate_report(
+            list(job.subscriptions), user_email=job.user_email, report_title=job.report_title
+        )
+    finally:
+        if use_timer:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+class ReportRenderPool:
+    """Bounded pool of worker processes rendering PDF reports.
+
+    Worker processes are started lazily with the ``spawn`` start method,
+    so they do not inherit the event loop, open sockets or database
+    connections of the API process.
+
+    Attributes:
+        max_workers: Number of worker processes (= concurrent renders).
+        max_queue: Reports allowed to wait for a free worker.
+        timeout: Time budget per report in seconds.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_queue: int | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        """Initialize the pool (no processes are started yet).
+
+        Args:
+            max_workers: Number of worker processes (default from settings).
+            max_queue: Reports allowed to wait for a worker (default from settings).
+            timeout: Time budget per report in seconds (default from settings).
+        """
+        self.max_workers = max(1, max_workers or settings.report_render_workers)
+        self.max_queue = max_queue if max_queue is not None else settings.report_render_queue_size
+        self.timeout = timeout or settings.report_render_timeout
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    @property
+    def running(self) -> int:
+        """Number of reports being rendered."""
+        return min(self._in_flight, self.max_workers)
+
+    @property
+    def queued(self) -> int:
+        """Number of reports waiting for a free worker."""
+        return max(self._in_flight - self.max_workers, 0)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Get the process pool, starting it on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def _publish(self) -> None:
+        """Export the current queue depth and running count."""
+        set_report_render_queue(self.queued, self.running)
+
+    def _submit(self, job: RenderJob) -> Future[bytes]:
+        """Reserve a slot and hand the job to a worker.
+
+        Raises:
+            ReportRenderError: If the queue is full.
+        """
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue:
+                raise ReportRenderError(
+                    "Too many reports are being generated, please retry shortly",
+                    retry_after=int(self.timeout),
+                )
+            self._in_flight += 1
+        self._publish()
+
+        try:
+            future = self._get_executor().submit(render_report, job, self.timeout)
+        except BaseException:
+            self._release()
+            raise
+        # The slot is held until the worker is actually free, even if the
+        # caller stops waiting first
+        future.add_done_callback(lambda _: self._release())
+        return future
+
+    def _release(self) -> None:
+        """Free a slot taken by _submit()."""
+        with self._lock:
+            self._in_flight -= 1
+        self._publish()
+
+    async def render(self, job: RenderJob) -> bytes:
+        """Render a report in a worker process.
+
+        Args:
+            job: Report to render.
+
+        Returns:
+            PDF file as bytes.
+
+        Raises:
+            ReportRenderError: If the queue is full or the report exceeds
+                its time budget.
+        """
+        try:
+            future = self._submit(job)
+        except ReportRenderError:
+            record_report_render("rejected", 0.0)
+            logger.warning(f"Rejected report render: {self.running} running, {self.queued} queued")
+            raise
+
+        start = time.perf_counter()
+        try:
+            # Queue time counts towards the backstop so callers are never
+            # held longer than one budget after their report starts
+            backstop = self.timeout * (1 + self.max_queue // self.max_workers)
+            pdf_bytes = await asyncio.wait_for(
+                asyncio.wrap_future(future), backstop + TIMEOUT_GRACE_SECONDS
+            )
+        except TimeoutError as e:
+            future.cancel()
+            record_report_render("timeout", time.perf_counter() - start)
+            logger.error(f"Report render exceeded its {self.timeout:.0f}s budget")
+            raise ReportRenderError(
+                f"Report generation took longer than {self.timeout:.0f} seconds"
+            ) from e
+        except Exception:
+            record_report_render("error", time.perf_counter() - start)
+            raise
+
+        record_report_render("success", time.perf_counter() - start)
+        return pdf_bytes
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, cancelling reports not yet started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Singleton instance
+_report_render_pool: ReportRenderPool | None = None
+
+
+def get_report_render_pool() -> ReportRenderPool:
+    """Get the shared report render pool.
+
+    Returns:
+        ReportRenderPool instance.
+    """
+    global _report_render_pool
+    if _report_render_pool is None:
+        _report_render_pool = ReportRenderPool()
+    return _report_render_pool
+
+
+def close_report_render_pool() -> None:
+    """Shut down the shared report render pool."""
+    global _report_render_pool
+    if _report_render_pool is not None:
+        _report_render_pool.shutdown()
+        _report_render_pool = None
@@ -0,0 +1,310 @@
+"""Event coalescing for REST hooks.
+
+By default every event is posted to every subscribed REST hook as its own
+request, so a bulk import of thousands of subscriptions means thousands
+of requests per hook, and Zapier-style endpoints start throttling.
+
+Hooks subscribed with ``batch=true`` receive events coalesced per hook
+instead:
+
+- Window: the first event for a hook opens a batch that is sent
+  ``rest_hook_batch_window`` seconds later; events arriving meanwhile
+  join it.
+- Caps: a batch is sent early once it holds ``rest_hook_batch_max_events``
+  events, and an event that would push the body past
+  ``rest_hook_batch_max_bytes`` starts a new batch.
+- Payload: a JSON array of the same event objects single deliveries send,
+  with the same headers. ``X-MoneyFlow-Event-ID`` identifies the batch and
+  ``X-MoneyFlow-Batch-Size`` gives the number of events.
+- Concurrency: each batch is sent by its own task on one pooled client,
+  so batches for different hooks go out concurrently.
+
+Delivery statistics are recorded per event once a batch has been sent.
+
+Example:
+    >>> batcher = get_rest_hook_batcher()
+    >>> batcher.add(hook, payload)
+    >>> await batcher.flush_all()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+import httpx
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.models.integration import IntegrationStatus, RestHookSubscription
+from src.schemas.integration import EventPayload
+
+logger = logging.getLogger(__name__)
+
+# Request timeout for REST hook deliveries (seconds)
+REST_HOOK_TIMEOUT = 10.0
+
+
+def rest_hook_headers(
+    event_type: str, event_id: str, batch_size: int | None = None
+) -> dict[str, str]:
+    """Build the headers of a REST hook delivery.
+
+    Args:
+        event_type: Type of the delivered event(s).
+        event_id: Event ID, or batch ID for batched deliveries.
+        batch_size: Number of events in a batched delivery.
+
+    Returns:
+        Request headers.
+    """
+    headers = {
+        "Content-Type": "application/json",
+        "X-MoneyFlow-Event": event_type,
+        "X-MoneyFlow-Event-ID": event_id,
+    }
+    if batch_size is not None:
+        headers["X-MoneyFlow-Batch-Size"] = str(batch_size)
+    return headers
+
+
+@dataclass
+class _Batch:
+    """Events waiting to be sent to one REST hook."""
+
+    subscription_id: str
+    target_url: str
+    event_type: str
+    events: list[bytes] = field(default_factory=list)
+    size: int = 2  # Enclosing brackets
+    timer: asyncio.TimerHandle | None = None
+
+    def fits(self, event: bytes, max_bytes: int) -> bool:
+        """Whether an event can join without exceeding the size cap."""
+        return not self.events or self.size + len(event) + 1 <= max_bytes
+
+    def append(self, event: bytes) -> None:
+        """Add an encoded event."""
+        self.size += len(event) + (1 if self.events else 0)
+        self.events.append(event)
+
+    def body(self) -> bytes:
+        """JSON array of the events."""
+        return b"[" + b",".join(self.events) + b"]"
+
+
+class RestHookBatcher:
+    """Coalesces events per REST hook into batched deliveries.
+
+    One batcher is shared by the process (see get_rest_hook_batcher()) so
+    events from concurrent requests for the same hook end up in the same
+    batch.
+
+    Attributes:
+        window: Seconds a batch collects events before it is sent.
+        max_events: Maximum events per batch.
+        max_bytes: Maximum body size of a batch.
+    """
+
+    def __init__(
+        self,
+        window: float | None = None,
+        max_events: int | None = None,
+        max_bytes: int | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        session_factory: Callable[[], AsyncSession] | None = None,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            window: Batching window in seconds (defaults to settings).
+            max_events: Events per batch (defaults to settings).
+            max_bytes: Body size cap in bytes (defaults to settings).
+            http_client: Optional shared HTTP client; the caller closes it.
+            session_factory: Session factory for recording delivery
+                statistics (defaults to the application's).
+        """
+        self.window = window if window is not None else settings.rest_hook_batch_window
+        self.max_events = max_events or settings.rest_hook_batch_max_events
+        self.max_bytes = max_bytes or settings.rest_hook_batch_max_bytes
+        self._http_client = http_client
+        self._owns_client = http_client is None
+        self._session_factory = session_factory
+        self._batches: dict[str, _Batch] = {}
+        self._sending: set[asyncio.Task[None]] = set()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the HTTP client, creating a pooled one on first use."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(timeout=REST_HOOK_TIMEOUT)
+        return self._http_client
+
+    def _get_session_factory(self) -> Callable[[], AsyncSession]:
+        """Get the session factory, defaulting to the application's."""
+        if self._session_factory is None:
+            from src.db.database import async_session_maker
+
+            self._session_factory = async_session_maker
+        return self._session_factory
+
+    @property
+    def pending_events(self) -> int:
+        """Number of events waiting in open batches."""
+        return sum(len(batch.events) for batch in self._batches.values())
+
+    def add(self, subscription: RestHookSubscription, payload: EventPayload) -> None:
+        """Add an event to the hook's open batch, opening one if needed.
+
+        Must be called from the event loop; never blocks.
+
+        Args:
+            subscription: REST hook to deliver to.
+            payload: Event to deliver.
+        """
+        event = payload.model_dump_json().encode()
+        batch = self._batches.get(subscription.id)
+        if batch is not None and not batch.fits(event, self.max_bytes):
+            self._send(subscription.id)
+            batch = None
+
+        if batch is None:
+            batch = _Batch(
+                subscription_id=subscription.id,
+                target_url=subscription.target_url,
+                event_type=subscription.event_type,
+            )
+            batch.timer = asyncio.get_running_loop().call_later(
+                self.window, self._send, subscription.id
+            )
+            self._batches[subscription.id] = batch
+
+        batch.append(event)
+        if len(batch.events) >= self.max_events:
+            self._send(subscription.id)
+
+    def _send(self, subscription_id: str) -> None:
+        """Close the hook's open batch and start sending it."""
+        batch = self._batches.pop(subscription_id, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+
+        task = asyncio.get_running_loop().create_task(self._deliver(batch))
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+
+    async def flush_all(self) -> None:
+        """Send all open batches now and wait for every batch in flight."""
+        for subscription_id in list(self._batches):
+            self._send(subscription_id)
+        if self._sending:
+            await asyncio.gather(*self._sending, return_exceptions=True)
+
+    async def close(self) -> None:
+        """Send open batches and close the HTTP client if the batcher created it."""
+        await self.flush_all()
+        if self._owns_client and self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    async def _deliver(self, batch: _Batch) -> None:
+        """Post a batch and record the outcome."""
+        count = len(batch.events)
+        try:
+            response = await self._get_client().post(
+                batch.target_url,
+                content=batch.body(),
+                headers=rest_hook_headers(batch.event_type, str(uuid.uuid4()), count),
+            )
+        except httpx.RequestError as e:
+            logger.error(f"Request error delivering batch to {batch.target_url}: {e}")
+            await self._record(batch.subscription_id, failure_count=count, error=str(e))
+            return
+        except Exception as e:
+            # Runs as a detached task: an escaping error would be lost
+            logger.error(f"Unexpected error delivering batch to {batch.target_url}: {e}")
+            await self._record(
+                batch.subscription_id,
+                failure_count=count,
+                error=f"Unexpected error: {str(e)[:200]}",
+            )
+            return
+
+        if 200 <= response.status_code < 300:
+            logger.info(f"Delivered {count} {batch.event_type} events to {batch.target_url}")
+            await self._record(batch.subscription_id, delivery_count=count)
+        elif response.status_code == 410:
+            # 410 Gone - Zapier wants us to unsubscribe
+            logger.info(f"Subscription {batch.subscription_id} returned 410, revoking")
+            await self._record(batch.subscription_id, revoke=True)
+        else:
+            logger.warning(
+                f"Failed to deliver batch to {batch.target_url}: HTTP {response.status_code}"
+            )
+            await self._record(
+                batch.subscription_id,
+                failure_count=count,
+                error=f"HTTP {response.status_code}",
+            )
+
+    async def _record(
+        self,
+        subscription_id: str,
+        delivery_count: int = 0,
+        failure_count: int = 0,
+        error: str | None = None,
+        revoke: bool = False,
+    ) -> None:
+        """Update a hook's delivery statistics in one statement."""
+        values: dict[str, Any]
+        if revoke:
+            values = {"status": IntegrationStatus.REVOKED}
+        else:
+            values = {
+                "delivery_count": RestHookSubscription.delivery_count + delivery_count,
+                "failure_count": RestHookSubscription.failure_count + failure_count,
+                "last_delivery_at": datetime.utcnow(),
+                "last_error": error[:500] if error else None,
+            }
+
+        try:
+            async with self._get_session_factory()() as session:
+                await session.execute(
+                    update(RestHookSubscription)
+                    .where(RestHookSubscription.id == subscription_id)
+                    .values(**values)
+                )
+                await session.commit()
+        except Exception as e:
+            logger.error(f"Failed to record batch delivery for hook {subscription_id}: {e}")
+
+
+# Singleton instance
+_rest_hook_batcher: RestHookBatcher | None = None
+
+
+def get_rest_hook_batcher() -> RestHookBatcher:
+    """Get the process-wide REST hook batcher.
+
+    Returns:
+        RestHookBatcher instance.
+    """
+    global _rest_hook_batcher
+    if _rest_hook_batcher is None:
+        _rest_hook_batcher = RestHookBatcher()
+    return _rest_hook_batcher
+
+
+async def close_rest_hook_batcher() -> None:
+    """Send pending batches and close the process-wide batcher."""
+    global _rest_hook_batcher
+    if _rest_hook_batcher is not None:
+        await _rest_hook_batcher.close()
+        _rest_hook_batcher = None
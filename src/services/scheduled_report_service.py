@@ -10,6 +10,12 @@ from enum import Enum
 from typing import TYPE_CHECKING
 
 from src.services.email_service import EmailService
+from src.services.email_templates import (
+    currency_symbol,
+    render_daily_report_html,
+    render_monthly_report_html,
+    render_weekly_report_html,
+)
 from src.services.pdf_report_service import PDFReportService
 
 if TYPE_CHECKING:
@@ -311,13 +317,7 @@ class ScheduledReportService:
         Returns:
             Currency symbol.
         """
-        symbols = {
-            "GBP": "£",
-            "USD": "$",
-            "EUR": "€",
-            "UAH": "₴",
-        }
-        return symbols.get(currency, "£")
+        return currency_symbol(currency)
 
     def _build_daily_email_html(
         self,
@@ -335,67 +335,7 @@ class ScheduledReportService:
         Returns:
             HTML email body.
         """
-        symbol = self._get_currency_symbol(currency)
-        today = date.today()
-
-        def format_payment_list(payments: list, title: str, emoji: str) -> str:
-            if not payments:
-                return ""
-            total = sum(float(p.amount) for p in payments)
-            items_html = ""
-            for p in payments:
-                items_html += f"""
-                <tr>
-                    <td style="padding: 8px; border-bottom: 1px solid #e5e7eb;">{p.name}</td>
-                    <td style="padding: 8px; border-bottom: 1px solid #e5e7eb; text-align: right;">{symbol}{float(p.amount):.2f}</td>
-                </tr>
-                """
-            return f"""
-            <h3 style="color: #1f2937; margin-top: 24px;">{emoji} {title}</h3>
-            <table style="width: 100%; border-collapse: collapse; margin-bottom: 16px;">
-                <thead>
-                    <tr style="background-color: #f3f4f6;">
-                        <th style="padding: 8px; text-align: left; border-bottom: 2px solid #e5e7eb;">Name</th>
-                        <th style="padding: 8px; text-align: right; border-bottom: 2px solid #e5e7eb;">Amount</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {items_html}
-                </tbody>
-                <tfoot>
-                    <tr style="background-color: #f9fafb; font-weight: bold;">
-                        <td style="padding: 8px;">Total</td>
-                        <td style="padding: 8px; text-align: right;">{symbol}{total:.2f}</td>
-                    </tr>
-                </tfoot>
-            </table>
-            """
-
-        today_section = format_payment_list(today_payments, "Due Today", "💳")
-        tomorrow_section = format_payment_list(tomorrow_payments, "Due Tomorrow", "📅")
-
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        </head>
-        <body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Helvetica, Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px; color: #374151;">
-            <h1 style="color: #1f2937;">📊 Daily Payment Report</h1>
-            <p style="color: #6b7280;">{today.strftime("%A, %d %B %Y")}</p>
-
-            {today_section if today_section else '<p style="color: #6b7280;">No payments due today.</p>'}
-            {tomorrow_section if tomorrow_section else '<p style="color: #6b7280;">No payments due tomorrow.</p>'}
-
-            <hr style="border: none; border-top: 1px solid #e5e7eb; margin: 24px 0;">
-            <p style="color: #9ca3af; font-size: 14px;">
-                See the attached PDF for your full subscription overview.<br>
-                <em>Money Flow - Your Personal Finance Tracker</em>
-            </p>
-        </body>
-        </html>
-        """
+        return render_daily_report_html(today_payments, tomorrow_payments, currency)
 
     def _build_weekly_email_html(
         self,
@@ -417,75 +357,7 @@ class ScheduledReportService:
         Returns:
             HTML email body.
         """
-        symbol = self._get_currency_symbol(currency)
-
-        # Group by day
-        day_groups: dict[date, list] = {}
-        for p in week_payments:
-            if p.next_payment_date:
-                day = p.next_payment_date
-                if day not in day_groups:
-                    day_groups[day] = []
-                day_groups[day].append(p)
-
-        days_html = ""
-        for day in sorted(day_groups.keys()):
-            payments = day_groups[day]
-            day_total = sum(float(p.amount) for p in payments)
-            items = ", ".join(p.name for p in payments)
-            days_html += f"""
-            <tr>
-                <td style="padding: 8px; border-bottom: 1px solid #e5e7eb;">{day.strftime("%A, %d %b")}</td>
-                <td style="padding: 8px; border-bottom: 1px solid #e5e7eb;">{items}</td>
-                <td style="padding: 8px; border-bottom: 1px solid #e5e7eb; text-align: right;">{symbol}{day_total:.2f}</td>
-            </tr>
-            """
-
-        if not days_html:
-            days_html = """
-            <tr>
-                <td colspan="3" style="padding: 16px; text-align: center; color: #6b7280;">No payments scheduled this week</td>
-            </tr>
-            """
-
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        </head>
-        <body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Helvetica, Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px; color: #374151;">
-            <h1 style="color: #1f2937;">📅 Weekly Report</h1>
-            <p style="color: #6b7280;">{week_start.strftime("%d %B")} - {week_end.strftime("%d %B %Y")}</p>
-
-            <div style="background-color: #f3f4f6; padding: 16px; border-radius: 8px; margin: 16px 0;">
-                <h2 style="margin: 0; color: #1f2937;">{symbol}{total:.2f}</h2>
-                <p style="margin: 4px 0 0 0; color: #6b7280;">Total this week ({len(week_payments)} payment(s))</p>
-            </div>
-
-            <h3 style="color: #1f2937;">Payment Schedule</h3>
-            <table style="width: 100%; border-collapse: collapse;">
-                <thead>
-                    <tr style="background-color: #f3f4f6;">
-                        <th style="padding: 8px; text-align: left; border-bottom: 2px solid #e5e7eb;">Day</th>
-                        <th style="padding: 8px; text-align: left; border-bottom: 2px solid #e5e7eb;">Payments</th>
-                        <th style="padding: 8px; text-align: right; border-bottom: 2px solid #e5e7eb;">Amount</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {days_html}
-                </tbody>
-            </table>
-
-            <hr style="border: none; border-top: 1px solid #e5e7eb; margin: 24px 0;">
-            <p style="color: #9ca3af; font-size: 14px;">
-                See the attached PDF for detailed charts and breakdowns.<br>
-                <em>Money Flow - Your Personal Finance Tracker</em>
-            </p>
-        </body>
-        </html>
-        """
+        return render_weekly_report_html(week_payments, total, week_start, week_end, currency)
 
     def _build_monthly_email_html(
         self,
@@ -507,58 +379,9 @@ class ScheduledReportService:
         Returns:
             HTML email body.
         """
-        symbol = self._get_currency_symbol(currency)
-
-        # Category breakdown
-        categories_html = ""
-        for category, cat_total in category_totals.items():
-            percentage = (cat_total / total * 100) if total > 0 else 0
-            categories_html += f"""
-            <tr>
-                <td style="padding: 8px; border-bottom: 1px solid #e5e7eb;">{category}</td>
-                <td style="padding: 8px; border-bottom: 1px solid #e5e7eb; text-align: right;">{symbol}{cat_total:.2f}</td>
-                <td style="padding: 8px; border-bottom: 1px solid #e5e7eb; text-align: right;">{percentage:.1f}%</td>
-            </tr>
-            """
-
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        </head>
-        <body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Helvetica, Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px; color: #374151;">
-            <h1 style="color: #1f2937;">📊 Monthly Report</h1>
-            <p style="color: #6b7280;">{month_name}</p>
-
-            <div style="background-color: #f3f4f6; padding: 16px; border-radius: 8px; margin: 16px 0;">
-                <h2 style="margin: 0; color: #1f2937;">{symbol}{total:.2f}</h2>
-                <p style="margin: 4px 0 0 0; color: #6b7280;">Total this month ({len(month_payments)} payment(s))</p>
-            </div>
-
-            <h3 style="color: #1f2937;">Spending by Category</h3>
-            <table style="width: 100%; border-collapse: collapse;">
-                <thead>
-                    <tr style="background-color: #f3f4f6;">
-                        <th style="padding: 8px; text-align: left; border-bottom: 2px solid #e5e7eb;">Category</th>
-                        <th style="padding: 8px; text-align: right; border-bottom: 2px solid #e5e7eb;">Amount</th>
-                        <th style="padding: 8px; text-align: right; border-bottom: 2px solid #e5e7eb;">%</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {categories_html}
-                </tbody>
-            </table>
-
-            <hr style="border: none; border-top: 1px solid #e5e7eb; margin: 24px 0;">
-            <p style="color: #9ca3af; font-size: 14px;">
-                See the attached PDF for the full report with charts.<br>
-                <em>Money Flow - Your Personal Finance Tracker</em>
-            </p>
-        </body>
-        </html>
-        """
+        return render_monthly_report_html(
+            month_payments, category_totals, total, month_name, currency
+        )
 
 
 # Global service instance
@@ -5,13 +5,17 @@ to detect recurring payment patterns and classify payment types.
 
 Features:
 - Transaction grouping by merchant/description
-- Recurring pattern detection (frequency, amount consistency)
+- Recurring pattern detection (frequency, amount consistency), computed
+  for all merchant groups at once over NumPy arrays
 - Payment type classification (subscription, utility, housing, etc.)
 - Confidence scoring for each detection
+- AI classifications cached per merchant and shared across users, so
+  only merchants never seen before are sent to Claude
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 from collections import defaultdict
@@ -19,13 +23,19 @@ from dataclasses import dataclass, field
 from datetime import date
 from decimal import Decimal
 from enum import Enum
-from statistics import mean, stdev
 from typing import Any
 
-from anthropic import Anthropic
+import numpy as np
+from anthropic import AsyncAnthropic
 
 from src.core.config import settings
-from src.services.parsers.base import StatementData, Transaction, TransactionType
+from src.services.cache_service import CacheService, get_cache_service
+from src.services.parsers.base import (
+    StatementData,
+    Transaction,
+    TransactionType,
+    fingerprint_transactions,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +57,7 @@ class PaymentTypeClassification(str, Enum):
 class FrequencyType(str, Enum):
     """Detected payment frequency."""
 
+    DAILY = "daily"
     WEEKLY = "weekly"
     BIWEEKLY = "biweekly"
     MONTHLY = "monthly"
@@ -281,8 +292,21 @@ class StatementAIService:
     # Minimum transactions to consider a pattern
     MIN_TRANSACTIONS_FOR_PATTERN = 2
 
+    # AI enhancement: patterns per prompt and concurrent prompts per statement
+    AI_CHUNK_SIZE = 20
+    AI_MAX_CONCURRENCY = 4
+
+    # Cache key prefix for merchant classifications
+    MERCHANT_CACHE_PREFIX = "merchant:cls"
+
+    # Classification fields shared across users through the cache; the
+    # confidence adjustment is derived from one statement's amounts and
+    # samples, so it only applies to the statement it was made for
+    MERCHANT_CACHE_FIELDS = ("name", "type")
+
     # Maximum days between transactions for each frequency
     FREQUENCY_DAY_RANGES = {
+        FrequencyType.DAILY: (1, 2),
         FrequencyType.WEEKLY: (5, 9),
         FrequencyType.BIWEEKLY: (12, 18),
         FrequencyType.MONTHLY: (25, 35),
@@ -290,19 +314,32 @@ class StatementAIService:
         FrequencyType.YEARLY: (350, 380),
     }
 
-    def __init__(self, anthropic_client: Anthropic | None = None) -> None:
+    # A daily cadence also needs enough transactions and steady gaps, so
+    # frequent but irregular spending (coffee, groceries) stays irregular
+    DAILY_MIN_TRANSACTIONS = 7
+    DAILY_MAX_GAP_VARIATION = 0.3  # Gap standard deviation / mean gap
+
+    def __init__(
+        self,
+        anthropic_client: AsyncAnthropic | None = None,
+        cache: CacheService | None = None,
+    ) -> None:
         """Initialize the statement AI service.
 
         Args:
-            anthropic_client: Optional Anthropic client for AI analysis
+            anthropic_client: Optional async Anthropic client for AI analysis
+            cache: Optional cache for merchant classifications
+                (defaults to the shared Redis cache)
         """
-        self.client = anthropic_client or Anthropic(api_key=settings.anthropic_api_key)
+        self.client = anthropic_client or AsyncAnthropic(api_key=settings.anthropic_api_key)
+        self.cache = cache
 
     async def analyze_statement(
         self,
         statement: StatementData,
         min_confidence: float = 0.5,
         use_ai: bool = True,
+        known_fingerprints: set[str] | None = None,
     ) -> list[DetectedPattern]:
         """Analyze a bank statement for recurring patterns.
 
@@ -310,6 +347,10 @@ class StatementAIService:
             statement: Parsed statement data with transactions
             min_confidence: Minimum confidence score to include (0.0-1.0)
             use_ai: Whether to use AI for enhanced analysis
+            known_fingerprints: Fingerprints of transactions already analysed
+                in earlier imports. Merchants whose transactions are all known
+                are skipped; merchants with any new activity are analysed with
+                their full history from this statement.
 
         Returns:
             List of detected recurring payment patterns
@@ -319,14 +360,15 @@ class StatementAIService:
 
         # Step 1: Group transactions by normalized merchant name
         grouped = self._group_transactions(statement.transactions)
-
-        # Step 2: Detect patterns in each group
-        patterns: list[DetectedPattern] = []
-        for merchant, transactions in grouped.items():
-            if len(transactions) >= self.MIN_TRANSACTIONS_FOR_PATTERN:
-                pattern = self._analyze_group(merchant, transactions)
-                if pattern and pattern.confidence >= min_confidence:
-                    patterns.append(pattern)
+        if known_fingerprints:
+            grouped = self._drop_known_groups(grouped, statement.transactions, known_fingerprints)
+
+        # Step 2: Detect patterns in all groups in one vectorized pass
+        patterns = [
+            pattern
+            for pattern in self._analyze_groups(grouped)
+            if pattern.confidence >= min_confidence
+        ]
 
         # Step 3: Use AI for enhanced classification if enabled
         if use_ai and patterns:
@@ -359,6 +401,33 @@ class StatementAIService:
 
         return dict(groups)
 
+    def _drop_known_groups(
+        self,
+        grouped: dict[str, list[Transaction]],
+        transactions: list[Transaction],
+        known_fingerprints: set[str],
+    ) -> dict[str, list[Transaction]]:
+        """Remove merchant groups with no transactions outside known_fingerprints.
+
+        Args:
+            grouped: Transactions grouped by normalized merchant name
+            transactions: All statement transactions, in statement order
+            known_fingerprints: Fingerprints seen in earlier imports
+
+        Returns:
+            Groups containing at least one new transaction
+        """
+        new_ids = {
+            id(txn)
+            for txn, fingerprint in zip(
+                transactions, fingerprint_transactions(transactions), strict=True
+            )
+            if fingerprint not in known_fingerprints
+        }
+        return {
+            name: txns for name, txns in grouped.items() if any(id(txn) in new_ids for txn in txns)
+        }
+
     def _normalize_merchant_name(self, description: str) -> str:
         """Normalize a transaction description to extract merchant name.
 
@@ -412,130 +481,197 @@ class StatementAIService:
         Returns:
             DetectedPattern if a recurring pattern is found, None otherwise
         """
-        if len(transactions) < self.MIN_TRANSACTIONS_FOR_PATTERN:
-            return None
+        patterns = self._analyze_groups({merchant: transactions})
+        return patterns[0] if patterns else None
 
-        # Sort by date
-        sorted_txns = sorted(transactions, key=lambda t: t.date)
+    def _analyze_groups(self, grouped: dict[str, list[Transaction]]) -> list[DetectedPattern]:
+        """Analyze all merchant groups for patterns in one vectorized pass.
 
-        # Calculate amount statistics
-        amounts = [abs(t.amount) for t in sorted_txns]
-        avg_amount = Decimal(str(mean([float(a) for a in amounts])))
+        Transactions are flattened into columnar arrays and sorted once by
+        (merchant, date). Amount statistics, inter-arrival gaps, frequency
+        and confidence are then computed for every group with NumPy
+        group-wise reductions instead of per-group Python loops.
 
-        # Calculate amount variance
-        if len(amounts) > 1:
-            try:
-                amount_std = stdev([float(a) for a in amounts])
-                amount_variance = min(1.0, amount_std / float(avg_amount)) if avg_amount else 1.0
-            except Exception:
-                amount_variance = 0.5
-        else:
-            amount_variance = 0.0
-
-        # Calculate days between transactions
-        days_between: list[int] = []
-        for i in range(1, len(sorted_txns)):
-            delta = (sorted_txns[i].date - sorted_txns[i - 1].date).days
-            if delta > 0:
-                days_between.append(delta)
-
-        if not days_between:
-            return None
-
-        avg_days = mean(days_between)
-
-        # Detect frequency
-        frequency = self._detect_frequency(avg_days, days_between)
-
-        # Calculate confidence based on consistency
-        confidence = self._calculate_confidence(
-            transaction_count=len(sorted_txns),
-            amount_variance=amount_variance,
-            days_between=days_between,
-            frequency=frequency,
+        Args:
+            grouped: Dict mapping normalized merchant names to transactions
+
+        Returns:
+            Detected patterns, in the order of ``grouped``
+        """
+        merchants = [
+            merchant
+            for merchant, transactions in grouped.items()
+            if len(transactions) >= self.MIN_TRANSACTIONS_FOR_PATTERN
+        ]
+        if not merchants:
+            return []
+
+        # Columnar layout: one row per transaction
+        flat: list[Transaction] = []
+        group_ids: list[int] = []
+        for group_id, merchant in enumerate(merchants):
+            flat.extend(grouped[merchant])
+            group_ids.extend([group_id] * len(grouped[merchant]))
+
+        n_groups = len(merchants)
+        groups = np.array(group_ids, dtype=np.int64)
+        days = np.fromiter((t.date.toordinal() for t in flat), dtype=np.int64, count=len(flat))
+        amounts = np.fromiter(
+            (abs(float(t.amount)) for t in flat), dtype=np.float64, count=len(flat)
         )
 
-        # Classify payment type based on keywords
-        payment_type = self._classify_payment_type(merchant, sorted_txns)
-
-        # Get original merchant name from first transaction
-        original_name = sorted_txns[0].description[:100] if sorted_txns else merchant
-
-        return DetectedPattern(
-            merchant_name=original_name,
-            normalized_name=merchant,
-            amount=avg_amount.quantize(Decimal("0.01")),
-            amount_variance=amount_variance,
-            frequency=frequency,
-            payment_type=payment_type,
-            confidence=confidence,
-            transaction_count=len(sorted_txns),
-            first_seen=sorted_txns[0].date,
-            last_seen=sorted_txns[-1].date,
-            sample_descriptions=[t.description for t in sorted_txns[:3]],
-            avg_days_between=avg_days,
-            raw_transactions=sorted_txns,
+        # Sort once by (merchant, date); lexsort is stable like sorted()
+        order = np.lexsort((days, groups))
+        groups, days, amounts = groups[order], days[order], amounts[order]
+        counts = np.bincount(groups, minlength=n_groups)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+        # Amount mean and sample standard deviation per group
+        avg_amounts = np.bincount(groups, weights=amounts, minlength=n_groups) / counts
+        squared = (amounts - avg_amounts[groups]) ** 2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            amount_std = np.sqrt(
+                np.bincount(groups, weights=squared, minlength=n_groups) / (counts - 1)
+            )
+            amount_variance = np.where(
+                avg_amounts > 0, np.minimum(1.0, amount_std / avg_amounts), 1.0
+            )
+        amount_variance = np.where(counts > 1, amount_variance, 0.0)
+
+        # Inter-arrival gaps within each group (same-day repeats ignored)
+        gaps = np.diff(days)
+        gap_mask = (groups[1:] == groups[:-1]) & (gaps > 0)
+        gap_groups = groups[1:][gap_mask]
+        gaps = gaps[gap_mask].astype(np.float64)
+        gap_counts = np.bincount(gap_groups, minlength=n_groups)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            avg_days = np.bincount(gap_groups, weights=gaps, minlength=n_groups) / gap_counts
+            gap_squared = (gaps - avg_days[gap_groups]) ** 2
+            gap_std = np.sqrt(
+                np.bincount(gap_groups, weights=gap_squared, minlength=n_groups) / (gap_counts - 1)
+            )
+
+        frequencies = self._detect_frequencies(avg_days, gap_std, counts)
+        confidences = self._calculate_confidences(
+            counts, amount_variance, avg_days, gap_std, gap_counts, frequencies
         )
 
-    def _detect_frequency(self, avg_days: float, days_between: list[int]) -> FrequencyType:
-        """Detect the payment frequency from average days between payments.
+        patterns: list[DetectedPattern] = []
+        for group_id, merchant in enumerate(merchants):
+            if not gap_counts[group_id]:
+                continue
+
+            begin = starts[group_id]
+            sorted_txns = [flat[i] for i in order[begin : begin + counts[group_id]]]
+            frequency = frequencies[group_id]
+
+            # Classify payment type based on keywords
+            payment_type = self._classify_payment_type(merchant, sorted_txns)
+
+            # Get original merchant name from first transaction
+            original_name = sorted_txns[0].description[:100]
+
+            # Exact mean, so half-cent averages round like the Decimal inputs
+            avg_amount = sum((abs(t.amount) for t in sorted_txns), Decimal(0)) / len(sorted_txns)
+            patterns.append(
+                DetectedPattern(
+                    merchant_name=original_name,
+                    normalized_name=merchant,
+                    amount=avg_amount.quantize(Decimal("0.01")),
+                    amount_variance=float(amount_variance[group_id]),
+                    frequency=frequency,
+                    payment_type=payment_type,
+                    confidence=round(min(1.0, float(confidences[group_id])), 2),
+                    transaction_count=len(sorted_txns),
+                    first_seen=sorted_txns[0].date,
+                    last_seen=sorted_txns[-1].date,
+                    sample_descriptions=[t.description for t in sorted_txns[:3]],
+                    avg_days_between=float(avg_days[group_id]),
+                    raw_transactions=sorted_txns,
+                )
+            )
+
+        return patterns
+
+    def _detect_frequencies(
+        self, avg_days: np.ndarray, gap_std: np.ndarray, counts: np.ndarray
+    ) -> list[FrequencyType]:
+        """Detect the payment frequency of every group.
+
+        The first matching range in ``FREQUENCY_DAY_RANGES`` wins. A daily
+        match additionally needs ``DAILY_MIN_TRANSACTIONS`` transactions and
+        a gap variation of at most ``DAILY_MAX_GAP_VARIATION``; otherwise
+        the group is irregular.
 
         Args:
-            avg_days: Average days between payments
-            days_between: List of actual days between each payment
+            avg_days: Average days between payments per group
+            gap_std: Sample standard deviation of gaps per group
+            counts: Transactions per group
 
         Returns:
-            Detected frequency type
+            Detected frequency type per group
         """
-        for frequency, (min_days, max_days) in self.FREQUENCY_DAY_RANGES.items():
-            if min_days <= avg_days <= max_days:
-                return frequency
+        ranges = list(self.FREQUENCY_DAY_RANGES.items())
+        choice = np.full(avg_days.shape, len(ranges), dtype=np.int64)
+        for index, (_, (min_days, max_days)) in reversed(list(enumerate(ranges))):
+            choice[(avg_days >= min_days) & (avg_days <= max_days)] = index
+
+        options = [frequency for frequency, _ in ranges] + [FrequencyType.IRREGULAR]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            steady = gap_std / avg_days <= self.DAILY_MAX_GAP_VARIATION
+        daily_ok = steady & (counts >= self.DAILY_MIN_TRANSACTIONS)
+        choice[(choice == options.index(FrequencyType.DAILY)) & ~daily_ok] = len(ranges)
 
-        return FrequencyType.IRREGULAR
+        return [options[index] for index in choice]
 
-    def _calculate_confidence(
+    def _calculate_confidences(
         self,
-        transaction_count: int,
-        amount_variance: float,
-        days_between: list[int],
-        frequency: FrequencyType,
-    ) -> float:
-        """Calculate confidence score for a detected pattern.
+        counts: np.ndarray,
+        amount_variance: np.ndarray,
+        avg_days: np.ndarray,
+        gap_std: np.ndarray,
+        gap_counts: np.ndarray,
+        frequencies: list[FrequencyType],
+    ) -> np.ndarray:
+        """Calculate unrounded confidence scores for many groups at once.
+
+        Confidence is a weighted average of the transaction count (full at
+        6 transactions), amount consistency and timing consistency, plus a
+        bonus for regular frequencies.
 
         Args:
-            transaction_count: Number of transactions in pattern
-            amount_variance: Variance in payment amounts (0-1)
-            days_between: Days between each transaction
-            frequency: Detected frequency
+            counts: Transactions per group
+            amount_variance: Variance in payment amounts per group (0-1)
+            avg_days: Average days between payments per group
+            gap_std: Sample standard deviation of gaps per group
+            gap_counts: Number of gaps per group
+            frequencies: Detected frequency per group
 
         Returns:
-            Confidence score from 0.0 to 1.0
+            Confidence scores (before clamping and rounding)
         """
-        # Base confidence from transaction count
-        count_score = min(1.0, transaction_count / 6)  # Max at 6 transactions
+        irregular = np.array([f == FrequencyType.IRREGULAR for f in frequencies], dtype=bool)
+
+        # Base confidence from transaction count (max at 6 transactions)
+        count_score = np.minimum(1.0, counts / 6)
 
         # Amount consistency score (inverted variance)
         amount_score = 1.0 - amount_variance
 
         # Timing consistency score
-        if frequency != FrequencyType.IRREGULAR and len(days_between) > 1:
-            try:
-                timing_std = stdev(days_between)
-                avg_days = mean(days_between)
-                timing_variance = timing_std / avg_days if avg_days else 1.0
-                timing_score = max(0.0, 1.0 - timing_variance)
-            except Exception:
-                timing_score = 0.5
-        else:
-            timing_score = 0.3 if frequency == FrequencyType.IRREGULAR else 0.5
+        with np.errstate(divide="ignore", invalid="ignore"):
+            timing_variance = np.where(avg_days > 0, gap_std / avg_days, 1.0)
+        timing_score = np.where(
+            ~irregular & (gap_counts > 1),
+            np.maximum(0.0, 1.0 - timing_variance),
+            np.where(irregular, 0.3, 0.5),
+        )
 
         # Frequency bonus (regular frequencies get a boost)
-        frequency_bonus = 0.0 if frequency == FrequencyType.IRREGULAR else 0.1
+        frequency_bonus = np.where(irregular, 0.0, 0.1)
 
         # Weighted average
-        confidence = count_score * 0.3 + amount_score * 0.3 + timing_score * 0.3 + frequency_bonus
-
-        return round(min(1.0, confidence), 2)
+        return count_score * 0.3 + amount_score * 0.3 + timing_score * 0.3 + frequency_bonus
 
     def _classify_payment_type(
         self, merchant: str, transactions: list[Transaction]
@@ -567,6 +703,16 @@ class StatementAIService:
     ) -> list[DetectedPattern]:
         """Use Claude AI to enhance pattern classification.
 
+        Cached classifications are applied first; the remaining merchants
+        are split into chunks of AI_CHUNK_SIZE and classified concurrently
+        (at most AI_MAX_CONCURRENCY requests in flight). New results are
+        written back to the cache.
+
+        The cache is shared by all users, so only the user-independent
+        fields (MERCHANT_CACHE_FIELDS) are cached and applied from it; the
+        confidence adjustment is applied only to the statement the model
+        was asked about.
+
         Args:
             patterns: Detected patterns to enhance
             currency: Statement currency
@@ -574,25 +720,91 @@ class StatementAIService:
         Returns:
             Enhanced patterns with AI classifications
         """
-        try:
-            # Build prompt for Claude
-            prompt = self._build_ai_prompt(patterns, currency)
+        cache = self.cache or await get_cache_service()
+        keys = {p.normalized_name: self._merchant_cache_key(p.normalized_name) for p in patterns}
+        cached = await cache.get_many(list(dict.fromkeys(keys.values())))
+
+        unknown: list[DetectedPattern] = []
+        for pattern in patterns:
+            classification = cached.get(keys[pattern.normalized_name])
+            if classification:
+                self._apply_classification(pattern, self._shared_fields(classification))
+            else:
+                unknown.append(pattern)
+
+        if not unknown:
+            return patterns
+
+        semaphore = asyncio.Semaphore(self.AI_MAX_CONCURRENCY)
+        chunks = [
+            unknown[i : i + self.AI_CHUNK_SIZE] for i in range(0, len(unknown), self.AI_CHUNK_SIZE)
+        ]
+        results = await asyncio.gather(
+            *(self._classify_chunk(chunk, currency, semaphore) for chunk in chunks)
+        )
 
-            response = self.client.messages.create(
-                model="claude-haiku-4-5-20250929",
-                max_tokens=2000,
-                messages=[{"role": "user", "content": prompt}],
-            )
+        classifications: dict[str, dict[str, Any]] = {}
+        for result in results:
+            classifications.update(result)
 
-            # Parse AI response and update patterns
-            ai_text = response.content[0].text if response.content else ""
-            patterns = self._parse_ai_response(patterns, ai_text)
+        for pattern in unknown:
+            classification = classifications.get(pattern.normalized_name)
+            if classification:
+                self._apply_classification(pattern, classification)
 
-        except Exception as e:
-            logger.warning(f"AI enhancement failed, using rule-based only: {e}")
+        new_entries = {
+            keys[name]: self._shared_fields(classification)
+            for name, classification in classifications.items()
+            if name in keys
+        }
+        if new_entries:
+            await cache.set_many(new_entries, ttl=settings.merchant_classification_cache_ttl)
 
         return patterns
 
+    async def _classify_chunk(
+        self,
+        patterns: list[DetectedPattern],
+        currency: str,
+        semaphore: asyncio.Semaphore,
+    ) -> dict[str, dict[str, Any]]:
+        """Ask Claude to classify one chunk of patterns.
+
+        Args:
+            patterns: At most AI_CHUNK_SIZE patterns
+            currency: Statement currency
+            semaphore: Bounds concurrent requests
+
+        Returns:
+            Classifications keyed by normalized name (empty on failure)
+        """
+        async with semaphore:
+            try:
+                prompt = self._build_ai_prompt(patterns, currency)
+
+                response = await self.client.messages.create(
+                    model="claude-haiku-4-5-20250929",
+                    max_tokens=2000,
+                    messages=[{"role": "user", "content": prompt}],
+                )
+
+                ai_text = response.content[0].text if response.content else ""
+                return self._parse_ai_classifications(ai_text)
+
+            except Exception as e:
+                logger.warning(
+                    f"AI enhancement failed for {len(patterns)} patterns, using rule-based only: {e}"
+                )
+                return {}
+
+    def _merchant_cache_key(self, normalized_name: str) -> str:
+        """Build the shared cache key for a merchant classification."""
+        return f"{self.MERCHANT_CACHE_PREFIX}:{normalized_name}"
+
+    def _shared_fields(self, classification: dict[str, Any]) -> dict[str, Any]:
+        """Keep the classification fields that may be shared across users."""
+        return {field: classification.get(field) for field in self.MERCHANT_CACHE_FIELDS}
+
     def _build_ai_prompt(self, patterns: list[DetectedPattern], currency: str) -> str:
         """Build prompt for Claude AI analysis.
 
@@ -607,7 +819,7 @@ class StatementAIService:
             [
                 f"- {p.normalized_name}: {currency} {p.amount}, {p.frequency.value}, "
                 f"{p.transaction_count} transactions, samples: {p.sample_descriptions[:2]}"
-                for p in patterns[:20]  # Limit to 20 patterns
+                for p in patterns[: self.AI_CHUNK_SIZE]
             ]
         )
 
@@ -626,74 +838,71 @@ PATTERN: [normalized_name] | NAME: [clean name] | TYPE: [payment_type] | ADJUST:
 
 Only include patterns you can classify. Focus on accuracy."""
 
-    def _parse_ai_response(
-        self, patterns: list[DetectedPattern], ai_response: str
-    ) -> list[DetectedPattern]:
-        """Parse AI response and update patterns.
+    def _parse_ai_classifications(self, ai_response: str) -> dict[str, dict[str, Any]]:
+        """Parse Claude's response into per-merchant classifications.
 
         Args:
-            patterns: Original patterns
             ai_response: Claude's response text
 
         Returns:
-            Updated patterns
+            Dict mapping normalized name to {"name", "type", "adjust"}
         """
-        # Create lookup by normalized name
-        pattern_lookup = {p.normalized_name: p for p in patterns}
+        classifications: dict[str, dict[str, Any]] = {}
 
-        # Parse each line of AI response
         for line in ai_response.split("\n"):
             if not line.startswith("PATTERN:"):
                 continue
 
+            parts = line.split("|")
+            if len(parts) < 4:
+                continue
+
+            normalized = parts[0].replace("PATTERN:", "").strip()
             try:
-                parts = line.split("|")
-                if len(parts) < 4:
-                    continue
-
-                # Extract values
-                normalized = parts[0].replace("PATTERN:", "").strip()
-                clean_name = parts[1].replace("NAME:", "").strip()
-                type_str = parts[2].replace("TYPE:", "").strip().lower()
-                adjust_str = parts[3].replace("ADJUST:", "").strip()
-
-                # Find matching pattern
-                if normalized in pattern_lookup:
-                    pattern = pattern_lookup[normalized]
-
-                    # Update merchant name
-                    if clean_name:
-                        pattern.merchant_name = clean_name
-
-                    # Update payment type
-                    try:
-                        pattern.payment_type = PaymentTypeClassification(type_str)
-                    except ValueError:
-                        pass
-
-                    # Apply confidence adjustment
-                    try:
-                        adjust = float(adjust_str)
-                        pattern.confidence = round(
-                            max(0.0, min(1.0, pattern.confidence + adjust)), 2
-                        )
-                    except ValueError:
-                        pass
+                adjust: float | None = float(parts[3].replace("ADJUST:", "").strip())
+            except ValueError:
+                adjust = None
 
-            except Exception as e:
-                logger.debug(f"Failed to parse AI line: {e}")
-                continue
+            classifications[normalized] = {
+                "name": parts[1].replace("NAME:", "").strip(),
+                "type": parts[2].replace("TYPE:", "").strip().lower(),
+                "adjust": adjust,
+            }
 
-        return patterns
+        return classifications
+
+    def _apply_classification(
+        self, pattern: DetectedPattern, classification: dict[str, Any]
+    ) -> None:
+        """Update a pattern in place from an AI classification.
+
+        Args:
+            pattern: Pattern to update
+            classification: Parsed or cached classification
+        """
+        # Update merchant name
+        if classification.get("name"):
+            pattern.merchant_name = classification["name"]
+
+        # Update payment type
+        try:
+            pattern.payment_type = PaymentTypeClassification(classification.get("type"))
+        except ValueError:
+            pass
+
+        # Apply confidence adjustment
+        adjust = classification.get("adjust")
+        if isinstance(adjust, int | float):
+            pattern.confidence = round(max(0.0, min(1.0, pattern.confidence + adjust)), 2)
 
 
 def get_statement_ai_service(
-    anthropic_client: Anthropic | None = None,
+    anthropic_client: AsyncAnthropic | None = None,
 ) -> StatementAIService:
     """Factory function for statement AI service.
 
     Args:
-        anthropic_client: Optional Anthropic client
+        anthropic_client: Optional async Anthropic client
 
     Returns:
         Configured StatementAIService
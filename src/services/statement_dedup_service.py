@@ -0,0 +1,198 @@
+"""Statement re-upload deduplication service.
+
+Users frequently upload the same statement twice, or statements whose
+periods overlap. This service avoids redoing work in both cases:
+
+- Parse cache: parsed StatementData is cached in Redis keyed by the
+  SHA-256 of the file bytes, so an identical re-upload skips parsing.
+- Transaction fingerprints: every transaction of an analysed statement is
+  recorded as a fingerprint, so once that import is confirmed the next
+  upload can tell which of its transactions were already imported and
+  only spend analysis (and AI tokens) on merchants with new activity.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import uuid
+from collections.abc import Sequence
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.models.statement_import import (
+    FileType,
+    ImportJobStatus,
+    StatementImportJob,
+    StatementTransactionFingerprint,
+)
+from src.services.cache_service import get_cache_service
+from src.services.parsers.base import StatementData
+
+logger = logging.getLogger(__name__)
+
+# Jobs whose transactions count as already analysed. Only confirmed jobs:
+# a READY job may still be cancelled, or be replaced by re-uploading the
+# statement with other analysis options, which must get a full analysis.
+ANALYSED_JOB_STATUSES = (ImportJobStatus.COMPLETED,)
+
+
+def hash_content(content: bytes) -> str:
+    """Return the SHA-256 hex digest of an uploaded file."""
+    return hashlib.sha256(content).hexdigest()
+
+
+class StatementDedupService:
+    """Parse-result cache and transaction fingerprint store.
+
+    Attributes:
+        db: Async database session.
+
+    Example:
+        >>> dedup = StatementDedupService(db)
+        >>> key = dedup.parse_cache_key(content_hash, FileType.CSV, "GBP")
+        >>> statement = await dedup.get_cached_statement(key)
+        >>> known = await dedup.find_known_fingerprints(user_id, fingerprints)
+    """
+
+    PARSE_CACHE_PREFIX = "stmt:parse"
+    # Bound on IN-list size when looking up fingerprints
+    LOOKUP_CHUNK_SIZE = 500
+
+    def __init__(self, db: AsyncSession) -> None:
+        """Initialize the service.
+
+        Args:
+            db: Async database session.
+        """
+        self.db = db
+
+    @classmethod
+    def parse_cache_key(
+        cls,
+        content_hash: str,
+        file_type: FileType,
+        currency: str,
+        bank_id: str | None = None,
+    ) -> str:
+        """Build the cache key for a parse result.
+
+        The parse output depends on the parser options as well as the
+        bytes, so the currency and bank profile are part of the key.
+
+        Args:
+            content_hash: SHA-256 of the file content.
+            file_type: Detected file type.
+            currency: Default currency passed to the parser.
+            bank_id: Bank profile used for CSV column mapping, if any.
+
+        Returns:
+            Cache key string.
+        """
+        options = f"{file_type.value}:{currency}:{bank_id or '-'}"
+        return f"{cls.PARSE_CACHE_PREFIX}:{content_hash}:{options}"
+
+    async def get_cached_statement(self, key: str) -> StatementData | None:
+        """Return a cached parse result, or None on a miss.
+
+        Args:
+            key: Key from parse_cache_key().
+
+        Returns:
+            Parsed statement, or None if not cached or unreadable.
+        """
+        cache = await get_cache_service()
+        data = await cache.get(key)
+        if data is None:
+            return None
+
+        try:
+            return StatementData.from_dict(data)
+        except (KeyError, TypeError, ValueError, ArithmeticError) as e:
+            logger.warning(f"Discarding unreadable cached statement {key}: {e}")
+            await cache.delete(key)
+            return None
+
+    async def cache_statement(self, key: str, statement: StatementData) -> bool:
+        """Cache a parse result.
+
+        Args:
+            key: Key from parse_cache_key().
+            statement: Parsed statement.
+
+        Returns:
+            True if cached, False if caching is unavailable.
+        """
+        cache = await get_cache_service()
+        return await cache.set(key, statement.to_dict(), ttl=settings.statement_parse_cache_ttl)
+
+    async def find_known_fingerprints(
+        self,
+        user_id: str,
+        fingerprints: Sequence[str],
+    ) -> set[str]:
+        """Return the fingerprints already analysed in the user's earlier imports.
+
+        Args:
+            user_id: Owner of the imports.
+            fingerprints: Fingerprints of the statement being imported.
+
+        Returns:
+            Subset of fingerprints recorded by COMPLETED jobs.
+        """
+        unique = list(dict.fromkeys(fingerprints))
+        known: set[str] = set()
+
+        for start in range(0, len(unique), self.LOOKUP_CHUNK_SIZE):
+            chunk = unique[start : start + self.LOOKUP_CHUNK_SIZE]
+            result = await self.db.execute(
+                select(StatementTransactionFingerprint.fingerprint)
+                .join(
+                    StatementImportJob,
+                    StatementImportJob.id == StatementTransactionFingerprint.job_id,
+                )
+                .where(
+                    StatementTransactionFingerprint.user_id == user_id,
+                    StatementTransactionFingerprint.fingerprint.in_(chunk),
+                    StatementImportJob.status.in_(ANALYSED_JOB_STATUSES),
+                )
+                .distinct()
+            )
+            known.update(result.scalars().all())
+
+        return known
+
+    async def record_fingerprints(
+        self,
+        user_id: str,
+        job_id: uuid.UUID,
+        fingerprints: Sequence[str],
+    ) -> None:
+        """Record the fingerprints of a job's transactions.
+
+        All fingerprints are stored, not only new ones, so deleting or
+        cancelling an earlier job never hides transactions of this one.
+
+        Args:
+            user_id: Owner of the import.
+            job_id: Import job the transactions belong to.
+            fingerprints: Fingerprints from fingerprint_transactions().
+        """
+        unique = list(dict.fromkeys(fingerprints))
+        if not unique:
+            return
+
+        await self.db.execute(
+            insert(StatementTransactionFingerprint.__table__),
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "user_id": user_id,
+                    "job_id": job_id,
+                    "fingerprint": fingerprint,
+                }
+                for fingerprint in unique
+            ],
+        )
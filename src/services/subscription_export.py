@@ -0,0 +1,258 @@
+"""Streaming subscription exports.
+
+Exports are produced incrementally: subscriptions are read from a
+server-side cursor (SubscriptionService.stream_all), converted to
+SubscriptionExport records one at a time and encoded into byte chunks
+that are sent as they are ready. Memory use does not grow with the
+number of payments, and the first bytes go out before the last row is
+read.
+
+Formats:
+    - JSON: the ExportData document (version 2.0). The subscription count
+      is written after the list, as it is only known at the end.
+    - NDJSON: one SubscriptionExport object per line.
+    - CSV: Money Flow v2.1 columns with a header row.
+
+Any format can be gzip-compressed on the fly with gzip_stream().
+
+Example:
+    >>> records = iter_export_records(service, is_active=None)
+    >>> chunks = gzip_stream(encode_export(records, ExportFormat.CSV))
+"""
+
+import csv
+import io
+import json
+import zlib
+from collections.abc import AsyncIterator
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+
+from src.models.subscription import PaymentType, Subscription
+from src.schemas.subscription import SubscriptionExport
+from src.services.subscription_service import SubscriptionService
+
+EXPORT_VERSION = "2.0"
+
+# Records encoded per yielded chunk
+CHUNK_RECORDS = 100
+
+# Compression level for gzipped exports (speed over ratio)
+GZIP_LEVEL = 6
+
+# CSV header (Money Flow v2.1 format with payment_mode)
+CSV_COLUMNS = [
+    "name",
+    "amount",
+    "currency",
+    "frequency",
+    "frequency_interval",
+    "start_date",
+    "next_payment_date",
+    "payment_type",
+    "payment_mode",
+    "category",
+    "notes",
+    "is_active",
+    "payment_method",
+    "reminder_days",
+    "icon_url",
+    "color",
+    "auto_renew",
+    "is_installment",
+    "total_installments",
+    "completed_installments",
+    # Debt-specific fields
+    "total_owed",
+    "remaining_balance",
+    "creditor",
+    # Savings-specific fields
+    "target_amount",
+    "current_saved",
+    "recipient",
+]
+
+
+class ExportFormat(str, Enum):
+    """Streaming export formats.
+
+    Attributes:
+        JSON: ExportData JSON document.
+        NDJSON: Newline-delimited SubscriptionExport objects.
+        CSV: Comma-separated values with a header row.
+    """
+
+    JSON = "json"
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    @property
+    def media_type(self) -> str:
+        """MIME type of the (uncompressed) export."""
+        return {
+            ExportFormat.JSON: "application/json",
+            ExportFormat.NDJSON: "application/x-ndjson",
+            ExportFormat.CSV: "text/csv",
+        }[self]
+
+
+def _format_decimal(value: Decimal | None) -> str | None:
+    """Format Decimal for export, preserving null vs zero distinction."""
+    if value is None:
+        return None
+    return str(value)
+
+
+def to_export(sub: Subscription, service: SubscriptionService) -> SubscriptionExport:
+    """Convert a subscription to its export record.
+
+    Stale schedules are exported with their effective values (see
+    SubscriptionService.resolve_schedule) without being written back.
+
+    Args:
+        sub: Subscription to export.
+        service: Service used to resolve the schedule.
+
+    Returns:
+        Export record of the subscription.
+    """
+    is_active, next_payment_date = service.resolve_schedule(sub)
+    return SubscriptionExport(
+        name=sub.name,
+        amount=str(sub.amount),
+        currency=sub.currency,
+        frequency=sub.frequency.value,
+        frequency_interval=sub.frequency_interval,
+        start_date=sub.start_date.isoformat(),
+        next_payment_date=next_payment_date.isoformat(),
+        payment_type=sub.payment_type.value,
+        payment_mode=sub.payment_mode.value if sub.payment_mode else "recurring",
+        category=sub.category,
+        notes=sub.notes,
+        is_active=is_active,
+        payment_method=sub.payment_method,
+        reminder_days=sub.reminder_days,
+        icon_url=sub.icon_url,
+        color=sub.color,
+        auto_renew=sub.auto_renew,
+        is_installment=sub.is_installment,
+        total_installments=sub.total_installments,
+        completed_installments=sub.completed_installments,
+        total_owed=_format_decimal(sub.total_owed),
+        remaining_balance=_format_decimal(sub.remaining_balance),
+        creditor=sub.creditor,
+        target_amount=_format_decimal(sub.target_amount),
+        current_saved=_format_decimal(sub.current_saved),
+        recipient=sub.recipient,
+    )
+
+
+async def iter_export_records(
+    service: SubscriptionService,
+    is_active: bool | None = None,
+    payment_type: PaymentType | None = None,
+) -> AsyncIterator[SubscriptionExport]:
+    """Stream export records of a user's subscriptions.
+
+    Args:
+        service: Subscription service of the user.
+        is_active: Filter by active status. If None, exports all payments.
+        payment_type: Optional filter for a specific payment type.
+
+    Yields:
+        Export records ordered by next payment date.
+    """
+    async for sub in service.stream_all(is_active=is_active, payment_type=payment_type):
+        yield to_export(sub, service)
+
+
+def _csv_value(value: object) -> object:
+    """Format a record value as the CSV export writes it."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return str(value).lower()
+    return value
+
+
+async def _encode_csv(records: AsyncIterator[SubscriptionExport]) -> AsyncIterator[bytes]:
+    """Encode records as CSV chunks."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_COLUMNS)
+    count = 0
+    async for record in records:
+        values = record.model_dump()
+        writer.writerow([_csv_value(values[column]) for column in CSV_COLUMNS])
+        count += 1
+        if count % CHUNK_RECORDS == 0:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+
+async def _encode_ndjson(records: AsyncIterator[SubscriptionExport]) -> AsyncIterator[bytes]:
+    """Encode records as NDJSON chunks."""
+    lines: list[str] = []
+    async for record in records:
+        lines.append(record.model_dump_json())
+        if len(lines) == CHUNK_RECORDS:
+            yield ("\n".join(lines) + "\n").encode()
+            lines.clear()
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
+async def _encode_json(records: AsyncIterator[SubscriptionExport]) -> AsyncIterator[bytes]:
+    """Encode records as an ExportData JSON document in chunks."""
+    header = json.dumps({"version": EXPORT_VERSION, "exported_at": datetime.utcnow().isoformat()})
+    # Open the subscriptions list inside the header object
+    yield (header[:-1] + ', "subscriptions": [').encode()
+    parts: list[str] = []
+    count = 0
+    async for record in records:
+        parts.append(("," if count else "") + record.model_dump_json())
+        count += 1
+        if len(parts) == CHUNK_RECORDS:
+            yield "".join(parts).encode()
+            parts.clear()
+    parts.append(f'], "subscription_count": {count}}}')
+    yield "".join(parts).encode()
+
+
+def encode_export(
+    records: AsyncIterator[SubscriptionExport], export_format: ExportFormat
+) -> AsyncIterator[bytes]:
+    """Encode export records incrementally.
+
+    Args:
+        records: Export records to encode.
+        export_format: Output format.
+
+    Returns:
+        Async iterator of UTF-8 encoded chunks.
+    """
+    encoders = {
+        ExportFormat.JSON: _encode_json,
+        ExportFormat.NDJSON: _encode_ndjson,
+        ExportFormat.CSV: _encode_csv,
+    }
+    return encoders[export_format](records)
+
+
+async def gzip_stream(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Gzip-compress a byte stream on the fly.
+
+    Args:
+        chunks: Uncompressed chunks.
+
+    Yields:
+        Chunks of a single gzip member.
+    """
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        if compressed := compressor.compress(chunk):
+            yield compressed
+    yield compressor.flush()
@@ -8,15 +8,17 @@ provides semantic search over subscription notes.
 """
 
 import logging
-from collections.abc import Sequence
+import uuid
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass
 from datetime import date, timedelta
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
 from dateutil.relativedelta import relativedelta
-from sqlalchemy import and_, select
+from sqlalchemy import and_, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from src.core.config import settings
 from src.core.exceptions import SubscriptionNotFoundError
@@ -27,6 +29,7 @@ from src.schemas.subscription import (
     SubscriptionSummary,
     SubscriptionUpdate,
 )
+from src.services.ical_cache import mark_subscriptions_changed
 from src.services.rag_service import get_rag_service
 
 if TYPE_CHECKING:
@@ -35,7 +38,25 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 # Re-export for backwards compatibility
-__all__ = ["SubscriptionService", "SubscriptionNotFoundError"]
+__all__ = ["BulkCreateResult", "SubscriptionService", "SubscriptionNotFoundError"]
+
+
+@dataclass
+class BulkCreateResult:
+    """Outcome of a bulk subscription insert.
+
+    Attributes:
+        ids: Created subscription ID per input row, None for failed rows.
+        errors: Error message per failed input row index.
+    """
+
+    ids: list[str | None]
+    errors: dict[int, str]
+
+    @property
+    def created_ids(self) -> list[str]:
+        """IDs of the rows that were created, in input order."""
+        return [sub_id for sub_id in self.ids if sub_id is not None]
 
 
 class SubscriptionService:
@@ -81,6 +102,9 @@ class SubscriptionService:
         self.user_id = user_id
         self._rag = None  # Lazy loaded
 
+    # Rows fetched per round trip by stream_all()
+    STREAM_BATCH_SIZE = 500
+
     def _get_rag(self):
         """Get RAG service (lazy loaded).
 
@@ -161,6 +185,84 @@ class SubscriptionService:
         logger.info(f"Created subscription: {subscription.name} ({subscription.id})")
         return subscription
 
+    async def create_many(
+        self,
+        items: Sequence[SubscriptionCreate],
+        **overrides: object,
+    ) -> BulkCreateResult:
+        """Create many subscriptions with a single multi-row INSERT.
+
+        Rows are inserted with one ``INSERT ... RETURNING`` statement and
+        their notes are indexed with one embedding batch. If the bulk
+        statement fails, rows are retried one by one inside savepoints so
+        a bad row is reported without aborting the rest.
+
+        Args:
+            items: Validated subscription creation data.
+            **overrides: Column values applied to every row
+                (e.g. ``card_id``, ``category_id``).
+
+        Returns:
+            BulkCreateResult with created IDs and per-row errors.
+
+        Example:
+            >>> result = await service.create_many([netflix_data, spotify_data])
+            >>> len(result.created_ids)
+            2
+        """
+        rows: list[dict[str, object]] = []
+        for data in items:
+            row = data.model_dump()
+            row.update({key: value for key, value in overrides.items() if value is not None})
+            row["id"] = str(uuid.uuid4())
+            row["next_payment_date"] = self._calculate_next_payment(
+                data.start_date, data.frequency, data.frequency_interval
+            )
+            if self.user_id and self.user_id != "default":
+                row["user_id"] = self.user_id
+            rows.append(row)
+
+        result = BulkCreateResult(ids=[None] * len(rows), errors={})
+        if not rows:
+            return result
+
+        # Core-level insert: the ORM bulk path falls back to per-row
+        # statements when RETURNING must follow parameter order
+        table = Subscription.__table__
+        stmt = insert(table).returning(table.c.id, sort_by_parameter_order=True)
+        try:
+            async with self.db.begin_nested():
+                inserted = await self.db.execute(stmt, rows)
+                result.ids = list(inserted.scalars().all())
+        except Exception as e:
+            logger.warning(
+                f"Bulk insert of {len(rows)} subscriptions failed, retrying per row: {e}"
+            )
+            for i, row in enumerate(rows):
+                try:
+                    async with self.db.begin_nested():
+                        await self.db.execute(insert(table), [row])
+                    result.ids[i] = str(row["id"])
+                except Exception as row_error:
+                    result.errors[i] = str(getattr(row_error, "orig", row_error))
+        if result.created_ids:
+            mark_subscriptions_changed(self.db, self.user_id)
+
+        # Index notes for semantic search in one batch
+        rag = self._get_rag()
+        if rag:
+            await rag.index_notes(
+                user_id=self.user_id,
+                notes={
+                    sub_id: data.notes
+                    for sub_id, data in zip(result.ids, items)
+                    if sub_id is not None and data.notes
+                },
+            )
+
+        logger.info(f"Created {len(result.created_ids)} subscriptions in bulk")
+        return result
+
     async def get_by_id(self, subscription_id: str) -> Subscription | None:
         """Get a subscription by its ID.
 
@@ -277,6 +379,37 @@ class SubscriptionService:
         elif include_card:
             query = query.options(selectinload(Subscription.payment_card))
 
+        conditions = self._filters(is_active, category, payment_type, payment_mode)
+        if conditions:
+            query = query.where(and_(*conditions))
+
+        result = await self.db.execute(query.order_by(Subscription.next_payment_date))
+        subscriptions = list(result.scalars().all())
+
+        # Auto-advance next_payment_date for subscriptions where it's in the past
+        # Also auto-deactivate subscriptions that have passed their end_date
+        today = date.today()
+        updated = False
+        for sub in subscriptions:
+            is_active, next_payment_date = self.resolve_schedule(sub, today)
+            if (is_active, next_payment_date) != (sub.is_active, sub.next_payment_date):
+                sub.is_active = is_active
+                sub.next_payment_date = next_payment_date
+                updated = True
+
+        if updated:
+            await self.db.flush()
+
+        return subscriptions
+
+    def _filters(
+        self,
+        is_active: bool | None = None,
+        category: str | None = None,
+        payment_type: PaymentType | None = None,
+        payment_mode: PaymentMode | None = None,
+    ) -> list:
+        """Build the WHERE conditions shared by get_all() and stream_all()."""
         conditions = []
         # Always filter by user_id if not "default" - uses composite index
         if self.user_id and self.user_id != "default":
@@ -289,36 +422,70 @@ class SubscriptionService:
             conditions.append(Subscription.payment_type == payment_type)
         if payment_mode is not None:
             conditions.append(Subscription.payment_mode == payment_mode)
+        return conditions
 
-        if conditions:
-            query = query.where(and_(*conditions))
+    def resolve_schedule(self, sub: Subscription, today: date | None = None) -> tuple[bool, date]:
+        """Get the effective active flag and next payment date of a subscription.
 
-        result = await self.db.execute(query.order_by(Subscription.next_payment_date))
-        subscriptions = list(result.scalars().all())
+        A subscription whose end_date has passed is inactive; an active one
+        whose next_payment_date is in the past is advanced to the next
+        occurrence. get_all() writes these values back; readers that must
+        not write (such as exports) use them as-is.
 
-        # Auto-advance next_payment_date for subscriptions where it's in the past
-        # Also auto-deactivate subscriptions that have passed their end_date
-        today = date.today()
-        updated = False
-        for sub in subscriptions:
-            # Auto-deactivate if end_date has passed
-            if sub.end_date and sub.end_date < today and sub.is_active:
-                sub.is_active = False
-                updated = True
-                continue
+        Args:
+            sub: Subscription to resolve.
+            today: Reference date (default: today).
 
-            if sub.next_payment_date < today and sub.is_active:
-                new_date = self._calculate_next_payment(
-                    sub.start_date, sub.frequency, sub.frequency_interval
-                )
-                if new_date != sub.next_payment_date:
-                    sub.next_payment_date = new_date
-                    updated = True
+        Returns:
+            Tuple of (is_active, next_payment_date).
+        """
+        today = today or date.today()
+        if not sub.is_active:
+            return sub.is_active, sub.next_payment_date
+        # Auto-deactivate if end_date has passed
+        if sub.end_date and sub.end_date < today:
+            return False, sub.next_payment_date
+        if sub.next_payment_date < today:
+            return True, self._calculate_next_payment(
+                sub.start_date, sub.frequency, sub.frequency_interval
+            )
+        return True, sub.next_payment_date
 
-        if updated:
-            await self.db.flush()
+    async def stream_all(
+        self,
+        is_active: bool | None = None,
+        payment_type: PaymentType | None = None,
+    ) -> AsyncIterator[Subscription]:
+        """Stream subscriptions from a server-side cursor.
 
-        return subscriptions
+        Rows are fetched STREAM_BATCH_SIZE at a time, so memory stays flat
+        however many payments a user has. Unlike get_all(), relationships
+        are not loaded and stale dates are not written back (see
+        resolve_schedule()).
+
+        Args:
+            is_active: Filter by active status. If None, streams all payments.
+            payment_type: Filter by payment type. If None, streams all types.
+
+        Yields:
+            Subscriptions ordered by next_payment_date.
+        """
+        query = (
+            select(Subscription)
+            .options(raiseload("*"))
+            .order_by(Subscription.next_payment_date)
+            .execution_options(yield_per=self.STREAM_BATCH_SIZE)
+        )
+        conditions = self._filters(is_active=is_active, payment_type=payment_type)
+        if conditions:
+            query = query.where(and_(*conditions))
+
+        result = await self.db.stream_scalars(query)
+        try:
+            async for sub in result:
+                yield sub
+        finally:
+            await result.close()
 
     async def update(
         self,
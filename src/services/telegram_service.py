@@ -7,6 +7,7 @@ and handling Telegram bot interactions. Supports both webhook and long-polling m
 import asyncio
 import hmac
 import logging
+from collections import defaultdict
 from collections.abc import Callable, Coroutine
 from datetime import date
 from decimal import Decimal
@@ -17,8 +18,21 @@ import httpx
 from src.core.config import settings
 from src.models.subscription import Subscription
 
+# HTTP/2 needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Connection pool of the service's own HTTP client
+HTTP_TIMEOUT = 10.0
+HTTP_MAX_CONNECTIONS = 20
+HTTP_KEEPALIVE_EXPIRY = 60.0
+
 # Type alias for update handler
 UpdateHandler = Callable[[dict[str, Any]], Coroutine[Any, Any, None]]
 
@@ -31,6 +45,32 @@ CURRENCY_SYMBOLS = {
 }
 
 
+def create_http_client(
+    max_connections: int = HTTP_MAX_CONNECTIONS,
+    timeout: float = HTTP_TIMEOUT,
+) -> httpx.AsyncClient:
+    """Create a pooled HTTP client for the Bot API.
+
+    Uses HTTP/2 when the h2 package is installed, so concurrent requests
+    share one connection.
+
+    Args:
+        max_connections: Connection pool size.
+        timeout: Default request timeout in seconds.
+
+    Returns:
+        New HTTP client; the caller must close it.
+    """
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=httpx.Timeout(timeout),
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+    )
+
+
 class TelegramService:
     """Service for sending Telegram notifications.
 
@@ -48,15 +88,44 @@ class TelegramService:
         True
     """
 
-    def __init__(self, bot_token: str | None = None):
+    # Longest flood-control wait honoured before giving up on a message
+    MAX_RETRY_AFTER = 30.0
+
+    def __init__(
+        self,
+        bot_token: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ):
         """Initialize TelegramService.
 
         Args:
             bot_token: Optional bot token (defaults to config).
+            http_client: Optional shared HTTP client. When given, requests
+                reuse its connection pool and the caller owns its lifetime;
+                otherwise the service creates its own pooled client on first
+                use and closes it in aclose().
         """
         self.bot_token = bot_token or settings.telegram_bot_token
         self.bot_username = settings.telegram_bot_username
         self.api_url = f"https://api.telegram.org/bot{self.bot_token}"
+        self._http_client = http_client
+        self._owns_client = http_client is None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating the service's own on first use.
+
+        The client is kept for the lifetime of the service so connections
+        (and TLS sessions) are reused across messages and polls.
+        """
+        if self._http_client is None:
+            self._http_client = create_http_client()
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if it was created by the service."""
+        if self._owns_client and self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
 
     @property
     def is_configured(self) -> bool:
@@ -102,25 +171,39 @@ class TelegramService:
             logger.warning("Telegram bot not configured, skipping message")
             return False
 
+        payload = {
+            "chat_id": chat_id,
+            "text": text,
+            "parse_mode": parse_mode,
+            "disable_notification": disable_notification,
+        }
         try:
-            async with httpx.AsyncClient() as client:
+            client = self._get_client()
+            response = await client.post(f"{self.api_url}/sendMessage", json=payload, timeout=10.0)
+            if response.status_code == 429:
+                # Flood control: wait as instructed by Telegram and retry once
+                retry_after = self._retry_after(response)
+                logger.warning(f"Telegram rate limit hit, retrying in {retry_after}s")
+                await asyncio.sleep(retry_after)
                 response = await client.post(
-                    f"{self.api_url}/sendMessage",
-                    json={
-                        "chat_id": chat_id,
-                        "text": text,
-                        "parse_mode": parse_mode,
-                        "disable_notification": disable_notification,
-                    },
-                    timeout=10.0,
+                    f"{self.api_url}/sendMessage", json=payload, timeout=10.0
                 )
-                response.raise_for_status()
-                result = response.json()
-                return result.get("ok", False)
+            response.raise_for_status()
+            result = response.json()
+            return result.get("ok", False)
         except httpx.HTTPError as e:
             logger.error(f"Failed to send Telegram message: {e}")
             return False
 
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> float:
+        """Read the flood-control delay from a 429 response, capped at MAX_RETRY_AFTER."""
+        try:
+            retry_after = float(response.json().get("parameters", {}).get("retry_after", 1))
+        except (ValueError, AttributeError):
+            retry_after = 1.0
+        return min(max(retry_after, 0.0), TelegramService.MAX_RETRY_AFTER)
+
     async def send_reminder(
         self,
         chat_id: str,
@@ -408,12 +491,12 @@ If you received this message, your Telegram notifications are working correctly!
             return None
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"{self.api_url}/getMe", timeout=10.0)
-                response.raise_for_status()
-                result = response.json()
-                if result.get("ok"):
-                    return result.get("result")
+            client = self._get_client()
+            response = await client.get(f"{self.api_url}/getMe", timeout=10.0)
+            response.raise_for_status()
+            result = response.json()
+            if result.get("ok"):
+                return result.get("result")
         except httpx.HTTPError as e:
             logger.error(f"Failed to get bot info: {e}")
 
@@ -444,16 +527,16 @@ If you received this message, your Telegram notifications are working correctly!
             params["offset"] = offset
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.api_url}/getUpdates",
-                    params=params,
-                    timeout=timeout + 10,  # HTTP timeout > long poll timeout
-                )
-                response.raise_for_status()
-                result = response.json()
-                if result.get("ok"):
-                    return result.get("result", [])
+            client = self._get_client()
+            response = await client.get(
+                f"{self.api_url}/getUpdates",
+                params=params,
+                timeout=timeout + 10,  # HTTP timeout > long poll timeout
+            )
+            response.raise_for_status()
+            result = response.json()
+            if result.get("ok"):
+                return result.get("result", [])
         except httpx.HTTPError as e:
             logger.error(f"Failed to get updates: {e}")
 
@@ -469,15 +552,15 @@ If you received this message, your Telegram notifications are working correctly!
             return False
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.api_url}/deleteWebhook",
-                    json={"drop_pending_updates": False},
-                    timeout=10.0,
-                )
-                response.raise_for_status()
-                result = response.json()
-                return result.get("ok", False)
+            client = self._get_client()
+            response = await client.post(
+                f"{self.api_url}/deleteWebhook",
+                json={"drop_pending_updates": False},
+                timeout=10.0,
+            )
+            response.raise_for_status()
+            result = response.json()
+            return result.get("ok", False)
         except httpx.HTTPError as e:
             logger.error(f"Failed to delete webhook: {e}")
             return False
@@ -487,27 +570,38 @@ class TelegramPoller:
     """Long polling handler for Telegram bot updates.
 
     Runs a background task that polls for updates and processes them.
+    Each batch returned by getUpdates is handled concurrently across chats
+    while updates of the same chat run in order. The batch is acknowledged
+    as a whole: the next getUpdates call passes the offset past its last
+    update once every handler has finished.
 
     Attributes:
         service: TelegramService instance.
         handler: Async function to handle updates.
+        max_concurrency: Maximum number of chats handled at once.
         running: Whether the poller is currently running.
         task: The background polling task.
     """
 
+    # Chats handled concurrently within one batch of updates
+    DEFAULT_MAX_CONCURRENCY = 10
+
     def __init__(
         self,
         service: TelegramService,
         handler: UpdateHandler,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ):
         """Initialize TelegramPoller.
 
         Args:
             service: TelegramService instance.
             handler: Async function to call for each update.
+            max_concurrency: Maximum number of chats handled at once.
         """
         self.service = service
         self.handler = handler
+        self.max_concurrency = max_concurrency
         self.running = False
         self.task: asyncio.Task | None = None
         self._offset: int | None = None
@@ -554,6 +648,40 @@ class TelegramPoller:
             self.task = None
         logger.info("Telegram long polling stopped")
 
+    @staticmethod
+    def _chat_key(update: dict[str, Any]) -> str:
+        """Key grouping updates that must be handled in order (one per chat)."""
+        chat_id = (update.get("message") or {}).get("chat", {}).get("id")
+        if chat_id is None:
+            return f"update:{update.get('update_id')}"
+        return f"chat:{chat_id}"
+
+    async def _handle(self, update: dict[str, Any]) -> None:
+        """Handle one update, logging failures."""
+        try:
+            await self.handler(update)
+        except Exception as e:
+            logger.error(f"Error handling update {update.get('update_id')}: {e}")
+
+    async def _handle_batch(self, updates: list[dict[str, Any]]) -> None:
+        """Handle a batch of updates, concurrently across chats.
+
+        Args:
+            updates: Updates in the order returned by Telegram.
+        """
+        by_chat: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for update in updates:
+            by_chat[self._chat_key(update)].append(update)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def handle_chat(chat_updates: list[dict[str, Any]]) -> None:
+            async with semaphore:
+                for update in chat_updates:
+                    await self._handle(update)
+
+        await asyncio.gather(*(handle_chat(chat_updates) for chat_updates in by_chat.values()))
+
     async def _poll_loop(self) -> None:
         """Main polling loop."""
         while self.running:
@@ -562,16 +690,15 @@ class TelegramPoller:
                     offset=self._offset,
                     timeout=30,
                 )
+                if not updates:
+                    continue
 
-                for update in updates:
-                    update_id = update.get("update_id")
-                    if update_id is not None:
-                        self._offset = update_id + 1
+                await self._handle_batch(updates)
 
-                    try:
-                        await self.handler(update)
-                    except Exception as e:
-                        logger.error(f"Error handling update: {e}")
+                # Acknowledge the whole batch with the next getUpdates call
+                update_ids = [u["update_id"] for u in updates if u.get("update_id") is not None]
+                if update_ids:
+                    self._offset = max(update_ids) + 1
 
             except asyncio.CancelledError:
                 break
@@ -594,3 +721,15 @@ def get_telegram_service() -> TelegramService:
     if _telegram_service is None:
         _telegram_service = TelegramService()
     return _telegram_service
+
+
+async def close_telegram_service() -> None:
+    """Close the TelegramService singleton's HTTP client.
+
+    Should be called during application shutdown.
+    """
+    global _telegram_service
+
+    if _telegram_service is not None:
+        await _telegram_service.aclose()
+        _telegram_service = None
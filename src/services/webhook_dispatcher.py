@@ -0,0 +1,491 @@
+"""Outbox-based webhook delivery.
+
+Webhook events are not sent from the request that produced them.
+``WebhookService.trigger_event`` only adds PENDING ``WebhookDelivery``
+rows to the caller's session, so the events are written in the same
+transaction as the change they describe (the transactional outbox) and
+disappear with it on rollback. Slow or failing customer endpoints no
+longer add to API latency.
+
+The dispatcher running in the ARQ worker sends the committed rows:
+
+- Claiming: pending deliveries are selected with ``FOR UPDATE SKIP
+  LOCKED``, so any number of dispatch jobs and workers can run at once
+  without sending a delivery twice.
+- Shared pool: all requests go through one pooled HTTP client.
+- Per-endpoint limits: a semaphore per endpoint host caps in-flight
+  requests, so one slow endpoint cannot take the whole pool.
+- Circuit breakers: an endpoint host failing repeatedly is skipped until
+  its circuit recovers; its deliveries are deferred, not failed.
+- Idempotency: every request carries an ``Idempotency-Key`` header equal
+  to the delivery ID, which stays the same when a delivery is sent again
+  (after a crash between the request and the commit), so receivers can
+  drop duplicates.
+
+Committing a transaction that queued deliveries enqueues a dispatch job
+straight away (see request_dispatch()); a cron run every minute picks up
+anything left behind.
+
+Failed deliveries are retried in place by a global scanner (retry_due(),
+run every minute by the worker): due RETRYING rows of all users are
+claimed in batches the same way and resent concurrently, with jittered
+backoff between attempts.
+
+Example:
+    >>> dispatcher = WebhookDispatcher(http_client=client)
+    >>> sent = await dispatcher.dispatch_pending(session)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import logging
+import random
+import time
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit
+
+import httpx
+from sqlalchemy import ColumnElement, event, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.core.resilience import (
+    CircuitBreakerState,
+    CircuitOpenError,
+    check_circuit,
+    record_circuit_failure,
+    record_circuit_success,
+)
+from src.models.webhook import (
+    DeliveryStatus,
+    WebhookDelivery,
+    WebhookStatus,
+    WebhookSubscription,
+)
+
+logger = logging.getLogger(__name__)
+
+# Retry configuration
+RETRY_DELAYS = [60, 300, 900]  # 1 min, 5 min, 15 min
+RETRY_JITTER = 0.2  # Random spread of retry delays (fraction of the delay)
+DELIVERY_TIMEOUT = 30  # seconds
+# How long a delivery sent directly by the API is hidden from the dispatcher
+# (seconds); long enough to cover the endpoint limit wait and the request
+DIRECT_SEND_LEASE = 300
+
+# Session.info key set when a transaction queued webhook deliveries
+DISPATCH_INFO_KEY = "webhook_dispatch_requested"
+
+# Dispatch jobs being enqueued from commit hooks (kept referenced until done)
+_pending_kicks: set[asyncio.Task[None]] = set()
+
+
+def sign_payload(payload: str, secret: str) -> str:
+    """Generate HMAC-SHA256 signature for payload.
+
+    Args:
+        payload: JSON payload string.
+        secret: Webhook secret.
+
+    Returns:
+        Hex-encoded signature.
+    """
+    signature = hmac.new(
+        secret.encode("utf-8"),
+        payload.encode("utf-8"),
+        hashlib.sha256,
+    )
+    return signature.hexdigest()
+
+
+def retry_delay(attempt_number: int) -> float:
+    """Delay before retrying a delivery, with jitter.
+
+    Deliveries that failed together (an endpoint outage) spread their
+    retries instead of hitting the endpoint again at the same moment.
+
+    Args:
+        attempt_number: Number of the attempt that failed (1-based).
+
+    Returns:
+        Delay in seconds.
+    """
+    base = RETRY_DELAYS[min(attempt_number - 1, len(RETRY_DELAYS) - 1)]
+    return base * random.uniform(1 - RETRY_JITTER, 1 + RETRY_JITTER)
+
+
+def endpoint_key(url: str) -> str:
+    """Endpoint a webhook URL is limited and circuit-broken by (its host).
+
+    Args:
+        url: Webhook target URL.
+
+    Returns:
+        Lower-cased host and port, or the URL itself if it has none.
+    """
+    return urlsplit(url).netloc.lower() or url
+
+
+def build_headers(webhook: WebhookSubscription, delivery: WebhookDelivery) -> dict[str, str]:
+    """Build the request headers of a delivery.
+
+    Args:
+        webhook: Target webhook subscription.
+        delivery: Delivery being sent.
+
+    Returns:
+        Signed request headers, including the webhook's custom headers.
+    """
+    signature = sign_payload(delivery.payload, webhook.secret)
+    headers = {
+        "Content-Type": "application/json",
+        "X-Webhook-Signature": f"sha256={signature}",
+        "X-Webhook-Event": delivery.event_type,
+        "X-Webhook-Id": webhook.id,
+        "X-Webhook-Delivery": delivery.id,
+        "Idempotency-Key": delivery.id,
+    }
+
+    # Add custom headers
+    custom_headers = webhook.get_headers_dict()
+    if custom_headers:
+        headers.update(custom_headers)
+    return headers
+
+
+class WebhookDispatcher:
+    """Sends webhook deliveries within per-endpoint limits.
+
+    One dispatcher is shared by all tasks of a worker (see
+    ``src.core.tasks.startup``) so concurrent dispatch runs share the same
+    connection pool, endpoint limits and circuit breakers.
+
+    Attributes:
+        endpoint_concurrency: Maximum requests in flight per endpoint host.
+    """
+
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient | None = None,
+        endpoint_concurrency: int | None = None,
+    ) -> None:
+        """Initialize the dispatcher.
+
+        Args:
+            http_client: Optional shared HTTP client. When given, requests
+                use its connection pool and the caller closes it.
+            endpoint_concurrency: Requests in flight per endpoint host
+                (defaults to settings.webhook_endpoint_concurrency).
+        """
+        self.endpoint_concurrency = endpoint_concurrency or settings.webhook_endpoint_concurrency
+        self._http_client = http_client
+        self._owns_client = http_client is None
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._circuits: dict[str, CircuitBreakerState] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the HTTP client, creating a pooled one on first use."""
+        if self._http_client is None:
+            from src.services.telegram_service import create_http_client
+
+            self._http_client = create_http_client(timeout=DELIVERY_TIMEOUT)
+        return self._http_client
+
+    async def close(self) -> None:
+        """Close the HTTP client if the dispatcher created it."""
+        if self._owns_client and self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    def _semaphore(self, endpoint: str) -> asyncio.Semaphore:
+        """Get the concurrency limit of an endpoint."""
+        if endpoint not in self._semaphores:
+            self._semaphores[endpoint] = asyncio.Semaphore(self.endpoint_concurrency)
+        return self._semaphores[endpoint]
+
+    def _circuit(self, endpoint: str) -> CircuitBreakerState:
+        """Get the circuit breaker of an endpoint."""
+        if endpoint not in self._circuits:
+            self._circuits[endpoint] = CircuitBreakerState()
+        return self._circuits[endpoint]
+
+    async def send(self, webhook: WebhookSubscription, delivery: WebhookDelivery) -> None:
+        """Attempt one delivery.
+
+        Updates the delivery (and the webhook's failure tracking) in place;
+        the caller commits. Failed deliveries that can be retried are
+        scheduled for retry. If the endpoint's circuit is open, the
+        delivery is deferred until it may recover and not attempted.
+
+        Args:
+            webhook: Target webhook subscription.
+            delivery: Delivery to send.
+        """
+        endpoint = endpoint_key(webhook.url)
+        circuit_name = f"webhook:{endpoint}"
+        circuit = self._circuit(endpoint)
+        try:
+            check_circuit(circuit, circuit_name)
+        except CircuitOpenError as e:
+            delivery.defer(datetime.utcnow() + timedelta(seconds=e.recovery_time))
+            logger.info(f"Deferred webhook delivery {delivery.id}: circuit open for {endpoint}")
+            return
+
+        start_time = time.time()
+        try:
+            async with self._semaphore(endpoint):
+                response = await self._get_client().post(
+                    webhook.url,
+                    content=delivery.payload,
+                    headers=build_headers(webhook, delivery),
+                    timeout=DELIVERY_TIMEOUT,
+                )
+        except httpx.TimeoutException as e:
+            record_circuit_failure(circuit, circuit_name, e)
+            self._record_failure(webhook, delivery, "Request timeout", start_time)
+            return
+        except httpx.RequestError as e:
+            record_circuit_failure(circuit, circuit_name, e)
+            self._record_failure(webhook, delivery, f"Connection error: {str(e)[:200]}", start_time)
+            return
+        except Exception as e:
+            record_circuit_failure(circuit, circuit_name, e)
+            self._record_failure(webhook, delivery, f"Unexpected error: {str(e)[:200]}", start_time)
+            logger.error(f"Webhook delivery exception {webhook.id}: {e}")
+            return
+
+        duration_ms = int((time.time() - start_time) * 1000)
+        response_body = response.text[:1000] if response.text else None
+
+        # Server errors and throttling count against the endpoint; other
+        # responses show it is up even when the delivery is rejected
+        if response.status_code >= 500 or response.status_code == 429:
+            record_circuit_failure(
+                circuit, circuit_name, RuntimeError(f"HTTP {response.status_code}")
+            )
+        else:
+            record_circuit_success(circuit, circuit_name)
+
+        if 200 <= response.status_code < 300:
+            delivery.mark_success(
+                status_code=response.status_code,
+                response_body=response_body,
+                duration_ms=duration_ms,
+            )
+            webhook.record_success()
+            logger.info(
+                f"Delivered webhook {webhook.id}: {delivery.event_type} ({response.status_code})"
+            )
+            return
+
+        self._record_failure(
+            webhook,
+            delivery,
+            f"HTTP {response.status_code}",
+            start_time,
+            status_code=response.status_code,
+            response_body=response_body,
+        )
+
+    def _record_failure(
+        self,
+        webhook: WebhookSubscription,
+        delivery: WebhookDelivery,
+        error_msg: str,
+        start_time: float,
+        status_code: int | None = None,
+        response_body: str | None = None,
+    ) -> None:
+        """Record a failed attempt and schedule a retry if allowed."""
+        delivery.mark_failed(
+            error_message=error_msg,
+            status_code=status_code,
+            response_body=response_body,
+            duration_ms=int((time.time() - start_time) * 1000),
+        )
+        webhook.record_failure(error_msg)
+        logger.warning(f"Webhook delivery failed {webhook.id}: {error_msg}")
+
+        if delivery.can_retry:
+            delay = retry_delay(delivery.attempt_number)
+            delivery.schedule_retry(datetime.utcnow() + timedelta(seconds=delay))
+            logger.info(f"Scheduled retry for webhook {webhook.id} in {delay:.0f}s")
+
+    async def _dispatch(self, webhook: WebhookSubscription, delivery: WebhookDelivery) -> None:
+        """Send a claimed delivery unless its webhook stopped receiving events."""
+        if webhook.status != WebhookStatus.ACTIVE or not webhook.is_active:
+            delivery.mark_failed(error_message="Webhook no longer active")
+            return
+        await self.send(webhook, delivery)
+
+    async def _claim_and_send(
+        self,
+        db: AsyncSession,
+        conditions: list[ColumnElement[bool]],
+        limit: int,
+    ) -> int:
+        """Claim one batch of deliveries with their webhooks and send it.
+
+        Deliveries and webhooks are loaded with one joined query. The
+        delivery rows are locked with ``FOR UPDATE SKIP LOCKED`` until the
+        results are committed, so concurrent runs claim disjoint batches.
+
+        Args:
+            db: Session to claim and update the deliveries in; committed
+                once the batch has been sent.
+            conditions: Filters selecting the deliveries to claim.
+            limit: Maximum deliveries to claim.
+
+        Returns:
+            Number of deliveries claimed.
+        """
+        result = await db.execute(
+            select(WebhookDelivery, WebhookSubscription)
+            .join(WebhookDelivery.webhook)
+            .where(*conditions)
+            .order_by(WebhookDelivery.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True, of=WebhookDelivery)
+        )
+        claimed = result.all()
+        if not claimed:
+            await db.commit()
+            return 0
+
+        await asyncio.gather(*(self._dispatch(webhook, delivery) for delivery, webhook in claimed))
+        await db.commit()
+        return len(claimed)
+
+    async def dispatch_pending(self, db: AsyncSession, limit: int | None = None) -> int:
+        """Claim and send one batch of pending deliveries.
+
+        Args:
+            db: Session to claim and update the deliveries in.
+            limit: Maximum deliveries to claim (defaults to
+                settings.webhook_dispatch_batch_size).
+
+        Returns:
+            Number of deliveries claimed.
+        """
+        claimed = await self._claim_and_send(
+            db,
+            [
+                WebhookDelivery.status == DeliveryStatus.PENDING,
+                or_(
+                    WebhookDelivery.next_retry_at.is_(None),
+                    WebhookDelivery.next_retry_at <= datetime.utcnow(),
+                ),
+            ],
+            limit or settings.webhook_dispatch_batch_size,
+        )
+        if claimed:
+            logger.info(f"Dispatched {claimed} webhook deliveries")
+        return claimed
+
+    async def retry_due(
+        self,
+        db: AsyncSession,
+        limit: int | None = None,
+        user_id: str | None = None,
+    ) -> int:
+        """Claim and resend one batch of deliveries due for retry.
+
+        Deliveries are retried in place: the same row (and idempotency
+        key) is sent again and its attempt number is updated.
+
+        Args:
+            db: Session to claim and update the deliveries in.
+            limit: Maximum deliveries to claim (defaults to
+                settings.webhook_dispatch_batch_size).
+            user_id: Only retry deliveries of this user's webhooks.
+
+        Returns:
+            Number of deliveries claimed.
+        """
+        conditions = [
+            WebhookDelivery.status == DeliveryStatus.RETRYING,
+            WebhookDelivery.next_retry_at <= datetime.utcnow(),
+        ]
+        if user_id is not None:
+            conditions.append(WebhookSubscription.user_id == user_id)
+
+        claimed = await self._claim_and_send(
+            db, conditions, limit or settings.webhook_dispatch_batch_size
+        )
+        if claimed:
+            logger.info(f"Retried {claimed} webhook deliveries")
+        return claimed
+
+
+# Singleton instance (API process; the worker creates its own in startup)
+_webhook_dispatcher: WebhookDispatcher | None = None
+
+
+def get_webhook_dispatcher() -> WebhookDispatcher:
+    """Get the process-wide webhook dispatcher.
+
+    Returns:
+        WebhookDispatcher with its own pooled HTTP client.
+    """
+    global _webhook_dispatcher
+    if _webhook_dispatcher is None:
+        _webhook_dispatcher = WebhookDispatcher()
+    return _webhook_dispatcher
+
+
+async def close_webhook_dispatcher() -> None:
+    """Close the process-wide webhook dispatcher."""
+    global _webhook_dispatcher
+    if _webhook_dispatcher is not None:
+        await _webhook_dispatcher.close()
+        _webhook_dispatcher = None
+
+
+async def _enqueue_dispatch() -> None:
+    """Enqueue a dispatch job; the cron run covers a failure."""
+    from src.core.tasks import enqueue_task
+
+    try:
+        await enqueue_task("dispatch_webhook_deliveries")
+    except Exception as e:
+        logger.warning(f"Could not enqueue webhook dispatch, left to the cron run: {e}")
+
+
+def _kick_dispatcher(session: Session) -> None:
+    """Enqueue a dispatch job once deliveries are committed (after_commit hook)."""
+    if not session.info.pop(DISPATCH_INFO_KEY, False):
+        return
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        logger.debug("No event loop to enqueue webhook dispatch")
+        return
+
+    task = loop.create_task(_enqueue_dispatch())
+    _pending_kicks.add(task)
+    task.add_done_callback(_pending_kicks.discard)
+
+
+def request_dispatch(session: AsyncSession | Session) -> None:
+    """Dispatch the session's queued deliveries as soon as it commits.
+
+    Args:
+        session: Session the deliveries were added to.
+    """
+    sync_session = session.sync_session if isinstance(session, AsyncSession) else session
+    if sync_session.info.get(DISPATCH_INFO_KEY):
+        return
+    sync_session.info[DISPATCH_INFO_KEY] = True
+    if not event.contains(sync_session, "after_commit", _kick_dispatcher):
+        event.listen(sync_session, "after_commit", _kick_dispatcher)
+
+
+async def wait_for_pending_kicks() -> None:
+    """Wait for dispatch jobs being enqueued by commits."""
+    if _pending_kicks:
+        await asyncio.gather(*_pending_kicks, return_exceptions=True)
@@ -7,23 +7,20 @@ Sprint 5.6 - Webhooks System
 
 Features:
 - CRUD operations for webhook subscriptions
-- Event delivery with HMAC signing
+- Event queueing in the caller's transaction (outbox), sent with HMAC
+  signing by the webhook dispatcher (see src.services.webhook_dispatcher)
 - Retry logic with exponential backoff
 - Delivery logging and statistics
 """
 
 from __future__ import annotations
 
-import hashlib
-import hmac
 import json
 import logging
-import time
 import uuid
 from datetime import datetime, timedelta
 from typing import Any
 
-import httpx
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -39,20 +36,22 @@ from src.schemas.webhook import (
     WebhookEventPayload,
     WebhookUpdate,
 )
+from src.services.webhook_dispatcher import (
+    DIRECT_SEND_LEASE,
+    get_webhook_dispatcher,
+    request_dispatch,
+)
 
 logger = logging.getLogger(__name__)
 
-# Retry configuration
-RETRY_DELAYS = [60, 300, 900]  # 1 min, 5 min, 15 min
-DELIVERY_TIMEOUT = 30  # seconds
 MAX_PAYLOAD_SIZE = 65536  # 64KB
 
 
 class WebhookService:
     """Service for webhook subscription and delivery management.
 
-    Handles CRUD operations for webhooks, event delivery with HMAC signing,
-    retry logic, and delivery statistics.
+    Handles CRUD operations for webhooks, event queueing, retry logic,
+    and delivery statistics.
 
     Attributes:
         db: AsyncSession for database access.
@@ -238,30 +237,13 @@ class WebhookService:
         logger.info(f"Regenerated secret for webhook {webhook_id}")
         return new_secret
 
-    def _sign_payload(self, payload: str, secret: str) -> str:
-        """Generate HMAC-SHA256 signature for payload.
-
-        Args:
-            payload: JSON payload string.
-            secret: Webhook secret.
-
-        Returns:
-            Hex-encoded signature.
-        """
-        signature = hmac.new(
-            secret.encode("utf-8"),
-            payload.encode("utf-8"),
-            hashlib.sha256,
-        )
-        return signature.hexdigest()
-
-    async def deliver(
+    def _build_delivery(
         self,
         webhook: WebhookSubscription,
         event_type: str,
         data: dict[str, Any],
     ) -> WebhookDelivery:
-        """Deliver an event to a webhook.
+        """Build a pending delivery of an event to a webhook.
 
         Args:
             webhook: Target webhook subscription.
@@ -269,7 +251,7 @@ class WebhookService:
             data: Event data payload.
 
         Returns:
-            WebhookDelivery record.
+            Unsaved WebhookDelivery record.
         """
         event_id = str(uuid.uuid4())
         timestamp = datetime.utcnow()
@@ -295,95 +277,43 @@ class WebhookService:
                 }
             )
 
-        # Generate signature
-        signature = self._sign_payload(payload_json, webhook.secret)
-
-        # Create delivery record
-        delivery = WebhookDelivery(
+        return WebhookDelivery(
+            id=str(uuid.uuid4()),
             webhook_id=webhook.id,
             event_type=event_type,
             event_id=event_id,
             payload=payload_json,
             status=DeliveryStatus.PENDING,
         )
+
+    async def deliver(
+        self,
+        webhook: WebhookSubscription,
+        event_type: str,
+        data: dict[str, Any],
+    ) -> WebhookDelivery:
+        """Deliver an event to a webhook immediately.
+
+        Used where the caller needs the result (test deliveries); events
+        go through trigger_event() and the outbox dispatcher. The delivery
+        is committed deferred by DIRECT_SEND_LEASE, so the dispatcher does
+        not claim and send it again while this request waits on the
+        endpoint, yet still sends it if this process dies mid-send.
+
+        Args:
+            webhook: Target webhook subscription.
+            event_type: Type of event.
+            data: Event data payload.
+
+        Returns:
+            WebhookDelivery record.
+        """
+        delivery = self._build_delivery(webhook, event_type, data)
+        delivery.defer(datetime.utcnow() + timedelta(seconds=DIRECT_SEND_LEASE))
         self.db.add(delivery)
         await self.db.commit()
 
-        # Attempt delivery
-        start_time = time.time()
-        try:
-            headers = {
-                "Content-Type": "application/json",
-                "X-Webhook-Signature": f"sha256={signature}",
-                "X-Webhook-Event": event_type,
-                "X-Webhook-Id": webhook.id,
-                "X-Webhook-Delivery": delivery.id,
-            }
-
-            # Add custom headers
-            custom_headers = webhook.get_headers_dict()
-            if custom_headers:
-                headers.update(custom_headers)
-
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    webhook.url,
-                    content=payload_json,
-                    headers=headers,
-                    timeout=DELIVERY_TIMEOUT,
-                )
-
-            duration_ms = int((time.time() - start_time) * 1000)
-
-            if 200 <= response.status_code < 300:
-                # Success
-                delivery.mark_success(
-                    status_code=response.status_code,
-                    response_body=response.text[:1000] if response.text else None,
-                    duration_ms=duration_ms,
-                )
-                webhook.record_success()
-                logger.info(
-                    f"Delivered webhook {webhook.id}: {event_type} ({response.status_code})"
-                )
-            else:
-                # HTTP error
-                error_msg = f"HTTP {response.status_code}"
-                delivery.mark_failed(
-                    error_message=error_msg,
-                    status_code=response.status_code,
-                    response_body=response.text[:1000] if response.text else None,
-                    duration_ms=duration_ms,
-                )
-                webhook.record_failure(error_msg)
-                logger.warning(f"Webhook delivery failed {webhook.id}: {error_msg}")
-
-        except httpx.TimeoutException:
-            duration_ms = int((time.time() - start_time) * 1000)
-            error_msg = "Request timeout"
-            delivery.mark_failed(error_message=error_msg, duration_ms=duration_ms)
-            webhook.record_failure(error_msg)
-            logger.warning(f"Webhook delivery timeout {webhook.id}")
-
-        except httpx.RequestError as e:
-            duration_ms = int((time.time() - start_time) * 1000)
-            error_msg = f"Connection error: {str(e)[:200]}"
-            delivery.mark_failed(error_message=error_msg, duration_ms=duration_ms)
-            webhook.record_failure(error_msg)
-            logger.warning(f"Webhook delivery error {webhook.id}: {error_msg}")
-
-        except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
-            error_msg = f"Unexpected error: {str(e)[:200]}"
-            delivery.mark_failed(error_message=error_msg, duration_ms=duration_ms)
-            webhook.record_failure(error_msg)
-            logger.error(f"Webhook delivery exception {webhook.id}: {e}")
-
-        # Schedule retry if failed and can retry
-        if delivery.status == DeliveryStatus.FAILED and delivery.can_retry:
-            retry_delay = RETRY_DELAYS[min(delivery.attempt_number - 1, len(RETRY_DELAYS) - 1)]
-            delivery.schedule_retry(datetime.utcnow() + timedelta(seconds=retry_delay))
-            logger.info(f"Scheduled retry for webhook {webhook.id} in {retry_delay}s")
+        await get_webhook_dispatcher().send(webhook, delivery)
 
         await self.db.commit()
         await self.db.refresh(delivery)
@@ -395,14 +325,19 @@ class WebhookService:
         event_type: WebhookEvent | str,
         data: dict[str, Any],
     ) -> list[WebhookDelivery]:
-        """Trigger an event for all subscribed webhooks.
+        """Queue an event for all subscribed webhooks.
+
+        Pending deliveries are added to the session without committing, so
+        they are written in the caller's transaction (and discarded if it
+        rolls back). The webhook dispatcher sends them once the transaction
+        commits.
 
         Args:
             event_type: Type of event.
             data: Event data payload.
 
         Returns:
-            List of WebhookDelivery records.
+            List of pending WebhookDelivery records.
         """
         event_str = event_type.value if isinstance(event_type, WebhookEvent) else event_type
 
@@ -421,13 +356,11 @@ class WebhookService:
             logger.debug(f"No webhooks subscribed to {event_str}")
             return []
 
-        # Deliver to all webhooks
-        deliveries = []
-        for webhook in webhooks:
-            delivery = await self.deliver(webhook, event_str, data)
-            deliveries.append(delivery)
+        deliveries = [self._build_delivery(webhook, event_str, data) for webhook in webhooks]
+        self.db.add_all(deliveries)
+        request_dispatch(self.db)
 
-        logger.info(f"Triggered {event_str} for {len(deliveries)} webhooks")
+        logger.info(f"Queued {event_str} for {len(deliveries)} webhooks")
         return deliveries
 
     async def test_webhook(
@@ -567,55 +500,12 @@ class WebhookService:
         }
 
     async def retry_failed_deliveries(self) -> int:
-        """Retry failed deliveries that are due for retry.
+        """Retry the current user's deliveries that are due for retry.
 
-        This should be called by a background task.
+        The worker retries due deliveries of all users (see the
+        retry_webhook_deliveries task); this runs one batch for one user.
 
         Returns:
             Number of deliveries retried.
         """
-        now = datetime.utcnow()
-
-        # Find deliveries due for retry
-        result = await self.db.execute(
-            select(WebhookDelivery)
-            .join(WebhookSubscription)
-            .where(
-                WebhookDelivery.status == DeliveryStatus.RETRYING,
-                WebhookDelivery.next_retry_at <= now,
-                WebhookSubscription.user_id == str(self.user_id),
-                WebhookSubscription.status == WebhookStatus.ACTIVE,
-            )
-            .limit(100)
-        )
-        deliveries = result.scalars().all()
-
-        if not deliveries:
-            return 0
-
-        retried = 0
-        for delivery in deliveries:
-            # Get webhook
-            webhook_result = await self.db.execute(
-                select(WebhookSubscription).where(
-                    WebhookSubscription.id == delivery.webhook_id,
-                )
-            )
-            webhook = webhook_result.scalar_one_or_none()
-
-            if not webhook or webhook.status != WebhookStatus.ACTIVE:
-                delivery.status = DeliveryStatus.FAILED
-                delivery.error_message = "Webhook no longer active"
-                continue
-
-            # Retry delivery
-            payload_dict = delivery.get_payload_dict()
-            data = payload_dict.get("data", {})
-
-            # Re-deliver
-            await self.deliver(webhook, delivery.event_type, data)
-            retried += 1
-
-        await self.db.commit()
-        logger.info(f"Retried {retried} webhook deliveries")
-        return retried
+        return await get_webhook_dispatcher().retry_due(self.db, user_id=str(self.user_id))
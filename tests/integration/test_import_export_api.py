@@ -3,6 +3,7 @@
 Tests cover:
 - JSON export endpoint
 - CSV export endpoint
+- NDJSON and compressed export endpoints
 - JSON import endpoint
 - CSV import endpoint
 - Duplicate handling
@@ -10,6 +11,7 @@ Tests cover:
 """
 
 import csv
+import gzip
 import io
 import json
 import uuid
@@ -23,6 +25,7 @@ from fastapi.testclient import TestClient
 from src.auth.dependencies import get_current_active_user
 from src.main import app
 from src.models.user import User, UserRole
+from src.services.subscription_service import BulkCreateResult
 
 
 @pytest.fixture
@@ -115,15 +118,27 @@ def mock_subscriptions():
     return [sub1, sub2]
 
 
+def mock_export_service(mock_service, subscriptions):
+    """Make a patched SubscriptionService stream the given subscriptions."""
+
+    async def stream_all(**kwargs):
+        for sub in subscriptions:
+            yield sub
+
+    mock_instance = MagicMock()
+    mock_instance.stream_all = MagicMock(side_effect=stream_all)
+    mock_instance.resolve_schedule = lambda sub: (sub.is_active, sub.next_payment_date)
+    mock_service.return_value = mock_instance
+    return mock_instance
+
+
 class TestExportJsonEndpoint:
     """Tests for GET /api/subscriptions/export/json endpoint."""
 
     def test_export_json_success(self, client, mock_subscriptions):
         """Test successful JSON export with Money Flow fields."""
         with patch("src.api.subscriptions.SubscriptionService") as mock_service:
-            mock_instance = MagicMock()
-            mock_instance.get_all = AsyncMock(return_value=mock_subscriptions)
-            mock_service.return_value = mock_instance
+            mock_export_service(mock_service, mock_subscriptions)
 
             response = client.get("/api/subscriptions/export/json")
 
@@ -140,9 +155,7 @@ class TestExportJsonEndpoint:
     def test_export_json_empty(self, client):
         """Test JSON export with no subscriptions."""
         with patch("src.api.subscriptions.SubscriptionService") as mock_service:
-            mock_instance = MagicMock()
-            mock_instance.get_all = AsyncMock(return_value=[])
-            mock_service.return_value = mock_instance
+            mock_export_service(mock_service, [])
 
             response = client.get("/api/subscriptions/export/json")
 
@@ -154,14 +167,12 @@ class TestExportJsonEndpoint:
     def test_export_json_exclude_inactive(self, client, mock_subscriptions):
         """Test JSON export excluding inactive subscriptions."""
         with patch("src.api.subscriptions.SubscriptionService") as mock_service:
-            mock_instance = MagicMock()
-            mock_instance.get_all = AsyncMock(return_value=[mock_subscriptions[0]])
-            mock_service.return_value = mock_instance
+            mock_instance = mock_export_service(mock_service, [mock_subscriptions[0]])
 
             response = client.get("/api/subscriptions/export/json?include_inactive=false")
 
             assert response.status_code == 200
-            mock_instance.get_all.assert_called_once_with(is_active=True, payment_type=None)
+            mock_instance.stream_all.assert_called_once_with(is_active=True, payment_type=None)
 
 
 class TestExportCsvEndpoint:
@@ -170,9 +181,7 @@ class TestExportCsvEndpoint:
     def test_export_csv_success(self, client, mock_subscriptions):
         """Test successful CSV export with Money Flow fields."""
         with patch("src.api.subscriptions.SubscriptionService") as mock_service:
-            mock_instance = MagicMock()
-            mock_instance.get_all = AsyncMock(return_value=mock_subscriptions)
-            mock_service.return_value = mock_instance
+            mock_export_service(mock_service, mock_subscriptions)
 
             response = client.get("/api/subscriptions/export/csv")
 
@@ -193,9 +202,7 @@ class TestExportCsvEndpoint:
     def test_export_csv_has_headers(self, client, mock_subscriptions):
         """Test CSV export has correct headers including Money Flow fields."""
         with patch("src.api.subscriptions.SubscriptionService") as mock_service:
-            mock_instance = MagicMock()
-            mock_instance.get_all = AsyncMock(return_value=mock_subscriptions)
-            mock_service.return_value = mock_instance
+            mock_export_service(mock_service, mock_subscriptions)
 
             response = client.get("/api/subscriptions/export/csv")
 
@@ -225,6 +232,35 @@ class TestExportCsvEndpoint:
             assert expected_headers.issubset(set(reader.fieldnames or []))
 
 
+class TestExportNdjsonEndpoint:
+    """Tests for GET /api/subscriptions/export/ndjson and compressed exports."""
+
+    def test_export_ndjson_success(self, client, mock_subscriptions):
+        """Test NDJSON export has one payment per line."""
+        with patch("src.api.subscriptions.SubscriptionService") as mock_service:
+            mock_export_service(mock_service, mock_subscriptions)
+
+            response = client.get("/api/subscriptions/export/ndjson")
+
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("application/x-ndjson")
+            lines = response.text.splitlines()
+            assert [json.loads(line)["name"] for line in lines] == ["Netflix", "Spotify"]
+
+    def test_export_compressed(self, client, mock_subscriptions):
+        """Test compressed exports are gzip file downloads."""
+        with patch("src.api.subscriptions.SubscriptionService") as mock_service:
+            mock_export_service(mock_service, mock_subscriptions)
+
+            response = client.get("/api/subscriptions/export/csv?compress=true")
+
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/gzip"
+            assert ".csv.gz" in response.headers["content-disposition"]
+            rows = list(csv.DictReader(io.StringIO(gzip.decompress(response.content).decode())))
+            assert len(rows) == 2
+
+
 class TestImportJsonEndpoint:
     """Tests for POST /api/subscriptions/import/json endpoint."""
 
@@ -250,7 +286,9 @@ class TestImportJsonEndpoint:
         with patch("src.api.subscriptions.SubscriptionService") as mock_service:
             mock_instance = MagicMock()
             mock_instance.get_all = AsyncMock(return_value=[])
-            mock_instance.create = AsyncMock(return_value=MagicMock())
+            mock_instance.create_many = AsyncMock(
+                return_value=BulkCreateResult(ids=["sub-1"], errors={})
+            )
             mock_service.return_value = mock_instance
 
             files = {"file": ("test.json", json.dumps(import_data), "application/json")}
@@ -342,7 +380,9 @@ New Service,19.99,GBP,MONTHLY,1,2025-01-01,2025-02-01"""
         with patch("src.api.subscriptions.SubscriptionService") as mock_service:
             mock_instance = MagicMock()
             mock_instance.get_all = AsyncMock(return_value=[])
-            mock_instance.create = AsyncMock(return_value=MagicMock())
+            mock_instance.create_many = AsyncMock(
+                return_value=BulkCreateResult(ids=["sub-1"], errors={})
+            )
             mock_service.return_value = mock_instance
 
             files = {"file": ("test.csv", csv_content, "text/csv")}
@@ -353,6 +393,42 @@ New Service,19.99,GBP,MONTHLY,1,2025-01-01,2025-02-01"""
             assert data["total"] == 1
             assert data["imported"] == 1
 
+    def test_import_csv_reports_failed_rows_in_batch(self, client):
+        """Test a row rejected by the bulk insert is reported without losing the rest."""
+        csv_content = """name,amount,currency,frequency,frequency_interval,start_date
+First Service,19.99,GBP,MONTHLY,1,2025-01-01
+Bad Amount,not-a-number,GBP,MONTHLY,1,2025-01-01
+Rejected Service,5.00,GBP,MONTHLY,1,2025-01-01
+Last Service,7.50,GBP,MONTHLY,1,2025-01-01"""
+
+        with patch("src.api.subscriptions.SubscriptionService") as mock_service:
+            mock_instance = MagicMock()
+            mock_instance.get_all = AsyncMock(return_value=[])
+            mock_instance.create_many = AsyncMock(
+                return_value=BulkCreateResult(
+                    ids=["sub-1", None, "sub-3"],
+                    errors={1: "CHECK constraint failed: amount"},
+                )
+            )
+            mock_service.return_value = mock_instance
+
+            files = {"file": ("test.csv", csv_content, "text/csv")}
+            response = client.post("/api/subscriptions/import/csv", files=files)
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["total"] == 4
+            assert data["imported"] == 2
+            assert data["failed"] == 2
+            assert any(e.startswith("Row 2:") and "amount" in e.lower() for e in data["errors"])
+            assert "Row 3: CHECK constraint failed: amount" in data["errors"]
+            rows = mock_instance.create_many.await_args.args[0]
+            assert [row.name for row in rows] == [
+                "First Service",
+                "Rejected Service",
+                "Last Service",
+            ]
+
     def test_import_csv_invalid_file_type(self, client):
         """Test CSV import rejects non-CSV files."""
         files = {"file": ("test.txt", "not csv", "text/plain")}
@@ -5,20 +5,32 @@ Tests cover:
 - Subscription serialization
 - Backup metadata models
 - Local storage fallback
+- Incremental backups (skips, deltas, periodic full snapshots)
+- Streaming backup files and restores
 """
 
 import gzip
 import json
+import os
 import tempfile
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 from unittest.mock import patch
 
-from src.models.subscription import Frequency, PaymentMode, PaymentType
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.db.database import Base
+from src.models.backup_state import BackupState
+from src.models.subscription import Frequency, PaymentMode, PaymentType, Subscription
+from src.models.user import User
 from src.services.backup_service import (
     BackupMetadata,
     BackupResult,
     BackupService,
+    BackupType,
 )
 
 
@@ -454,3 +466,235 @@ class TestRetentionPolicy:
         """Test long retention period."""
         service = BackupService(retention_days=365)
         assert service.retention_days == 365
+
+
+@pytest_asyncio.fixture
+async def backup_db(tmp_path, monkeypatch):
+    """In-memory database with one user and two subscriptions; local backups in tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    engine = create_async_engine("sqlite+aiosqlite://")
+    tables = [User.__table__, Subscription.__table__, BackupState.__table__]
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, tables=tables))
+
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as session:
+        user = User(id="u1", email="u1@example.com", hashed_password="x")
+        session.add(user)
+        for sub_id, name in [("s1", "Netflix"), ("s2", "Spotify")]:
+            session.add(
+                Subscription(
+                    id=sub_id,
+                    user_id="u1",
+                    name=name,
+                    amount=Decimal("9.99"),
+                    currency="GBP",
+                    frequency="monthly",
+                    start_date=date(2026, 1, 1),
+                    next_payment_date=date(2026, 2, 1),
+                    is_active=True,
+                )
+            )
+        await session.commit()
+        yield session, user
+
+    await engine.dispose()
+
+
+def _read_backup(path: str) -> dict:
+    """Merge the header, subscriptions and trailer lines of a backup file."""
+    data: dict = {"subscriptions": []}
+    with gzip.open(path, "rt") as lines:
+        for line in lines:
+            ((kind, value),) = json.loads(line).items()
+            if kind == "subscription":
+                data["subscriptions"].append(value)
+            else:
+                data.update(value)
+    return data
+
+
+class TestIncrementalBackup:
+    """Tests for change-aware incremental backups."""
+
+    @pytest.fixture
+    def service(self):
+        """Local-storage backup service with weekly full snapshots."""
+        return BackupService(bucket_name="", full_interval_days=7)
+
+    @pytest.mark.asyncio
+    async def test_first_backup_is_full(self, backup_db, service):
+        """Test a user without backups gets a compact full snapshot."""
+        db, user = backup_db
+
+        result = await service.create_backup(db, user)
+
+        assert result.success is True
+        assert result.backup_type == BackupType.FULL
+        assert result.subscription_count == 2
+        assert result.file_path.endswith(".jsonl.gz")
+        with gzip.open(result.file_path, "rt") as f:
+            lines = f.read().splitlines()
+        assert len(lines) == 4  # Header, one line per subscription, trailer
+        data = _read_backup(result.file_path)
+        assert data["backup_type"] == "full"
+        assert data["subscription_count"] == 2
+        assert {s["id"] for s in data["subscriptions"]} == {"s1", "s2"}
+
+        state = await db.get(BackupState, "u1")
+        assert state.last_full_backup_id == result.backup_id
+        assert set(state.snapshot_hashes) == {"s1", "s2"}
+
+    @pytest.mark.asyncio
+    async def test_unchanged_user_skipped(self, backup_db, service):
+        """Test nothing is written when the data did not change."""
+        db, user = backup_db
+        await service.create_backup(db, user)
+
+        result = await service.create_backup(db, user)
+
+        assert result.success is True
+        assert result.skipped is True
+        assert len(os.listdir("backups/u1")) == 1
+
+    @pytest.mark.asyncio
+    async def test_delta_holds_changes_since_snapshot(self, backup_db, service):
+        """Test a delta lists changed subscriptions and removed IDs only."""
+        db, user = backup_db
+        full = await service.create_backup(db, user)
+
+        await db.execute(
+            update(Subscription).where(Subscription.id == "s1").values(amount=Decimal("12.99"))
+        )
+        await db.execute(delete(Subscription).where(Subscription.id == "s2"))
+        await db.commit()
+
+        with patch("src.services.backup_service.datetime") as mock_dt:
+            mock_dt.utcnow.return_value = datetime.utcnow() + timedelta(days=1)
+            result = await service.create_backup(db, user)
+
+        assert result.backup_type == BackupType.DELTA
+        assert result.backup_id.endswith("_delta")
+        data = _read_backup(result.file_path)
+        assert data["base_backup_id"] == full.backup_id
+        assert [s["id"] for s in data["subscriptions"]] == ["s1"]
+        assert data["subscriptions"][0]["amount"] == "12.99"
+        assert data["removed_subscription_ids"] == ["s2"]
+
+        state = await db.get(BackupState, "u1")
+        assert state.last_backup_id == result.backup_id
+        assert state.last_full_backup_id == full.backup_id
+
+    @pytest.mark.asyncio
+    async def test_full_snapshot_when_interval_elapsed(self, backup_db, service):
+        """Test a full snapshot is written once the interval passed, even if unchanged."""
+        db, user = backup_db
+        await service.create_backup(db, user)
+        state = await db.get(BackupState, "u1")
+        state.last_full_backup_at -= timedelta(days=8)
+        await db.commit()
+
+        result = await service.create_backup(db, user)
+
+        assert result.skipped is False
+        assert result.backup_type == BackupType.FULL
+
+    @pytest.mark.asyncio
+    async def test_cleanup_keeps_snapshots_deltas_depend_on(self, backup_db, service):
+        """Test full snapshots outlive deltas by one full interval."""
+        os.makedirs("backups/u1")
+        old = (datetime.utcnow() - timedelta(days=33)).timestamp()
+        for name in ["u1_a.json.gz", "u1_b_delta.json.gz"]:
+            path = f"backups/u1/{name}"
+            with open(path, "wb") as f:
+                f.write(b"")
+            os.utime(path, (old, old))
+
+        deleted = await service.cleanup_old_backups("u1")
+
+        assert deleted == 1
+        assert os.listdir("backups/u1") == ["u1_a.json.gz"]
+
+
+class TestRestore:
+    """Tests for streaming restores."""
+
+    @pytest.fixture
+    def service(self):
+        """Local-storage backup service with a tiny batch size."""
+        service = BackupService(bucket_name="", full_interval_days=7)
+        service.STREAM_BATCH_SIZE = 1
+        return service
+
+    @staticmethod
+    async def _subscriptions(db) -> dict[str, Decimal]:
+        result = await db.execute(select(Subscription.id, Subscription.amount))
+        return dict(result.all())
+
+    @pytest.mark.asyncio
+    async def test_restore_full_snapshot(self, backup_db, service):
+        """Test deleted subscriptions come back with their values."""
+        db, user = backup_db
+        backup = await service.create_backup(db, user)
+        await db.execute(delete(Subscription))
+        await db.commit()
+
+        result = await service.restore_backup(db, "u1", backup.backup_id)
+
+        assert result.success is True
+        assert result.restored_count == 2
+        assert await self._subscriptions(db) == {"s1": Decimal("9.99"), "s2": Decimal("9.99")}
+        frequency = await db.scalar(select(Subscription.frequency).where(Subscription.id == "s1"))
+        assert frequency == Frequency.MONTHLY
+
+    @pytest.mark.asyncio
+    async def test_restore_delta_applies_on_snapshot(self, backup_db, service):
+        """Test a delta restore takes changes from the delta and the rest from its base."""
+        db, user = backup_db
+        await service.create_backup(db, user)
+        await db.execute(
+            update(Subscription).where(Subscription.id == "s1").values(amount=Decimal("12.99"))
+        )
+        await db.execute(delete(Subscription).where(Subscription.id == "s2"))
+        await db.commit()
+        with patch("src.services.backup_service.datetime") as mock_dt:
+            mock_dt.utcnow.return_value = datetime.utcnow() + timedelta(days=1)
+            delta = await service.create_backup(db, user)
+
+        await db.execute(
+            update(Subscription).where(Subscription.id == "s1").values(amount=Decimal("1.00"))
+        )
+        await db.commit()
+        result = await service.restore_backup(db, "u1", delta.backup_id)
+
+        assert result.success is True
+        assert result.restored_count == 1
+        assert await self._subscriptions(db) == {"s1": Decimal("12.99")}
+
+    @pytest.mark.asyncio
+    async def test_restore_legacy_backup(self, backup_db, service):
+        """Test a version 2.0 single-document backup can still be restored."""
+        db, _ = backup_db
+        os.makedirs("backups/u1")
+        legacy = {
+            "version": "2.0",
+            "backup_id": "u1_20251218_120000",
+            "subscriptions": [service._serialize_subscription(MockSubscription(sub_id="s9"))],
+        }
+        with open("backups/u1/u1_20251218_120000.json.gz", "wb") as f:
+            f.write(gzip.compress(json.dumps(legacy, indent=2).encode()))
+
+        result = await service.restore_backup(db, "u1", "u1_20251218_120000")
+
+        assert result.success is True
+        assert "s9" in await self._subscriptions(db)
+
+    @pytest.mark.asyncio
+    async def test_restore_missing_backup(self, backup_db, service):
+        """Test restoring an unknown backup fails cleanly."""
+        db, _ = backup_db
+
+        result = await service.restore_backup(db, "u1", "nope")
+
+        assert result.success is False
+        assert "not found" in result.error
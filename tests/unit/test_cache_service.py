@@ -7,7 +7,7 @@ Tests cover:
 - Pattern-based clearing
 """
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -113,6 +113,32 @@ class TestCacheServiceOperations:
 
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_get_many_returns_found_values(self, cache_service, mock_redis):
+        """Test that get_many fetches all keys with one MGET."""
+        mock_redis.mget = AsyncMock(return_value=['{"a": 1}', None])
+
+        result = await cache_service.get_many(["k1", "k2"])
+
+        assert result == {"k1": {"a": 1}}
+        mock_redis.mget.assert_called_once_with(["k1", "k2"])
+
+    @pytest.mark.asyncio
+    async def test_set_many_pipelines_writes(self, cache_service, mock_redis):
+        """Test that set_many writes all keys in one pipeline."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=False)
+        mock_redis.pipeline = MagicMock(return_value=pipe)
+
+        result = await cache_service.set_many({"k1": 1, "k2": [2]}, ttl=60)
+
+        assert result is True
+        pipe.setex.assert_any_call("k1", 60, "1")
+        pipe.setex.assert_any_call("k2", 60, "[2]")
+        pipe.execute.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_delete_removes_key(self, cache_service, mock_redis):
         """Test that delete removes a key."""
@@ -7,12 +7,14 @@ Tests cover:
 - Reminder email generation
 - Daily/weekly digest generation
 - HTML template generation
+- SMTP connection reuse in sessions
 """
 
 from datetime import date, timedelta
 from decimal import Decimal
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import aiosmtplib
 import pytest
 
 from src.models.subscription import Frequency, PaymentMode, PaymentType
@@ -162,6 +164,75 @@ class TestSendEmail:
             assert result is False
 
 
+class TestEmailSession:
+    """Tests for SMTP connection reuse."""
+
+    @pytest.fixture
+    def service(self):
+        """Create configured EmailService."""
+        return EmailService(
+            smtp_host="smtp.example.com",
+            smtp_user="user@example.com",
+            smtp_password="secret",
+            from_email="noreply@example.com",
+        )
+
+    @staticmethod
+    def _mock_smtp():
+        smtp = MagicMock()
+        smtp.is_connected = False
+
+        async def connect():
+            smtp.is_connected = True
+
+        smtp.connect = AsyncMock(side_effect=connect)
+        smtp.send_message = AsyncMock()
+        smtp.quit = AsyncMock()
+        return smtp
+
+    @pytest.mark.asyncio
+    async def test_session_reuses_connection(self, service):
+        """Test sends inside a session share one SMTP connection."""
+        smtp = self._mock_smtp()
+
+        with (
+            patch("src.services.email_service.aiosmtplib.SMTP", return_value=smtp),
+            patch("src.services.email_service.aiosmtplib.send", new_callable=AsyncMock) as send,
+        ):
+            async with service.session(connections=1):
+                for i in range(3):
+                    assert await service.send_email(f"u{i}@example.com", "Hi", "<p>Hi</p>")
+
+        smtp.connect.assert_awaited_once()
+        assert smtp.send_message.await_count == 3
+        smtp.quit.assert_awaited_once()
+        send.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_session_reconnects_after_disconnect(self, service):
+        """Test a dropped idle connection is reopened and the send retried."""
+        smtp = self._mock_smtp()
+        smtp.send_message.side_effect = [aiosmtplib.SMTPServerDisconnected("idle"), None]
+
+        with patch("src.services.email_service.aiosmtplib.SMTP", return_value=smtp):
+            async with service.session():
+                assert await service.send_email("u@example.com", "Hi", "<p>Hi</p>")
+
+        assert smtp.connect.await_count == 2
+        assert smtp.send_message.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_send_outside_session_uses_one_off_connection(self, service):
+        """Test sends after the session closes fall back to aiosmtplib.send."""
+        with patch("src.services.email_service.aiosmtplib.SMTP", return_value=self._mock_smtp()):
+            async with service.session():
+                pass
+
+        with patch("src.services.email_service.aiosmtplib.send", new_callable=AsyncMock) as send:
+            assert await service.send_email("u@example.com", "Hi", "<p>Hi</p>")
+        send.assert_awaited_once()
+
+
 class TestSendReminder:
     """Tests for send_reminder method."""
 
@@ -0,0 +1,150 @@
+"""Unit tests for precompiled email templates.
+
+Tests cover:
+- Template compilation, binding and embedding
+- Batch digest rendering
+- Escaping of user-provided text
+- Reuse of the cached per-currency digest template
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from src.models.subscription import Frequency
+from src.services.email_templates import (
+    CompiledTemplate,
+    DigestContent,
+    DigestPeriod,
+    _digest_template,
+    render_digests,
+    render_reminder,
+)
+
+TODAY = date(2026, 1, 12)
+
+
+def make_subscription(name: str = "Netflix", amount: str = "15.99", days: int = 0):
+    """Create a subscription stand-in with the fields the templates read."""
+    return SimpleNamespace(
+        id=f"sub-{name}",
+        name=name,
+        amount=Decimal(amount),
+        currency="GBP",
+        category="Entertainment",
+        frequency=Frequency.MONTHLY,
+        next_payment_date=TODAY + timedelta(days=days),
+    )
+
+
+class TestCompiledTemplate:
+    """Tests for CompiledTemplate."""
+
+    def test_render(self):
+        """Test placeholders are filled in order."""
+        template = CompiledTemplate("<p>{{ a }} and {{b}}</p>")
+
+        assert template.fields == ("a", "b")
+        assert template.render(a=1, b="two") == "<p>1 and two</p>"
+
+    def test_css_braces_untouched(self):
+        """Test single braces are kept as literals."""
+        template = CompiledTemplate("body { color: {{ color }}; }")
+
+        assert template.render(color="red") == "body { color: red; }"
+
+    def test_missing_value(self):
+        """Test rendering without a value raises KeyError."""
+        with pytest.raises(KeyError):
+            CompiledTemplate("{{ a }}").render()
+
+    def test_bind(self):
+        """Test binding folds values into literals."""
+        template = CompiledTemplate("{{ a }}-{{ b }}-{{ a }}").bind(a="x")
+
+        assert template.fields == ("b",)
+        assert template.render(b="y") == "x-y-x"
+
+    def test_embed(self):
+        """Test embedding keeps the inner template's placeholders."""
+        outer = CompiledTemplate("<div>{{ content }}</div>{{ footer }}")
+        inner = CompiledTemplate("<b>{{ name }}</b>")
+
+        template = outer.embed("content", inner)
+
+        assert template.fields == ("name", "footer")
+        assert template.render(name="n", footer="f") == "<div><b>n</b></div>f"
+
+
+class TestRenderDigests:
+    """Tests for batch digest rendering."""
+
+    def test_renders_batch_in_order(self):
+        """Test one email per digest with per-user totals and currency."""
+        emails = render_digests(
+            [
+                DigestContent([make_subscription(amount="10.00")], "GBP"),
+                DigestContent(
+                    [make_subscription("Spotify", "5.00"), make_subscription("Gym", "20.00", 3)],
+                    "USD",
+                ),
+            ],
+            DigestPeriod.DAILY,
+            TODAY,
+        )
+
+        assert len(emails) == 2
+        assert emails[0].subject == "📊 Daily Digest: 1 payments this week (£10.00)"
+        assert emails[1].subject == "📊 Daily Digest: 2 payments this week ($25.00)"
+        assert "Payments today: 1" in emails[1].text_body
+        assert "Payments this week: 1" in emails[1].text_body
+        assert "Spotify" in emails[1].html_body
+        assert "Daily Payment Digest" in emails[1].html_body
+
+    def test_weekly_period(self):
+        """Test the weekly heading and subject."""
+        (email,) = render_digests(
+            [DigestContent([make_subscription()])], DigestPeriod.WEEKLY, TODAY
+        )
+
+        assert email.subject.startswith("📅 Weekly Summary: 1 payments")
+        assert "Weekly Payment Digest" in email.html_body
+
+    def test_escapes_names(self):
+        """Test subscription names are HTML-escaped."""
+        (email,) = render_digests(
+            [DigestContent([make_subscription("<script>x</script>")])],
+            DigestPeriod.DAILY,
+            TODAY,
+        )
+
+        assert "<script>" not in email.html_body
+        assert "&lt;script&gt;" in email.html_body
+
+    def test_shared_template_cached(self):
+        """Test users with the same currency share one compiled page."""
+        _digest_template.cache_clear()
+
+        render_digests(
+            [DigestContent([make_subscription()], "EUR") for _ in range(5)],
+            DigestPeriod.DAILY,
+            TODAY,
+        )
+
+        info = _digest_template.cache_info()
+        assert info.misses == 1
+        assert info.hits == 4
+
+
+class TestRenderReminder:
+    """Tests for reminder rendering."""
+
+    def test_due_today(self):
+        """Test the urgency text for a payment due today."""
+        email = render_reminder(make_subscription("A & B"), 0)
+
+        assert email.subject == "💳 Payment Due Today: A & B - £15.99"
+        assert "A &amp; B" in email.html_body
+        assert "A & B" in email.text_body
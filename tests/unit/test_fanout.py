@@ -0,0 +1,177 @@
+"""Tests for sharded cron fan-out.
+
+Tests cover:
+- Deterministic shard job IDs
+- Enqueuing one job per shard and skipping duplicates
+- Completion barrier aggregation
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.fanout import (
+    aggregate_results,
+    fan_out,
+    fan_out_job,
+    record_shard_result,
+    shard_job_id,
+)
+
+SLOT = "2026-01-10T08:15+00:00"
+
+
+class FakePipeline:
+    """Minimal transactional pipeline over FakeRedis."""
+
+    def __init__(self, redis: "FakeRedis") -> None:
+        self.redis = redis
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+
+        return queue
+
+    async def execute(self):
+        return [await getattr(self.redis, n)(*a, **kw) for n, a, kw in self.calls]
+
+
+class FakeRedis:
+    """In-memory stand-in for the hash/string commands used by the barrier."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.strings: dict[str, str] = {}
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value
+
+    async def expire(self, key, ttl):
+        return True
+
+    async def hlen(self, key):
+        return len(self.hashes.get(key, {}))
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    async def set(self, key, value, ex=None):
+        self.strings[key] = value
+
+
+class TestShardJobId:
+    """Tests for shard_job_id."""
+
+    def test_deterministic(self):
+        """Test the same shard of the same run always gets the same ID."""
+        assert shard_job_id("send_daily_digest", SLOT, 3, 8) == (
+            "send_daily_digest:2026-01-10T08:15+00:00:3-of-8"
+        )
+        assert shard_job_id("send_daily_digest", SLOT, 3, 8) == shard_job_id(
+            "send_daily_digest", SLOT, 3, 8
+        )
+
+
+class TestAggregateResults:
+    """Tests for aggregate_results."""
+
+    def test_sums_numeric_counters(self):
+        """Test counters are summed and non-numeric values ignored."""
+        results = [
+            {"reminders_sent": 3, "users_notified": 2, "note": "x"},
+            {"reminders_sent": 1, "users_notified": 1, "ok": True},
+        ]
+
+        assert aggregate_results(results) == {"reminders_sent": 4, "users_notified": 3}
+
+
+class TestFanOut:
+    """Tests for fan_out."""
+
+    @pytest.mark.asyncio
+    async def test_enqueues_one_job_per_shard(self):
+        """Test each shard is enqueued with its idempotency key."""
+        redis = MagicMock()
+        redis.enqueue_job = AsyncMock(return_value=MagicMock())
+
+        job_ids = await fan_out(redis, "send_daily_digest", SLOT, 4)
+
+        assert job_ids == [shard_job_id("send_daily_digest", SLOT, i, 4) for i in range(4)]
+        kwargs = redis.enqueue_job.await_args_list[2].kwargs
+        assert kwargs["_job_id"] == "send_daily_digest:2026-01-10T08:15+00:00:2-of-4"
+        assert kwargs["shard_index"] == 2
+        assert kwargs["shard_count"] == 4
+        assert kwargs["slot"] == SLOT
+
+    @pytest.mark.asyncio
+    async def test_skips_shards_already_enqueued(self):
+        """Test a repeated fan-out does not enqueue existing shard jobs again."""
+        redis = MagicMock()
+        redis.enqueue_job = AsyncMock(side_effect=[MagicMock(), None, MagicMock()])
+
+        job_ids = await fan_out(redis, "send_daily_digest", SLOT, 3)
+
+        assert job_ids == [
+            "send_daily_digest:2026-01-10T08:15+00:00:0-of-3",
+            "send_daily_digest:2026-01-10T08:15+00:00:2-of-3",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_fan_out_job_uses_ctx_redis(self):
+        """Test the cron coroutine fans out through ARQ's Redis connection."""
+        redis = MagicMock()
+        redis.enqueue_job = AsyncMock(return_value=MagicMock())
+        job = fan_out_job("send_weekly_digest", shard_count=2)
+
+        result = await job({"redis": redis})
+
+        assert job.__name__ == "fan_out_send_weekly_digest"
+        assert result == {"shards_enqueued": 2, "shard_count": 2}
+
+
+class TestCompletionBarrier:
+    """Tests for record_shard_result."""
+
+    @pytest.mark.asyncio
+    async def test_last_shard_aggregates(self):
+        """Test only the shard completing the run gets the totals."""
+        redis = FakeRedis()
+
+        first = await record_shard_result(redis, "t", SLOT, 1, 3, {"sent": 2})
+        second = await record_shard_result(redis, "t", SLOT, 0, 3, {"sent": 5})
+        last = await record_shard_result(redis, "t", SLOT, 2, 3, {"sent": 1})
+
+        assert first is None
+        assert second is None
+        assert last == {"sent": 8}
+        assert redis.strings["fanout:t:2026-01-10T08:15+00:00:3:summary"] == '{"sent": 8}'
+
+    @pytest.mark.asyncio
+    async def test_repeated_shard_does_not_complete_run(self):
+        """Test recording the same shard twice counts it once."""
+        redis = FakeRedis()
+
+        await record_shard_result(redis, "t", SLOT, 0, 2, {"sent": 1})
+        repeated = await record_shard_result(redis, "t", SLOT, 0, 2, {"sent": 1})
+
+        assert repeated is None
+
+    @pytest.mark.asyncio
+    async def test_unsharded_runs_are_not_recorded(self):
+        """Test single-shard runs and runs outside a worker skip the barrier."""
+        redis = FakeRedis()
+
+        assert await record_shard_result(redis, "t", SLOT, 0, 1, {"sent": 1}) is None
+        assert await record_shard_result(None, "t", SLOT, 0, 4, {"sent": 1}) is None
+        assert redis.hashes == {}
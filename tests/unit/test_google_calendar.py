@@ -9,18 +9,28 @@ Tests cover:
 - OAuth flow helpers
 - Token management
 - Event creation
+- Incremental, batched sync against a fake Calendar API
 """
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+import httplib2
 import pytest
+import pytest_asyncio
+from googleapiclient.errors import HttpError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
+from src.db.database import Base
 from src.models.google_calendar import (
     GoogleCalendarConnection,
+    GoogleCalendarEventSync,
     GoogleCalendarSyncStatus,
 )
+from src.models.subscription import Subscription
 
 
 class TestGoogleCalendarSyncStatus:
@@ -369,7 +379,7 @@ class TestGoogleCalendarServiceEventBuilding:
         """Create mock subscription."""
         sub = MagicMock()
         sub.id = uuid4()
-        sub.service_name = "Netflix"
+        sub.name = "Netflix"
         sub.amount = 15.99
         sub.currency = "GBP"
         sub.frequency = "monthly"
@@ -485,3 +495,323 @@ class TestGoogleCalendarOAuthFlow:
         assert "accounts.google.com" in auth_url
         assert state == "test_state"
         mock_flow.authorization_url.assert_called_once()
+
+
+class FakeRequest:
+    """Calendar API request executed against FakeCalendarAPI."""
+
+    def __init__(self, api, method, **kwargs):
+        self.api = api
+        self.method = method
+        self.kwargs = kwargs
+
+    def execute(self):
+        return self.api.handle(self.method, **self.kwargs)
+
+
+class FakeEvents:
+    """events() resource of FakeCalendarAPI."""
+
+    def __init__(self, api):
+        self.api = api
+
+    def insert(self, calendarId, body):  # noqa: N803
+        return FakeRequest(self.api, "insert", calendarId=calendarId, body=body)
+
+    def update(self, calendarId, eventId, body):  # noqa: N803
+        return FakeRequest(self.api, "update", calendarId=calendarId, eventId=eventId, body=body)
+
+    def delete(self, calendarId, eventId):  # noqa: N803
+        return FakeRequest(self.api, "delete", calendarId=calendarId, eventId=eventId)
+
+
+class FakeBatch:
+    """Batch HTTP request of FakeCalendarAPI."""
+
+    def __init__(self, api, callback):
+        self.api = api
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id=None):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        if self.api.batch_error is not None:
+            raise self.api.batch_error
+        self.api.batches.append(len(self.requests))
+        for request_id, request in self.requests:
+            try:
+                self.callback(request_id, request.execute(), None)
+            except HttpError as e:
+                self.callback(request_id, None, e)
+
+
+class FakeCalendarAPI:
+    """In-memory Google Calendar API with batch support."""
+
+    def __init__(self):
+        self.events_by_key = {}
+        self.calls = []
+        self.batches = []
+        self.failing_events = set()
+        self.batch_error = None
+        self._next_id = 0
+
+    def events(self):
+        return FakeEvents(self)
+
+    def new_batch_http_request(self, callback):
+        return FakeBatch(self, callback)
+
+    def handle(self, method, calendarId, eventId=None, body=None):  # noqa: N803
+        self.calls.append(method)
+        if method == "insert":
+            self._next_id += 1
+            event_id = f"evt{self._next_id}"
+            self.events_by_key[(calendarId, event_id)] = body
+            return {"id": event_id, **body}
+
+        key = (calendarId, eventId)
+        if eventId in self.failing_events:
+            raise HttpError(httplib2.Response({"status": 500}), b"backend error")
+        if key not in self.events_by_key:
+            raise HttpError(httplib2.Response({"status": 410}), b"deleted")
+        if method == "update":
+            self.events_by_key[key] = body
+            return {"id": eventId, **body}
+        del self.events_by_key[key]
+        return ""
+
+
+@pytest_asyncio.fixture
+async def sync_db():
+    """In-memory database with a connected user."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    tables = [
+        Subscription.__table__,
+        GoogleCalendarConnection.__table__,
+        GoogleCalendarEventSync.__table__,
+    ]
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, tables=tables))
+
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as session:
+        session.add(
+            GoogleCalendarConnection(
+                user_id="u1",
+                access_token="token",
+                sync_status=GoogleCalendarSyncStatus.CONNECTED,
+            )
+        )
+        await session.commit()
+        yield session
+
+    await engine.dispose()
+
+
+class TestIncrementalSync:
+    """Tests for diff-based, batched sync_subscriptions_to_calendar."""
+
+    @pytest.fixture
+    def api(self):
+        """Fake Google Calendar API."""
+        return FakeCalendarAPI()
+
+    @pytest.fixture
+    def service(self, sync_db, api):
+        """Service talking to the fake API."""
+        from src.services.google_calendar_service import GoogleCalendarService
+
+        service = GoogleCalendarService(sync_db, "u1")
+        service._get_credentials = AsyncMock(return_value=MagicMock())
+        service._get_calendar_service = MagicMock(return_value=api)
+        return service
+
+    async def add_subscriptions(self, db, count):
+        """Add active subscriptions of user u1."""
+        subs = [
+            Subscription(
+                id=f"s{i}",
+                user_id="u1",
+                name=f"Service {i}",
+                amount=Decimal("9.99"),
+                currency="GBP",
+                frequency="monthly",
+                start_date=date(2025, 1, 1),
+                next_payment_date=date(2025, 2, 1),
+            )
+            for i in range(count)
+        ]
+        db.add_all(subs)
+        await db.commit()
+        return subs
+
+    async def states(self, db):
+        """Sync state rows by subscription ID."""
+        result = await db.execute(select(GoogleCalendarEventSync))
+        return {state.subscription_id: state for state in result.scalars().all()}
+
+    @pytest.mark.asyncio
+    async def test_first_sync_creates_in_one_batch(self, service, sync_db, api):
+        """Test the first sync creates every event with a single batch request."""
+        await self.add_subscriptions(sync_db, 3)
+
+        result = await service.sync_subscriptions_to_calendar()
+
+        assert result["created"] == 3
+        assert result["total"] == 3
+        assert api.batches == [3]
+        assert {s.event_id for s in (await self.states(sync_db)).values()} == {
+            "evt1",
+            "evt2",
+            "evt3",
+        }
+
+    @pytest.mark.asyncio
+    async def test_unchanged_sync_sends_nothing(self, service, sync_db, api):
+        """Test a second sync without changes makes no API requests."""
+        await self.add_subscriptions(sync_db, 3)
+        await service.sync_subscriptions_to_calendar()
+
+        result = await service.sync_subscriptions_to_calendar()
+
+        assert result["unchanged"] == 3
+        assert result["created"] == result["updated"] == result["deleted"] == 0
+        assert api.batches == [3]
+        service._get_calendar_service.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_sync_pushes_only_changes(self, service, sync_db, api):
+        """Test changed, removed and new subscriptions are updated, deleted and created."""
+        subs = await self.add_subscriptions(sync_db, 3)
+        await service.sync_subscriptions_to_calendar()
+
+        subs[0].amount = Decimal("12.99")
+        subs[1].is_active = False
+        sync_db.add(
+            Subscription(
+                id="s9",
+                user_id="u1",
+                name="New",
+                amount=Decimal("1.00"),
+                currency="GBP",
+                frequency="monthly",
+                start_date=date(2025, 1, 1),
+                next_payment_date=date(2025, 2, 1),
+            )
+        )
+        await sync_db.commit()
+        api.calls.clear()
+
+        result = await service.sync_subscriptions_to_calendar()
+
+        assert sorted(api.calls) == ["delete", "insert", "update"]
+        assert (result["created"], result["updated"], result["deleted"]) == (1, 1, 1)
+        assert result["unchanged"] == 1
+        assert set(await self.states(sync_db)) == {"s0", "s2", "s9"}
+        assert "£12.99" in api.events_by_key[("primary", "evt1")]["summary"]
+
+    @pytest.mark.asyncio
+    async def test_event_deleted_in_calendar_is_recreated(self, service, sync_db, api):
+        """Test an update of an event the user deleted creates it again."""
+        subs = await self.add_subscriptions(sync_db, 1)
+        await service.sync_subscriptions_to_calendar()
+        api.events_by_key.clear()
+
+        subs[0].amount = Decimal("12.99")
+        await sync_db.commit()
+        result = await service.sync_subscriptions_to_calendar()
+
+        assert result["created"] == 1
+        assert (await self.states(sync_db))["s0"].event_id == "evt2"
+
+    @pytest.mark.asyncio
+    async def test_calendar_change_moves_events(self, service, sync_db, api):
+        """Test syncing to another calendar moves the events."""
+        await self.add_subscriptions(sync_db, 1)
+        await service.sync_subscriptions_to_calendar()
+
+        await service.sync_subscriptions_to_calendar(calendar_id="work")
+
+        assert list(api.events_by_key) == [("work", "evt2")]
+        state = (await self.states(sync_db))["s0"]
+        assert (state.calendar_id, state.event_id) == ("work", "evt2")
+
+    @pytest.mark.asyncio
+    async def test_failed_move_delete_retried_next_sync(self, service, sync_db, api):
+        """Test a move whose delete failed creates nothing and is retried."""
+        await self.add_subscriptions(sync_db, 1)
+        await service.sync_subscriptions_to_calendar()
+
+        api.failing_events.add("evt1")
+        result = await service.sync_subscriptions_to_calendar(calendar_id="work")
+
+        assert result["failed"] == 1
+        assert "insert" not in api.calls[1:]
+        assert list(api.events_by_key) == [("primary", "evt1")]
+        state = (await self.states(sync_db))["s0"]
+        assert (state.calendar_id, state.event_id) == ("primary", "evt1")
+
+        api.failing_events.clear()
+        result = await service.sync_subscriptions_to_calendar(calendar_id="work")
+
+        assert (result["deleted"], result["created"]) == (1, 1)
+        assert list(api.events_by_key) == [("work", "evt2")]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error",
+        [
+            HttpError(httplib2.Response({"status": 503}), b"unavailable"),
+            httplib2.ServerNotFoundError("Unable to find the server"),
+            TimeoutError("timed out"),
+        ],
+    )
+    async def test_failed_batch_request_counts_failures(self, service, sync_db, api, error):
+        """Test a batch request rejected as a whole fails its operations cleanly."""
+        await self.add_subscriptions(sync_db, 3)
+        api.batch_error = error
+
+        result = await service.sync_subscriptions_to_calendar()
+
+        assert result["failed"] == 3
+        assert result["created"] == 0
+        assert await self.states(sync_db) == {}
+        connection = await service.get_connection()
+        assert connection.last_sync_at is not None
+        assert connection.last_error
+
+        api.batch_error = None
+        result = await service.sync_subscriptions_to_calendar()
+        assert result["created"] == 3
+
+    @pytest.mark.asyncio
+    async def test_requests_split_into_batches(self, service, sync_db, api):
+        """Test operations are sent in batches of SYNC_BATCH_SIZE."""
+        await self.add_subscriptions(sync_db, 5)
+
+        with patch("src.services.google_calendar_service.SYNC_BATCH_SIZE", 2):
+            await service.sync_subscriptions_to_calendar()
+
+        assert api.batches == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_failed_update_retried_next_sync(self, service, sync_db, api):
+        """Test a failed update keeps the old hash so the next sync retries it."""
+        subs = await self.add_subscriptions(sync_db, 1)
+        await service.sync_subscriptions_to_calendar()
+        old_hash = (await self.states(sync_db))["s0"].content_hash
+
+        subs[0].amount = Decimal("12.99")
+        await sync_db.commit()
+        api.failing_events.add("evt1")
+        result = await service.sync_subscriptions_to_calendar()
+
+        assert result["failed"] == 1
+        assert (await self.states(sync_db))["s0"].content_hash == old_hash
+
+        api.failing_events.clear()
+        result = await service.sync_subscriptions_to_calendar()
+        assert result["updated"] == 1
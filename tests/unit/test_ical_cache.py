@@ -0,0 +1,274 @@
+"""Unit tests for the iCal feed cache.
+
+Tests cover:
+- Subscription data versions (creation, reuse, bumps)
+- Feed caching keyed by version, date and parameters
+- ETag / Last-Modified validators and conditional requests
+- Session hooks bumping versions on commit
+"""
+
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from src.db.database import Base
+from src.models.subscription import Subscription
+from src.services import ical_cache
+from src.services.ical_cache import (
+    CachedFeed,
+    FeedVersion,
+    ICalFeedCache,
+    mark_subscriptions_changed,
+    track_subscription_changes,
+    wait_for_pending_bumps,
+)
+
+TODAY = date(2025, 3, 10)
+PARAMS = {"include_inactive": False, "days_ahead": 365, "payment_types": None}
+
+
+class FakeCache:
+    """In-memory stand-in for CacheService."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+
+    async def get(self, key: str) -> Any | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
+        self.data[key] = value
+        return True
+
+    async def add(self, key: str, value: Any, ttl: int | None = None) -> bool:
+        if key in self.data:
+            return False
+        self.data[key] = value
+        return True
+
+    async def set_many(self, items: dict[str, Any], ttl: int | None = None) -> bool:
+        self.data.update(items)
+        return True
+
+    async def delete(self, key: str) -> bool:
+        return self.data.pop(key, None) is not None
+
+
+@pytest.fixture
+def feed_cache():
+    """Feed cache backed by an in-memory cache."""
+    return ICalFeedCache(cache=FakeCache())
+
+
+class TestFeedVersion:
+    """Tests for subscription data versions."""
+
+    @pytest.mark.asyncio
+    async def test_version_created_once(self, feed_cache):
+        """Test a missing version is created and then reused."""
+        first = await feed_cache.get_version("u1")
+        second = await feed_cache.get_version("u1")
+
+        assert first == second
+
+    @pytest.mark.asyncio
+    async def test_bump_replaces_version(self, feed_cache):
+        """Test a bump gives the changed users a new token."""
+        before = await feed_cache.get_version("u1")
+        other = await feed_cache.get_version("u2")
+
+        await feed_cache.bump({"u1"})
+
+        assert (await feed_cache.get_version("u1")).token != before.token
+        assert await feed_cache.get_version("u2") == other
+
+
+class TestFeedCaching:
+    """Tests for caching serialized feeds."""
+
+    @pytest.mark.asyncio
+    async def test_put_then_get(self, feed_cache):
+        """Test a stored feed is served for the same version and parameters."""
+        version = await feed_cache.get_version("u1")
+
+        stored = await feed_cache.put("u1", version, PARAMS, b"BEGIN:VCALENDAR", today=TODAY)
+
+        assert await feed_cache.get("u1", version, PARAMS, today=TODAY) == stored
+
+    @pytest.mark.asyncio
+    async def test_miss_after_bump(self, feed_cache):
+        """Test a feed is not served once the user's data changed."""
+        version = await feed_cache.get_version("u1")
+        await feed_cache.put("u1", version, PARAMS, b"BEGIN:VCALENDAR", today=TODAY)
+
+        await feed_cache.bump({"u1"})
+        new_version = await feed_cache.get_version("u1")
+
+        assert await feed_cache.get("u1", new_version, PARAMS, today=TODAY) is None
+
+    @pytest.mark.asyncio
+    async def test_miss_for_other_day_or_params(self, feed_cache):
+        """Test feeds are cached per date and per parameters."""
+        version = await feed_cache.get_version("u1")
+        await feed_cache.put("u1", version, PARAMS, b"BEGIN:VCALENDAR", today=TODAY)
+
+        tomorrow = TODAY + timedelta(days=1)
+        assert await feed_cache.get("u1", version, PARAMS, today=tomorrow) is None
+        other_params = {**PARAMS, "days_ahead": 90}
+        assert await feed_cache.get("u1", version, other_params, today=TODAY) is None
+
+
+class TestCachedFeed:
+    """Tests for feed validators and conditional requests."""
+
+    @pytest.fixture
+    def feed(self):
+        """Feed whose data last changed on TODAY at noon."""
+        version = FeedVersion(token="t", modified=datetime(2025, 3, 10, 12, 0, tzinfo=UTC))
+        return CachedFeed.build(b"BEGIN:VCALENDAR", version, TODAY)
+
+    def test_strong_etag(self, feed):
+        """Test the ETag is a quoted strong tag derived from the content."""
+        assert feed.etag.startswith('"') and not feed.etag.startswith("W/")
+        version = FeedVersion(token="t", modified=feed.last_modified)
+        assert CachedFeed.build(b"OTHER", version, TODAY).etag != feed.etag
+
+    def test_last_modified_not_before_feed_date(self):
+        """Test an old data change still yields the start of the feed date."""
+        version = FeedVersion(token="t", modified=datetime(2025, 1, 1, tzinfo=UTC))
+
+        feed = CachedFeed.build(b"BEGIN:VCALENDAR", version, TODAY)
+
+        assert feed.last_modified == datetime(2025, 3, 10, tzinfo=UTC)
+
+    def test_if_none_match(self, feed):
+        """Test If-None-Match matching, including lists, weak tags and '*'."""
+        assert feed.is_current(feed.etag, None)
+        assert feed.is_current(f'"other", W/{feed.etag}', None)
+        assert feed.is_current("*", None)
+        assert not feed.is_current('"other"', None)
+
+    def test_if_none_match_takes_precedence(self, feed):
+        """Test If-Modified-Since is ignored when If-None-Match is sent."""
+        assert not feed.is_current('"other"', "Tue, 11 Mar 2025 00:00:00 GMT")
+
+    def test_if_modified_since(self, feed):
+        """Test If-Modified-Since against Last-Modified."""
+        assert feed.is_current(None, "Mon, 10 Mar 2025 12:00:00 GMT")
+        assert not feed.is_current(None, "Mon, 10 Mar 2025 11:59:59 GMT")
+        assert not feed.is_current(None, "not a date")
+        assert not feed.is_current(None, None)
+
+    def test_round_trip(self, feed):
+        """Test a feed survives serialization for the cache."""
+        assert CachedFeed.from_dict(feed.to_dict()) == feed
+
+
+@pytest_asyncio.fixture
+async def tracked_db(monkeypatch):
+    """In-memory database with change tracking and an in-memory feed cache."""
+    feed_cache = ICalFeedCache(cache=FakeCache())
+    monkeypatch.setattr(ical_cache, "_ical_feed_cache", feed_cache)
+    track_subscription_changes()
+
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            lambda sync_conn: Base.metadata.create_all(sync_conn, tables=[Subscription.__table__])
+        )
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as session:
+        yield session, feed_cache
+
+    await engine.dispose()
+    event.remove(Session, "after_flush", ical_cache._collect_subscription_changes)
+    event.remove(Session, "after_commit", ical_cache._publish_subscription_changes)
+    event.remove(Session, "after_transaction_end", ical_cache._discard_subscription_changes)
+
+
+def make_subscription(user_id: str) -> Subscription:
+    """Create a minimal subscription."""
+    return Subscription(
+        user_id=user_id,
+        name="Netflix",
+        amount=Decimal("9.99"),
+        currency="GBP",
+        frequency="monthly",
+        start_date=TODAY,
+        next_payment_date=TODAY,
+    )
+
+
+class TestChangeTracking:
+    """Tests for the session hooks bumping versions on commit."""
+
+    @pytest.mark.asyncio
+    async def test_commit_bumps_changed_users(self, tracked_db):
+        """Test committing ORM changes replaces the owners' versions only."""
+        session, feed_cache = tracked_db
+        before = await feed_cache.get_version("u1")
+        other = await feed_cache.get_version("u2")
+
+        sub = make_subscription("u1")
+        session.add(sub)
+        await session.commit()
+        await wait_for_pending_bumps()
+        after_insert = await feed_cache.get_version("u1")
+
+        sub.amount = Decimal("12.99")
+        await session.commit()
+        await wait_for_pending_bumps()
+
+        assert after_insert.token != before.token
+        assert (await feed_cache.get_version("u1")).token != after_insert.token
+        assert await feed_cache.get_version("u2") == other
+
+    @pytest.mark.asyncio
+    async def test_rollback_keeps_version(self, tracked_db):
+        """Test rolled back changes do not replace the version."""
+        session, feed_cache = tracked_db
+        before = await feed_cache.get_version("u1")
+
+        session.add(make_subscription("u1"))
+        await session.flush()
+        await session.rollback()
+        await session.commit()
+        await wait_for_pending_bumps()
+
+        assert await feed_cache.get_version("u1") == before
+
+    @pytest.mark.asyncio
+    async def test_savepoint_rollback_keeps_changes(self, tracked_db):
+        """Test a rolled back savepoint does not drop earlier changes."""
+        session, feed_cache = tracked_db
+        before = await feed_cache.get_version("u1")
+
+        session.add(make_subscription("u1"))
+        await session.flush()
+        with pytest.raises(ValueError):
+            async with session.begin_nested():
+                session.add(make_subscription("u1"))
+                await session.flush()
+                raise ValueError("row rejected")
+        await session.commit()
+        await wait_for_pending_bumps()
+
+        assert (await feed_cache.get_version("u1")).token != before.token
+
+    @pytest.mark.asyncio
+    async def test_marked_core_changes(self, tracked_db):
+        """Test users marked for Core statements are bumped on commit."""
+        session, feed_cache = tracked_db
+        before = await feed_cache.get_version("u1")
+
+        mark_subscriptions_changed(session, "u1", None)
+        await session.commit()
+        await wait_for_pending_bumps()
+
+        assert (await feed_cache.get_version("u1")).token != before.token
@@ -486,19 +486,20 @@ class TestIconServiceAsync:
     @pytest.mark.asyncio
     async def test_bulk_fetch(self) -> None:
         """Test bulk fetching icons."""
+        from src.services.icon_fetcher import IconFetcher
         from src.services.icon_service import IconService
 
         mock_db = AsyncMock()
         mock_result = MagicMock()
 
-        # Return None for all - simulating empty cache
-        mock_result.scalar_one_or_none.return_value = None
+        # Return nothing - simulating empty cache
+        mock_result.scalars.return_value.all.return_value = []
         mock_db.execute.return_value = mock_result
 
         service = IconService(mock_db)
 
-        # Patch get_icon to return some results
-        async def mock_get_icon(name, **kwargs):
+        # Patch the shared fetch to return some results
+        async def mock_fetch_shared(name, sources=None, **kwargs):
             if name == "netflix":
                 return IconResponse(
                     id="icon-1",
@@ -508,7 +509,10 @@ class TestIconServiceAsync:
                 )
             return None
 
-        with patch.object(service, 'get_icon', side_effect=mock_get_icon):
+        with (
+            patch("src.services.icon_service.get_icon_fetcher", return_value=IconFetcher()),
+            patch.object(service, "_fetch_shared", side_effect=mock_fetch_shared),
+        ):
             response = await service.bulk_fetch(["netflix", "unknown"])
 
         assert response.found == 1
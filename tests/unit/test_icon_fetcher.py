@@ -0,0 +1,248 @@
+"""Unit tests for the process-wide icon fetcher.
+
+Tests cover:
+- In-process LRU of resolved icons (TTL, icon expiry, eviction, invalidation)
+- Single-flight fetches and negative caching
+- Concurrency limit on source requests
+- Bulk fetches served from memory, one cache query and concurrent fetches
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from src.models.icon_cache import IconCache, IconSource
+from src.schemas.icon import IconResponse, IconSourceEnum
+from src.services.icon_fetcher import IconFetcher
+from src.services.icon_service import IconService
+
+
+def make_icon(name: str = "netflix", expires_at: datetime | None = None) -> IconResponse:
+    """Create a resolved icon."""
+    return IconResponse(
+        id=f"icon-{name}",
+        service_name=name,
+        source=IconSourceEnum.SIMPLE_ICONS,
+        created_at=datetime.now(UTC),
+        expires_at=expires_at,
+    )
+
+
+def make_cached(name: str, expires_at: datetime) -> IconCache:
+    """Create a global cache entry."""
+    return IconCache(
+        id=f"icon-{name}",
+        service_name=name,
+        display_name=name.title(),
+        source=IconSource.SIMPLE_ICONS,
+        created_at=datetime.now(UTC),
+        expires_at=expires_at,
+        fetch_count=0,
+        is_verified=False,
+    )
+
+
+class TestMemoryCache:
+    """Tests for the in-process LRU."""
+
+    def test_put_then_get(self):
+        """Test icons are cached per name and user."""
+        fetcher = IconFetcher()
+        icon = make_icon()
+
+        fetcher.put("netflix", None, icon)
+
+        assert fetcher.get("netflix") == icon
+        assert fetcher.get("netflix", "u1") is None
+
+    def test_ttl_and_icon_expiry(self):
+        """Test entries are dropped after the TTL or once the icon expires."""
+        expired = make_icon("spotify", expires_at=datetime.now(UTC) - timedelta(seconds=1))
+        fetcher = IconFetcher(cache_ttl=-1)
+        fetcher.put("netflix", None, make_icon())
+        assert fetcher.get("netflix") is None
+
+        fetcher = IconFetcher()
+        fetcher.put("spotify", None, expired)
+        assert fetcher.get("spotify") is None
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used icon is evicted at capacity."""
+        fetcher = IconFetcher(cache_size=2)
+        fetcher.put("netflix", None, make_icon("netflix"))
+        fetcher.put("spotify", None, make_icon("spotify"))
+        fetcher.get("netflix")
+
+        fetcher.put("hulu", None, make_icon("hulu"))
+
+        assert fetcher.get("spotify") is None
+        assert fetcher.get("netflix") is not None
+        assert fetcher.get("hulu") is not None
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self):
+        """Test invalidation drops icons and negative results for a name."""
+        fetcher = IconFetcher()
+        fetcher.put("netflix", None, make_icon())
+        fetcher.put("netflix", "u1", make_icon())
+        await fetcher.single_flight(("netflix", "clearbit"), AsyncMock(return_value=None))
+
+        fetcher.invalidate("netflix")
+
+        assert fetcher.get("netflix") is None
+        assert fetcher.get("netflix", "u1") is None
+        assert not fetcher.is_missing(("netflix", "clearbit"))
+
+
+class TestSingleFlight:
+    """Tests for deduplicated fetches."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_fetch(self):
+        """Test concurrent fetches of one key run once."""
+        calls = 0
+
+        async def fetch() -> IconResponse:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return make_icon()
+
+        fetcher = IconFetcher()
+        results = await asyncio.gather(
+            *(fetcher.single_flight(("netflix",), fetch) for _ in range(5))
+        )
+
+        assert calls == 1
+        assert all(result == results[0] for result in results)
+
+    @pytest.mark.asyncio
+    async def test_negative_result_cached(self):
+        """Test a missing icon is not fetched again unless forced."""
+        fetch = AsyncMock(return_value=None)
+        fetcher = IconFetcher()
+
+        assert await fetcher.single_flight(("unknown",), fetch) is None
+        assert await fetcher.single_flight(("unknown",), fetch) is None
+        assert fetch.await_count == 1
+
+        await fetcher.single_flight(("unknown",), fetch, use_negative_cache=False)
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_negative_result_expires(self):
+        """Test a missing icon is fetched again once the TTL passes."""
+        fetch = AsyncMock(return_value=None)
+        fetcher = IconFetcher(negative_ttl=-1)
+
+        await fetcher.single_flight(("unknown",), fetch)
+        await fetcher.single_flight(("unknown",), fetch)
+
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_keeps_fetch(self):
+        """Test a caller giving up does not cancel the fetch for others."""
+        started = asyncio.Event()
+
+        async def fetch() -> IconResponse:
+            started.set()
+            await asyncio.sleep(0.01)
+            return make_icon()
+
+        fetcher = IconFetcher()
+        first = asyncio.create_task(fetcher.single_flight(("netflix",), fetch))
+        await started.wait()
+        second = asyncio.create_task(fetcher.single_flight(("netflix",), fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert (await second).service_name == "netflix"
+
+
+class TestHead:
+    """Tests for pooled source requests."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        """Test source requests in flight stay within the limit."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        fetcher = IconFetcher(concurrency=2, http_client=client)
+
+        await asyncio.gather(*(fetcher.head(f"https://icons.example.com/{i}") for i in range(6)))
+
+        assert peak == 2
+
+
+class TestIconServiceWithFetcher:
+    """Tests for IconService using the shared fetcher."""
+
+    @pytest.fixture
+    def fetcher(self):
+        """Fresh fetcher in place of the process-wide one."""
+        fetcher = IconFetcher()
+        with patch("src.services.icon_service.get_icon_fetcher", return_value=fetcher):
+            yield fetcher
+
+    @pytest.mark.asyncio
+    async def test_get_icon_from_memory(self, fetcher):
+        """Test a remembered icon is returned without a query."""
+        mock_db = AsyncMock()
+        fetcher.put("netflix", None, make_icon())
+
+        icon = await IconService(mock_db).get_icon("Netflix")
+
+        assert icon.service_name == "netflix"
+        mock_db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_bulk_fetch(self, fetcher):
+        """Test memory hits, one cache query and concurrent fetches for the rest."""
+        fresh = make_cached("spotify", datetime.now(UTC) + timedelta(hours=1))
+        stale = make_cached("hulu", datetime.now(UTC) - timedelta(hours=1))
+        mock_db = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [fresh, stale]
+        mock_db.execute.return_value = mock_result
+        fetcher.put("netflix", None, make_icon("netflix"))
+        service = IconService(mock_db)
+        in_flight = 0
+        peak = 0
+        fetched: list[str] = []
+
+        async def fetch_shared(name, sources=None, **kwargs):
+            nonlocal in_flight, peak
+            fetched.append(name)
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return make_icon("figma") if name == "Figma" else None
+
+        with patch.object(service, "_fetch_shared", side_effect=fetch_shared):
+            response = await service.bulk_fetch(
+                ["Netflix", "netflix", "Spotify", "Hulu", "Figma", "unknown"]
+            )
+
+        mock_db.execute.assert_awaited_once()
+        assert sorted(fetched) == ["Figma", "Hulu", "unknown"]
+        assert peak == 3
+        assert response.found == 5
+        assert response.missing == ["unknown"]
+        assert response.icons["Hulu"].service_name == "hulu"
+        assert fetcher.get("spotify").id == fresh.id
+        assert fresh.fetch_count == 1
@@ -0,0 +1,148 @@
+"""Tests for the notification dispatcher.
+
+Tests cover:
+- Token bucket refill and waiting
+- Per-channel concurrency bound
+- Rate limiting of sends
+- Error isolation in gather()
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.models.notification_history import NotificationChannel
+from src.services.notification_dispatcher import (
+    ChannelLimits,
+    NotificationDispatcher,
+    TokenBucket,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_rejects_non_positive_rate(self):
+        """Test a zero rate is rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+    def test_capacity_defaults_to_one_second(self):
+        """Test the default burst size is one second's worth of tokens."""
+        assert TokenBucket(rate=25).capacity == 25
+        assert TokenBucket(rate=0.5).capacity == 1
+
+    @pytest.mark.asyncio
+    async def test_burst_then_refill(self):
+        """Test a full bucket allows a burst and then refills with time."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+
+        await bucket.acquire()
+        await bucket.acquire()
+        assert bucket._tokens == 0
+
+        clock.now = 0.5
+        await bucket.acquire()  # one token refilled
+        assert bucket._tokens == 0
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_when_empty(self):
+        """Test acquire sleeps until a token is available."""
+        bucket = TokenBucket(rate=20, capacity=1)
+
+        start = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+        elapsed = time.monotonic() - start
+
+        # First token is free, the next two take 1/20s each
+        assert elapsed >= 0.09
+
+
+class TestNotificationDispatcher:
+    """Tests for NotificationDispatcher."""
+
+    @staticmethod
+    def _limits(rate: float = 1000, concurrency: int = 2):
+        return {
+            channel: ChannelLimits(rate=rate, concurrency=concurrency)
+            for channel in NotificationChannel
+        }
+
+    @pytest.mark.asyncio
+    async def test_send_returns_result(self):
+        """Test send returns the send coroutine's result."""
+        dispatcher = NotificationDispatcher(self._limits())
+
+        async def ok():
+            return True
+
+        assert await dispatcher.send(NotificationChannel.EMAIL, ok) is True
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded_per_channel(self):
+        """Test no more than `concurrency` sends run at once on a channel."""
+        dispatcher = NotificationDispatcher(self._limits(concurrency=2))
+        in_flight = 0
+        peak = 0
+
+        async def slow_send():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return True
+
+        async def job():
+            await dispatcher.send(NotificationChannel.TELEGRAM, slow_send)
+            return 1
+
+        total = await dispatcher.gather(job() for _ in range(10))
+
+        assert total == 10
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_sends_are_rate_limited(self):
+        """Test the token bucket spaces sends once the burst is used."""
+        dispatcher = NotificationDispatcher(self._limits(rate=50, concurrency=10))
+
+        async def send():
+            return True
+
+        async def job():
+            await dispatcher.send(NotificationChannel.PUSH, send)
+            return 1
+
+        start = time.monotonic()
+        # Burst of 50, then 10 more at 50/s
+        await dispatcher.gather(job() for _ in range(60))
+        elapsed = time.monotonic() - start
+
+        assert elapsed >= 0.18
+
+    @pytest.mark.asyncio
+    async def test_gather_isolates_failures(self):
+        """Test a failing job counts as zero and does not abort the batch."""
+        dispatcher = NotificationDispatcher(self._limits())
+
+        async def ok():
+            return 2
+
+        async def boom():
+            raise RuntimeError("send failed")
+
+        assert await dispatcher.gather([ok(), boom(), ok()]) == 4
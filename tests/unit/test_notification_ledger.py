@@ -0,0 +1,230 @@
+"""Tests for the notification send ledger.
+
+Tests cover:
+- Atomic claims skipping sent and in-flight notifications
+- Re-claiming failed sends
+- Delivering claimed sends and recording outcomes
+- Retention pruning
+- Single-pass, deduplicated reminder runs
+"""
+
+import uuid
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.db.database import Base
+from src.models.notification import NotificationPreferences
+from src.models.notification_history import (
+    NotificationChannel,
+    NotificationStatus,
+    NotificationType,
+)
+from src.models.notification_send import NotificationSend
+from src.models.subscription import Subscription
+from src.models.user import User
+from src.services.notification_dispatcher import ChannelLimits, NotificationDispatcher
+from src.services.notification_ledger import LedgerKey, NotificationLedger, PendingSend
+
+TODAY = date(2026, 1, 10)
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    """In-memory database with the ledger, users, preferences and subscriptions."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    tables = [
+        User.__table__,
+        NotificationPreferences.__table__,
+        Subscription.__table__,
+        NotificationSend.__table__,
+    ]
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, tables=tables))
+
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as session:
+        session.add(User(id="u1", email="u1@example.com", hashed_password="x"))
+        await session.commit()
+
+    yield factory
+    await engine.dispose()
+
+
+@pytest.fixture
+def dispatcher():
+    """Dispatcher with limits high enough not to slow tests down."""
+    return NotificationDispatcher(
+        {channel: ChannelLimits(rate=1000, concurrency=5) for channel in NotificationChannel}
+    )
+
+
+def _key(subscription_id="s1", channel=NotificationChannel.TELEGRAM):
+    return LedgerKey("u1", subscription_id, TODAY, channel, NotificationType.PAYMENT_REMINDER)
+
+
+async def _statuses(factory):
+    async with factory() as session:
+        result = await session.execute(
+            select(NotificationSend.subscription_key, NotificationSend.status)
+        )
+        return dict(result.all())
+
+
+class TestClaim:
+    """Tests for NotificationLedger.claim."""
+
+    @pytest.mark.asyncio
+    async def test_second_claim_is_skipped(self, session_factory):
+        """Test a key can only be claimed once, even by another ledger."""
+        async with session_factory() as a, session_factory() as b:
+            first = await NotificationLedger(a).claim([_key("s1"), _key("s2")])
+            second = await NotificationLedger(b).claim([_key("s2"), _key("s3")])
+
+        assert set(first) == {_key("s1"), _key("s2")}
+        assert set(second) == {_key("s3")}
+
+    @pytest.mark.asyncio
+    async def test_key_includes_channel_and_digest_keys(self, session_factory):
+        """Test channels are claimed separately and user-level keys collide."""
+        digest = LedgerKey(
+            "u1", None, TODAY, NotificationChannel.EMAIL, NotificationType.DAILY_DIGEST
+        )
+        async with session_factory() as session:
+            ledger = NotificationLedger(session, chunk_size=1)
+            first = await ledger.claim(
+                [
+                    _key(channel=NotificationChannel.TELEGRAM),
+                    _key(channel=NotificationChannel.EMAIL),
+                    digest,
+                ]
+            )
+            second = await ledger.claim([digest])
+
+        assert len(first) == 3
+        assert second == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_send_can_be_reclaimed(self, session_factory):
+        """Test only failed sends are claimed again."""
+        async with session_factory() as session:
+            ledger = NotificationLedger(session)
+            claimed = await ledger.claim([_key("s1"), _key("s2")])
+            await ledger.record({claimed[_key("s1")]: True, claimed[_key("s2")]: False})
+
+            reclaimed = await ledger.claim([_key("s1"), _key("s2")])
+
+        assert set(reclaimed) == {_key("s2")}
+        assert await _statuses(session_factory) == {
+            "s1": NotificationStatus.SENT.value,
+            "s2": NotificationStatus.PENDING.value,
+        }
+
+
+class TestDeliver:
+    """Tests for NotificationLedger.deliver."""
+
+    @pytest.mark.asyncio
+    async def test_sends_claimed_and_records_outcomes(self, session_factory, dispatcher):
+        """Test claimed sends run once and their outcomes are stored."""
+        ok = AsyncMock(return_value=True)
+        rejected = AsyncMock(return_value=False)
+        boom = AsyncMock(side_effect=RuntimeError("network"))
+
+        async with session_factory() as session:
+            ledger = NotificationLedger(session)
+            outcomes = await ledger.deliver(
+                dispatcher,
+                [
+                    PendingSend(_key("s1"), ok),
+                    PendingSend(_key("s1"), ok),  # duplicate in the same batch
+                    PendingSend(_key("s2"), rejected),
+                    PendingSend(_key("s3"), boom),
+                ],
+            )
+            repeat = await ledger.deliver(dispatcher, [PendingSend(_key("s1"), ok)])
+
+        assert outcomes == {_key("s1"): True, _key("s2"): False, _key("s3"): False}
+        assert repeat == {}
+        ok.assert_awaited_once()
+        assert await _statuses(session_factory) == {
+            "s1": NotificationStatus.SENT.value,
+            "s2": NotificationStatus.FAILED.value,
+            "s3": NotificationStatus.FAILED.value,
+        }
+
+
+class TestPrune:
+    """Tests for NotificationLedger.prune."""
+
+    @pytest.mark.asyncio
+    async def test_deletes_old_entries(self, session_factory):
+        """Test only entries claimed before the cut-off are deleted."""
+        async with session_factory() as session:
+            ledger = NotificationLedger(session)
+            await ledger.claim([_key("s1")])
+
+            assert await ledger.prune(datetime.utcnow() - timedelta(days=1)) == 0
+            assert await ledger.prune(datetime.utcnow() + timedelta(seconds=1)) == 1
+
+
+class TestPaymentReminderRun:
+    """Tests for the merged, deduplicated reminder task."""
+
+    @pytest.mark.asyncio
+    async def test_one_pass_sends_each_channel_once(self, session_factory, dispatcher):
+        """Test Telegram and email go out in one run and a retry sends nothing."""
+        from src.core import tasks
+
+        async with session_factory() as session:
+            session.add(
+                NotificationPreferences(
+                    user_id="u1",
+                    telegram_enabled=True,
+                    telegram_verified=True,
+                    telegram_chat_id="1",
+                    email_enabled=True,
+                    reminder_days_before=0,
+                )
+            )
+            session.add(
+                Subscription(
+                    id=str(uuid.uuid4()),
+                    user_id="u1",
+                    name="Netflix",
+                    amount=Decimal("9.99"),
+                    currency="GBP",
+                    frequency="monthly",
+                    start_date=date.today(),
+                    next_payment_date=date.today(),
+                    is_active=True,
+                )
+            )
+            await session.commit()
+
+        ctx = {"session_factory": session_factory, "dispatcher": dispatcher}
+        with (
+            patch(
+                "src.services.telegram_service.TelegramService.send_reminder",
+                new=AsyncMock(return_value=True),
+            ) as telegram,
+            patch(
+                "src.services.email_service.EmailService.send_reminder",
+                new=AsyncMock(return_value=True),
+            ) as email,
+            patch.object(tasks.settings, "smtp_host", "smtp.example.com"),
+            patch.object(tasks.settings, "smtp_user", "user"),
+            patch.object(tasks.settings, "smtp_password", "password"),
+        ):
+            first = await tasks.send_payment_reminders(ctx)
+            retry = await tasks.send_payment_reminders(ctx)
+
+        assert first == {"reminders_sent": 1, "emails_sent": 1, "users_notified": 1}
+        assert retry == {"reminders_sent": 0, "emails_sent": 0, "users_notified": 0}
+        telegram.assert_awaited_once()
+        email.assert_awaited_once()
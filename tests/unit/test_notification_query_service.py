@@ -0,0 +1,362 @@
+"""Tests for NotificationQueryService.
+
+Tests cover:
+- Reminder recipients matched on each user's reminder_days_before
+- Digest windows with and without empty recipients
+- Overdue recipients
+- Chunking and per-user grouping
+- Currency read from the JSON preferences string
+- Hash sharding of users
+- Several channels served by one query
+- Delivery windows by timezone and local delivery time
+"""
+
+import json
+import uuid
+from datetime import date, time, timedelta
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.db.database import Base
+from src.models.notification import NotificationPreferences
+from src.models.notification_history import NotificationChannel
+from src.models.subscription import Subscription
+from src.models.user import User
+from src.services.notification_query_service import (
+    NotificationQueryService,
+    _preferred_currency,
+    shard_of,
+    window_conditions,
+)
+
+TODAY = date(2026, 1, 10)
+
+
+@pytest_asyncio.fixture
+async def db():
+    """In-memory database with users, preferences and subscriptions.
+
+    Users u0..u4 have Telegram and email enabled, reminder_days_before=i and
+    three active subscriptions due at TODAY + i - 1, + i and + i + 1.
+    """
+    engine = create_async_engine("sqlite+aiosqlite://")
+    tables = [User.__table__, NotificationPreferences.__table__, Subscription.__table__]
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, tables=tables))
+
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_maker() as session:
+        for i in range(5):
+            user = User(
+                id=f"u{i}",
+                email=f"u{i}@example.com",
+                hashed_password="x",
+                preferences=json.dumps({"currency": "USD"}) if i == 0 else None,
+            )
+            session.add(user)
+            session.add(
+                NotificationPreferences(
+                    user_id=user.id,
+                    telegram_enabled=True,
+                    telegram_verified=True,
+                    telegram_chat_id=str(i),
+                    email_enabled=True,
+                    reminder_days_before=i,
+                    weekly_digest=True,
+                )
+            )
+            for k in range(3):
+                session.add(
+                    Subscription(
+                        id=str(uuid.uuid4()),
+                        user_id=user.id,
+                        name=f"s{i}{k}",
+                        amount=Decimal("1.00"),
+                        currency="GBP",
+                        frequency="monthly",
+                        start_date=TODAY,
+                        next_payment_date=TODAY + timedelta(days=i + k - 1),
+                        is_active=True,
+                    )
+                )
+        await session.commit()
+        yield session
+
+    await engine.dispose()
+
+
+async def _collect(iterator):
+    """Flatten yielded batches into (batch sizes, {user_id: [subscription names]})."""
+    sizes = []
+    recipients = {}
+    async for batch in iterator:
+        sizes.append(len(batch))
+        for recipient in batch:
+            recipients[recipient.user_id] = [sub.name for sub in recipient.subscriptions]
+    return sizes, recipients
+
+
+async def _prefs_id(db, user_id):
+    """Return the NotificationPreferences id for a user."""
+    result = await db.execute(
+        select(NotificationPreferences.id).where(NotificationPreferences.user_id == user_id)
+    )
+    return result.scalar_one()
+
+
+class TestNotificationQueryService:
+    """Tests for the recipient iterators."""
+
+    @pytest.mark.asyncio
+    async def test_reminder_recipients_match_reminder_days_before(self, db):
+        """Test each user only gets subscriptions due in reminder_days_before days."""
+        service = NotificationQueryService(db)
+
+        _, recipients = await _collect(
+            service.iter_reminder_recipients(NotificationChannel.TELEGRAM, TODAY)
+        )
+
+        # Subscription k=1 of every user is due at TODAY + i
+        assert recipients == {f"u{i}": [f"s{i}1"] for i in range(5)}
+
+    @pytest.mark.asyncio
+    async def test_reminder_recipients_respect_channel(self, db):
+        """Test users without a verified Telegram chat are skipped."""
+        prefs = await db.get(NotificationPreferences, (await _prefs_id(db, "u2")))
+        prefs.telegram_verified = False
+        await db.commit()
+
+        service = NotificationQueryService(db)
+        _, telegram = await _collect(
+            service.iter_reminder_recipients(NotificationChannel.TELEGRAM, TODAY)
+        )
+        _, email = await _collect(
+            service.iter_reminder_recipients(NotificationChannel.EMAIL, TODAY)
+        )
+
+        assert "u2" not in telegram
+        assert "u2" in email
+
+    @pytest.mark.asyncio
+    async def test_upcoming_recipients_group_and_chunk(self, db):
+        """Test rows are grouped per user and yielded in chunk_size batches."""
+        service = NotificationQueryService(db, chunk_size=2)
+
+        sizes, recipients = await _collect(
+            service.iter_upcoming_recipients(
+                NotificationChannel.EMAIL, TODAY, TODAY + timedelta(days=7)
+            )
+        )
+
+        assert sizes == [2, 2, 1]
+        assert recipients["u0"] == ["s01", "s02"]  # s00 is due yesterday
+        assert recipients["u3"] == ["s30", "s31", "s32"]
+
+    @pytest.mark.asyncio
+    async def test_upcoming_recipients_include_empty(self, db):
+        """Test include_empty keeps users with nothing due in the window."""
+        service = NotificationQueryService(db)
+        window = (TODAY, TODAY + timedelta(days=1))
+
+        _, without_empty = await _collect(
+            service.iter_upcoming_recipients(NotificationChannel.EMAIL, *window)
+        )
+        _, with_empty = await _collect(
+            service.iter_upcoming_recipients(
+                NotificationChannel.EMAIL,
+                *window,
+                NotificationPreferences.weekly_digest.is_(True),
+                include_empty=True,
+            )
+        )
+
+        assert "u4" not in without_empty
+        assert with_empty["u4"] == []
+        assert len(with_empty) == 5
+
+    @pytest.mark.asyncio
+    async def test_overdue_recipients(self, db):
+        """Test only subscriptions with a past payment date are returned."""
+        service = NotificationQueryService(db)
+
+        _, recipients = await _collect(
+            service.iter_overdue_recipients(NotificationChannel.TELEGRAM, TODAY)
+        )
+
+        assert recipients == {"u0": ["s00"]}
+
+    @pytest.mark.asyncio
+    async def test_overdue_recipients_apply_extra_conditions(self, db):
+        """Test caller conditions (e.g. delivery windows) narrow overdue recipients."""
+        service = NotificationQueryService(db)
+
+        _, recipients = await _collect(
+            service.iter_overdue_recipients(
+                NotificationChannel.TELEGRAM, TODAY, NotificationPreferences.user_id == "u1"
+            )
+        )
+
+        assert recipients == {}
+
+    @pytest.mark.asyncio
+    async def test_multiple_channels_in_one_pass(self, db):
+        """Test users reachable on any channel are returned once with their channels."""
+        for user_id, values in {
+            "u1": {"telegram_enabled": False},
+            "u2": {"email_enabled": False},
+            "u3": {"telegram_enabled": False, "email_enabled": False},
+        }.items():
+            prefs = await db.get(NotificationPreferences, await _prefs_id(db, user_id))
+            for key, value in values.items():
+                setattr(prefs, key, value)
+        await db.commit()
+        service = NotificationQueryService(db)
+
+        reachable = {}
+        async for batch in service.iter_upcoming_recipients(
+            [NotificationChannel.TELEGRAM, NotificationChannel.EMAIL],
+            TODAY,
+            TODAY + timedelta(days=7),
+        ):
+            for r in batch:
+                reachable[r.user_id] = [c.value for c in NotificationChannel if r.can_receive(c)]
+
+        assert reachable == {
+            "u0": ["telegram", "email"],
+            "u1": ["email"],
+            "u2": ["telegram"],
+            "u4": ["telegram", "email"],
+        }
+
+    @pytest.mark.asyncio
+    async def test_recipient_currency_from_preferences_json(self, db):
+        """Test the currency is parsed from the user's JSON preferences."""
+        service = NotificationQueryService(db)
+        currencies = {}
+        async for batch in service.iter_upcoming_recipients(
+            NotificationChannel.EMAIL, TODAY, TODAY + timedelta(days=7)
+        ):
+            currencies.update({r.user_id: r.currency for r in batch})
+
+        assert currencies["u0"] == "USD"
+        assert currencies["u1"] == "GBP"
+
+
+class TestSharding:
+    """Tests for splitting recipients into hash shards."""
+
+    def test_shard_of(self):
+        """Test the shard is the ID's last two hex digits modulo the count."""
+        assert shard_of("3f2b1c8e-0000-4000-8000-0000000000ff", 8) == 0xFF % 8
+        assert shard_of("3F2B1C8E-0000-4000-8000-00000000000A", 4) == 0x0A % 4
+        assert shard_of("u1", 8) == 0  # non-hex suffix
+
+    @pytest.mark.asyncio
+    async def test_shards_partition_recipients(self, db):
+        """Test every recipient appears in exactly the shard shard_of() names."""
+        for i in range(16):
+            user_id = str(uuid.UUID(int=i * 0x1F3))
+            db.add(User(id=user_id, email=f"{user_id}@example.com", hashed_password="x"))
+            db.add(NotificationPreferences(user_id=user_id, email_enabled=True))
+        await db.commit()
+
+        shard_count = 3
+        seen = {}
+        for shard_index in range(shard_count):
+            service = NotificationQueryService(db, shard_index=shard_index, shard_count=shard_count)
+            _, recipients = await _collect(
+                service.iter_upcoming_recipients(
+                    NotificationChannel.EMAIL, TODAY, TODAY, include_empty=True
+                )
+            )
+            for user_id in recipients:
+                assert user_id not in seen
+                seen[user_id] = shard_index
+
+        assert len(seen) == 21  # 5 fixture users + 16 UUID users
+        assert all(shard_of(user_id, shard_count) == shard for user_id, shard in seen.items())
+
+
+class TestDeliveryWindows:
+    """Tests for timezone-aware delivery windows."""
+
+    @staticmethod
+    async def _update_prefs(db, user_id, **values):
+        prefs_id = await _prefs_id(db, user_id)
+        prefs = await db.get(NotificationPreferences, prefs_id)
+        for key, value in values.items():
+            setattr(prefs, key, value)
+        await db.commit()
+
+    async def _recipients_in_slot(self, db, slot):
+        service = NotificationQueryService(db)
+        users = set()
+        for window in await service.delivery_windows(slot):
+            _, recipients = await _collect(
+                service.iter_upcoming_recipients(
+                    NotificationChannel.TELEGRAM,
+                    window.local_date,
+                    window.local_date + timedelta(days=7),
+                    *window_conditions(window),
+                    include_empty=True,
+                )
+            )
+            users |= set(recipients)
+        return users
+
+    @pytest.mark.asyncio
+    async def test_unscheduled_run_selects_everyone(self, db):
+        """Test a run without a slot keeps the legacy all-users behaviour."""
+        (window,) = await NotificationQueryService(db).delivery_windows(None)
+
+        assert window_conditions(window) == []
+
+    @pytest.mark.asyncio
+    async def test_users_are_notified_at_local_reminder_time(self, db):
+        """Test each user is selected only in the slot of their local reminder_time."""
+        await self._update_prefs(db, "u1", timezone="Asia/Tokyo")  # 09:00 JST = 00:00 UTC
+
+        assert await self._recipients_in_slot(db, "2026-01-10T00:00+00:00") == {"u1"}
+        assert await self._recipients_in_slot(db, "2026-01-10T09:00+00:00") == {
+            "u0",
+            "u2",
+            "u3",
+            "u4",
+        }
+        assert await self._recipients_in_slot(db, "2026-01-10T09:15+00:00") == set()
+
+    @pytest.mark.asyncio
+    async def test_quiet_hours_defer_delivery_to_their_end(self, db):
+        """Test a reminder_time inside quiet hours is delivered when they end."""
+        await self._update_prefs(
+            db,
+            "u2",
+            quiet_hours_enabled=True,
+            quiet_hours_start=time(22, 0),
+            quiet_hours_end=time(9, 30),
+        )
+
+        assert "u2" not in await self._recipients_in_slot(db, "2026-01-10T09:00+00:00")
+        assert await self._recipients_in_slot(db, "2026-01-10T09:30+00:00") == {"u2"}
+
+
+class TestPreferredCurrency:
+    """Tests for reading the currency from preferences JSON."""
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            (None, "GBP"),
+            ("", "GBP"),
+            ("not json", "GBP"),
+            ("[]", "GBP"),
+            ('{"currency": "EUR"}', "EUR"),
+        ],
+    )
+    def test_preferred_currency(self, raw, expected):
+        """Test missing or invalid preferences fall back to GBP."""
+        assert _preferred_currency(raw) == expected
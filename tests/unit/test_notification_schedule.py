@@ -0,0 +1,163 @@
+"""Tests for the notification scheduling wheel.
+
+Tests cover:
+- Flooring moments to slot starts and slot IDs
+- Grouping timezones into local delivery windows
+- Windows that cross local midnight
+- Daylight saving transitions
+- Unknown and missing timezones
+- Quiet hours in scheduled and unscheduled windows
+"""
+
+import json
+from datetime import UTC, date, datetime, time, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.services.notification_schedule import (
+    DeliveryWindow,
+    build_delivery_windows,
+    parse_slot,
+    resolve_timezone,
+    slot_id,
+    slot_start,
+    unscheduled_window,
+    user_timezone,
+)
+
+SLOT = datetime(2026, 1, 10, 8, 15, tzinfo=UTC)
+
+
+class TestSlots:
+    """Tests for slot_start, slot_id and parse_slot."""
+
+    def test_slot_start_floors_to_quarter_hour(self):
+        """Test a moment is floored to the start of its 15-minute slot."""
+        assert slot_start(datetime(2026, 1, 10, 8, 29, 59, 1, tzinfo=UTC)) == SLOT
+
+    def test_slot_start_converts_to_utc(self):
+        """Test aware moments are converted and naive ones taken as UTC."""
+        plus_two = timezone(timedelta(hours=2))
+
+        assert slot_start(datetime(2026, 1, 10, 10, 20, tzinfo=plus_two)) == SLOT
+        assert slot_start(datetime(2026, 1, 10, 8, 20)) == SLOT
+
+    def test_slot_id_round_trips(self):
+        """Test slot IDs are stable and parse back to the slot start."""
+        assert slot_id(SLOT + timedelta(minutes=7)) == "2026-01-10T08:15+00:00"
+        assert parse_slot(slot_id(SLOT)) == SLOT
+
+
+class TestBuildDeliveryWindows:
+    """Tests for build_delivery_windows."""
+
+    def test_groups_timezones_by_local_window(self):
+        """Test timezones with the same local window share it."""
+        windows = build_delivery_windows(SLOT, ["UTC", "Europe/London", "Asia/Tokyo"])
+
+        by_zone = {tz: w for w in windows for tz in w.timezones}
+        assert len(windows) == 2
+        assert by_zone["UTC"] is by_zone["Europe/London"]
+        assert by_zone["UTC"].local_date == date(2026, 1, 10)
+        assert (by_zone["UTC"].start, by_zone["UTC"].end) == (time(8, 15), time(8, 30))
+        assert by_zone["Asia/Tokyo"].start == time(17, 15)
+
+    def test_window_crossing_midnight_runs_to_midnight(self):
+        """Test the last slot of a local day has no end and the right date."""
+        slot = datetime(2026, 1, 10, 14, 45, tzinfo=UTC)  # 23:45 in Tokyo
+
+        (window,) = build_delivery_windows(slot, ["Asia/Tokyo"])
+
+        assert window.local_date == date(2026, 1, 10)
+        assert window.start == time(23, 45)
+        assert window.end is None
+
+    def test_local_date_follows_timezone(self):
+        """Test timezones already in the next day get that day's date."""
+        slot = datetime(2026, 1, 10, 23, 0, tzinfo=UTC)
+
+        (window,) = build_delivery_windows(slot, ["Asia/Tokyo"])
+
+        assert window.local_date == date(2026, 1, 11)
+        assert window.start == time(8, 0)
+
+    def test_spring_forward_slot_covers_skipped_hour(self):
+        """Test local times skipped when clocks go forward are delivered."""
+        slot = datetime(2026, 3, 29, 0, 45, tzinfo=UTC)  # 01:00 UTC: 01:00 GMT -> 02:00 BST
+
+        (window,) = build_delivery_windows(slot, ["Europe/London"])
+        (after,) = build_delivery_windows(slot + timedelta(minutes=15), ["Europe/London"])
+
+        assert (window.start, window.end) == (time(0, 45), time(2, 0))
+        assert (after.start, after.end) == (time(2, 0), time(2, 15))
+
+    def test_fall_back_slot_is_cut_at_transition(self):
+        """Test the slot spanning clocks going back does not end before it starts."""
+        slot = datetime(2026, 10, 25, 0, 45, tzinfo=UTC)  # 01:00 UTC: 02:00 BST -> 01:00 GMT
+
+        (window,) = build_delivery_windows(slot, ["Europe/London"])
+
+        assert (window.start, window.end) == (time(1, 45), time(2, 0))
+        # The repeated local times are covered again after the transition
+        windows = [
+            build_delivery_windows(slot + timedelta(minutes=15 * i), ["Europe/London"])[0]
+            for i in range(1, 5)
+        ]
+        assert [(w.start, w.end) for w in windows] == [
+            (time(1, 0), time(1, 15)),
+            (time(1, 15), time(1, 30)),
+            (time(1, 30), time(1, 45)),
+            (time(1, 45), time(2, 0)),
+        ]
+        assert all(w.end > w.start for w in [window, *windows])
+
+    def test_unknown_timezone_is_scheduled_as_utc(self):
+        """Test an invalid timezone name falls back to UTC."""
+        (window,) = build_delivery_windows(SLOT, ["Not/AZone"])
+
+        assert window.start == time(8, 15)
+        assert window.timezones == ("Not/AZone",)
+        assert resolve_timezone(None).key == "UTC"
+
+
+class TestUserTimezone:
+    """Tests for user_timezone."""
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            (json.dumps({"timezone": "Europe/Paris"}), "Europe/Paris"),
+            (json.dumps({"currency": "USD"}), "UTC"),
+            (json.dumps(["Europe/Paris"]), "UTC"),
+            ("not json", "UTC"),
+            (None, "UTC"),
+        ],
+    )
+    def test_user_timezone(self, raw, expected):
+        """Test the timezone is read from the JSON preferences with a UTC default."""
+        assert user_timezone(raw) == expected
+
+
+class TestDeliveryWindow:
+    """Tests for DeliveryWindow quiet hours handling."""
+
+    def test_scheduled_window_never_suppresses(self):
+        """Test scheduled windows leave quiet hours to the delivery-time query."""
+        prefs = MagicMock()
+        window = DeliveryWindow(date(2026, 1, 10), time(8, 15), time(8, 30), ("UTC",))
+
+        assert window.is_scheduled
+        assert not window.suppresses(prefs)
+        prefs.is_in_quiet_hours.assert_not_called()
+
+    def test_unscheduled_window_checks_quiet_hours(self):
+        """Test unscheduled runs check quiet hours at the current time."""
+        prefs = MagicMock()
+        prefs.is_in_quiet_hours.return_value = True
+        window = unscheduled_window(datetime(2026, 1, 10, 23, 0))
+
+        assert not window.is_scheduled
+        assert window.local_date == date(2026, 1, 10)
+        assert window.suppresses(prefs)
+        prefs.is_in_quiet_hours.assert_called_once_with(time(23, 0))
@@ -3,11 +3,13 @@
 Tests cover:
 - NotificationPreferences model
 - TelegramService
+- TelegramPoller batch handling
 - Notification API schemas
 - Verification code generation and validation
 - Quiet hours functionality
 """
 
+import asyncio
 from datetime import datetime, time, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
@@ -415,6 +417,27 @@ class TestTelegramService:
             assert result is True
             mock_client.post.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_send_message_retries_after_flood_control(self, telegram_service):
+        """Test a 429 response is retried once after Telegram's retry_after."""
+        limited = MagicMock()
+        limited.status_code = 429
+        limited.json.return_value = {"ok": False, "parameters": {"retry_after": 2}}
+        ok = MagicMock()
+        ok.status_code = 200
+        ok.json.return_value = {"ok": True}
+
+        client = AsyncMock()
+        client.post = AsyncMock(side_effect=[limited, ok])
+        telegram_service._http_client = client
+
+        with patch("src.services.telegram_service.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            result = await telegram_service.send_message("123456", "Hello")
+
+        assert result is True
+        assert client.post.await_count == 2
+        sleep.assert_awaited_once_with(2.0)
+
     @pytest.mark.asyncio
     async def test_send_test_notification(self, telegram_service):
         """Test sending test notification."""
@@ -442,6 +465,108 @@ class TestTelegramService:
             call_args = mock_send.call_args
             assert "linked" in call_args[0][1].lower()
 
+    @pytest.mark.asyncio
+    async def test_http_client_reused(self, telegram_service):
+        """Test requests share one persistent client until aclose()."""
+        client = telegram_service._get_client()
+
+        assert telegram_service._get_client() is client
+        assert not client.is_closed
+
+        await telegram_service.aclose()
+
+        assert client.is_closed
+        assert telegram_service._http_client is None
+
+    @pytest.mark.asyncio
+    async def test_aclose_keeps_injected_client(self, mock_settings):
+        """Test a caller-provided client is not closed by the service."""
+        import httpx
+
+        from src.services.telegram_service import TelegramService
+
+        async with httpx.AsyncClient() as client:
+            service = TelegramService(http_client=client)
+            await service.aclose()
+
+            assert not client.is_closed
+            assert service._get_client() is client
+
+
+class TestTelegramPoller:
+    """Tests for TelegramPoller batch handling."""
+
+    @staticmethod
+    def make_update(update_id: int, chat_id: int) -> dict:
+        """Create a text message update."""
+        return {"update_id": update_id, "message": {"chat": {"id": chat_id}, "text": "hi"}}
+
+    @pytest.mark.asyncio
+    async def test_batch_concurrent_across_chats_ordered_within(self):
+        """Test chats run concurrently while each chat keeps its order."""
+        from src.services.telegram_service import TelegramPoller
+
+        handled: list[int] = []
+        active = 0
+        peak = 0
+
+        async def handler(update: dict) -> None:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            handled.append(update["update_id"])
+            active -= 1
+
+        poller = TelegramPoller(MagicMock(), handler)
+        await poller._handle_batch(
+            [self.make_update(1, 100), self.make_update(2, 200), self.make_update(3, 100)]
+        )
+
+        assert sorted(handled) == [1, 2, 3]
+        assert handled.index(1) < handled.index(3)
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_update_does_not_block_chat(self):
+        """Test a failing handler is logged and later updates still run."""
+        from src.services.telegram_service import TelegramPoller
+
+        handled: list[int] = []
+
+        async def handler(update: dict) -> None:
+            if update["update_id"] == 1:
+                raise RuntimeError("boom")
+            handled.append(update["update_id"])
+
+        poller = TelegramPoller(MagicMock(), handler)
+        await poller._handle_batch([self.make_update(1, 100), self.make_update(2, 100)])
+
+        assert handled == [2]
+
+    @pytest.mark.asyncio
+    async def test_offset_acknowledges_batch(self):
+        """Test the offset moves past the batch after it is handled."""
+        from src.services.telegram_service import TelegramPoller
+
+        service = MagicMock()
+        poller = TelegramPoller(service, AsyncMock())
+        offsets: list[int | None] = []
+
+        async def get_updates(offset=None, timeout=30):
+            offsets.append(offset)
+            if len(offsets) == 1:
+                return [self.make_update(7, 1), self.make_update(9, 2), self.make_update(8, 1)]
+            poller.running = False
+            return []
+
+        service.get_updates = get_updates
+        poller.running = True
+        await poller._poll_loop()
+
+        assert offsets == [None, 10]
+        assert poller.handler.await_count == 3
+
 
 # =============================================================================
 # Reminder Message Formatting Tests
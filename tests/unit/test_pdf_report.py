@@ -7,16 +7,31 @@ Tests cover:
 - Upcoming payments section
 - Monthly conversion calculations
 - Multi-currency conversion
+- Subscription snapshots and the report render pool
+- Report cache keys, LRU eviction and chart reuse
+- Single-pass report aggregation
 """
 
+import os
+import pickle
+from concurrent.futures import Future
 from datetime import date, timedelta
 from decimal import Decimal
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from reportlab.lib.pagesizes import A4
 
+from src.core.exceptions import ReportRenderError
 from src.models.subscription import Frequency, PaymentMode, PaymentType
-from src.services.pdf_report_service import CURRENCY_SYMBOLS, PDFReportService
+from src.schemas.report import ReportConfig
+from src.services.pdf_report_service import (
+    CURRENCY_SYMBOLS,
+    PDFReportService,
+    ReportSubscription,
+)
+from src.services.report_cache import ReportCache
+from src.services.report_render_pool import RenderJob, ReportRenderPool, render_report
 
 
 class MockCategory:
@@ -660,7 +675,7 @@ class TestCurrencyConversion:
         ]
 
         # Build summary section
-        elements = service._build_summary(subs)
+        elements = service._build_summary(service._aggregate(subs))
 
         # Elements should be generated successfully
         assert len(elements) > 0
@@ -734,6 +749,304 @@ class TestAsyncReportGeneration:
         assert pdf_bytes[:4] == b"%PDF"
 
 
+def make_job(subscriptions: list | None = None, rates: dict | None = None) -> RenderJob:
+    """Create a render job from mock subscriptions."""
+    return RenderJob(
+        subscriptions=tuple(ReportSubscription.from_subscription(s) for s in subscriptions or []),
+        user_email="user@example.com",
+        report_title="Test Report",
+        page_size=A4,
+        include_inactive=False,
+        currency="GBP",
+        config=None,
+        rates=rates,
+    )
+
+
+class TestReportSnapshot:
+    """Tests for detached subscription snapshots and rate tables."""
+
+    def test_snapshot_copies_relationships(self):
+        """Test snapshots carry category, card, history and progress fields."""
+        sub = MockSubscription(
+            name="Loan",
+            category_rel=MockCategory("Finance", Decimal("500")),
+            payment_card=MockPaymentCard("Visa"),
+            payment_mode=PaymentMode.DEBT,
+            total_owed=Decimal("1000"),
+            remaining_balance=Decimal("250"),
+            payment_history=[MagicMock(payment_date=date.today(), amount=Decimal("5"))],
+        )
+
+        snapshot = ReportSubscription.from_subscription(sub)
+
+        assert snapshot.category_rel.name == "Finance"
+        assert snapshot.category_rel.budget_amount == Decimal("500")
+        assert snapshot.payment_card.name == "Visa"
+        assert snapshot.card_id == "card-123"
+        assert len(snapshot.payment_history) == 1
+        assert snapshot.debt_paid_percentage == 75.0
+
+    def test_snapshot_is_picklable(self):
+        """Test snapshots survive the trip to a worker process."""
+        snapshot = ReportSubscription.from_subscription(
+            MockSubscription(category_rel=MockCategory("Streaming"))
+        )
+
+        assert pickle.loads(pickle.dumps(snapshot)) == snapshot
+
+    def test_convert_with_rate_table(self):
+        """Test conversion uses a given rate table without a currency service."""
+        service = PDFReportService(
+            currency="GBP", rates={"USD": Decimal("1.00"), "GBP": Decimal("0.80")}
+        )
+
+        assert service._convert_amount(Decimal("100.00"), "USD") == Decimal("80.00")
+
+    def test_snapshot_rates(self):
+        """Test rate snapshots distinguish no service from missing rates."""
+        assert PDFReportService().snapshot_rates() is None
+
+        currency_service = MockCurrencyService()
+        service = PDFReportService(currency_service=currency_service)
+        assert service.snapshot_rates() == currency_service.rates
+
+        currency_service._cache.is_expired.return_value = True
+        assert service.snapshot_rates() == {}
+
+
+class TestReportRenderPool:
+    """Tests for rendering reports in worker processes."""
+
+    def test_render_report(self):
+        """Test a job renders in-process with its rate table."""
+        job = make_job(
+            [MockSubscription(amount=Decimal("10.00"), currency="USD")],
+            rates={"USD": Decimal("1.00"), "GBP": Decimal("0.80")},
+        )
+
+        pdf_bytes = render_report(job, timeout=30)
+
+        assert pdf_bytes[:4] == b"%PDF"
+
+    def test_render_report_time_budget(self):
+        """Test the worker aborts a render that exceeds its budget."""
+        job = make_job([MockSubscription(name=f"Sub{i}") for i in range(200)])
+
+        with pytest.raises(TimeoutError):
+            render_report(job, timeout=0.001)
+
+    @pytest.mark.asyncio
+    async def test_render_in_worker_process(self):
+        """Test the pool renders a report in a worker process."""
+        pool = ReportRenderPool(max_workers=1, max_queue=0, timeout=60)
+        try:
+            pdf_bytes = await pool.render(make_job([MockSubscription()]))
+        finally:
+            pool.shutdown()
+
+        assert pdf_bytes[:4] == b"%PDF"
+        assert pool.running == 0
+        assert pool.queued == 0
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_full(self):
+        """Test renders beyond workers plus queue are rejected."""
+        pool = ReportRenderPool(max_workers=1, max_queue=1, timeout=60)
+        pending: list[Future] = []
+        executor = MagicMock()
+        executor.submit.side_effect = lambda *args: pending.append(Future()) or pending[-1]
+        pool._executor = executor
+
+        pool._submit(make_job())
+        pool._submit(make_job())
+        assert pool.running == 1
+        assert pool.queued == 1
+
+        with pytest.raises(ReportRenderError) as exc_info:
+            await pool.render(make_job())
+        assert exc_info.value.status_code == 503
+
+        # A finished render frees its slot
+        pending[0].set_result(b"%PDF")
+        assert pool.running == 1
+        assert pool.queued == 0
+
+    @pytest.mark.asyncio
+    async def test_worker_timeout_raises_render_error(self):
+        """Test a worker timeout surfaces as ReportRenderError."""
+        pool = ReportRenderPool(max_workers=1, max_queue=0, timeout=60)
+        future: Future = Future()
+        future.set_exception(TimeoutError())
+        pool._executor = MagicMock()
+        pool._executor.submit.return_value = future
+
+        with pytest.raises(ReportRenderError):
+            await pool.render(make_job())
+
+
+class TestReportCache:
+    """Tests for cached report artifacts."""
+
+    def test_cache_key_stable(self):
+        """Test identical jobs share a key."""
+        today = date(2026, 1, 12)
+        first = make_job([MockSubscription()], rates={"USD": Decimal("1.00")})
+        second = make_job([MockSubscription()], rates={"USD": Decimal("1.00")})
+
+        assert first.cache_key(today) == second.cache_key(today)
+
+    def test_cache_key_changes(self):
+        """Test data, rates, options and date all change the key."""
+        today = date(2026, 1, 12)
+        job = make_job([MockSubscription()], rates={"USD": Decimal("1.00")})
+        key = job.cache_key(today)
+
+        changed_data = make_job(
+            [MockSubscription(amount=Decimal("11.00"))], rates={"USD": Decimal("1.00")}
+        )
+        changed_rates = make_job([MockSubscription()], rates={"USD": Decimal("1.01")})
+        changed_config = RenderJob(**{**job.__dict__, "config": ReportConfig()})
+
+        assert changed_data.cache_key(today) != key
+        assert changed_rates.cache_key(today) != key
+        assert changed_config.cache_key(today) != key
+        assert job.cache_key(today + timedelta(days=1)) != key
+
+    @pytest.mark.asyncio
+    async def test_put_and_get(self, tmp_path):
+        """Test a cached report is returned as stored."""
+        cache = ReportCache(directory=str(tmp_path), max_bytes=1024)
+
+        assert await cache.get("abc") is None
+        await cache.put("abc", b"%PDF-1")
+
+        assert await cache.get("abc") == b"%PDF-1"
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self, tmp_path):
+        """Test eviction keeps recently read reports."""
+        cache = ReportCache(directory=str(tmp_path), max_bytes=250)
+        await cache.put("a", b"a" * 100)
+        await cache.put("b", b"b" * 100)
+        os.utime(tmp_path / "a.pdf", (1, 1))
+        os.utime(tmp_path / "b.pdf", (2, 2))
+        await cache.get("a")  # refreshes "a"
+
+        await cache.put("c", b"c" * 100)
+
+        assert await cache.get("a") is not None
+        assert await cache.get("b") is None
+        assert await cache.get("c") is not None
+
+    @pytest.mark.asyncio
+    async def test_generate_report_async_served_from_cache(self, tmp_path):
+        """Test a repeat request skips rendering."""
+        cache = ReportCache(directory=str(tmp_path))
+        pool = MagicMock()
+        pool.render = AsyncMock(return_value=b"%PDF-rendered")
+        service = PDFReportService()
+        subs = [MockSubscription()]
+
+        first = await service.generate_report_async(subs, pool=pool, cache=cache)
+        second = await service.generate_report_async(subs, pool=pool, cache=cache)
+
+        assert first == second == b"%PDF-rendered"
+        pool.render.assert_awaited_once()
+
+    def test_chart_drawings_reused(self):
+        """Test charts with unchanged data are built once."""
+        service = PDFReportService()
+        data = [("Streaming", Decimal("20.00")), ("Gym", Decimal("30.00"))]
+
+        first = service._build_category_pie_chart(data)
+        second = service._build_category_pie_chart(list(data))
+
+        assert first is not second
+        assert first.contents is second.contents
+        assert (
+            service._build_horizontal_bar_chart(data, "Spending", "£").contents
+            is not service._build_horizontal_bar_chart(data, "Spending", "$").contents
+        )
+
+
+class TestReportAggregation:
+    """Tests for the single-pass report data model."""
+
+    def test_aggregates_sections(self):
+        """Test category, card, budget and schedule figures from one pass."""
+        service = PDFReportService(currency="GBP")
+        today = date.today()
+        card = MockPaymentCard("Visa", "card-1")
+        subs = [
+            MockSubscription(
+                name="Netflix",
+                amount=Decimal("10.00"),
+                category_rel=MockCategory("Streaming", Decimal("15")),
+                payment_card=card,
+                next_payment_date=today + timedelta(days=3),
+            ),
+            MockSubscription(
+                name="Spotify",
+                amount=Decimal("10.00"),
+                category_rel=MockCategory("Streaming", Decimal("15")),
+                next_payment_date=today - timedelta(days=1),
+            ),
+            MockSubscription(
+                name="Laptop",
+                amount=Decimal("900.00"),
+                category="Tech",
+                payment_mode=PaymentMode.ONE_TIME,
+            ),
+            MockSubscription(name="Old", is_active=False),
+        ]
+
+        data = service._aggregate(subs)
+
+        assert data.active_count == 3
+        assert data.inactive_count == 1
+        assert data.monthly_total == Decimal("20.00")
+        assert data.category_monthly == {"Streaming": Decimal("20.00"), "Tech": Decimal("0")}
+        assert data.category_budgets == {"Streaming": Decimal("15")}
+        assert data.card_monthly == {"card-1": Decimal("10.00"), "unassigned": Decimal("10.00")}
+        assert [line.sub.name for line in data.one_time["Tech"]] == ["Laptop"]
+        assert {line.sub.name: days for line, days in data.scheduled}["Spotify"] == -1
+
+    def test_converts_each_subscription_once(self):
+        """Test a full report converts every subscription amount once."""
+        service = PDFReportService(currency="GBP", currency_service=MockCurrencyService())
+        calls = []
+        convert = service._convert_amount
+
+        def counting_convert(amount, currency):
+            calls.append(currency)
+            return convert(amount, currency)
+
+        service._convert_amount = counting_convert
+        subs = [
+            MockSubscription(name=f"Sub{i}", currency="USD", category=f"Cat{i % 3}")
+            for i in range(10)
+        ]
+
+        service.generate_report(subscriptions=subs)
+
+        assert len(calls) == len(subs)
+
+    def test_over_budget_count_per_category(self):
+        """Test the over-budget count compares each category to its own budget."""
+        service = PDFReportService()
+        subs = [
+            MockSubscription(name="A", amount=Decimal("5"), category="Unbudgeted"),
+            MockSubscription(
+                name="B", amount=Decimal("50"), category_rel=MockCategory("Food", Decimal("40"))
+            ),
+        ]
+
+        elements = service._build_budget_status(service._aggregate(subs))
+
+        assert "1 category/categories over budget" in elements[-2].text
+
+
 class TestOverduePayments:
     """Tests for overdue payment detection and display."""
 
@@ -820,7 +1133,7 @@ class TestOverduePayments:
             ),
         ]
 
-        elements = service._build_upcoming_payments(subs)
+        elements = service._build_upcoming_payments(service._aggregate(subs))
 
         # Check section header is present
         assert len(elements) > 0
@@ -835,7 +1148,7 @@ class TestOverduePayments:
             ),
         ]
 
-        elements = service._build_upcoming_payments(subs)
+        elements = service._build_upcoming_payments(service._aggregate(subs))
 
         # Should still return elements (with empty message)
         assert len(elements) > 0
@@ -883,7 +1196,7 @@ class TestPaymentHistory:
             ),
         ]
 
-        elements = service._build_payment_history(subs)
+        elements = service._build_payment_history(service._aggregate(subs))
 
         # Should return elements with "no payments" message
         assert len(elements) > 0
@@ -911,7 +1224,7 @@ class TestPaymentHistory:
             ),
         ]
 
-        elements = service._build_payment_history(subs)
+        elements = service._build_payment_history(service._aggregate(subs))
 
         # Should have elements including the failed payment
         assert len(elements) > 0
@@ -942,7 +1255,7 @@ class TestPaymentHistory:
             ),
         ]
 
-        elements = service._build_payment_history(subs)
+        elements = service._build_payment_history(service._aggregate(subs))
 
         assert len(elements) > 0
 
@@ -964,7 +1277,7 @@ class TestPaymentHistory:
             ),
         ]
 
-        elements = service._build_payment_history(subs)
+        elements = service._build_payment_history(service._aggregate(subs))
 
         # Should return "no payments" since payment is outside range
         assert len(elements) > 0
@@ -988,10 +1301,10 @@ class TestPaymentHistory:
         ]
 
         # With 30 days (default), should not include
-        elements_30 = service._build_payment_history(subs, history_days=30)
+        elements_30 = service._build_payment_history(service._aggregate(subs), history_days=30)
 
         # With 60 days, should include
-        elements_60 = service._build_payment_history(subs, history_days=60)
+        elements_60 = service._build_payment_history(service._aggregate(subs), history_days=60)
 
         assert len(elements_30) > 0
         assert len(elements_60) > 0
@@ -1023,7 +1336,7 @@ class TestPaymentHistory:
             MockSubscription(name="Rent", payment_history=[rent_payment]),
         ]
 
-        elements = service._build_payment_history(subs)
+        elements = service._build_payment_history(service._aggregate(subs))
 
         assert len(elements) > 0
 
@@ -1045,7 +1358,7 @@ class TestPaymentHistory:
             ),
         ]
 
-        elements = service._build_payment_history(subs)
+        elements = service._build_payment_history(service._aggregate(subs))
 
         assert len(elements) > 0
 
@@ -1328,7 +1641,7 @@ class TestCardBreakdown:
             MockSubscription(name="Electric", amount=Decimal("80.00"), payment_card=card2),
         ]
 
-        elements = service._build_card_breakdown(subs)
+        elements = service._build_card_breakdown(service._aggregate(subs))
 
         assert len(elements) > 0
 
@@ -1343,7 +1656,7 @@ class TestCardBreakdown:
             MockSubscription(name="Unassigned", amount=Decimal("50.00")),  # No card
         ]
 
-        elements = service._build_card_breakdown(subs)
+        elements = service._build_card_breakdown(service._aggregate(subs))
 
         assert len(elements) > 0
 
@@ -1355,7 +1668,7 @@ class TestCardBreakdown:
             MockSubscription(name="Inactive", is_active=False),
         ]
 
-        elements = service._build_card_breakdown(subs)
+        elements = service._build_card_breakdown(service._aggregate(subs))
 
         # Should return "No active payments" message
         assert len(elements) > 0
@@ -1391,7 +1704,7 @@ class TestCardBreakdown:
             ),
         ]
 
-        elements = service._build_card_breakdown(subs)
+        elements = service._build_card_breakdown(service._aggregate(subs))
 
         assert len(elements) > 0
 
@@ -1424,7 +1737,7 @@ class TestDebtProgress:
             ),
         ]
 
-        elements = service._build_debt_progress(subs)
+        elements = service._build_debt_progress(service._aggregate(subs))
 
         assert len(elements) > 0
 
@@ -1436,7 +1749,7 @@ class TestDebtProgress:
             MockSubscription(name="Netflix"),  # Regular subscription
         ]
 
-        elements = service._build_debt_progress(subs)
+        elements = service._build_debt_progress(service._aggregate(subs))
 
         # Should return "No debt payments" message
         assert len(elements) > 0
@@ -1455,7 +1768,7 @@ class TestDebtProgress:
             ),
         ]
 
-        elements = service._build_debt_progress(subs)
+        elements = service._build_debt_progress(service._aggregate(subs))
 
         assert len(elements) > 0
 
@@ -1476,7 +1789,7 @@ class TestDebtProgress:
             ),
         ]
 
-        elements = service._build_debt_progress(subs)
+        elements = service._build_debt_progress(service._aggregate(subs))
 
         assert len(elements) > 0
 
@@ -1531,7 +1844,7 @@ class TestSavingsProgress:
             ),
         ]
 
-        elements = service._build_savings_progress(subs)
+        elements = service._build_savings_progress(service._aggregate(subs))
 
         assert len(elements) > 0
 
@@ -1543,7 +1856,7 @@ class TestSavingsProgress:
             MockSubscription(name="Netflix"),  # Regular subscription
         ]
 
-        elements = service._build_savings_progress(subs)
+        elements = service._build_savings_progress(service._aggregate(subs))
 
         # Should return "No savings goals" message
         assert len(elements) > 0
@@ -1562,7 +1875,7 @@ class TestSavingsProgress:
             ),
         ]
 
-        elements = service._build_savings_progress(subs)
+        elements = service._build_savings_progress(service._aggregate(subs))
 
         assert len(elements) > 0
 
@@ -1580,7 +1893,7 @@ class TestSavingsProgress:
             ),
         ]
 
-        elements = service._build_savings_progress(subs)
+        elements = service._build_savings_progress(service._aggregate(subs))
 
         assert len(elements) > 0
 
@@ -1601,7 +1914,7 @@ class TestSavingsProgress:
             ),
         ]
 
-        elements = service._build_savings_progress(subs)
+        elements = service._build_savings_progress(service._aggregate(subs))
 
         assert len(elements) > 0
 
@@ -1657,7 +1970,7 @@ class TestBudgetStatus:
             ),
         ]
 
-        elements = service._build_budget_status(subs)
+        elements = service._build_budget_status(service._aggregate(subs))
 
         assert len(elements) > 0
 
@@ -1681,7 +1994,7 @@ class TestBudgetStatus:
             # Total: £25.98 > £20 budget
         ]
 
-        elements = service._build_budget_status(subs)
+        elements = service._build_budget_status(service._aggregate(subs))
 
         assert len(elements) > 0
 
@@ -1699,7 +2012,7 @@ class TestBudgetStatus:
             ),
         ]
 
-        elements = service._build_budget_status(subs)
+        elements = service._build_budget_status(service._aggregate(subs))
 
         # Should return "No category budgets configured" message
         assert len(elements) > 0
@@ -1718,7 +2031,7 @@ class TestBudgetStatus:
             ),
         ]
 
-        elements = service._build_budget_status(subs)
+        elements = service._build_budget_status(service._aggregate(subs))
 
         assert len(elements) > 0
 
@@ -1738,7 +2051,7 @@ class TestBudgetStatus:
             ),
         ]
 
-        elements = service._build_budget_status(subs)
+        elements = service._build_budget_status(service._aggregate(subs))
 
         assert len(elements) > 0
 
@@ -2305,7 +2618,7 @@ class TestOneTimePaymentHandling:
             ),
         ]
 
-        elements = service._build_category_breakdown(subs)
+        elements = service._build_category_breakdown(service._aggregate(subs))
 
         # Should have elements (header, table, etc.)
         assert len(elements) > 0
@@ -2330,7 +2643,7 @@ class TestOneTimePaymentHandling:
             ),
         ]
 
-        elements = service._build_card_breakdown(subs)
+        elements = service._build_card_breakdown(service._aggregate(subs))
 
         # Should have elements
         assert len(elements) > 0
@@ -2354,7 +2667,7 @@ class TestOneTimePaymentHandling:
             ),
         ]
 
-        elements = service._build_category_breakdown(subs)
+        elements = service._build_category_breakdown(service._aggregate(subs))
 
         # Should have elements (the Entertainment category)
         assert len(elements) > 0
@@ -2392,7 +2705,7 @@ class TestSpendingBarCharts:
             ),
         ]
 
-        elements = service._build_spending_bar_charts(subs)
+        elements = service._build_spending_bar_charts(service._aggregate(subs))
 
         # Should have elements (header, charts, spacers)
         assert len(elements) > 0
@@ -2403,7 +2716,7 @@ class TestSpendingBarCharts:
         """Test bar charts with no subscriptions."""
         service = PDFReportService()
 
-        elements = service._build_spending_bar_charts([])
+        elements = service._build_spending_bar_charts(service._aggregate([]))
 
         # Should have header and "no data" message
         assert len(elements) > 0
@@ -2422,7 +2735,7 @@ class TestSpendingBarCharts:
             ),
         ]
 
-        elements = service._build_spending_bar_charts(subs)
+        elements = service._build_spending_bar_charts(service._aggregate(subs))
 
         # Should have header and "no data" message
         assert len(elements) > 0
@@ -2446,7 +2759,7 @@ class TestSpendingBarCharts:
             ),
         ]
 
-        elements = service._build_spending_bar_charts(subs)
+        elements = service._build_spending_bar_charts(service._aggregate(subs))
 
         # Should have elements
         assert len(elements) > 0
@@ -2465,6 +2778,7 @@ class TestSpendingBarCharts:
 
         # Should return a Drawing
         from reportlab.graphics.shapes import Drawing
+
         assert isinstance(chart, Drawing)
 
     def test_horizontal_bar_chart_empty_returns_none(self):
@@ -2484,6 +2798,7 @@ class TestSpendingBarCharts:
         chart = service._build_horizontal_bar_chart(data, "Single Category", "£")
 
         from reportlab.graphics.shapes import Drawing
+
         assert isinstance(chart, Drawing)
 
     def test_bar_charts_in_full_report_with_charts_enabled(self):
@@ -2525,7 +2840,7 @@ class TestSpendingBarCharts:
             for i in range(12)
         ]
 
-        elements = service._build_spending_bar_charts(subs)
+        elements = service._build_spending_bar_charts(service._aggregate(subs))
 
         # Should have elements
         assert len(elements) > 0
@@ -2539,4 +2854,5 @@ class TestSpendingBarCharts:
             chart = service._build_horizontal_bar_chart(data, "Test", symbol)
 
             from reportlab.graphics.shapes import Drawing
-            assert isinstance(chart, Drawing)
\ No newline at end of file
+
+            assert isinstance(chart, Drawing)
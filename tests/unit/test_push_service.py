@@ -12,6 +12,8 @@ from datetime import date
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from src.models.subscription import Frequency, PaymentMode, PaymentType
 from src.services.push_service import CURRENCY_SYMBOLS, PushService
 
@@ -474,6 +476,49 @@ class TestSendTestNotification:
         mock_webpush.assert_called_once()
 
 
+class TestAsyncSends:
+    """Tests for sends run off the event loop."""
+
+    @pytest.mark.asyncio
+    @patch("src.services.push_service.webpush")
+    async def test_send_notification_async_runs_in_thread(self, mock_webpush):
+        """Test the blocking webpush call runs outside the event loop thread."""
+        import threading
+
+        service = PushService(
+            vapid_private_key="private-key",
+            vapid_public_key="public-key",
+            vapid_email="admin@example.com",
+        )
+        loop_thread = threading.get_ident()
+        call_threads = []
+        mock_webpush.side_effect = lambda **kwargs: call_threads.append(threading.get_ident())
+
+        result = await service.send_test_notification_async(
+            {"endpoint": "https://push.example.com/send/123", "keys": {}}
+        )
+
+        assert result is True
+        assert call_threads and call_threads[0] != loop_thread
+
+    @patch("src.services.push_service.webpush")
+    def test_requests_session_is_reused(self, mock_webpush):
+        """Test consecutive sends share one HTTP session."""
+        service = PushService(
+            vapid_private_key="private-key",
+            vapid_public_key="public-key",
+            vapid_email="admin@example.com",
+        )
+        info = {"endpoint": "https://push.example.com/send/123", "keys": {}}
+
+        service.send_notification(subscription_info=info, title="A", body="a")
+        service.send_notification(subscription_info=info, title="B", body="b")
+
+        sessions = [c.kwargs["requests_session"] for c in mock_webpush.call_args_list]
+        assert sessions[0] is sessions[1]
+        service.close()
+
+
 class TestCurrencySymbols:
     """Tests for currency symbol mapping."""
 
@@ -6,7 +6,7 @@ Tests cover:
 - RAGService: context retrieval, reference resolution, session management
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -395,6 +395,52 @@ class TestRAGServiceSessionManagement:
         await self.rag.clear_session("user-1", "nonexistent-session")
 
 
+class TestRAGServiceIndexNotes:
+    """Tests for batched note indexing."""
+
+    def setup_method(self):
+        """Reset services and create fresh RAG service."""
+        reset_rag_service()
+        EmbeddingService.reset()
+        VectorStore.reset()
+        self.rag = RAGService()
+
+    def teardown_method(self):
+        """Reset services after each test."""
+        reset_rag_service()
+        EmbeddingService.reset()
+        VectorStore.reset()
+
+    @pytest.mark.asyncio
+    async def test_index_notes_uses_single_batch(self):
+        """Test notes are embedded and upserted in one batch each."""
+        self.rag.embedding_service.embed_batch = AsyncMock(return_value=[[0.1], [0.2]])
+        self.rag.vector_store.upsert_batch = AsyncMock()
+
+        with patch("src.services.rag_service.settings") as mock_settings:
+            mock_settings.rag_enabled = True
+            await self.rag.index_notes("user-1", {"sub-1": "Family plan", "sub-2": "Work"})
+
+        self.rag.embedding_service.embed_batch.assert_awaited_once_with(
+            ["Family plan", "Work"], use_cache=True
+        )
+        call = self.rag.vector_store.upsert_batch.await_args.kwargs
+        assert call["ids"] == ["note:sub-1", "note:sub-2"]
+        assert [p["subscription_id"] for p in call["payloads"]] == ["sub-1", "sub-2"]
+        assert all(p["user_id"] == "user-1" for p in call["payloads"])
+
+    @pytest.mark.asyncio
+    async def test_index_notes_skips_empty(self):
+        """Test nothing is indexed when there are no notes."""
+        self.rag.embedding_service.embed_batch = AsyncMock()
+
+        with patch("src.services.rag_service.settings") as mock_settings:
+            mock_settings.rag_enabled = True
+            await self.rag.index_notes("user-1", {"sub-1": ""})
+
+        self.rag.embedding_service.embed_batch.assert_not_awaited()
+
+
 class TestRAGServiceReferenceResolution:
     """Tests for RAGService reference resolution."""
 
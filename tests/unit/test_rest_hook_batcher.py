@@ -0,0 +1,269 @@
+"""Unit tests for REST hook event batching.
+
+Tests cover:
+- Coalescing events within the window into one JSON array
+- Event count and body size caps
+- Concurrent sends for different hooks
+- Recording delivery statistics per event
+- Routing batching hooks through the batcher from trigger_event
+"""
+
+import asyncio
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from src.models.integration import IntegrationStatus, IntegrationType, RestHookSubscription
+from src.schemas.integration import EventPayload
+from src.services import integration_service
+from src.services.integration_service import IntegrationService
+from src.services.rest_hook_batcher import RestHookBatcher
+
+
+class FakeSessionFactory:
+    """Records the statements executed through its sessions."""
+
+    def __init__(self) -> None:
+        self.statements: list = []
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    async def execute(self, statement) -> None:
+        self.statements.append(statement)
+
+    async def commit(self) -> None:
+        return None
+
+
+def make_hook(url: str = "https://hooks.zapier.com/a", batch: bool = True) -> RestHookSubscription:
+    """Create an active REST hook."""
+    return RestHookSubscription(
+        id=str(uuid4()),
+        user_id=str(uuid4()),
+        integration_type=IntegrationType.ZAPIER,
+        target_url=url,
+        event_type="subscription.created",
+        status=IntegrationStatus.ACTIVE,
+        batch_events=batch,
+        delivery_count=0,
+        failure_count=0,
+    )
+
+
+def make_payload(name: str = "Netflix") -> EventPayload:
+    """Create an event payload."""
+    return EventPayload(
+        id=str(uuid4()),
+        event_type="subscription.created",
+        timestamp=datetime.utcnow(),
+        data={"name": name},
+    )
+
+
+def make_batcher(handler, **kwargs) -> tuple[RestHookBatcher, FakeSessionFactory]:
+    """Batcher sending through a mock transport."""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    sessions = FakeSessionFactory()
+    kwargs.setdefault("window", 0.01)
+    batcher = RestHookBatcher(http_client=client, session_factory=sessions, **kwargs)
+    return batcher, sessions
+
+
+class TestBatching:
+    """Tests for coalescing events per hook."""
+
+    @pytest.mark.asyncio
+    async def test_window_coalesces_into_array(self):
+        """Test events within the window are sent as one JSON array."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200)
+
+        batcher, sessions = make_batcher(handler)
+        hook = make_hook()
+        payloads = [make_payload(f"Sub {i}") for i in range(3)]
+
+        for payload in payloads:
+            batcher.add(hook, payload)
+        assert batcher.pending_events == 3
+        await asyncio.sleep(0.05)
+        await batcher.flush_all()
+
+        assert len(requests) == 1
+        body = json.loads(requests[0].content)
+        assert [event["id"] for event in body] == [p.id for p in payloads]
+        headers = requests[0].headers
+        assert headers["X-MoneyFlow-Event"] == "subscription.created"
+        assert headers["X-MoneyFlow-Batch-Size"] == "3"
+        assert headers["X-MoneyFlow-Event-ID"]
+        assert len(sessions.statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_max_events_sends_early(self):
+        """Test a full batch is sent without waiting for the window."""
+        sizes: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sizes.append(len(json.loads(request.content)))
+            return httpx.Response(200)
+
+        batcher, _ = make_batcher(handler, window=60, max_events=2)
+        hook = make_hook()
+
+        for _ in range(5):
+            batcher.add(hook, make_payload())
+        await asyncio.sleep(0)
+        assert batcher.pending_events == 1
+        await batcher.flush_all()
+
+        assert sorted(sizes) == [1, 2, 2]
+
+    @pytest.mark.asyncio
+    async def test_max_bytes_starts_new_batch(self):
+        """Test an event that would exceed the size cap opens a new batch."""
+        sizes: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert len(request.content) <= 400
+            sizes.append(len(json.loads(request.content)))
+            return httpx.Response(200)
+
+        batcher, _ = make_batcher(handler, window=60, max_bytes=400)
+        hook = make_hook()
+
+        for _ in range(4):
+            batcher.add(hook, make_payload())
+        await batcher.flush_all()
+
+        assert len(sizes) > 1
+        assert sum(sizes) == 4
+
+    @pytest.mark.asyncio
+    async def test_hooks_sent_concurrently(self):
+        """Test batches for different hooks are in flight together."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200)
+
+        batcher, _ = make_batcher(handler, window=60)
+        for i in range(3):
+            batcher.add(make_hook(f"https://hooks.zapier.com/{i}"), make_payload())
+        await batcher.flush_all()
+
+        assert peak == 3
+
+
+class TestRecording:
+    """Tests for recording batch outcomes."""
+
+    @pytest.mark.asyncio
+    async def test_success_counts_each_event(self):
+        """Test a delivered batch adds one delivery per event."""
+        batcher, sessions = make_batcher(lambda request: httpx.Response(200))
+        hook = make_hook()
+        for _ in range(3):
+            batcher.add(hook, make_payload())
+
+        await batcher.flush_all()
+
+        values = sessions.statements[0].compile().params
+        assert values["delivery_count_1"] == 3
+        assert values["failure_count_1"] == 0
+        assert values["id_1"] == hook.id
+
+    @pytest.mark.asyncio
+    async def test_gone_revokes(self):
+        """Test a 410 response revokes the hook."""
+        batcher, sessions = make_batcher(lambda request: httpx.Response(410))
+        batcher.add(make_hook(), make_payload())
+
+        await batcher.flush_all()
+
+        assert sessions.statements[0].compile().params["status"] == IntegrationStatus.REVOKED
+
+    @pytest.mark.asyncio
+    async def test_failure_counts_each_event(self):
+        """Test a rejected batch adds one failure per event."""
+        batcher, sessions = make_batcher(lambda request: httpx.Response(503))
+        hook = make_hook()
+        for _ in range(2):
+            batcher.add(hook, make_payload())
+
+        await batcher.flush_all()
+
+        values = sessions.statements[0].compile().params
+        assert values["failure_count_1"] == 2
+        assert values["last_error"] == "HTTP 503"
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_counts_each_event(self):
+        """Test an error other than a request error is recorded as a failure."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise ValueError("bad target")
+
+        batcher, sessions = make_batcher(handler)
+        hook = make_hook()
+        for _ in range(2):
+            batcher.add(hook, make_payload())
+
+        await batcher.flush_all()
+
+        values = sessions.statements[0].compile().params
+        assert values["failure_count_1"] == 2
+        assert values["last_error"] == "Unexpected error: bad target"
+
+
+class TestTriggerEvent:
+    """Tests for routing events from IntegrationService."""
+
+    @pytest.mark.asyncio
+    async def test_batching_hooks_use_batcher(self, monkeypatch):
+        """Test batching hooks are queued while others are posted directly."""
+        batched = make_hook("https://hooks.zapier.com/batched")
+        direct = make_hook("https://hooks.zapier.com/direct", batch=False)
+        db = AsyncMock()
+        db.execute.return_value = MagicMock(
+            scalars=lambda: MagicMock(all=lambda: [batched, direct])
+        )
+        batcher = MagicMock()
+        monkeypatch.setattr(integration_service, "get_rest_hook_batcher", lambda: batcher)
+        posted: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            posted.append(str(request.url))
+            return httpx.Response(200)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(integration_service.httpx, "AsyncClient", lambda **kwargs: client)
+
+        successful = await IntegrationService(db, batched.user_id).trigger_event(
+            "subscription.created", {"name": "Netflix"}
+        )
+
+        assert successful == 2
+        assert posted == ["https://hooks.zapier.com/direct"]
+        batcher.add.assert_called_once()
+        assert batcher.add.call_args.args[0] is batched
+        assert direct.delivery_count == 1
+        db.commit.assert_awaited_once()
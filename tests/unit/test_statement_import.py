@@ -10,12 +10,22 @@ This module contains comprehensive tests for:
 
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
-
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.db.database import Base
+from src.models.statement_import import (
+    FileType,
+    ImportJobStatus,
+    StatementImportJob,
+    StatementTransactionFingerprint,
+)
 from src.models.subscription import Frequency, Subscription
 from src.schemas.statement import (
     BulkUpdateDetectedRequest,
@@ -41,6 +51,7 @@ from src.services.parsers.base import (
     TransactionType,
     UnsupportedFormatError,
     detect_format,
+    fingerprint_transactions,
 )
 from src.services.statement_ai_service import (
     PAYMENT_TYPE_KEYWORDS,
@@ -49,12 +60,29 @@ from src.services.statement_ai_service import (
     PaymentTypeClassification,
     StatementAIService,
 )
+from src.services.statement_dedup_service import StatementDedupService
 
 # =============================================================================
 # Transaction Tests
 # =============================================================================
 
 
+def make_transactions(
+    gaps: list[int],
+    amounts: list[str] | None = None,
+    description: str = "Test",
+) -> list[Transaction]:
+    """Create debits separated by the given numbers of days."""
+    dates = [date(2024, 1, 1)]
+    for gap in gaps:
+        dates.append(dates[-1] + timedelta(days=gap))
+    amounts = amounts or ["-9.99"] * len(dates)
+    return [
+        Transaction(date=day, amount=Decimal(amount), description=description)
+        for day, amount in zip(dates, amounts, strict=False)
+    ]
+
+
 class TestTransaction:
     """Tests for Transaction dataclass."""
 
@@ -253,6 +281,117 @@ class TestStatementData:
         assert len(results) == 2
         assert all("netflix" in r.description.lower() for r in results)
 
+    def test_statement_data_round_trip(self) -> None:
+        """Test to_dict/from_dict preserve the parsed statement."""
+        stmt = StatementData(
+            transactions=[
+                Transaction(
+                    date=date(2024, 1, 1),
+                    amount=Decimal("-15.99"),
+                    description="Netflix",
+                    balance=Decimal("1000.01"),
+                    reference="REF1",
+                    raw_data={"row": ["2024-01-01", "Netflix", "-15.99"]},
+                ),
+            ],
+            bank_name="Monzo",
+            period_start=date(2024, 1, 1),
+            period_end=date(2024, 1, 31),
+            opening_balance=Decimal("1016.00"),
+            format=StatementFormat.CSV,
+            raw_text="not cached",
+        )
+
+        restored = StatementData.from_dict(stmt.to_dict())
+
+        assert restored.transactions == stmt.transactions
+        assert restored.bank_name == "Monzo"
+        assert restored.period_end == date(2024, 1, 31)
+        assert restored.opening_balance == Decimal("1016.00")
+        assert restored.closing_balance is None
+        assert restored.format == StatementFormat.CSV
+        assert restored.raw_text is None
+
+
+class TestTransactionFingerprints:
+    """Tests for per-transaction fingerprints."""
+
+    def test_fingerprint_ignores_formatting(self) -> None:
+        """Test case, whitespace and amount scale do not change the fingerprint."""
+        a = Transaction(date=date(2024, 1, 1), amount=Decimal("-9.9"), description="NETFLIX  COM")
+        b = Transaction(date=date(2024, 1, 1), amount=Decimal("-9.90"), description="netflix com")
+
+        assert fingerprint_transactions([a]) == fingerprint_transactions([b])
+
+    def test_fingerprint_distinguishes_transactions(self) -> None:
+        """Test date, amount and description all contribute."""
+        base = Transaction(date=date(2024, 1, 1), amount=Decimal("-9.99"), description="Spotify")
+        others = [
+            Transaction(date=date(2024, 1, 2), amount=Decimal("-9.99"), description="Spotify"),
+            Transaction(date=date(2024, 1, 1), amount=Decimal("-10.99"), description="Spotify"),
+            Transaction(date=date(2024, 1, 1), amount=Decimal("-9.99"), description="Netflix"),
+        ]
+
+        fingerprints = fingerprint_transactions([base, *others])
+        assert len(set(fingerprints)) == 4
+
+    def test_fingerprint_counts_repeated_transactions(self) -> None:
+        """Test identical transactions get distinct, order-stable fingerprints."""
+        txn = Transaction(date=date(2024, 1, 1), amount=Decimal("-3.50"), description="Cafe")
+        twice = fingerprint_transactions([txn, txn])
+        thrice = fingerprint_transactions([txn, txn, txn])
+
+        assert twice[0] != twice[1]
+        # An overlapping statement with one more occurrence shares the first two
+        assert thrice[:2] == twice
+
+
+@pytest_asyncio.fixture
+async def dedup_db():
+    """In-memory database with the import job and fingerprint tables."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    tables = [StatementImportJob.__table__, StatementTransactionFingerprint.__table__]
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, tables=tables))
+
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+
+    await engine.dispose()
+
+
+class TestStatementDedupService:
+    """Tests for recognising transactions of earlier imports."""
+
+    async def add_job(self, db, status: ImportJobStatus, fingerprints: list[str]):
+        """Add an import job of user u1 with its transaction fingerprints."""
+        job = StatementImportJob(
+            user_id="u1",
+            filename="statement.csv",
+            file_type=FileType.CSV,
+            content_hash="a" * 64,
+            status=status,
+        )
+        db.add(job)
+        await db.flush()
+        await StatementDedupService(db).record_fingerprints("u1", job.id, fingerprints)
+        await db.commit()
+        return job
+
+    @pytest.mark.asyncio
+    async def test_reupload_while_ready_is_fully_analysed(self, dedup_db) -> None:
+        """Test an unconfirmed job does not hide the transactions of a re-upload."""
+        fingerprints = fingerprint_transactions(make_transactions([30, 30], description="Netflix"))
+        job = await self.add_job(dedup_db, ImportJobStatus.READY, fingerprints)
+        dedup = StatementDedupService(dedup_db)
+
+        assert await dedup.find_known_fingerprints("u1", fingerprints) == set()
+
+        job.status = ImportJobStatus.COMPLETED
+        await dedup_db.commit()
+        assert await dedup.find_known_fingerprints("u1", fingerprints) == set(fingerprints)
+        assert await dedup.find_known_fingerprints("u2", fingerprints) == set()
+
 
 # =============================================================================
 # Format Detection Tests
@@ -378,7 +517,7 @@ class TestStatementAIService:
 
     def test_service_initialization_default(self) -> None:
         """Test service initialization with default client."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
             assert service.client is not None
 
@@ -390,7 +529,7 @@ class TestStatementAIService:
 
     def test_normalize_merchant_name_basic(self) -> None:
         """Test basic merchant name normalization."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
 
             result = service._normalize_merchant_name("NETFLIX.COM")
@@ -398,7 +537,7 @@ class TestStatementAIService:
 
     def test_normalize_merchant_name_with_prefixes(self) -> None:
         """Test merchant name normalization with payment prefixes."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
 
             result = service._normalize_merchant_name("CARD PAYMENT TO SPOTIFY")
@@ -406,7 +545,7 @@ class TestStatementAIService:
 
     def test_normalize_merchant_name_with_reference(self) -> None:
         """Test merchant name normalization with reference numbers."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
 
             result = service._normalize_merchant_name("Netflix ref: 12345678")
@@ -414,7 +553,7 @@ class TestStatementAIService:
 
     def test_normalize_merchant_name_empty(self) -> None:
         """Test empty merchant name normalization."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
 
             result = service._normalize_merchant_name("")
@@ -422,7 +561,7 @@ class TestStatementAIService:
 
     def test_normalize_merchant_name_truncation(self) -> None:
         """Test long merchant name truncation."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
 
             long_name = "A" * 100
@@ -431,7 +570,7 @@ class TestStatementAIService:
 
     def test_group_transactions(self) -> None:
         """Test transaction grouping by normalized name."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
 
             txns = [
@@ -450,7 +589,7 @@ class TestStatementAIService:
 
     def test_group_transactions_skip_credits(self) -> None:
         """Test that credits are skipped during grouping."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
 
             txns = [
@@ -464,57 +603,88 @@ class TestStatementAIService:
             # Only the debit should be included
             assert len(groups) == 1
 
+    def test_detect_frequency_daily(self) -> None:
+        """Test daily frequency detection."""
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
+            service = StatementAIService()
+
+            pattern = service._analyze_group("test", make_transactions([1] * 8))
+            assert pattern.frequency == FrequencyType.DAILY
+
     def test_detect_frequency_weekly(self) -> None:
         """Test weekly frequency detection."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
 
-            result = service._detect_frequency(7, [7, 7, 7])
-            assert result == FrequencyType.WEEKLY
+            pattern = service._analyze_group("test", make_transactions([7, 7, 7]))
+            assert pattern.frequency == FrequencyType.WEEKLY
 
     def test_detect_frequency_biweekly(self) -> None:
         """Test biweekly frequency detection."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
 
-            result = service._detect_frequency(14, [14, 14])
-            assert result == FrequencyType.BIWEEKLY
+            pattern = service._analyze_group("test", make_transactions([14, 14]))
+            assert pattern.frequency == FrequencyType.BIWEEKLY
 
     def test_detect_frequency_monthly(self) -> None:
         """Test monthly frequency detection."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
 
-            result = service._detect_frequency(30, [30, 31, 29])
-            assert result == FrequencyType.MONTHLY
+            pattern = service._analyze_group("test", make_transactions([30, 31, 29]))
+            assert pattern.frequency == FrequencyType.MONTHLY
 
     def test_detect_frequency_quarterly(self) -> None:
         """Test quarterly frequency detection."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
 
-            result = service._detect_frequency(90, [90, 91])
-            assert result == FrequencyType.QUARTERLY
+            pattern = service._analyze_group("test", make_transactions([90, 91]))
+            assert pattern.frequency == FrequencyType.QUARTERLY
 
     def test_detect_frequency_yearly(self) -> None:
         """Test yearly frequency detection."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
 
-            result = service._detect_frequency(365, [365])
-            assert result == FrequencyType.YEARLY
+            pattern = service._analyze_group("test", make_transactions([365]))
+            assert pattern.frequency == FrequencyType.YEARLY
 
     def test_detect_frequency_irregular(self) -> None:
         """Test irregular frequency detection."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
+            service = StatementAIService()
+
+            pattern = service._analyze_group("test", make_transactions([45, 50, 40]))
+            assert pattern.frequency == FrequencyType.IRREGULAR
+
+    def test_detect_frequency_daily_needs_steady_gaps(self) -> None:
+        """Test frequent spending with irregular 1-3 day gaps is not daily."""
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
+            service = StatementAIService()
+
+            gaps = [1, 3, 2, 1, 3, 1, 2, 3, 1, 2, 1, 3]
+            amounts = ["-3.50", "-4.20", "-2.80", "-3.90", "-5.10", "-3.20", "-4.60"]
+            txns = make_transactions(gaps, amounts=amounts * 2)
+
+            pattern = service._analyze_group("coffee shop", txns)
+            assert pattern.frequency == FrequencyType.IRREGULAR
+            # No timing score or regular-frequency bonus for irregular spending
+            expected = 0.3 + (1 - pattern.amount_variance) * 0.3 + 0.3 * 0.3
+            assert pattern.confidence == round(expected, 2)
+
+    def test_detect_frequency_daily_needs_enough_transactions(self) -> None:
+        """Test a few payments a day apart are not daily."""
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
 
-            result = service._detect_frequency(45, [45, 50, 40])
-            assert result == FrequencyType.IRREGULAR
+            pattern = service._analyze_group("test", make_transactions([1, 1, 1]))
+            assert pattern.frequency == FrequencyType.IRREGULAR
 
     def test_classify_payment_type_subscription(self) -> None:
         """Test subscription payment type classification."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
 
             txns = [
@@ -525,7 +695,7 @@ class TestStatementAIService:
 
     def test_classify_payment_type_housing(self) -> None:
         """Test housing payment type classification."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
 
             txns = [
@@ -538,7 +708,7 @@ class TestStatementAIService:
 
     def test_classify_payment_type_utility(self) -> None:
         """Test utility payment type classification."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
 
             txns = [
@@ -551,7 +721,7 @@ class TestStatementAIService:
 
     def test_classify_payment_type_insurance(self) -> None:
         """Test insurance payment type classification."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
 
             txns = [
@@ -564,7 +734,7 @@ class TestStatementAIService:
 
     def test_classify_payment_type_debt(self) -> None:
         """Test debt payment type classification."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
 
             txns = [
@@ -577,7 +747,7 @@ class TestStatementAIService:
 
     def test_classify_payment_type_savings(self) -> None:
         """Test savings payment type classification."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
 
             txns = [
@@ -590,7 +760,7 @@ class TestStatementAIService:
 
     def test_classify_payment_type_unknown(self) -> None:
         """Test unknown payment type classification."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
 
             txns = [
@@ -603,33 +773,53 @@ class TestStatementAIService:
 
     def test_calculate_confidence_high(self) -> None:
         """Test high confidence calculation."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
 
-            confidence = service._calculate_confidence(
-                transaction_count=6,
-                amount_variance=0.0,
-                days_between=[30, 30, 30, 30, 30],
-                frequency=FrequencyType.MONTHLY,
+            confidences = service._calculate_confidences(
+                counts=np.array([6]),
+                amount_variance=np.array([0.0]),
+                avg_days=np.array([30.0]),
+                gap_std=np.array([0.0]),
+                gap_counts=np.array([5]),
+                frequencies=[FrequencyType.MONTHLY],
             )
-            assert confidence >= 0.8
+            assert confidences[0] == pytest.approx(1.0)
 
     def test_calculate_confidence_low(self) -> None:
         """Test low confidence calculation."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
+            service = StatementAIService()
+
+            confidences = service._calculate_confidences(
+                counts=np.array([3]),
+                amount_variance=np.array([0.5]),
+                avg_days=np.array([52.5]),
+                gap_std=np.array([10.6]),
+                gap_counts=np.array([2]),
+                frequencies=[FrequencyType.IRREGULAR],
+            )
+            # 0.5 * 0.3 (count) + 0.5 * 0.3 (amount) + 0.3 * 0.3 (irregular timing)
+            assert confidences[0] == pytest.approx(0.39)
+
+    def test_calculate_confidence_single_gap(self) -> None:
+        """Test a regular pattern with one gap gets the neutral timing score."""
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
 
-            confidence = service._calculate_confidence(
-                transaction_count=2,
-                amount_variance=0.5,
-                days_between=[45, 60],
-                frequency=FrequencyType.IRREGULAR,
+            confidences = service._calculate_confidences(
+                counts=np.array([2]),
+                amount_variance=np.array([0.0]),
+                avg_days=np.array([365.0]),
+                gap_std=np.array([np.nan]),
+                gap_counts=np.array([1]),
+                frequencies=[FrequencyType.YEARLY],
             )
-            assert confidence < 0.6
+            assert confidences[0] == pytest.approx(2 / 6 * 0.3 + 0.3 + 0.5 * 0.3 + 0.1)
 
     def test_analyze_group_minimum_transactions(self) -> None:
         """Test that groups with too few transactions are rejected."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
 
             txns = [
@@ -640,7 +830,7 @@ class TestStatementAIService:
 
     def test_analyze_group_valid_pattern(self) -> None:
         """Test pattern detection from valid transaction group."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
 
             txns = [
@@ -655,10 +845,66 @@ class TestStatementAIService:
             assert result.amount == Decimal("15.99")
             assert result.transaction_count == 3
 
+    def test_analyze_groups(self) -> None:
+        """Test all groups are analyzed in one pass."""
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
+            service = StatementAIService()
+
+            grouped = {
+                "netflix": [
+                    Transaction(
+                        date=date(2024, 3, 1), amount=Decimal("-15.99"), description="Netflix"
+                    ),
+                    Transaction(
+                        date=date(2024, 1, 1), amount=Decimal("-15.99"), description="Netflix"
+                    ),
+                    Transaction(
+                        date=date(2024, 2, 1), amount=Decimal("-17.99"), description="Netflix"
+                    ),
+                ],
+                "gym": [
+                    Transaction(date=date(2024, 1, 2), amount=Decimal("-30.00"), description="Gym"),
+                    Transaction(date=date(2024, 1, 9), amount=Decimal("-30.00"), description="Gym"),
+                    Transaction(
+                        date=date(2024, 1, 17), amount=Decimal("-30.00"), description="Gym"
+                    ),
+                ],
+                "one off": [
+                    Transaction(
+                        date=date(2024, 1, 5), amount=Decimal("-99.00"), description="One Off"
+                    ),
+                ],
+            }
+
+            patterns = service._analyze_groups(grouped)
+
+            assert [p.normalized_name for p in patterns] == ["netflix", "gym"]
+            netflix, gym = patterns
+            assert netflix.first_seen == date(2024, 1, 1)
+            assert netflix.last_seen == date(2024, 3, 1)
+            assert netflix.amount == Decimal("16.66")
+            assert netflix.frequency == FrequencyType.MONTHLY
+            assert gym.frequency == FrequencyType.WEEKLY
+            assert gym.avg_days_between == 7.5
+            # 0.5 * 0.3 (count) + 0.3 (amount) + (1 - 0.7071 / 7.5) * 0.3 (timing) + 0.1
+            assert gym.confidence == 0.82
+
+    def test_analyze_groups_skips_same_day_only(self) -> None:
+        """Test groups whose transactions share one date are rejected."""
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
+            service = StatementAIService()
+
+            txns = [
+                Transaction(date=date(2024, 1, 1), amount=Decimal("-5.00"), description="Cafe"),
+                Transaction(date=date(2024, 1, 1), amount=Decimal("-5.00"), description="Cafe"),
+            ]
+
+            assert service._analyze_groups({"cafe": txns}) == []
+
     @pytest.mark.asyncio
     async def test_analyze_statement_empty(self) -> None:
         """Test analyzing empty statement."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
 
             stmt = StatementData()
@@ -668,7 +914,7 @@ class TestStatementAIService:
     @pytest.mark.asyncio
     async def test_analyze_statement_no_patterns(self) -> None:
         """Test analyzing statement with no recurring patterns."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
 
             txns = [
@@ -686,7 +932,7 @@ class TestStatementAIService:
     @pytest.mark.asyncio
     async def test_analyze_statement_with_patterns(self) -> None:
         """Test analyzing statement with recurring patterns."""
-        with patch("src.services.statement_ai_service.Anthropic"):
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
             service = StatementAIService()
 
             txns = [
@@ -703,6 +949,135 @@ class TestStatementAIService:
             # Should be sorted by confidence
             assert patterns[0].confidence >= patterns[1].confidence
 
+    @pytest.mark.asyncio
+    async def test_analyze_statement_skips_known_merchants(self) -> None:
+        """Test merchants with only already-imported transactions are skipped."""
+        with patch("src.services.statement_ai_service.AsyncAnthropic"):
+            service = StatementAIService()
+
+            previous = [
+                Transaction(date=date(2024, 1, 1), amount=Decimal("-15.99"), description="Netflix"),
+                Transaction(date=date(2024, 2, 1), amount=Decimal("-15.99"), description="Netflix"),
+                Transaction(date=date(2024, 1, 5), amount=Decimal("-9.99"), description="Spotify"),
+                Transaction(date=date(2024, 2, 5), amount=Decimal("-9.99"), description="Spotify"),
+            ]
+            # Overlapping statement: Spotify has a new month, Netflix does not
+            current = [
+                *previous,
+                Transaction(date=date(2024, 3, 5), amount=Decimal("-9.99"), description="Spotify"),
+            ]
+            known = set(fingerprint_transactions(previous))
+
+            patterns = await service.analyze_statement(
+                StatementData(transactions=current),
+                use_ai=False,
+                known_fingerprints=known,
+            )
+
+            assert [p.normalized_name for p in patterns] == ["spotify"]
+            # The new activity is analysed with its full history
+            assert patterns[0].transaction_count == 3
+
+
+class TestStatementAIEnhancement:
+    """Tests for batched, cached AI enhancement."""
+
+    def _make_pattern(self, name: str) -> DetectedPattern:
+        """Create a rule-based pattern awaiting AI classification."""
+        return DetectedPattern(
+            merchant_name=name,
+            normalized_name=name,
+            amount=Decimal("9.99"),
+            amount_variance=0.0,
+            frequency=FrequencyType.MONTHLY,
+            payment_type=PaymentTypeClassification.UNKNOWN,
+            confidence=0.7,
+            transaction_count=3,
+            first_seen=date(2024, 1, 1),
+            last_seen=date(2024, 3, 1),
+        )
+
+    def _make_service(self, cached: dict) -> tuple[StatementAIService, MagicMock, MagicMock]:
+        """Create a service with a mocked async client and cache."""
+
+        async def create(**kwargs):
+            prompt = kwargs["messages"][0]["content"]
+            lines = [
+                f"PATTERN: {name} | NAME: {name.title()} | TYPE: subscription | ADJUST: 0.1"
+                for name in (line[2:].split(":")[0] for line in prompt.split("\n"))
+                if name.startswith("merchant")
+            ]
+            return MagicMock(content=[MagicMock(text="\n".join(lines))])
+
+        client = MagicMock()
+        client.messages.create = AsyncMock(side_effect=create)
+        cache = MagicMock()
+        cache.get_many = AsyncMock(return_value=cached)
+        cache.set_many = AsyncMock(return_value=True)
+        return StatementAIService(anthropic_client=client, cache=cache), client, cache
+
+    @pytest.mark.asyncio
+    async def test_cached_merchants_skip_model(self) -> None:
+        """Test cached classifications are applied without calling Claude.
+
+        A confidence adjustment in a cache entry (written for another
+        user's statement) is ignored.
+        """
+        cached = {
+            "merchant:cls:netflix": {"name": "Netflix", "type": "subscription", "adjust": 0.2}
+        }
+        service, client, cache = self._make_service(cached)
+
+        patterns = await service._enhance_with_ai([self._make_pattern("netflix")], "GBP")
+
+        client.messages.create.assert_not_called()
+        cache.set_many.assert_not_called()
+        assert patterns[0].merchant_name == "Netflix"
+        assert patterns[0].payment_type == PaymentTypeClassification.SUBSCRIPTION
+        assert patterns[0].confidence == 0.7
+
+    @pytest.mark.asyncio
+    async def test_unknown_merchants_chunked_and_cached(self) -> None:
+        """Test only unknown merchants are sent, in chunks, and results cached."""
+        cached = {"merchant:cls:netflix": {"name": "Netflix", "type": "subscription"}}
+        service, client, cache = self._make_service(cached)
+        patterns = [self._make_pattern("netflix")] + [
+            self._make_pattern(f"merchant {i}") for i in range(45)
+        ]
+
+        await service._enhance_with_ai(patterns, "GBP")
+
+        # 45 unknown merchants -> chunks of 20, 20 and 5
+        assert client.messages.create.await_count == 3
+        prompts = [
+            c.kwargs["messages"][0]["content"] for c in client.messages.create.call_args_list
+        ]
+        assert not any("netflix" in prompt for prompt in prompts)
+        assert all(p.payment_type == PaymentTypeClassification.SUBSCRIPTION for p in patterns)
+        assert patterns[1].merchant_name == "Merchant 0"
+        assert patterns[1].confidence == 0.8
+
+        # Only user-independent fields are shared through the cache
+        written = cache.set_many.call_args.args[0]
+        assert len(written) == 45
+        assert written["merchant:cls:merchant 0"] == {
+            "name": "Merchant 0",
+            "type": "subscription",
+        }
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_keeps_rule_based_result(self) -> None:
+        """Test an API failure leaves patterns unchanged and uncached."""
+        service, client, cache = self._make_service({})
+        client.messages.create.side_effect = RuntimeError("overloaded")
+        pattern = self._make_pattern("merchant 1")
+
+        await service._enhance_with_ai([pattern], "GBP")
+
+        assert pattern.payment_type == PaymentTypeClassification.UNKNOWN
+        assert pattern.confidence == 0.7
+        cache.set_many.assert_not_called()
+
 
 class TestDetectedPattern:
     """Tests for DetectedPattern dataclass."""
@@ -980,6 +1355,118 @@ class TestDuplicateDetector:
         assert best_match is not None
         assert best_match.existing_subscription.name == "Spotify Premium"
 
+    def _make_pattern(self, name: str, amount: str) -> DetectedPattern:
+        """Create a monthly subscription pattern for index tests."""
+        return DetectedPattern(
+            merchant_name=name,
+            normalized_name=name.lower(),
+            amount=Decimal(amount),
+            amount_variance=0.0,
+            frequency=FrequencyType.MONTHLY,
+            payment_type=PaymentTypeClassification.SUBSCRIPTION,
+            confidence=0.9,
+            transaction_count=3,
+            first_seen=date(2024, 1, 1),
+            last_seen=date(2024, 3, 1),
+        )
+
+    def _make_subscription(self, sub_id: str, name: str, amount: str) -> MagicMock:
+        """Create a mock monthly subscription for index tests."""
+        mock_sub = MagicMock(spec=Subscription)
+        mock_sub.id = sub_id
+        mock_sub.name = name
+        mock_sub.amount = Decimal(amount)
+        mock_sub.frequency = Frequency.MONTHLY
+        return mock_sub
+
+    def test_index_candidates_skip_unrelated(self) -> None:
+        """Test the index only returns plausible candidates."""
+        detector = DuplicateDetector()
+        subs = [
+            self._make_subscription("sub-1", "Netflix", "15.99"),
+            self._make_subscription("sub-2", "Gym Membership", "900.00"),
+            self._make_subscription("sub-3", "Amazon Prime", "8.99"),
+        ]
+        index = detector.build_index(subs)
+
+        candidates = index.candidates("netflix", Decimal("400.00"), 0.63)
+        assert [entry.subscription.id for entry in candidates] == ["sub-1"]
+
+    def test_index_candidates_include_close_amounts(self) -> None:
+        """Test amount buckets surface weak name matches with close amounts."""
+        detector = DuplicateDetector()
+        subs = [
+            self._make_subscription("sub-1", "Gym Membership", "15.50"),
+            self._make_subscription("sub-2", "Gym Membership", "500.00"),
+        ]
+        index = detector.build_index(subs)
+
+        candidates = index.candidates("netflix", Decimal("15.99"), 0.63)
+        assert [entry.subscription.id for entry in candidates] == ["sub-1"]
+
+    def test_find_best_match_accepts_prebuilt_index(self) -> None:
+        """Test find_best_match gives the same result with a prebuilt index."""
+        detector = DuplicateDetector()
+        subs = [
+            self._make_subscription("sub-1", "Netflix", "15.99"),
+            self._make_subscription("sub-2", "Spotify Premium", "9.99"),
+        ]
+        pattern = self._make_pattern("Spotify", "9.99")
+
+        from_list = detector.find_best_match(pattern, subs)
+        from_index = detector.find_best_match(pattern, detector.build_index(subs))
+
+        assert from_list is not None and from_index is not None
+        assert from_index.existing_subscription.id == "sub-2"
+        assert from_index.similarity_score == from_list.similarity_score
+
+    def test_find_duplicates_matches_pairwise_scoring(self) -> None:
+        """Test indexed matching returns exactly the pairwise results."""
+        detector = DuplicateDetector()
+        names = [
+            "Netflix",
+            "Netflx",
+            "Spotify Premium",
+            "Spotfy",
+            "Amazon Prime Video",
+            "Prime Video",
+            "Disney Plus",
+            "Apple Music",
+            "BT",
+            "Hulu",
+            "Gym",
+        ]
+        amounts = ["15.99", "9.99", "8.99", "7.99", "10.99", "0", "29.99", "4.50"]
+        subs = [
+            self._make_subscription(f"sub-{i}", name, amounts[i % len(amounts)])
+            for i, name in enumerate(names)
+        ]
+        patterns = [
+            self._make_pattern(name, amounts[(i + 3) % len(amounts)])
+            for i, name in enumerate(names + ["Hlu", "Appe Music", "Disney"])
+        ]
+
+        for min_similarity in (0.4, 0.5, 0.6, 0.7, 0.85):
+            expected = []
+            for pattern in patterns:
+                for sub in subs:
+                    match = detector._check_match(pattern, sub)
+                    if match and match.similarity_score >= min_similarity:
+                        expected.append(match)
+            expected.sort(key=lambda m: m.similarity_score, reverse=True)
+
+            actual = detector.find_duplicates(patterns, subs, min_similarity)
+
+            def key(m: DuplicateMatchResult) -> tuple[str, str, float, list[str]]:
+                return (
+                    m.detected_pattern.merchant_name,
+                    m.existing_subscription.id,
+                    m.similarity_score,
+                    m.match_reasons,
+                )
+
+            assert [key(m) for m in actual] == [key(m) for m in expected]
+
 
 class TestDuplicateMatchResult:
     """Tests for DuplicateMatch result dataclass."""
@@ -0,0 +1,185 @@
+"""Unit tests for streaming subscription exports.
+
+Tests cover:
+- Streaming subscriptions from a server-side cursor
+- Effective schedules exported without writing back
+- JSON, NDJSON and CSV encoding in chunks
+- On-the-fly gzip compression
+"""
+
+import csv
+import gzip
+import io
+import json
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.db.database import Base
+from src.models.subscription import Subscription
+from src.services import subscription_export
+from src.services.subscription_export import (
+    CSV_COLUMNS,
+    ExportFormat,
+    encode_export,
+    gzip_stream,
+    iter_export_records,
+)
+from src.services.subscription_service import SubscriptionService
+
+TODAY = date.today()
+
+
+@pytest_asyncio.fixture
+async def export_db():
+    """In-memory database with three subscriptions of user u1 and one of u2."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            lambda sync_conn: Base.metadata.create_all(sync_conn, tables=[Subscription.__table__])
+        )
+
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as session:
+        rows = [
+            ("s1", "u1", "Netflix", TODAY + timedelta(days=5), None),
+            # Stale: next payment date in the past
+            ("s2", "u1", "Spotify", TODAY - timedelta(days=3), None),
+            # Ended: end date in the past
+            ("s3", "u1", "Gym", TODAY + timedelta(days=1), TODAY - timedelta(days=1)),
+            ("s4", "u2", "Other", TODAY, None),
+        ]
+        for sub_id, user_id, name, next_payment_date, end_date in rows:
+            session.add(
+                Subscription(
+                    id=sub_id,
+                    user_id=user_id,
+                    name=name,
+                    amount=Decimal("9.99"),
+                    currency="GBP",
+                    frequency="monthly",
+                    start_date=TODAY - timedelta(days=33),
+                    next_payment_date=next_payment_date,
+                    end_date=end_date,
+                    is_active=True,
+                )
+            )
+        await session.commit()
+        yield session
+
+    await engine.dispose()
+
+
+async def collect(chunks) -> bytes:
+    """Join an async byte stream."""
+    return b"".join([chunk async for chunk in chunks])
+
+
+class TestStreamAll:
+    """Tests for SubscriptionService.stream_all."""
+
+    @pytest.mark.asyncio
+    async def test_streams_user_rows_in_order(self, export_db):
+        """Test only the user's payments are streamed, by next payment date."""
+        service = SubscriptionService(export_db, user_id="u1")
+
+        names = [sub.name async for sub in service.stream_all()]
+
+        assert names == ["Spotify", "Gym", "Netflix"]
+
+    @pytest.mark.asyncio
+    async def test_export_resolves_schedule_without_writing(self, export_db):
+        """Test stale and ended payments export effective values, unchanged in the DB."""
+        service = SubscriptionService(export_db, user_id="u1")
+
+        records = {r.name: r async for r in iter_export_records(service)}
+
+        assert date.fromisoformat(records["Spotify"].next_payment_date) >= TODAY
+        assert records["Gym"].is_active is False
+        assert not export_db.dirty
+        stored = await export_db.scalar(
+            select(Subscription.next_payment_date).where(Subscription.id == "s2")
+        )
+        assert stored == TODAY - timedelta(days=3)
+
+
+class TestEncodeExport:
+    """Tests for the streaming encoders."""
+
+    @pytest.mark.asyncio
+    async def test_json_document(self, export_db):
+        """Test the JSON export is one ExportData document."""
+        service = SubscriptionService(export_db, user_id="u1")
+
+        data = json.loads(
+            await collect(encode_export(iter_export_records(service), ExportFormat.JSON))
+        )
+
+        assert data["version"] == "2.0"
+        assert data["subscription_count"] == 3
+        assert [s["name"] for s in data["subscriptions"]] == ["Spotify", "Gym", "Netflix"]
+        assert "exported_at" in data
+
+    @pytest.mark.asyncio
+    async def test_json_empty(self, export_db):
+        """Test an export without payments is still a valid document."""
+        service = SubscriptionService(export_db, user_id="nobody")
+
+        data = json.loads(
+            await collect(encode_export(iter_export_records(service), ExportFormat.JSON))
+        )
+
+        assert data["subscription_count"] == 0
+        assert data["subscriptions"] == []
+
+    @pytest.mark.asyncio
+    async def test_ndjson_lines(self, export_db):
+        """Test NDJSON has one payment per line."""
+        service = SubscriptionService(export_db, user_id="u1")
+
+        body = await collect(encode_export(iter_export_records(service), ExportFormat.NDJSON))
+
+        lines = body.decode().splitlines()
+        assert [json.loads(line)["name"] for line in lines] == ["Spotify", "Gym", "Netflix"]
+
+    @pytest.mark.asyncio
+    async def test_csv_rows(self, export_db):
+        """Test CSV has the header and formats nulls and booleans."""
+        service = SubscriptionService(export_db, user_id="u1")
+
+        body = await collect(encode_export(iter_export_records(service), ExportFormat.CSV))
+
+        reader = csv.DictReader(io.StringIO(body.decode()))
+        rows = list(reader)
+        assert reader.fieldnames == CSV_COLUMNS
+        assert [row["name"] for row in rows] == ["Spotify", "Gym", "Netflix"]
+        assert rows[1]["is_active"] == "false"
+        assert rows[0]["total_owed"] == ""
+
+    @pytest.mark.asyncio
+    async def test_chunks_records(self, export_db, monkeypatch):
+        """Test records are yielded in chunks rather than all at once."""
+        monkeypatch.setattr(subscription_export, "CHUNK_RECORDS", 1)
+        service = SubscriptionService(export_db, user_id="u1")
+
+        chunks = [
+            chunk
+            async for chunk in encode_export(iter_export_records(service), ExportFormat.NDJSON)
+        ]
+
+        assert len(chunks) == 3
+
+    @pytest.mark.asyncio
+    async def test_gzip_stream(self, export_db):
+        """Test gzipped output decompresses to the plain export."""
+        service = SubscriptionService(export_db, user_id="u1")
+
+        compressed = await collect(
+            gzip_stream(encode_export(iter_export_records(service), ExportFormat.NDJSON))
+        )
+
+        assert len(gzip.decompress(compressed).decode().splitlines()) == 3
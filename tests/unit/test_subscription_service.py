@@ -145,6 +145,74 @@ class TestSubscriptionServiceCreate:
         assert subscription.notes == "Annual home insurance"
 
 
+class TestSubscriptionServiceCreateMany:
+    """Tests for bulk subscription creation."""
+
+    @pytest.mark.asyncio
+    async def test_create_many_inserts_all_rows(self, service):
+        """Test creating many subscriptions in one call."""
+        items = [
+            SubscriptionCreate(
+                name=f"Service {i}",
+                amount=Decimal("9.99"),
+                frequency=Frequency.MONTHLY,
+                start_date=date.today() - timedelta(days=45),
+            )
+            for i in range(50)
+        ]
+
+        result = await service.create_many(items)
+
+        assert len(result.created_ids) == 50
+        assert result.errors == {}
+        all_subs = await service.get_all()
+        assert len(all_subs) == 50
+        assert all(s.next_payment_date >= date.today() for s in all_subs)
+
+    @pytest.mark.asyncio
+    async def test_create_many_preserves_input_order(self, service):
+        """Test returned IDs line up with the input rows."""
+        items = [
+            SubscriptionCreate(
+                name=name,
+                amount=Decimal("5.00"),
+                frequency=Frequency.MONTHLY,
+                start_date=date.today(),
+            )
+            for name in ("Alpha", "Beta", "Gamma")
+        ]
+
+        result = await service.create_many(items)
+
+        names = [(await service.get_by_id(sub_id)).name for sub_id in result.created_ids]
+        assert names == ["Alpha", "Beta", "Gamma"]
+
+    @pytest.mark.asyncio
+    async def test_create_many_applies_overrides(self, service):
+        """Test column overrides are applied to every row."""
+        items = [
+            SubscriptionCreate(
+                name="Override",
+                amount=Decimal("5.00"),
+                frequency=Frequency.MONTHLY,
+                start_date=date.today(),
+            )
+        ]
+
+        result = await service.create_many(items, category="utilities")
+
+        created = await service.get_by_id(result.created_ids[0])
+        assert created.category == "utilities"
+
+    @pytest.mark.asyncio
+    async def test_create_many_empty(self, service):
+        """Test bulk creation with no rows."""
+        result = await service.create_many([])
+
+        assert result.ids == []
+        assert result.errors == {}
+
+
 class TestSubscriptionServiceRead:
     """Tests for reading subscriptions."""
 
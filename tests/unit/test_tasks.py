@@ -144,6 +144,50 @@ class TestWorkerSettings:
         assert WorkerSettings.poll_delay == 0.5
 
 
+class TestWorkerLifecycle:
+    """Tests for shared worker resources created in startup/shutdown."""
+
+    @pytest.mark.asyncio
+    async def test_startup_creates_and_shutdown_closes_shared_resources(self):
+        """Test one engine, session factory and HTTP client live for the worker."""
+        from src.core.tasks import shutdown, startup
+
+        engine = MagicMock()
+        engine.dispose = AsyncMock()
+        ctx: dict = {}
+
+        with (
+            patch("src.db.database.create_database_engine", return_value=engine) as create,
+            patch("src.services.cache_service.get_cache_service", AsyncMock()),
+            patch("src.services.cache_service.close_cache_service", AsyncMock()) as close_cache,
+        ):
+            await startup(ctx)
+
+            assert ctx["engine"] is engine
+            assert ctx["session_factory"].kw["bind"] is engine
+            http_client = ctx["http_client"]
+            assert not http_client.is_closed
+
+            await shutdown(ctx)
+
+        create.assert_called_once()
+        engine.dispose.assert_awaited_once()
+        close_cache.assert_awaited_once()
+        assert http_client.is_closed
+        assert "engine" not in ctx and "http_client" not in ctx
+
+    def test_open_session_prefers_injected_then_worker_factory(self):
+        """Test tasks reuse ctx sessions instead of creating engines."""
+        from src.core.tasks import _open_session
+
+        injected = MagicMock()
+        assert _open_session({"db_session": injected}) is injected
+
+        factory = MagicMock()
+        assert _open_session({"session_factory": factory}) is factory.return_value
+        factory.assert_called_once_with()
+
+
 class TestBuiltInTasks:
     """Tests for built-in tasks."""
 
@@ -255,3 +299,80 @@ class TestTaskExecution:
 
         assert "reminders_sent" in result
         assert isinstance(result["reminders_sent"], int)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("digest", [False, True])
+    async def test_no_channels_closes_sessions_and_records_shard(self, digest):
+        """Test a run left without channels still cleans up and counts its shard."""
+        from src.core.tasks import _send_digests, _send_payment_reminders
+        from src.models.notification_history import NotificationType
+
+        sessions = [AsyncMock(), AsyncMock()]
+        ctx = {"session_factory": MagicMock(side_effect=sessions), "redis": AsyncMock()}
+        slot = "2026-01-10T08:15+00:00"
+        task_name = "send_daily_digest" if digest else "send_payment_reminders"
+
+        with patch("src.core.tasks.record_shard_result", new_callable=AsyncMock) as record:
+            if digest:
+                result = await _send_digests(
+                    ctx, task_name, NotificationType.DAILY_DIGEST, [], 1, 4, slot
+                )
+            else:
+                result = await _send_payment_reminders(ctx, task_name, [], 1, 4, slot)
+
+        for session in sessions:
+            session.close.assert_awaited_once()
+            session.execute.assert_not_awaited()
+        record.assert_awaited_once_with(ctx["redis"], task_name, slot, 1, 4, result)
+
+    @pytest.mark.asyncio
+    async def test_notification_run_closes_own_telegram_client(self):
+        """Test a run closes the Telegram client it created but not the worker's."""
+        import httpx
+
+        from src.core.tasks import _NotificationRun
+
+        ctx = {"session_factory": MagicMock(side_effect=lambda: AsyncMock())}
+
+        run = _NotificationRun(ctx, [], 0, 1)
+        own_client = run.telegram_service._get_client()
+        await run.close()
+        assert own_client.is_closed
+
+        async with httpx.AsyncClient() as shared_client:
+            run = _NotificationRun({**ctx, "http_client": shared_client}, [], 0, 1)
+            await run.close()
+            assert not shared_client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_cloud_backup_counts_upload_and_cleanup_errors(self):
+        """Test upload errors count as failed and cleanup errors separately."""
+        from src.core.tasks import scheduled_cloud_backup
+
+        users = [MagicMock(id=user_id) for user_id in ("u1", "u2", "u3")]
+        mock_session = AsyncMock()
+        mock_session.execute.return_value = MagicMock(all=lambda: users)
+        prepared = {user.id: MagicMock(user_id=user.id) for user in users}
+
+        async def upload_prepared(backup):
+            if backup.user_id == "u1":
+                raise OSError("bucket unreachable")
+            return MagicMock(success=True)
+
+        async def cleanup_old_backups(user_id):
+            if user_id == "u2":
+                raise OSError("listing failed")
+            return 0
+
+        backup_service = MagicMock()
+        backup_service.prepare_backup = AsyncMock(side_effect=lambda db, user: prepared[user.id])
+        backup_service.upload_prepared = AsyncMock(side_effect=upload_prepared)
+        backup_service.cleanup_old_backups = AsyncMock(side_effect=cleanup_old_backups)
+        backup_service.record_backups = AsyncMock()
+        ctx = {"db_session": mock_session, "backup_service": backup_service}
+
+        result = await scheduled_cloud_backup(ctx)
+
+        assert result == {"successful": 2, "skipped": 0, "failed": 1, "cleanup_failed": 1}
+        recorded = backup_service.record_backups.call_args.args[1]
+        assert sorted(backup.user_id for backup in recorded) == ["u2", "u3"]
@@ -0,0 +1,356 @@
+"""Unit tests for outbox-based webhook delivery.
+
+Tests cover:
+- Signed requests with idempotency keys on a shared client
+- Failure handling, retries and per-endpoint circuit breakers
+- Per-endpoint concurrency limits
+- Claiming pending deliveries in batches
+- Retrying due deliveries in place with jittered backoff
+- Queueing events in the caller's transaction
+- Direct deliveries hidden from the dispatcher while being sent
+- Enqueueing a dispatch job when the transaction commits
+"""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import httpx
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.core.resilience import config as resilience_config
+from src.models.webhook import (
+    DeliveryStatus,
+    WebhookDelivery,
+    WebhookEvent,
+    WebhookStatus,
+    WebhookSubscription,
+)
+from src.services import webhook_dispatcher
+from src.services.webhook_dispatcher import (
+    RETRY_DELAYS,
+    RETRY_JITTER,
+    WebhookDispatcher,
+    request_dispatch,
+    retry_delay,
+    sign_payload,
+    wait_for_pending_kicks,
+)
+from src.services.webhook_service import WebhookService
+
+
+def make_webhook(url: str = "https://hooks.example.com/in") -> WebhookSubscription:
+    """Create an active webhook."""
+    return WebhookSubscription(
+        id=str(uuid4()),
+        user_id=str(uuid4()),
+        name="Test",
+        url=url,
+        secret="s3cret",
+        events=["subscription.created"],
+        status=WebhookStatus.ACTIVE,
+        is_active=True,
+        consecutive_failures=0,
+        max_failures=100,
+    )
+
+
+def make_delivery(webhook: WebhookSubscription) -> WebhookDelivery:
+    """Create a pending delivery to a webhook."""
+    return WebhookDelivery(
+        id=str(uuid4()),
+        webhook_id=webhook.id,
+        event_type="subscription.created",
+        event_id=str(uuid4()),
+        payload='{"data": {}}',
+        status=DeliveryStatus.PENDING,
+        attempt_number=1,
+        max_attempts=3,
+    )
+
+
+def make_dispatcher(handler, **kwargs) -> WebhookDispatcher:
+    """Dispatcher sending through a mock transport."""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return WebhookDispatcher(http_client=client, **kwargs)
+
+
+class TestSend:
+    """Tests for sending a single delivery."""
+
+    @pytest.mark.asyncio
+    async def test_success_signed_with_idempotency_key(self):
+        """Test a delivery is signed and carries its ID as idempotency key."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, text="ok")
+
+        webhook = make_webhook()
+        delivery = make_delivery(webhook)
+
+        await make_dispatcher(handler).send(webhook, delivery)
+
+        headers = requests[0].headers
+        assert headers["Idempotency-Key"] == delivery.id
+        assert headers["X-Webhook-Signature"] == "sha256=" + sign_payload(
+            delivery.payload, "s3cret"
+        )
+        assert delivery.status == DeliveryStatus.SUCCESS
+        assert webhook.last_success_at is not None
+
+    @pytest.mark.asyncio
+    async def test_failure_schedules_retry(self):
+        """Test a failed attempt is recorded and retried in place."""
+        webhook = make_webhook()
+        delivery = make_delivery(webhook)
+
+        await make_dispatcher(lambda request: httpx.Response(500)).send(webhook, delivery)
+
+        assert delivery.status == DeliveryStatus.RETRYING
+        assert delivery.attempt_number == 2
+        assert delivery.next_retry_at is not None
+        assert webhook.consecutive_failures == 1
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_defers_without_request(self):
+        """Test a failing endpoint is skipped once its circuit opens."""
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(503)
+
+        dispatcher = make_dispatcher(handler)
+        webhook = make_webhook()
+        for _ in range(resilience_config.circuit_failure_threshold):
+            await dispatcher.send(webhook, make_delivery(webhook))
+
+        delivery = make_delivery(webhook)
+        await dispatcher.send(webhook, delivery)
+
+        assert calls == resilience_config.circuit_failure_threshold
+        assert delivery.status == DeliveryStatus.PENDING
+        assert delivery.attempt_number == 1
+        assert delivery.next_retry_at is not None
+
+    @pytest.mark.asyncio
+    async def test_client_errors_keep_circuit_closed(self):
+        """Test rejected deliveries do not trip the endpoint's circuit."""
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(400)
+
+        dispatcher = make_dispatcher(handler)
+        webhook = make_webhook()
+        attempts = resilience_config.circuit_failure_threshold + 1
+        for _ in range(attempts):
+            await dispatcher.send(webhook, make_delivery(webhook))
+
+        assert calls == attempts
+
+    @pytest.mark.asyncio
+    async def test_per_endpoint_concurrency(self):
+        """Test requests to one endpoint host stay within its limit."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200)
+
+        dispatcher = make_dispatcher(handler, endpoint_concurrency=2)
+        webhooks = [make_webhook(f"https://hooks.example.com/{i}") for i in range(6)]
+
+        await asyncio.gather(*(dispatcher.send(w, make_delivery(w)) for w in webhooks))
+
+        assert peak == 2
+
+
+class TestDispatchPending:
+    """Tests for claiming and sending pending deliveries."""
+
+    @pytest.mark.asyncio
+    async def test_sends_claimed_batch_and_commits(self):
+        """Test claimed deliveries are sent, skipping inactive webhooks."""
+        active = make_webhook()
+        paused = make_webhook()
+        paused.pause()
+        sent = make_delivery(active)
+        skipped = make_delivery(paused)
+        db = AsyncMock()
+        db.execute.return_value = MagicMock(all=lambda: [(sent, active), (skipped, paused)])
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(204)
+
+        claimed = await make_dispatcher(handler).dispatch_pending(db, limit=10)
+
+        assert claimed == 2
+        assert calls == 1
+        assert sent.status == DeliveryStatus.SUCCESS
+        assert skipped.status == DeliveryStatus.FAILED
+        db.commit.assert_awaited_once()
+        statement = db.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+        assert "FOR UPDATE OF webhook_deliveries SKIP LOCKED" in str(statement)
+
+
+class TestRetryDue:
+    """Tests for the batched retry scanner."""
+
+    def test_retry_delay_jitter(self):
+        """Test retry delays spread around the backoff schedule."""
+        delays = {retry_delay(1) for _ in range(20)}
+
+        assert len(delays) > 1
+        for delay in delays:
+            assert RETRY_DELAYS[0] * (1 - RETRY_JITTER) <= delay
+            assert delay <= RETRY_DELAYS[0] * (1 + RETRY_JITTER)
+        assert retry_delay(10) >= RETRY_DELAYS[-1] * (1 - RETRY_JITTER)
+
+    @pytest.mark.asyncio
+    async def test_retries_in_place_with_one_query(self):
+        """Test due retries resend the same rows, claimed with their webhooks."""
+        webhook = make_webhook()
+        first = make_delivery(webhook)
+        second = make_delivery(webhook)
+        for delivery in (first, second):
+            delivery.mark_failed("HTTP 500", status_code=500)
+            delivery.schedule_retry(datetime.utcnow())
+        db = AsyncMock()
+        db.execute.return_value = MagicMock(all=lambda: [(first, webhook), (second, webhook)])
+        keys: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            keys.append(request.headers["Idempotency-Key"])
+            return httpx.Response(200 if len(keys) == 1 else 502)
+
+        claimed = await make_dispatcher(handler).retry_due(db, limit=10, user_id="u1")
+
+        assert claimed == 2
+        assert sorted(keys) == sorted([first.id, second.id])
+        statuses = sorted([first.status, second.status])
+        assert statuses == sorted([DeliveryStatus.SUCCESS, DeliveryStatus.RETRYING])
+        retried = first if first.status == DeliveryStatus.RETRYING else second
+        assert retried.attempt_number == 3
+        db.execute.assert_awaited_once()
+        db.commit.assert_awaited_once()
+        statement = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "JOIN webhook_subscriptions" in statement
+        assert "webhook_subscriptions.user_id" in statement
+        assert "FOR UPDATE OF webhook_deliveries SKIP LOCKED" in statement
+
+    @pytest.mark.asyncio
+    async def test_last_attempt_fails(self):
+        """Test a delivery out of attempts stays failed."""
+        webhook = make_webhook()
+        delivery = make_delivery(webhook)
+        delivery.attempt_number = delivery.max_attempts
+        delivery.status = DeliveryStatus.RETRYING
+        db = AsyncMock()
+        db.execute.return_value = MagicMock(all=lambda: [(delivery, webhook)])
+
+        await make_dispatcher(lambda request: httpx.Response(500)).retry_due(db)
+
+        assert delivery.status == DeliveryStatus.FAILED
+        assert delivery.next_retry_at is None
+
+
+class TestTriggerEvent:
+    """Tests for queueing events in the caller's transaction."""
+
+    @pytest.mark.asyncio
+    async def test_queues_without_committing(self):
+        """Test events become pending deliveries without a commit or request."""
+        webhooks = [make_webhook(), make_webhook()]
+        db = AsyncMock(spec=AsyncSession)
+        db.add_all = MagicMock()
+        db.execute.return_value = MagicMock(scalars=lambda: MagicMock(all=lambda: webhooks))
+        db.sync_session = Session()
+        service = WebhookService(db, uuid4())
+
+        deliveries = await service.trigger_event(WebhookEvent.SUBSCRIPTION_CREATED, {"id": "s1"})
+
+        assert [d.webhook_id for d in deliveries] == [w.id for w in webhooks]
+        assert all(d.status == DeliveryStatus.PENDING for d in deliveries)
+        db.add_all.assert_called_once_with(deliveries)
+        db.commit.assert_not_awaited()
+
+
+class TestDeliver:
+    """Tests for deliveries sent directly by the API."""
+
+    @pytest.mark.asyncio
+    async def test_delivery_hidden_from_dispatcher_while_sent(self, monkeypatch):
+        """Test the row is committed out of dispatch_pending's reach until sent."""
+        webhook = make_webhook()
+        db = AsyncMock(spec=AsyncSession)
+        db.add = MagicMock()
+        committed: list[tuple[DeliveryStatus, datetime | None]] = []
+
+        async def commit():
+            delivery = db.add.call_args.args[0]
+            committed.append((delivery.status, delivery.next_retry_at))
+
+        db.commit.side_effect = commit
+        dispatcher = make_dispatcher(lambda request: httpx.Response(200))
+        monkeypatch.setattr(
+            "src.services.webhook_service.get_webhook_dispatcher", lambda: dispatcher
+        )
+
+        delivery = await WebhookService(db, uuid4()).deliver(
+            webhook, "test.subscription.created", {"test": True}
+        )
+
+        status, next_retry_at = committed[0]
+        assert status == DeliveryStatus.PENDING
+        assert next_retry_at > datetime.utcnow()
+        assert delivery.status == DeliveryStatus.SUCCESS
+        assert delivery.next_retry_at is None
+
+
+class TestRequestDispatch:
+    """Tests for enqueueing a dispatch job on commit."""
+
+    @pytest.mark.asyncio
+    async def test_commit_enqueues_once(self, monkeypatch):
+        """Test one dispatch job is enqueued per committed transaction."""
+        enqueue = AsyncMock()
+        monkeypatch.setattr(webhook_dispatcher, "_enqueue_dispatch", enqueue)
+        session = Session()
+
+        request_dispatch(session)
+        request_dispatch(session)
+        session.commit()
+        session.commit()
+        await wait_for_pending_kicks()
+
+        enqueue.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_no_enqueue_without_deliveries(self, monkeypatch):
+        """Test commits that queued nothing do not enqueue a job."""
+        enqueue = AsyncMock()
+        monkeypatch.setattr(webhook_dispatcher, "_enqueue_dispatch", enqueue)
+        session = Session()
+
+        session.commit()
+        await wait_for_pending_kicks()
+
+        enqueue.assert_not_awaited()